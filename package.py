@@ -6,6 +6,7 @@ import os
 import subprocess
 import shutil
 from src.config import config
+from src.utils.template import compile_report_templates
 
 # 主程式資訊
 APP_NAME = config.APP_NAME # "AutoTestingSystem" # 打包後的應用程式名稱
@@ -44,7 +45,7 @@ def build(main, method):
 
         # 外觀樣式，會搬到打包後的專案內
         # '--include-data-dir=res=res',
-        # '--include-data-dir=res/report=res/report',
+        '--include-data-dir=res/report=res/report',     # SPC 等報告模板 (FileSystemLoader)
 
         # API副程式 (將其他會用到的exe，複製到打包專案內)
         '--include-data-files=tools/*.exe=tools/',          # tools資料夾下所有exe檔
@@ -142,6 +143,9 @@ if __name__ == '__main__':
         output_dir = os.path.join(project_root, 'package')
         os.makedirs(output_dir, exist_ok = True)
 
+        # 預編譯報告模板 (res/report/compiled_templates.zip，隨 res/report 一起打包)
+        compile_report_templates()
+
         # # 產生打包指令
         exe_path = build(enter, input("[Debug(0) / Release(1)]："))
         exe_path = r"C:\OneDrive-YC\OneDrive - CYPRESS TECHNOLOGY CO.,LTD\Python\New_AutoTesting\package\release\AutoTesting.dist"
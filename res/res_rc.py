@@ -6,159 +6,171 @@
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x09d\
+\x00\x00\x0a&\
 \x00\
-\x00(\x01x\xda\xcdZ\xddN\xe4\xc8\x15\xbe\x9eHy\
-\x87Z#\xd2\xb0\xc1\xfd\x03a\x80\xa6\xe9\x15\xbb\xccd\
-F\xabaF\x03l\x94+Tm\x97\xe9Z\xec\xb2U\
-UM7\xcb\xf0\x02\xb9\xcb\x1b\xe4*R\xa4\xdc\xe4.\
-/\xb4Q\x1e#\xe7\x94\xed\xc6m\x97\xfb\x8f\xd5\x92\x06\
-\x89\xb6]\xe7\xd4\xf9\xfd\xce9ez_\x9d}\xfc\xee\
-\xf2\xcf\x9f\xde\x90\xa1\x8e\xc2\xfeo\x7f\xd3\xc3\xbf$\xa4\
-\xe2\xe6\xc4\xf9i\xe8\xbe\xa3B;p\x1b\x1f0\xea\xc3\
-7\x02\x9f^\xc44%\xde\x90J\xc5\xf4\x89su\xf9\
-\xd6=t\xf2g\x9a\xeb\x90\xf5\xff\xf3\xef\x7f\xfe\xf7\x1f\
-\x7f\xff\xf9o\xff\xfa\xf9\xaf\x7f!.yx \x92%\
-\xb1\xd4\xd7\xe61y|\xec\xb5\xd2\x85\x19\x95\xd2\xf7\xd3\
-\x0b\xfc\x0cb\xff\x9e<<]\xe3'\x88\x85v\x03\x1a\
-\xf1\xf0\xbeK\x1a\xefXx\xc74\xf7(9g#\xd6\
-\xd8!\xa7\x92\xd3p\x87(*\x94\xab\x98\xe4\xc1\xf1,\
-\xb9\x17\x87\xb1\xec\x92\x8d\xbd\xbd\xbd\xd2\x93\x88\xca\x1b.\
-\xbad\xb7\x9dLJ\x8f\x06\xd4\xbb\xbd\x91\xf1H\xf8n\
-N\x1f\x1c\xe2Oa\xdd#\xda'\xbfhz %\xe5\
-\x82\xc9\xb2\xf8\x11\x9d\xb8c\xee\xeba\x97\x1c\xbd\xae\xee\
-\x94\x0b\xd1&t\xa4\xe3%\xc4\x08\xca\x0a&\xd4\xf7\xb9\
-\xb8\xe9\x92=\x8b\x1e\xb1\xf4\x99t%\xf5\xf9Hu\xc9\
-\xa1e\xc1\xc4UC\xea\xc7c\x14a7\x99\x90\x0ep\
-!\xf2f@\xb7\xda;$\xfbmv\xb6\xeb\x14\x1fv\
-\xca\x0a\xe7\x92\xb6\xdb\x87\xa7\xa7\xdf\x96\xf6\xd3l\xa2]\
-\x1a\xf2\x1bP\xd9cB3i\xb5\x87;\x88\xb5\x8e\xa3\
-\xae\x91\xa6n\xeb\xa4\xa9F\x11\xac\x87\x88!\xad\xaf\xc9\
-\xf7\x8c%\x84\x07d\xa4\x98OX\xa8\xd8x\xc8$\xdb\
-!\xb1\x86\xbfc\xae\x18\x89\x13\xcdcAC\xf2uk\
-E\xa9r\x9d\x0e\x0e\x0e\xe6\xcb\xbb;G^M\x07\x90\
-\x03%ke\xa1\xd1i\xb77\xed\xbe\x83\xadC\x9a(\
-\xd6%\xf97\xbb\x04:N\xec\xa1<\xe3\xe1\x0e8w\
-\xdf\xe2\xe0\xf6~\xad\x87\xf5p\xa7p\xe1\x97\x15\x98\x86\
-_\xc7D\xcf~E\x80\xa2qC\x16h\xbb\x9aS\x87\
-\x03\x13\x15\x87\xdc'\x1b\x8c\x95U\xbdc\x12S?\xcc\
-\xd9\x81\xce\xc7\xe8\xfaS\xbc$\x98\x82\xe0<\xb8\x8b\x0f\
-\x007$\x89F\xa1\xe6n\x08yI>\x9c~\xa7f\
-\x1c_R\xb2\xac\x97-\xf7\xda\xf8S\x13\x1a\xfb\xfb\xfb\
-\xc7\x16\xe0\x1a3~3\xd4]P3\xf4k-l`\
-O\xcb\xae\xd0C\xd7\x1b\xf2\xd0\xdfbwLl/#\
-\xd2\x11\xfe\xd4\xa2\x92\xd2T\x8f\x94\xab\xe5\x08\x02o*\
-\xea\xee\x01e\xaf\xdb\xc7\x16\x01\x91\xbcL\x1cP\xc8\xa5\
-\x025;\xf8\x83\xb7\xe7-K\xcd\xa4\x04?<Q\x07\
-{G^g\xd7N\x8d\xae|\x1f\x90\xfbx\x84IL\
-\xde|\xfe\xfc\xf13I\xf9\xccx.\xe7=\x12\xb7\x22\
-\x1e\x8b\x02\xf7\xa3\xa3\xa3\xa5X_\x9d\x7f\x7f\xfe\xf1O\
-\xe7E\xe6\x05\xf6i\xcdr3tqo$\xafD\xbd\
-\xcfU\x12R(H\xf8\xb0\xe4w\x0cH\xff\xc7\x91\xd2\
-(\xd6(\x12\x0a\x1c\x87\x98\x14OCt\x07\x92\xf6~\
-\xc0H\xc0'p?_5\x8e\xe5-\x190\x0d\xf0C\
-@\xafo*0\x05\x8cq;W\xb3\x086\xd7\xcc\xcd\
-(\xbbXe\x19\xd5[XB\xdc\x80\x87P\x0f#.\
-\xa0\xf2l\xed\xb5\x01\x11vH'\x90\xdb\xdb\xc7\x15\x86\
-\xf3\xb9\xed\xa5t&\xc3\xdeL(\xac\x02\x10\xda\x9b\x8a\
-[aF\x93\x14\xafm(\xb4\x00\xa4J(Z_\xc9\
-\xa68;\x0b\x13\xa9\xcd}\xa2XB%\xd5\x10q4\
-@3\xe6\x05\xa2,k\x06Z\xb3\xb0\x8dL.\x12\xea\
-1p\x02\x80\x07+p\xab\xc5\x8d\xa61!\x07\x1b\xd6\
-FH\x10\xb2\xb22x\xcb\xf5\xb9d\x1e\x16$0x\
-<.\xad0\x00g\xf8\x82?0|\x10\xc3\x8e\x17\x0b\
-\xd1\x0c\xe9\x80\x85\xd6\x16\xaa\x06\x89\xe6cX\xe6\x18\x99\
-\x92\x1e\xe6V\x0a\xf1:\xbc\x87H\xf1G\x1e\x84p\xba\
-\xacb\xe6\xf1\x10\x84r\x15\xda\xb4\x8b!-i\x8a\xd7\
-\x9f$\xe2\x9b&\xa9\xb0x;\x01oT\xc8\x8d\x99\xd4\
-Prq\x0b\xb5\xcbP\x9e\xc5\xa2\xa1Iz/#_\
-\xc67\xcd;\x1a\x8e*\xb5\x17\xf8\xfd`\xee{T\x18\
-)\xb0}\x10\x8c\xf9\xa0QE\x15\x88?w \x19\x05\
-Q\xcc\x1f\xa8A\xa1\x11\xe9[\xbc\x22a\x0c\x0a`\x8d\
-i]\x9c\xab\x94\x8f\xc7\x94*\x07\x9f\x11\xf0\xd5\xabf\
-B\x95\x82\x84\x1b\x81\x11V\xc6\xe5\x80\xf2\xb0B;\x1f\
-\x95\x8b\xd4\x1c: W2\x05\xa5\xd1\x1a'\x8a\xff\x04\
-\xde\xea4wY\xb4\xa8\xa0\xcd\xf4I\xa5\xde,\x911\
-\xc4\x86v\x05\x8d*\x86_\xba\xdf\xaa)\xaa\xf5\x22\xae\
-\xd0\x8ea\x1c\xe3\xf8a\x1a\x85\xb3\xabKHw\x93\x8e\
-\x90\xb9w\x1cT#[\x1f\xb3~q{\xb6\xfa\xf8#\
-\xed\xe6k\x1e,\x80\x9a\x02$\xc8GZ\xc4\xed\xe4\xb0\
-\x22 \xa7\xc3Z\xf0\xcc\xe0\xcd\xe0#\xb6@>UC\
-\x88\xc2\x0d\xcf\xf3\xe6 ig!\x92\xee\x97\xf5\xb7i\
-\xd1\x0d\xb8T:\xed<\xca\x1a\xcdH&b\x91b\xed\
-y\x9c\xdd\xcf\xa1\x12zlb\xb8\x18K\x96\xb5\x9b\x11\
-\xbamsH\xaf\x95\x8f\x82\xbdV6r\xc2W\xec\x8b\
-\xf2Q\x11d%^\x08is\xe2Lg-\xa70:\
-\xf6\x86\x9d~y\xde\xfcB|\x16P\x08\xf4\xad\xc6%\
-\x03\xd9>\x9b\x87\x8dm3\x88\xc2\xfa\x02u\x923/\
-\xc6\xad\xd3\xbf\xf0$O49\x87\x8b.\x8e\xb3\xd9\xd3\
-k\x13\xd5\x05\xf6\xe7\xad\xd3\x8cm\xd2/\x06Y\xef+\
-\xd7%'''\xd9\xd6\xe4\x22+H\x7f\xc4\x9e\x02\xef\
-\xbbnQ\x8a\x82\x92\x96&\xa4\xa8n\x81\xb91\xf9{\
-\x01~\x88\xa8\x09\xe0\x8b,\x90\xcb\xec\xf1\xf3\xb0i\xe2\
-\x1d\xbcO\x00\xb0\xe1\x8f\x22\x9b\x8f%o\xe1\xb2\x0d\x92\
-G\xff4\x1f\xa05\x193&\xd2\xa6\x1a\x9a\x01\xdcW\
-\x91\x0d\x1b\xf5\xa6A\xc0\x18\x10>\x8e\x93f\x1a\x18\xb6\
-m\x8a\x0a\x17\x02\xd2\xe9\xf7Z\xf0\xb5o\xe5\xcc\x84\x0f\
-\xcc7gr\xb9 \xf6\x19\x038\x89\xb0\xe3\xa7Y\x81\
-@}\xf5\x90+c\xa7\x1aq\x15\xd3h\x8c\xeb\x94\xe2\
-\x04\xbf7\x8d\x8fa\xab\xe9w\x1c*\x89\x83\x5c\x1c\xf2\
-\xfbT5.|6\xf9\xa2\xb4\xc4\xfae\x97\xa9\xa8\xe3\
-\xb4\x229\x16\xdd\xd2\x13\x11D\x8al\xb5\x11\x06b\xf0\
-\x9clA\xe8=\x89\xf7\xf8\xb8\xdd\x85\x84\x81\x95\xcbp\
-1\xa5\xcf\xe9\xa7\x1c\x9aJ\xd8\xc3\xb6\x86[\x9d\x1f\x9e\
-\xad\xd4\x0fL*\x8c\xd1_N\xb3\xbb\x8c\xe3\xff\x85z\
-\xd0\x09\xfc\x12\xaa\xd9W>\xa5\x18\xea\x1dQ\xcf\x9e\xc3\
-3\xcb\x1f\x9e\xd6~!?\xc6\x5cl5z\x03\xd9\x07\
-\xf3|!\x8a\x06x6g\xb2'\xedZ\xd3i\x19\xd0\
-\x9e$\x90\xf8f~\xdex\x9c+\x8c\xc9\x8dER\x80\
-?\xe63\x99\xa6\xb6\xd5@\xabxq\x9eH\xa0\xe7[\
-(\xc68NgFT\xa0#@\x14`\x04\x0cC\xfa\
-\xde\xaa\xec\xb3c\xe2\x8c\xddq\x18.\x10\xa9W\x8f\x04\
-\xa8\xb8\x08<\x1c\x88\xb1\x08!L\xfa\xcd\x95-\x22|\
-\x04\xc3\xb2M\xf2:\xf2F\xf8\x95Z\x92\xd7\x90\x12/\
-kyH\x87&\x9d\x12\x1aI\xcbv\x5c\x88\xf7\xaf\xe0\
-c\x17\xce\x14\xf0\x8b\x8c\xf9\xef\xc8%\x8f\x98U\xd0\xb5\
-\x5cfs\xd7\x95\x82\xce\xa8\xde\xc2v \xd2 %\x93\
-s\xda\x03\x0b;\x9b\xb3\x9e%yf\xa5\x95\x85\xcf]\
-\xf7b\x82\x7f\x88}\xb6\xb2\xd4\x11\x10\xbd\x9c\xc8gT\
-\xb3\xb5\xa2\xe4\xda\x07\xca\x17\x8d\x11hG1\x8b\xd6\x09\
-\x13\xd3a\xbfd\x88#T\xad%<@\xe0\x0b\x8b~\
-\x19k@\xcd\xb5\x84\xd7H\xfa|\xf1g\x00\x7fY\x5c\
--\xb1\x98S\x01\xd2\xb3\x05\xcbd\x004\x0b\x0a\x80\xa1\
-\xa9\x116\x9b\xe0\xcc\xb9E>F\xe5\xc2A\xd5x\x96\
-O>\xc1\xc5*\xde O\xe77\xc61xy\x8dY\
-\xad\x8a\x8ei\xff\x8aQ\xf5\x96\xf2p5\x15\x9e\x8e\x91\
-\x8c\x0ax\xb9\x96\x0a\xcf\xb5}\x9a\x0ff\xe7u\x13\xe2\
-\xd72|\xa1A~\x8b\xc7hy8BC\x86\x13\xa7\
-\xd0\xe1}~\xb4\x8f[\x0b\x1c\x0a\xb3\x13\x9fo\xec\x0d\
-4p\x9c\x1e\xad\x7f\xa0\xb70ojC\x8a}i\x12\
-+\xc5\x07!\xdb\x01\xc5\x12\xc0-l\xc8\xcd\x09\x13\xf0\
-D\x8a\x09\xaf\xebTm\xf1Q\x90\xb7\xde\xcc\xe9Ta\
-\x8e\x08\xaf\xb3#B\xe8\x89\xc1\xae\xa0\x9dO(\xc0E\
-\xf9\x19\x0e\xf9x,T\xdf\xb5[\x22\xafx\x04\x99\xbd\
-\xcb\x01g6\xf05U\xa3\x22\x80i\xe3\x1b\xe6-T\
-\x03\xbc:w(z \x0e\xa6\xb2cg\xe2`\x928\
-\xc0c\xc5\xf9b\xe1x\xb3\xa4\x8e\xd9\xfb*h-\xd3\
-/s7\xb4\x8eB\xcb\xa1y\x0dH\x16\xce\x99R\xb0\
-5\x84H\x15\x07\xc4\xf6\xce\xabL\x95\x9fe\x99M\xde\
-\xe3\xbb\x09ri\xdeiW\x0f\xb2\xcc\xbb\xeer\x9a\xe9\
-\xc2?\x93\xcc>\x90u\x93\x90\x1e\xf6\x9fv\xeb\xb5\xe0\
-\xb2~\xe1\x95\xe0z\xc1\x92\x0f\x5c,ZA'\x0bV\
-\x98W\x06\x0b\xd6\x14\xdcP\xb3\x12n\xcb\x0a4\xd9\x0c\
-\xd4\xd3\x85SP\xcbI\x9ey\xbf\xc1E\xdaS\xe6\xa5\
-\xd7z\xd66\xc7\xca>\x82)rjV\x0eN3(\
-\xd5\xfe\x12\xc4#\xf0\xc0\xba\xb4\x00\xa0k\x93\xd2\xc9\xba\
-\xa4i\xb2\xae@\x9c\x22\xa4\xa1\xb5\x03d\xe9\xd1B|\
-\xcc$\xca\xd1\xc3\x06\x87E\x96+\xa0a\x05\x11+|\
-\x16\x00b\x16\x94sL\xb1\xf8\xd4\xa7\xaa\xda\x14\x05\xa1\
-o5\xdc\xb1\x08\xbe\x03\xd3A\xdcE\x1cJ\x1e\x14\xcd\
-L\xc8\xba3\xa7\xb9GE\x96\xccZ(m}n\xa4\
-\x0a\xc4!\x22\xf5\x89\xf3\xda!\xe6=\xc5\x89cy\x85\
-5\xf3_B\xe6\xc4\x06sr\xda\x0eK\xe6\xe1+\x13\
-<\xb5\xb1\x9bt\x8e\xe05\xe76\xad26\xc0\x9d\x02\
-\xf0\xe6\xd5\xa2\xd7\xca\x96\x99\xb7+\xf8\x1f\x7f\xff\x03\xf5\
-\xf7[\x8b\
+\x00(\x82x\x9c\xc5Z\xddo\x1b\xc7\x11\x7f\xb6\xfe\x8a\
+\x0d\x05WT\xaa\xe3\x87TY\x12M1P\x22\xbb1\
+\x02\xcb\x86%\xa5\xe8\x93\xb0\xbc\xdb\x137:\xde]w\
+\x97\x22\x15Z@P\xb4@\x11\xa0@\x0b\x14-\x82>\
+\xd4OE\x0b\x14\x01\x8a\xbe\xa4\x0fE\xff\x19+\xa9\xff\
+\x8b\xce\xec\xde\x91w\xc7\xe5\x97\x14D\x94\x0d\x92w;\
+\xb3\xbf\xf9\xdc\x99\xe1\x0dW\xc9\xcd\x1f\xbf~\xfb\xcd\x17\
+\xef\xde\xfc\xfa\xbb?\x7f}\xf3\x9b?\x91\xf2\xcdo\xff\
+\xf5\xedW\xbf\xbcy\xf3\xcf\x9b\xdf\x7f\xf9\xee\x8b\xdf\xc1\
+\xb5w_\xfd\xea\xe6\xcb7p\xf1\xed\xbf\xff\xf2\xf6?\
+\xff\xfd\xee\x0f\x7f['\xce\xea\xf5\xca\xf0!\xe9RW\
+D\x84+\xd6=\x13Q\xbf\x8c\x1f\xe0\xde\xc3\xeb\x15R\
+x5\x95hM\x5c47\xbc\xd6p\xa8YT\x14W\
+\x01#\xaf\x89\xc7|\xda\x0bTymm\x9d\x5c_7\
+\xab\xb0d.m/\xe4\xea\x96\xa4]\x1e\xde\x96\x92\x0e\
+nIyI\x83\xde2\xa2\x82\xae\xb9oH\x05\x93@\
+A\xb8Db\x1e2\x8f\xd0\xd0+\xde\x0a#\x05\xffC\
+F,\xb6\xc8\xe0!n@\xa5\xdc/IEUO:\
+\x80nM\x89\x1e[+n\xc6\x02\xc9\xc8\x9aO\xe1m\
+\x0dp\x96\xec G`\x87\xa4\xf4\x12\xf8\x96\xaclJ\
+O)\x0fJ\xc0e:\xb0Yj\xd0<fHe\x11\
+\xab\x17^\x84Q?,\xb5\x8e\xaa\x07\x9a7\x19\xae\x92\
+\x8fAk\xe0m].%\x0f\xcfI\x82p\xd5\xce\x18\
+\xf7\x0d=\x90\xc6\xe6\xdaU\xf4\xed\xe1C\x07\x97\x98\x80\
+\xc0\x08h\xbew\xf8\xe2\xa3\x93\x9f\xbf|B:\xaa\x1b\
+\xb4V\x9a\xf8F\x02\x1a\x9e\xef\x97>\xef8\xb0\xbd\x02\
+5\xc2eF\x13a\x9b]\xa6(q;TH\xa6\xf6\
+K\xa7'O\x9d\xddD\xd3\xc6\xfc\x01\xbfD\xd1\xcd\xba\
+\x8eR\xb1\xc3~\xd1\xe3\x97\xfb%\xc1|\xc0\xdf)\x11\
+7\x0a\x15\x0b\x81\xb8^+\xb5\x8a\xa0\x9b:\xbeZ\xdf\
+~\xf3\x8f\xff\xfd\xfd\xaf&\xc0\x89\x83\xc6\x12,\x8e\x84\
+:3\xe1\xa7\xbdP/4DR]\xa5\x9f\xf1\xd5\x8e\
+\xbc+2\xcc)\xc1\x87M\x1d\x9fvyp\xd5 k\
+\x1f\xb3\xe0\x92)\xeeRr\xc4\xc0\x936\xc8\x81\xe04\
+\xd8 \x92\x86\xd2\x91Lp\xffq\x8e\xda\x8d\x82H4\
+\xc8\xea\xd6\xd6V\xfeF\x97\x8as\x1e6\xc8f-\x1e\
+\xe4\xef\xb4\xa9{q.\xa2^\xe89)\xb5\xbf\x8b\x7f\
+\xe3e\xd7+\xa3\x8f\x15T\x0a\x85@\x11\x05\xdc\x10\xbd\
+N\x9f{\xaa\xd3 {\x8f&6I\xb7\xaf\x11\xdaS\
+\xd1|\x00~A\xae\x98z\x1e8V\x83lM\xe2\x8f\
+\x84\xc7\x84#\xa8\xc7{\xb2Av'\xef\x0f\x1c\xd9\xa1\
+^\xd4\xc7\xed7\xe3\x01\xa9\x03\x0f\x22\xce\xdb\xb4\x5c\xdb\
+ \xc9\xbfJ}\xdd*o\xa7^\x903\x85X\xab\xed\
+\x1e\x1c|\x98\xdfJ\xb1\x81rh\xc0\xcfAR\x17<\
+\x87\x09\x9b\x16\x9cv\xa4T\xd4mh\x1c\xd6M\xe3\x8a\
+\xecua1\xf8\x06\xa9\xbeO>a,F\x8f\xedI\
+HO\x18\xb1\xfd\x0e\x13l\x83D\x0a\xde\xfb\x1c\x228\
+\x8a\x15\x8fB\x1a\x90\xf7\xabK\x01J\x85\xd9\xd9\xd9\x99\
+\x89ts\x1aRE\xdb\xe0\xe5y\x0d%^P\xaf\xd5\
+\x1eZ-\x05\x9b\x064\x96\xacA\xd2O\xd6\xbdU\x14\
+[\xdd5g\xce:Xr\xdbb\xcd\xda\xb6\xdd\x9c\xaa\
+\xb31\xfe\xec\x15\x80\x8f\x9c\xac\xae\xbdd\xbb\xb8uV\
+\x9b\x01\xf3\x95U\xba\x91q\x81\x85\x8c\x02\xee\x91U\xc6\
+\x0a\x12^2\x811\x1d\xa4\xcc@\xd4\xc7h\xe8\x03\xfc\
+\x9a\xa6\x1d\xb8\x8a7 !\x08\xd2\x85l\xca\x9d\x00\xc2\
+\x8e<?\xf8Hf\xcd\x9c\x13\xae \x90-\xb2j\xf8\
+g\xf7\x82\xed\xed\xed\xfc\x0d\x9d\x8b\xfa\x8c\x9fwT\x03\
+\xe4\x0b<\xbbNu\x16S\xa2\x11\xaa\x8e\xe3vx\xe0\
+\x95\xd9%\x0b\xd7\x17\x00\xb3\x87\x7f\xf6<\x93\x9c6x\
+\x80B\x14\xa4\x14\x9b;\x94=\xaa=\xb6 #\xd7\x13\
+\xb4\xfa\x84\xcd\x10\xb3\x9d\x9f\xb8[\xee\x82\xc4L\x08P\
+\xfc\x98\xd8\xdf\xdas\xeb\x9bvb\xb4\xdd3\x9f\x5cE\
+=\x8cQ\xf2\xe4\xd5\xab\x17\xaf\x88\xe1\x935U%\x7f\
+\x82f\x98\xef\xed\xed-\xc4\xf9\xf4\xe8\x93\xa3\x17?;\
+\xca\xf0\x1e37\xe7\x8e\x93d\x0e\xe7\x5c\xf0\xa2\x7f{\
+\x5c\xc6\x01\x85c\x05\xef\xe5-\x8d\xce\xe7}\xd6\x93\x0a\
+!\xf5\xba\xa1\x04sa\xb6\x89F\xee\xb8\x01qy\xd5\
+f\xc4\xe7\x03\xb8\x9e\xae\xeaG\xe2\x82\xb4\x99\x82\xcc\x02\
+\x15R\xff\x83b\x02\x02\xbe\xb8\x99\x03e\x0bl\xad\x98\
+\x93\x106\xf0\x98dT\x95\xf18p|\x1e\xc0\x99\x06\
+\x95#\x1c\x22\xe5\xad\x1a\xc4\xfc\x06\xa9\xfbb}\xfdq\
+\x91\xdflf[\x86L\xc7\xd2\x93\x01\x85U\x90d\xb6\
+F`\x8b\xbchlr\xb0%\xcb\xcc\xceA\x85\xec8\
+\xf5L\x1a\xa5\xcf|.0\xda\xf6\x88d1\x15T\x81\
+\x9bQ\x1f\x15\x98&\xfd\x02\xce$-\xe5\x931\xf28\
+\x8e\xa9\xcb@\xfb\x90!X\x86\x99=9T\xb4\xea\xb0\
+~\x9c\xe6\x15~\xc0\x0ab\xe0\x15\xc7\xe3\x82\xb9x\xbc\
+\x80\x9a\xa3~~\x81\xce_\x9a)\x18\x01=\x06S\x94\
+=\x9e\xc7\xdbW\x02\xdaf\x81\xad\xec\xb1\xa7\x1a|M\
+MQ\x89)\x84!\xdcM5\x13\xe0\xf7\xe0\x0a\x1c\xc3\
+\xeb\xb9\xe0\xaffYQ\xb3\xfd\x0e\x00r$\xaa\xb1\x81\
+\xee+\xa8\xc9\xc3/\x05&0E\x0cP\xbc\x1ccU\
+[\xa0\xd6\xda\x91\x1d\xc1\xc3\x0b8\x8a4\xe1a\x14\xae\
+)b\xae%\xd4s\xad\x91t/\xc3b\xdc|\xaa/\
+\xbb4\xd4\x00\xf0\xfc\x0f\x19\xf3@\x96\xa2\x10\xe0kN\
+[0\x0a(\xf4\x1b\x9c*\x81F\xf3!~#A\x04\
+\xd0\xf1\xd4\xa8\x1e\x1fI\xc3\xc6eR\x16\x1c\x0d\xb0=\
+xP\x89\xa1\xd0\x87\xa8\xea\x81\xec\xcb\xe6\x5c\x1f\xfa\x90\
+\x09\xd2\x99\x197C\xcb\xa1vq\x92\xa6\xc1\xe2\x17\x92\
+\x7f\x0e\x06\xaaW6Yw\xce\x01\x95-pr\x05U\
+,\x22\xf0\x04\xe5\x84\xb4[\xd4\xf5\xa2E\x92\xfdx\x9c\
+\x8am\xd1\x12\x0a\xdd\x15\xbb\x02}\xd0\x1f\x9e\x9e@$\
+\xebp\x83\xc0\xbc\xe4 \x10)\xbfH\xaa\xbb\xf5\xdca\
+\xe2\xf5\x94\x93.\xc9\x0b\xa4}\xcb$=@F\xaa\xc4\
+\xa9\xa7\xf9\x22\x84\x90\x0d\xa6%\xc4$k\xe9\xa4\x87\xe5\
+\x8bGe\x07\xfcm\xd5u\xdd\xe9\xd9\xb1>/;n\
+\xe7\xe5\xb6\xe1o\xf8\x5cHej\x87\x82,9P\xd8\
+\x83kI\x8e\xa2\xe4z\x9a\xfd\xa0\x12&\x9a\x89\xd6`\
+A\xae\x1c\xde\xda\x84\x11\x9a\xd5\xa4+kVM\xfb\xb8\
+\xd2\xc4\x8a&\xe9\xd8\x00b\xda\x00\x8fZ\x9fL\xc7\xde\
+\xec\xd4[\xc5\xa6/3\x888a\x00\xe9\x95\xbe\x99\xcc\
+$`\xfd\x988NYg\xdd\xb3\xd4:v\x05\x8f\x15\
+9\x82/\x0dl)\x93\xbbg\xday3\xdc\xa1\x03O\
+\xb8\xc6c\xa6\xf9\xee\xd6\xba\x03)\xb6\xf2\x08\x133\x1c\
+\xa4HXw\x0e\x91(+\x95\x0a\xb2\xcd\xb6\xbdc\xdc\
+\xef9\x0e\xd9\xdf\xdfO$#\xc7\xc9\xc1\xf5S\xac9\
+\xf0\xba\xe3d\x84\xcch\xd0R\xa3\x14\xa6\x1f\x09km\
+\xc6g!\xd8\xb6Ku0\x1c'AQ`\x9e\x08\x8c\
+\xa1\x03\xfe\x84\xf8\xe1M\xda\x06\x0b\xc3U\x92\xc6\xd1(\
+\xb2\xa0p\xe93\x16\x9a\xf2\x1a\x8a\x05\xdcU\xda\xa6\x16\
+F\xa78\x06\x0a\xa2(\xae\x18O\xb3M/2\xb2f\
+\xfc\xbb\xd4jV\xe1\xe3\xe4\x14\xc6\xaa\xdd\x0c\xe2C\x06\
+\xd9\xa8\x8be?M\x8e\x13\x94Tu\xb8\xd4\x0a\xb2#\
+\x95L\xa1\x16\xce\x0c\xc1>~\xaeh\xab\xc3>\xa3\xcf\
+fx\x84LJ\xe4\xc7F*\x1ezl\xf0Z*\x81\
+\x9e`\x03\x94\x95nt~M\x99^5%&\x9bd\
+\xb1F\x02n}D\xca\xe0\xcdcl\xd7\xd7\xeb\x0d\x88\
+>X\xb9\x00\x13}L\x96Z\x86AE\x86\xf6@\xb0\
+3\x9b\xa2\xfe\xbb\x0a\xf4)\x13\x12\x9d\xf2{\x93\xea2\
+ax\xff\xa2A\xc1\xf0=\x88e]\x88/\x13P(\
+r\x97\xba\xd6x\xcd\xad\x1e\x8e\x97\xbe&\x9fE<,\
+\xaf5\xdb\xa2\x05\x8ayM$\xf5q\xce\xa6\xc3\xc5\x94\
+\xb2\xa6G\xc6ym\x0cA\xae\xbb\xe6)\x93\xc8\x04\xca\
+\xdc)(\xbc\xc0\x0e3YL\x1bh\xe2k\x09\xdb\xcd\
+@\x03\x02>\x85\xd3\x1b\xfb\xe8Dy\x12\x84\x93zB\
+\x0d\x1d\x91\xba\xb2IyW?8d\x97\x1c\x9a\x0cL\
+\xc5K[\x1fNiL0\x1ch\xf1X\xc1T\xe8U\
+\x96\xd4E\xe8a\xc6+h#=$\x9e\x84\xde\xc4A\
+\x91\x1c\x10yF\xd6\xdco\xda&e\xc84\xc8\x82\xfe\
+\xe6e\xf3\x07\xf0\xb2\xe2\xd2\xa7\xfeq\xc2\xf9G\xe4\x84\
+w\x99\x0d\xe3m\xecd\xb3\xd1\xa9\x84\x12j\xaa^\xed\
+\xd9F\x01D&fT\x14\x93\xdc,\x16\xba\x0b\xeaD\
+?\xcb\x02O\x0dv?\xa0\x9fG\x1e[\x16q\x17h\
+\xee\x09\xee!UK\xc3E\xcf8\xf3\x80\xf0\xfe\xfc\x02\
+JJ\x8c\x99[\xb8\x86\xae\xc1\xef\xcd\xa51\x1f\xdd\x06\
+8d\xb9\xfb\x84}\x12)H\x8c\xb7\x01\xae\x90\xf2\xae\
+\xd0s\xe9|\xc1\xd4\x99g0#\xbf\x9b\xa1\xc2dQ\
+\x0f$s\xd2;\x92\xd8q&M\x9d\x9eV\xa4\xadO\
+\x82\x0bN\x84\xbbX\x02\x7f\xe7]\xc2\x06d<\xaf\xd1\
+\xe6\xc0\xafg\x18\xbf2k\x8e\xda\x0f\xe5G\xf8S\xf4\
+R\xf0\xc73#\x0d\x1f\xbf\xde\x02\xfe\x1dun\xbc_\
+o{K\xf7\xffA\x14\x9e)o\x9f\xe2\xb8,u@\
+(\xac\xb0A\x0cUp\x95\x8e\xe8q\xdf\x10\x9b\xb8d\
+\xce\xf3\x81\xb5\xfc\x05\x86\xa3\x19\xf9sz\x01\xed\xa1\xd2\
+\x94X[\xc6\x91\x94\xbc\x1d\xb0\x0d\x10*\x86\xec\x84\xd5\
+\xb4\x1e+\x01K\xa4\x18\xf0)\xd5\xa6\xcd+2h\xa7\
+*\xd8\xf4\x03z\x0exf\x7f$\xa3xo\xde3\x19\
+6w\xcb\x8e\x19m\x0fi\xe4\xf6X\xfc)\x8d\xdc\x13\
+\x1a\x93<f?\xa21C#3\xdb\x92\x05\xe5\x1b\x8d\
+xN\xcd\x87Y\xdb\xd9Z\x98\x85\xf2\xb5=\x17\xae\xe4\
+y\x182\xa4\x89|b\xfb\xb1*O\x93\x8e\x98\xf4\x06\
+\xcf\xf0\x17\x06r\xa2\x7fl\x9e\x98/\xe9\xdf\xa0\x0bA\
+\xa5\xc6\x0f\x82\xe4\xafO}p\xaa\xd3\x1a\xef\xd4\xac\xc2\
+\xd7\xa9\xebNC\xaef\xafx\xce\xc39\x0b\xe8`\xf6\
+\x02=\xfc\x9f\xbd$\xa3y\xfbB\xf3(M\xe1\xca\xa4\
+^\x9aj<\xed\xcc\xbe\x92\xb1\x9a\xfe\x8d\x82\x87\xa6,\
+LOS[w:,>\xb9fq\xf8Y\xdd\xedx\
+\xc4fF\x97\x93\x82O\xb5\x9eyJ)\x0a\xd0\xb5\xf7\
+K\x8fJD\x0ft\xf7K\x96\xc9~\xee\x91\x07\xdd\xa2\
+\xa2`\xa32A0\x17\xe7\xca\xd8\xa6Z\x9f\x9a\x9a\xd4\
+i*\xd6\xb4\xfe?\xd7\xc4\xce\x16\x12\x98\xe7M\x01\x17\
+\xc6\xbe\x9dDb\xb3j\xd6\xe0\xb4Z?\x0a\x95\xd9\xfc\
+\xff\xc0\x19\xd8!\
 \x00\x00+\xb0\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -5100,201 +5112,190 @@ Q\xc7g\xae\x0d\x00\x00\x00\x00 \x94C\x22\xea\xea\xde\
 \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9c\
 T\x03\x9e\xeb\x0f\x10\xd0\xf7\x96\x93\x00\x00\x00\x00IE\
 ND\xaeB`\x82\
-\x00\x00\x0c\x0b\
+\x00\x00\x0b]\
 /\
 * \xe5\x85\xa8\xe5\xb1\x80\xe6\xa8\xa3\xe5\xbc\x8f *\
-/\x0d\x0aQWidget {\x0d\x0a  \
-  font-family: \x22\
-Microsoft YaHei\x22\
-, \x22Segoe UI\x22, Ar\
-ial;\x0d\x0a    font-s\
-ize: 16px;\x0d\x0a}\x0d\x0a\x0d\
-\x0a/* \xe4\xb8\xbb\xe7\xaa\x97\xe5\x8f\xa3 */\
-\x0d\x0aQMainWindow {\x0d\
-\x0a    background-\
-color: #f5f5f5;\x0d\
-\x0a}\x0d\x0a\x0d\x0a/* \xe6\x8c\x89\xe9\x88\x95\xe6\
-\xa8\xa3\xe5\xbc\x8f */\x0d\x0aQPushB\
-utton {\x0d\x0a    bac\
+/\x0aQWidget {\x0a    \
+font-family: \x22Mi\
+crosoft YaHei\x22, \
+\x22Segoe UI\x22, Aria\
+l;\x0a    font-size\
+: 16px;\x0a}\x0a\x0a/* \xe4\xb8\
+\xbb\xe7\xaa\x97\xe5\x8f\xa3 */\x0aQMain\
+Window {\x0a    bac\
 kground-color: #\
-008AAB;\x0d\x0a    col\
-or: white;\x0d\x0a    \
-border: none;\x0d\x0a \
+f5f5f5;\x0a}\x0a\x0a/* \xe6\x8c\
+\x89\xe9\x88\x95\xe6\xa8\xa3\xe5\xbc\x8f */\x0aQP\
+ushButton {\x0a    \
+background-color\
+: #008AAB;\x0a    c\
+olor: white;\x0a   \
+ border: none;\x0a \
    border-radius\
-: 4px;\x0d\x0a    padd\
-ing: 8px 16px;\x0d\x0a\
-    min-width: 8\
-0px;\x0d\x0a    font-w\
-eight: bold;\x0d\x0a  \
-  font-size: 24p\
-x;\x0d\x0a}\x0d\x0a\x0d\x0aQPushBu\
-tton:hover {\x0d\x0a  \
+: 4px;\x0a    paddi\
+ng: 8px 16px;\x0a  \
+  min-width: 80p\
+x;\x0a    font-weig\
+ht: bold;\x0a    fo\
+nt-size: 24px;\x0a}\
+\x0a\x0aQPushButton:ho\
+ver {\x0a    backgr\
+ound-color: #009\
+bc1;\x0a}\x0a\x0aQPushBut\
+ton:pressed {\x0a  \
   background-col\
-or: #009bc1;\x0d\x0a}\x0d\
-\x0a\x0d\x0aQPushButton:p\
-ressed {\x0d\x0a    ba\
-ckground-color: \
-#007795;\x0d\x0a}\x0d\x0a\x0d\x0aQ\
-PushButton:disab\
-led {\x0d\x0a    backg\
+or: #007795;\x0a}\x0a\x0a\
+QPushButton:disa\
+bled {\x0a    backg\
 round-color: #cc\
-cccc;\x0d\x0a    color\
-: #666666;\x0d\x0a}\x0d\x0a\x0d\
-\x0a/* QSS \xe6\xa8\xa3\xe5\xbc\x8f *\
-/\x0d\x0aQPushButton[t\
-ype=\x22primary\x22] {\
-\x0d\x0a    font-size:\
- 16px;\x0d\x0a}\x0d\x0a\x0d\x0aQPu\
-shButton[type=\x22s\
-econdary\x22] {\x0d\x0a  \
-  font-size: 54p\
-x;\x0d\x0a}\x0d\x0a\x0d\x0a/* \xe5\x88\x97\xe8\
-\xa1\xa8\xe9\x83\xa8\xe4\xbb\xb6 */\x0d\x0aQLi\
-stWidget {\x0d\x0a    \
-background-color\
-: white;\x0d\x0a    bo\
+cccc;\x0a    color:\
+ #666666;\x0a}\x0a\x0a/* \
+QSS \xe6\xa8\xa3\xe5\xbc\x8f */\x0aQP\
+ushButton[type=\x22\
+primary\x22] {\x0a    \
+font-size: 16px;\
+\x0a}\x0a\x0aQPushButton[\
+type=\x22secondary\x22\
+] {\x0a    font-siz\
+e: 54px;\x0a}\x0a\x0a/* \xe5\
+\x88\x97\xe8\xa1\xa8\xe9\x83\xa8\xe4\xbb\xb6 */\x0aQ\
+ListWidget {\x0a   \
+ background-colo\
+r: white;\x0a    bo\
 rder: 1px solid \
-#e0e0e0;\x0d\x0a    bo\
-rder-radius: 4px\
-;\x0d\x0a    padding: \
-4px;\x0d\x0a}\x0d\x0a\x0d\x0aQList\
-Widget::item {\x0d\x0a\
-    padding: 8px\
-;\x0d\x0a    border-ra\
-dius: 2px;\x0d\x0a}\x0d\x0a\x0d\
-\x0aQListWidget::it\
-em:selected {\x0d\x0a \
-   background-co\
-lor: #008AAB;\x0d\x0a \
-   color: white;\
-\x0d\x0a}\x0d\x0a\x0d\x0aQListWidg\
-et::item:hover {\
-\x0d\x0a    background\
+#e0e0e0;\x0a    bor\
+der-radius: 4px;\
+\x0a    padding: 4p\
+x;\x0a}\x0a\x0aQListWidge\
+t::item {\x0a    pa\
+dding: 8px;\x0a    \
+border-radius: 2\
+px;\x0a}\x0a\x0aQListWidg\
+et::item:selecte\
+d {\x0a    backgrou\
+nd-color: #008AA\
+B;\x0a    color: wh\
+ite;\x0a}\x0a\x0aQListWid\
+get::item:hover \
+{\x0a    background\
 -color: #e8f6f9;\
-\x0d\x0a}\x0d\x0a\x0d\x0a/* \xe9\x80\xb2\xe5\xba\xa6\
-\xe6\xa2\x9d */\x0d\x0aQProgres\
-sBar {\x0d\x0a    bord\
-er: none;\x0d\x0a    b\
-ackground-color:\
- #e0e0e0;\x0d\x0a    b\
-order-radius: 3p\
-x;\x0d\x0a    text-ali\
-gn: center;\x0d\x0a   \
- color: #333333;\
-\x0d\x0a}\x0d\x0a\x0d\x0aQProgress\
-Bar::chunk {\x0d\x0a  \
-  background-col\
-or: #008AAB;\x0d\x0a  \
-  border-radius:\
- 3px;\x0d\x0a}\x0d\x0a\x0d\x0a/* G\
-roupBox \xe6\xa8\xa3\xe5\xbc\x8f *\
-/\x0d\x0aQGroupBox {\x0d\x0a\
-    border: 1px \
-solid #e0e0e0;\x0d\x0a\
+\x0a}\x0a\x0a/* \xe9\x80\xb2\xe5\xba\xa6\xe6\xa2\x9d\
+ */\x0aQProgressBar\
+ {\x0a    border: n\
+one;\x0a    backgro\
+und-color: #e0e0\
+e0;\x0a    border-r\
+adius: 3px;\x0a    \
+text-align: cent\
+er;\x0a    color: #\
+333333;\x0a}\x0a\x0aQProg\
+ressBar::chunk {\
+\x0a    background-\
+color: #008AAB;\x0a\
     border-radiu\
-s: 4px;\x0d\x0a    mar\
-gin-top: 12px;\x0d\x0a\
-    padding-top:\
- 8px;\x0d\x0a    backg\
-round-color: #f5\
-f5f5;/*palette(w\
-indow);  \xe4\xbd\xbf\xe7\x94\xa8\xe7\
-\xb3\xbb\xe7\xb5\xb1\xe8\xaa\xbf\xe8\x89\xb2\xe6\x9d\xbf\xe7\x9a\
-\x84\xe7\xaa\x97\xe5\x8f\xa3\xe9\xa1\x8f\xe8\x89\xb2 */\
-\x0d\x0a}\x0d\x0a\x0d\x0aQGroupBox\
-::title {\x0d\x0a    c\
-olor: #008AAB;\x0d\x0a\
-    margin-top: \
--12px;\x0d\x0a    marg\
-in-left: 8px;\x0d\x0a \
-   padding: 0 5p\
-x;\x0d\x0a    backgrou\
-nd-color: #f5f5f\
-5;/*palette(wind\
-ow);  \xe4\xbd\xbf\xe7\x94\xa8\xe7\xb3\xbb\xe7\
-\xb5\xb1\xe8\xaa\xbf\xe8\x89\xb2\xe6\x9d\xbf\xe7\x9a\x84\xe7\xaa\
-\x97\xe5\x8f\xa3\xe9\xa1\x8f\xe8\x89\xb2 */\x0d\x0a \
+s: 3px;\x0a}\x0a\x0a/* Gr\
+oupBox \xe6\xa8\xa3\xe5\xbc\x8f */\
+\x0aQGroupBox {\x0a   \
+ border: 1px sol\
+id #e0e0e0;\x0a    \
+border-radius: 4\
+px;\x0a    margin-t\
+op: 12px;\x0a    pa\
+dding-top: 8px;\x0a\
+    background-c\
+olor: #f5f5f5;/*\
+palette(window);\
+  \xe4\xbd\xbf\xe7\x94\xa8\xe7\xb3\xbb\xe7\xb5\xb1\xe8\xaa\
+\xbf\xe8\x89\xb2\xe6\x9d\xbf\xe7\x9a\x84\xe7\xaa\x97\xe5\x8f\xa3\
+\xe9\xa1\x8f\xe8\x89\xb2 */\x0a}\x0a\x0aQGr\
+oupBox::title {\x0a\
+    color: #008A\
+AB;\x0a    margin-t\
+op: -12px;\x0a    m\
+argin-left: 8px;\
+\x0a    padding: 0 \
+5px;\x0a    backgro\
+und-color: #f5f5\
+f5;/*palette(win\
+dow);  \xe4\xbd\xbf\xe7\x94\xa8\xe7\xb3\xbb\
+\xe7\xb5\xb1\xe8\xaa\xbf\xe8\x89\xb2\xe6\x9d\xbf\xe7\x9a\x84\xe7\
+\xaa\x97\xe5\x8f\xa3\xe9\xa1\x8f\xe8\x89\xb2 */\x0a \
    font-weight: \
-bold;\x0d\x0a}\x0d\x0a\x0d\x0a/* \xe6\
-\xa8\x99\xe7\xb1\xa4\xe6\xa8\xa3\xe5\xbc\x8f */\x0d\x0a\
-QLabel {\x0d\x0a    co\
-lor: #333333;\x0d\x0a}\
-\x0d\x0a\x0d\x0a/* MenuBar \xe6\
-\xa8\xa3\xe5\xbc\x8f */\x0d\x0aQMenuB\
-ar {\x0d\x0a    backgr\
-ound-color: whit\
-e;\x0d\x0a    border-b\
-ottom: 1px solid\
- #e0e0e0;\x0d\x0a}\x0d\x0a\x0d\x0a\
-QMenuBar::item {\
-\x0d\x0a    padding: 8\
-px 12px;\x0d\x0a    ba\
+bold;\x0a}\x0a\x0a/* \xe6\xa8\x99\xe7\
+\xb1\xa4\xe6\xa8\xa3\xe5\xbc\x8f */\x0aQLab\
+el {\x0a    color: \
+#333333;\x0a}\x0a\x0a/* M\
+enuBar \xe6\xa8\xa3\xe5\xbc\x8f */\
+\x0aQMenuBar {\x0a    \
+background-color\
+: white;\x0a    bor\
+der-bottom: 1px \
+solid #e0e0e0;\x0a}\
+\x0a\x0aQMenuBar::item\
+ {\x0a    padding: \
+8px 12px;\x0a    ba\
 ckground-color: \
-transparent;\x0d\x0a}\x0d\
-\x0a\x0d\x0aQMenuBar::ite\
-m:selected {\x0d\x0a  \
-  background-col\
-or: #008AAB;\x0d\x0a  \
-  color: white;\x0d\
-\x0a}\x0d\x0a\x0d\x0a/* Menu \xe6\xa8\
-\xa3\xe5\xbc\x8f */\x0d\x0aQMenu {\
-\x0d\x0a    background\
--color: white;\x0d\x0a\
-    border: 1px \
-solid #e0e0e0;\x0d\x0a\
-    padding: 4px\
-;\x0d\x0a}\x0d\x0a\x0d\x0aQMenu::i\
-tem {\x0d\x0a    paddi\
-ng: 8px 24px;\x0d\x0a \
-   border-radius\
-: 2px;\x0d\x0a}\x0d\x0a\x0d\x0aQMe\
-nu::item:selecte\
-d {\x0d\x0a    backgro\
-und-color: #008A\
-AB;\x0d\x0a    color: \
-white;\x0d\x0a}\x0d\x0a\x0d\x0a/* \
-StatusBar \xe6\xa8\xa3\xe5\xbc\x8f\
- */\x0d\x0aQStatusBar \
-{\x0d\x0a    backgroun\
-d-color: white;\x0d\
-\x0a    color: #333\
-333;\x0d\x0a}\x0d\x0a\x0d\x0a/* \xe7\x89\
-\xb9\xe6\xae\x8a\xe6\xa8\x99\xe7\xb1\xa4\xe6\xa8\xa3\xe5\xbc\x8f\
-\xef\xbc\x88\xe7\x94\xa8\xe6\x96\xbc\xe9\xa1\xaf\xe7\xa4\xba\xe9\
-\x87\x8d\xe8\xa6\x81\xe4\xbf\xa1\xe6\x81\xaf\xef\xbc\x89 *\
-/\x0d\x0aQLabel#Lb_DUT\
- {\x0d\x0a    font-siz\
-e: 34px;\x0d\x0a    fo\
-nt-weight: bold;\
-\x0d\x0a    color: #00\
-4d99;\x0d\x0a}\x0d\x0a\x0d\x0a/* \xe5\
-\xb0\x8f\xe6\xa8\x99\xe9\xa0\xad */\x0d\x0aQLa\
-bel[type=\x22sTitle\
-\x22]\x0d\x0a{\x0d\x0a    color\
-: #008AAB;\x0d\x0a    \
-font-size: 16px;\
-\x0d\x0a    font-weigh\
-t: bold;\x0d\x0a}\x0d\x0a\x0d\x0a/\
-* \xe6\xb8\xac\xe8\xa9\xa6\xe8\xa8\x88\xe6\x95\xb8\xe5\x99\
-\xa8 */\x0d\x0aQLabel[obj\
-ectName=\x22Lb_Coun\
-tPass\x22],\x0d\x0aQLabel\
+transparent;\x0a}\x0a\x0a\
+QMenuBar::item:s\
+elected {\x0a    ba\
+ckground-color: \
+#008AAB;\x0a    col\
+or: white;\x0a}\x0a\x0a/*\
+ Menu \xe6\xa8\xa3\xe5\xbc\x8f */\x0a\
+QMenu {\x0a    back\
+ground-color: wh\
+ite;\x0a    border:\
+ 1px solid #e0e0\
+e0;\x0a    padding:\
+ 4px;\x0a}\x0a\x0aQMenu::\
+item {\x0a    paddi\
+ng: 8px 24px;\x0a  \
+  border-radius:\
+ 2px;\x0a}\x0a\x0aQMenu::\
+item:selected {\x0a\
+    background-c\
+olor: #008AAB;\x0a \
+   color: white;\
+\x0a}\x0a\x0a/* StatusBar\
+ \xe6\xa8\xa3\xe5\xbc\x8f */\x0aQStat\
+usBar {\x0a    back\
+ground-color: wh\
+ite;\x0a    color: \
+#333333;\x0a}\x0a\x0a/* \xe7\
+\x89\xb9\xe6\xae\x8a\xe6\xa8\x99\xe7\xb1\xa4\xe6\xa8\xa3\xe5\xbc\
+\x8f\xef\xbc\x88\xe7\x94\xa8\xe6\x96\xbc\xe9\xa1\xaf\xe7\xa4\xba\
+\xe9\x87\x8d\xe8\xa6\x81\xe4\xbf\xa1\xe6\x81\xaf\xef\xbc\x89 \
+*/\x0aQLabel#Lb_DUT\
+ {\x0a    font-size\
+: 34px;\x0a    font\
+-weight: bold;\x0a \
+   color: #004d9\
+9;\x0a}\x0a\x0a/* \xe5\xb0\x8f\xe6\xa8\x99\xe9\
+\xa0\xad */\x0aQLabel[typ\
+e=\x22sTitle\x22]\x0a{\x0a  \
+  color: #008AAB\
+;\x0a    font-size:\
+ 16px;\x0a    font-\
+weight: bold;\x0a}\x0a\
+\x0a/* \xe6\xb8\xac\xe8\xa9\xa6\xe8\xa8\x88\xe6\x95\xb8\
+\xe5\x99\xa8 */\x0aQLabel[ob\
+jectName=\x22Lb_Cou\
+ntPass\x22],\x0aQLabel\
 [objectName=\x22Lb_\
-CountFail\x22] \x0d\x0a{\x0d\
-\x0a    background-\
-color: #f8f8f8;\x0d\
-\x0a    border: 1px\
- solid #e0e0e0;\x0d\
-\x0a    border-radi\
-us: 2px;\x0d\x0a    pa\
-dding: 2px 4px;\x0d\
-\x0a}\x0d\x0a\x0d\x0aQLineEdit#\
-Tb_CountFail {\x0d\x0a\
-    color: #ff00\
-00;\x0d\x0a}\x0d\x0a\x0d\x0aQLineE\
-dit#Tb_CountPass\
- {\x0d\x0a    color: #\
-228505;\x0d\x0a}\
+CountFail\x22] \x0a{\x0a \
+   background-co\
+lor: #f8f8f8;\x0a  \
+  border: 1px so\
+lid #e0e0e0;\x0a   \
+ border-radius: \
+2px;\x0a    padding\
+: 2px 4px;\x0a}\x0a\x0aQL\
+ineEdit#Tb_Count\
+Fail {\x0a    color\
+: #ff0000;\x0a}\x0a\x0aQL\
+ineEdit#Tb_Count\
+Pass {\x0a    color\
+: #228505;\x0a}\
 \x00\x00\x1f\xfb\
 \x00\
 \x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00 \x00\xe5\x1f\x00\
@@ -5862,16 +5863,16 @@ qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x05\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x01=\xf7\
-\x00\x00\x01\x96\x1f\x1a/\xdb\
+\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x01>\xb9\
+\x00\x00\x01\x96jSs\x00\
 \x00\x00\x00F\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x96A\xe6\xbaF\
-\x00\x00\x00t\x00\x00\x00\x00\x00\x01\x00\x00\x09h\
-\x00\x00\x01\x94\xcf\xebM\xf8\
-\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x005\x1c\
-\x00\x00\x01o1\xf0\xb8(\
-\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x01J\x06\
-\x00\x00\x01n\xa1X\xd1\xd8\
+\x00\x00\x01\xa1T2\x93{\
+\x00\x00\x00t\x00\x00\x00\x00\x00\x01\x00\x00\x0a*\
+\x00\x00\x01\x96jSs\x00\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x005\xde\
+\x00\x00\x01\x96jSs\x00\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x01J\x1a\
+\x00\x00\x01\x96jSs\x00\
 "
 
 def qInitResources():
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from PySide6.QtCore import Qt, QFile, QTextStream, QUrl
+from PySide6.QtGui import QDesktopServices
+from PySide6.QtWidgets import QDialog, QHeaderView, QTableWidgetItem
+from src.config import config
+from src.utils.log import Log
+from src.utils.report_index import ReportIndex, locate_report
+from src.views.reportSearchDialog_ui import Ui_FormReportSearchDialog
+
+class ReportSearchDialog(QDialog, Ui_FormReportSearchDialog):
+    """
+    報告搜尋視窗：以全文索引查詢 MO/SN/MAC/測試站/不良項目，雙擊結果開啟報告。
+    """
+    COLUMNS = [("時間", 'created'), ("結果", 'final_result'), ("測試站", 'station'), ("MO", 'mo'),
+               ("SN", 'sn'), ("MAC", 'mac'), ("不良項目", 'failed_items'), ("檔案", 'file_name')]
+
+    def __init__(self, *args, **kwargs):
+        super(ReportSearchDialog, self).__init__(*args, **kwargs)
+
+        self.setupUi(self)
+        # 关闭后自动销毁
+        self.setAttribute(Qt.WA_DeleteOnClose, True)
+        self._loadStylesheet(config.STYLE_FILE)
+
+        self._results = []
+        self.Table_Reports.setColumnCount(len(self.COLUMNS))
+        self.Table_Reports.setHorizontalHeaderLabels([label for label, _ in self.COLUMNS])
+        self.Table_Reports.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.Table_Reports.horizontalHeader().setStretchLastSection(True)
+
+        self.Btn_Search.clicked.connect(self.search)
+        self.Le_Query.returnPressed.connect(self.search)
+        self.Btn_Open.clicked.connect(self.open_selected)
+        self.Table_Reports.cellDoubleClicked.connect(lambda row, _: self.open_report(row))
+        self.Btn_Close.clicked.connect(self.close)
+
+    def search(self):
+        query = self.Le_Query.text().strip()
+        self._results = ReportIndex.instance().search(query) if query else []
+
+        self.Table_Reports.setRowCount(len(self._results))
+        for row, result in enumerate(self._results):
+            for col, (_, key) in enumerate(self.COLUMNS):
+                value = result[key]
+                if key == 'final_result':
+                    value = "Pass" if value else "Fail"
+                elif key == 'failed_items':
+                    value = ", ".join(value.splitlines())
+                self.Table_Reports.setItem(row, col, QTableWidgetItem(str(value)))
+        self.Lb_Status.setText(f"{len(self._results)} report(s) found.")
+
+    def open_selected(self):
+        row = self.Table_Reports.currentRow()
+        if row >= 0:
+            self.open_report(row)
+
+    def open_report(self, row: int):
+        file_name = self._results[row]['file_name']
+        path = locate_report(file_name)
+        if path is None:
+            self.Lb_Status.setText(f"找不到報告檔案: {file_name}")
+            Log.warn(f"Report file not found: {file_name}")
+            return
+        QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+    def _loadStylesheet(self, filename):
+        """
+        從指定文件加載並應用 Qt 樣式表
+
+        Args:
+            filename (str): 樣式表文件的路徑
+        """
+        style_file = QFile(filename)
+        if style_file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
+            stream = QTextStream(style_file)
+            self.setStyleSheet(stream.readAll())
+            style_file.close()
+        else:
+            print(f"無法打開樣式表文件: {filename}")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from PySide6.QtCore import Qt, QFile, QTextStream, Signal
+from PySide6.QtWidgets import QDialog, QLineEdit
+from src.config import config
+from src.utils.log import Log
+from src.utils.barcode import build_scan_fields, route_scan, fill_from_workorder, derive_product_macs
+from src.views.scanDialog_ui import Ui_FormScanDialog
+
+class ScanDialog(QDialog, Ui_FormScanDialog):
+    """
+    條碼掃描視窗 (非 modal)：所有需要的條碼一次列出，掃描槍送出 Enter 時依格式填入對應欄位並跳到下一個空欄位，
+    全部欄位有效後送出 completed。
+    """
+    completed = Signal(object)  # 收集完成的產品資訊 {'$mo1': ..., '$sn1': ..., '$mac11': ...}
+
+    STYLE_VALID = "border: 2px solid #2e7d32;"
+    STYLE_INVALID = "border: 2px solid #c62828;"
+
+    def __init__(self, script_config, *args, **kwargs):
+        super(ScanDialog, self).__init__(*args, **kwargs)
+
+        self.setupUi(self)
+        # 关闭后自动销毁
+        self.setAttribute(Qt.WA_DeleteOnClose, True)
+        self._loadStylesheet(config.STYLE_FILE)
+
+        # 腳本配置錯誤時由呼叫端處理 (ValueError)
+        self._script_config = script_config
+        self._fields, self._preset = build_scan_fields(script_config)
+        self._values = {}
+        self._edits = {}
+        for field in self._fields:
+            edit = QLineEdit(self)
+            edit.setInputMethodHints(Qt.InputMethodHint.ImhNoPredictiveText)   # 避免干擾掃描槍
+            edit.textEdited.connect(lambda text, f=field: self._validate_live(f, text))
+            edit.returnPressed.connect(lambda f=field: self._on_scan(f))
+            self.Layout_Fields.addRow(field.label, edit)
+            self._edits[field.key] = edit
+
+        self.Btn_Clear.clicked.connect(self.clear)
+        self.Btn_Cancel.clicked.connect(self.close)
+        self._focus_next()
+
+    def clear(self):
+        self._values.clear()
+        for edit in self._edits.values():
+            edit.clear()
+            edit.setStyleSheet("")
+        self.Lb_Status.setText("")
+        self._focus_next()
+
+    def _validate_live(self, field, text: str):
+        """輸入中即時顯示格式是否正確"""
+        text = text.strip()
+        self._edits[field.key].setStyleSheet("" if not text else
+                                             self.STYLE_VALID if field.validator(text) else self.STYLE_INVALID)
+
+    def _on_scan(self, field):
+        edit = self._edits[field.key]
+        scanned = edit.text().strip()
+        if not scanned:
+            return
+        target = route_scan(self._fields, self._values, scanned, preferred=field.key)
+
+        # 掃描值若屬於其他欄位，焦點欄位恢復原本的值
+        if target != field.key:
+            edit.setText(self._values.get(field.key, ""))
+            self._validate_live(field, edit.text())
+        if target is None:
+            self.Lb_Status.setText(f"'{scanned}' 不符合任何空欄位的格式或已重複，請重新掃描。")
+            Log.warn(f"Scanned value '{scanned}' does not match any open barcode field.")
+            edit.selectAll()
+            return
+
+        self._values[target] = scanned
+        target_field = next(f for f in self._fields if f.key == target)
+        self._edits[target].setText(scanned)
+        self._validate_live(target_field, scanned)
+        self.Lb_Status.setText(f"{target_field.label}: {scanned}")
+        Log.info(f"Scanned {target_field.label} -> '{scanned}'")
+
+        # 工單資料命中時帶入同一設備的其他條碼，未命中的欄位仍需掃描
+        filled = fill_from_workorder(self._fields, self._values, target)
+        for key, value in filled.items():
+            self._values[key] = value
+            self._edits[key].setText(value)
+            self._validate_live(next(f for f in self._fields if f.key == key), value)
+        if filled:
+            self.Lb_Status.setText(f"{target_field.label}: {scanned} (工單帶入 {len(filled)} 個欄位)")
+
+        if len(self._values) == len(self._fields):
+            self._complete()
+        else:
+            self._focus_next(after=field.key)
+
+    def _focus_next(self, after: str = None):
+        """焦點移到 after 之後 (循環) 的第一個空欄位"""
+        keys = [f.key for f in self._fields]
+        start = keys.index(after) + 1 if after in keys else 0
+        for key in keys[start:] + keys[:start]:
+            if key not in self._values:
+                self._edits[key].setFocus()
+                self._edits[key].selectAll()
+                return
+
+    def _complete(self):
+        product_info = {**self._preset}
+        for field in self._fields:      # 依欄位順序輸出 (MO、SN、MAC，設備 1 在前)
+            product_info[field.key] = self._values[field.key]
+        try:
+            product_info.update(derive_product_macs(self._script_config, product_info))
+        except ValueError as e:
+            # MAC1 無法推算整組 MAC (例如超出 OUI 範圍)，清除後重新掃描
+            for key in [key for key in self._values if key.startswith("$mac") and key.endswith("1")]:
+                del self._values[key]
+                self._edits[key].clear()
+                self._edits[key].setStyleSheet(self.STYLE_INVALID)
+            self.Lb_Status.setText(f"MAC 推算錯誤：{e}")
+            Log.warn(f"MAC derivation failed: {e}")
+            self._focus_next()
+            return
+        Log.info("Collected Product Info: %s", product_info)
+        self.completed.emit(product_info)
+        self.close()
+
+    def _loadStylesheet(self, filename):
+        """
+        從指定文件加載並應用 Qt 樣式表
+
+        Args:
+            filename (str): 樣式表文件的路徑
+        """
+        style_file = QFile(filename)
+        if style_file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
+            stream = QTextStream(style_file)
+            self.setStyleSheet(stream.readAll())
+            style_file.close()
+        else:
+            print(f"無法打開樣式表文件: {filename}")
@@ -1,6 +1,6 @@
 from PySide6.QtCore import QFile, QTextStream, Qt
-from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtWidgets import QMainWindow, QHeaderView
+from PySide6.QtGui import QPixmap, QIcon, QKeySequence, QShortcut
+from PySide6.QtWidgets import QMainWindow, QHeaderView, QLabel, QPushButton
 
 from src.views.ui_main_ui import Ui_MainWindow
 from src.utils.commonUtils import UiUpdater
@@ -23,6 +23,15 @@ class MainBase(QMainWindow, Ui_MainWindow):
         # 初始化表格設置
         self._initTables()
 
+        # 狀態列: 等待上傳的報告數量
+        self.Lb_UploadBacklog = QLabel("")
+        self.statusBar().addPermanentWidget(self.Lb_UploadBacklog)
+
+        # 狀態列: 報告搜尋 (Ctrl+F)
+        self.Btn_SearchReports = QPushButton("搜尋報告")
+        self.statusBar().addPermanentWidget(self.Btn_SearchReports)
+        self.Sc_SearchReports = QShortcut(QKeySequence.StandardKey.Find, self)
+
         # 設定視窗標題     
         self.setWindowTitle("Auto Testing System")
         # self.setWindowTitle("自動測試系統")
@@ -106,6 +115,8 @@ class MainBase(QMainWindow, Ui_MainWindow):
             self.Btn_OpenScript.clicked.connect(self._load_script)
             self.Btn_ReloadScript.clicked.connect(self._reload_script)
             self.Btn_Exit.clicked.connect(self.close)    
+            self.Btn_SearchReports.clicked.connect(self.show_report_search)
+            self.Sc_SearchReports.activated.connect(self.show_report_search)
             self.actionExit.triggered.connect(self.close)
 
             # 將UI信號綁定ui_updater
@@ -118,6 +129,8 @@ class MainBase(QMainWindow, Ui_MainWindow):
             UiUpdater.messageBoxDialog.connect(self.show_message_box)
             UiUpdater.failCountChanged.connect(self.set_fail_count)
             UiUpdater.passCountChanged.connect(self.set_pass_count)
+            UiUpdater.reportFinished.connect(self.on_report_finished)
+            UiUpdater.uploadBacklogChanged.connect(self.set_upload_backlog)
 
             # Update視窗
             UiUpdater.updateDialogShowed.connect(self._initUpdate)
@@ -15,12 +15,20 @@ from src.config import setting, config
 from src.utils.application import QSingleApplication
 from src.utils.script import ScriptManager
 from src.utils.perform import PerformManager
-from src.utils.record import ReportGenerator
+from src.utils.record import ReportGenerator, recover_live_reports
 from src.utils.log import Log
 from src.controllers.mainBase import MainBase
 from src.controllers.dialog.updateDialog import UpdateDialog
 from src.controllers.dialog.noticeDialog import NoticeDialog
-from src.utils.barcode import collect_product_barcodes
+from src.controllers.dialog.reportSearchDialog import ReportSearchDialog
+from src.controllers.dialog.scanDialog import ScanDialog
+from src.utils.replication import ReplicationAgent
+from src.utils.journal import DatabaseWriter, schedule_journal_replay, schedule_dimension_migration
+from src.utils.database import DatabaseManager
+from src.utils.upload import UploadSpool
+from src.utils.workorder import schedule_workorder_refresh
+from src.utils.duplicate import DuplicateGuard
+from src.utils.macalloc import reserve_product_macs
 
 #===================================================================================================
 # Window
@@ -29,6 +37,7 @@ class MainController(MainBase):
     """主窗口類，處理UI界面和所有相關的操作邏輯"""
     _loaded_script = None
     _file_name = None
+    _scan_dialog = None
 
     def __init__(self):
         super(MainController, self).__init__()
@@ -43,6 +52,31 @@ class MainController(MainBase):
         self._initSignals()
         setting.Setting.init(self)
 
+        # 重播上次中斷時遺留的結果 journal
+        schedule_journal_replay()
+
+        # 舊 Session 分批轉入 scripts / duts / dut_macs (背景進行)
+        schedule_dimension_migration()
+
+        # 舊資料庫升級後第一次啟動：由歷史 Session 建立良率統計 (Dashboard 資料來源)
+        if DatabaseManager().summary_rebuild_pending:
+            DatabaseWriter.instance().submit(DatabaseManager().rebuild_yield_summary)
+
+        # 背景複製到中央資料庫 (未設定時不啟用)
+        ReplicationAgent.start_if_configured()
+
+        # 報告上傳佇列 (接續上次未上傳的報告)
+        UploadSpool.instance()
+
+        # 上次中斷時遺留的即時報告 (保留為 _INCOMPLETE 報告)
+        recover_live_reports()
+
+        # 工單快取 (CSV/MES 批次更新，背景進行)
+        schedule_workorder_refresh()
+
+        # SN/MAC 重複檢查 (背景載入歷史通過紀錄)
+        DuplicateGuard.load_in_background()
+
     def _create_centered_checkbox(self):     
         """創建居中的checkbox widget"""    
         checkbox = QCheckBox()
@@ -57,7 +91,7 @@ class MainController(MainBase):
         """checkbox事件"""
         is_checked = state == Qt.CheckState.Checked.value  # 獲取枚舉值
         self.checkbox_states[row] = is_checked
-        Log.debug(f"Row {row} checkbox {'checked' if is_checked else 'unchecked'}")
+        Log.debug("Row %s checkbox %s", row, 'checked' if is_checked else 'unchecked')
         
         # 獲取該行的數據
         if state == Qt.CheckState.Checked.value:
@@ -92,10 +126,20 @@ class MainController(MainBase):
         )
         
         if reply == QMessageBox.Yes:
+            ReportGenerator.wait_for_reports(30000)         # 等待背景報告寫出/上傳
+            DatabaseWriter.instance().flush(timeout=5)     # 等待尚未寫入資料庫的結果
+            ReplicationAgent.shutdown()
+            UploadSpool.shutdown()
+            Log.shutdown()                                  # 寫出佇列中剩餘的日誌
             event.accept()
         else:
             event.ignore()
 
+    def show_report_search(self):
+        """報告搜尋視窗 (非 modal，測試中也可使用)"""
+        dialog = ReportSearchDialog(self)
+        dialog.show()
+
     def show_about(self):
         """關於視窗"""
         user='TEST_01'
@@ -132,13 +176,41 @@ class MainController(MainBase):
                 if testMode and hasattr(self._loaded_script, 'test_mode'):
                     self._loaded_script.test_mode = testMode
 
-            result = collect_product_barcodes(self, self._loaded_script)
-            Log.info(f"Product info collected: {result}")
-            if result:
-                Log.info(f"開始測試...")
-                self.setStartBtnText('Stop')
-                self.update_product_info(result) # 更新產品資訊
-                self.run_script(result)
+            self.show_scan_dialog()
+
+    def show_scan_dialog(self):
+        """條碼掃描視窗 (非 modal)，全部條碼有效後開始測試"""
+        if self._scan_dialog is not None:
+            self._scan_dialog.activateWindow()
+            return
+        try:
+            dialog = ScanDialog(self._loaded_script, self)
+        except ValueError as e:
+            Log.error(str(e))
+            QMessageBox.critical(self, "配置錯誤", str(e))
+            return
+        self._scan_dialog = dialog
+        dialog.completed.connect(self.start_with_product_info)
+        dialog.destroyed.connect(lambda: setattr(self, '_scan_dialog', None))
+        dialog.show()
+
+    def start_with_product_info(self, result: dict):
+        """條碼收集完成後開始測試"""
+        Log.info("Product info collected: %s", result)
+        conflicts = DuplicateGuard.instance().check(result) if result else []
+        if conflicts:
+            QMessageBox.critical(self, "條碼重複", "以下條碼已貼在另一片通過的產品上，請確認標籤：\n" + "\n".join(conflicts))
+            return
+        conflicts = reserve_product_macs(result) if result else []
+        if conflicts:
+            QMessageBox.critical(self, "MAC 區段重疊", "以下 MAC 已配置給其他產品，請確認標籤：\n" + "\n".join(conflicts)
+                                 + "\n\n先前 SN 掃錯時可執行 python -m src.utils.macalloc release <SN> 釋放")
+            return
+        if result:
+            Log.info(f"開始測試...")
+            self.setStartBtnText('Stop')
+            self.update_product_info(result) # 更新產品資訊
+            self.run_script(result)
 
     def select_mode(self):
         """
@@ -355,6 +427,29 @@ class MainController(MainBase):
         """
         self.Tb_CountPass.setText(str(valid_count))
 
+    def set_upload_backlog(self, count):
+        """
+        Slot 方法
+
+        Args:
+            count (int): 等待上傳的報告數量
+        """
+        self.Lb_UploadBacklog.setText(f"待上傳報告: {count}" if count else "")
+
+    def on_report_finished(self, success, product_name):
+        """
+        Slot 方法，背景報告完成
+
+        Args:
+            success (bool): 報告是否成功生成
+            product_name (str): 產品名稱
+        """
+        if success:
+            Log.info(f"Report finished: {product_name}")
+        else:
+            Log.error(f"Report failed: {product_name}")
+            self.show_message_box("報告錯誤", f"{product_name} 測試報告生成或上傳失敗，請查看 Log。")
+
     def update_current_line(self, current_item):
         """
         Slot 方法
@@ -362,13 +457,13 @@ class MainController(MainBase):
         Args:
             current_line (str): 目前執行item的title 
         """
-        Log.debug(f"Current item: {current_item}")
+        Log.debug("Current item: %s", current_item)
         self.Tb_CurrentItem.setText(current_item) # 設定 bar value 值
         self.Tb_CurrentItem.setReadOnly(True) # 設定為唯讀
 
     def init_result_table(self):
         """Slot 方法，初始化 result table 狀態。"""
-        Log.debug(f"Init result table.")
+        Log.debug("Init result table.")
 
         table = self.Table_TestResult
         for row_index in range(table.rowCount()):
@@ -387,7 +482,7 @@ class MainController(MainBase):
 
     def update_result_table(self, row_index, value, result):
         """Slot 方法，更新 result table 測試結果"""
-        Log.debug(f"Update table index: {row_index}, result: {value}, check_result: {result}")
+        Log.debug("Update table index: %s, result: %s, check_result: %s", row_index, value, result)
         table = self.Table_TestResult
         
         if row_index >= 0 and row_index < table.rowCount():
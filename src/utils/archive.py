@@ -0,0 +1,323 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import re
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+import threading
+from datetime import datetime, date, timedelta
+
+from src.config import config
+from src.utils.log import Log
+
+try:
+    import zstandard
+except ImportError:     # 未安裝時以未壓縮格式儲存 (仍可減少檔案數量)
+    zstandard = None
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+ARCHIVE_VERSION = 1
+ARCHIVE_SUFFIX = '.rpa'             # report pack archive
+INDEX_SUFFIX = '.idx'               # sidecar index (JSON: 檔名 -> offset/length)
+LOCK_SUFFIX = '.lock'
+LOCK_STALE_SEC = 3600
+ARCHIVE_EXTENSIONS = ('.html', '.json', '.xml')
+_DATE_IN_NAME = re.compile(r'_(\d{8})_\d{6}')
+_STYLE_OPEN = re.compile(rb'<style[^>]*>', re.IGNORECASE)
+_STYLE_CLOSE = b'</style>'
+
+#===================================================================================================
+# Helpers
+#===================================================================================================
+def _compress(data: bytes) -> tuple[str, bytes]:
+    if zstandard is None:
+        return 'raw', data
+    return 'zstd', zstandard.ZstdCompressor(level=config.REPORT_ARCHIVE_ZSTD_LEVEL, write_content_size=True).compress(data)
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == 'raw':
+        return data
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("Report archive is zstd-compressed but 'zstandard' is not installed.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown report archive codec: {codec}")
+
+def _split_style(data: bytes) -> tuple[bytes, bytes | None, int]:
+    """
+    取出第一個 <style> 區塊的內容 (報告模板的 CSS)，返回 (去除 CSS 後的內容, CSS, 插回位置)。
+    """
+    match = _STYLE_OPEN.search(data)
+    if match is None:
+        return data, None, 0
+    end = data.find(_STYLE_CLOSE, match.end())
+    if end < 0:
+        return data, None, 0
+    return data[:match.end()] + data[end:], data[match.end():end], match.end()
+
+def report_date(path: str) -> date:
+    """
+    報告日期：優先使用檔名中的時間戳記 (..._YYYYMMDD_HHMMSS)，否則使用修改時間。
+    """
+    match = _DATE_IN_NAME.search(os.path.basename(path))
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%Y%m%d").date()
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(os.path.getmtime(path)).date()
+
+def archive_path(archive_dir: str, day: date) -> str:
+    return os.path.join(archive_dir, f"{day:%Y%m%d}{ARCHIVE_SUFFIX}")
+
+#===================================================================================================
+# Archive
+#===================================================================================================
+class ReportArchive:
+    """
+    每日報告封存檔：每個報告各自壓縮成獨立的 zstd frame 依序附加在 .rpa 檔，
+    sidecar 索引 (.rpa.idx) 記錄每個檔名的 offset/length，讀取單一報告只需要 seek 與解壓一個 frame。
+
+    報告模板的 CSS 只存一份 (shared)，讀取時再插回原位置，並以 sha256 驗證還原後的內容。
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return {'version': ARCHIVE_VERSION, 'shared': {}, 'members': {}}
+        if index.get('version') != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported report archive version: {index.get('version')} ({self.index_path})")
+        return index
+
+    def _save_index(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.index_path)
+
+    def names(self) -> list[str]:
+        return sorted(self._index['members'])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index['members']
+
+    #===================================================================================================
+    # Write
+    #===================================================================================================
+    def _append_frame(self, f, data: bytes) -> dict:
+        codec, payload = _compress(data)
+        offset = f.seek(0, os.SEEK_END)
+        f.write(payload)
+        return {'offset': offset, 'length': len(payload), 'codec': codec, 'size': len(data)}
+
+    def add_files(self, paths: list[str]) -> list[str]:
+        """
+        把檔案附加到封存檔 (同名檔案以新內容取代)，返回已加入的檔名。
+        資料先 fsync 再更新索引，中途中斷只會在檔尾留下未被索引的資料。
+        """
+        if not paths:
+            return []
+        added = []
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'ab') as f:
+                for path in paths:
+                    with open(path, 'rb') as src:
+                        data = src.read()
+                    entry = {'sha256': hashlib.sha256(data).hexdigest(), 'css': None, 'css_at': 0,
+                             'mtime': os.path.getmtime(path)}
+                    if path.lower().endswith('.html'):
+                        data, css, entry['css_at'] = _split_style(data)
+                        if css:
+                            css_hash = hashlib.sha256(css).hexdigest()
+                            if css_hash not in self._index['shared']:
+                                self._index['shared'][css_hash] = self._append_frame(f, css)
+                            entry['css'] = css_hash
+                    entry.update(self._append_frame(f, data))
+                    self._index['members'][os.path.basename(path)] = entry
+                    added.append(os.path.basename(path))
+                f.flush()
+                os.fsync(f.fileno())
+            self._save_index()
+        return added
+
+    #===================================================================================================
+    # Read
+    #===================================================================================================
+    @staticmethod
+    def _read_frame(f, entry: dict) -> bytes:
+        f.seek(entry['offset'])
+        data = _decompress(entry['codec'], f.read(entry['length']))
+        if len(data) != entry['size']:
+            raise IOError(f"Report archive frame size mismatch at offset {entry['offset']}")
+        return data
+
+    def read(self, name: str) -> bytes:
+        """
+        讀取單一報告 (只解壓該報告與其共用 CSS)。
+        """
+        entry = self._index['members'].get(name)
+        if entry is None:
+            raise KeyError(name)
+        with open(self.path, 'rb') as f:
+            data = self._read_frame(f, entry)
+            if entry['css']:
+                css = self._read_frame(f, self._index['shared'][entry['css']])
+                data = data[:entry['css_at']] + css + data[entry['css_at']:]
+        if hashlib.sha256(data).hexdigest() != entry['sha256']:
+            raise IOError(f"Report archive checksum mismatch: {name} ({self.path})")
+        return data
+
+    def extract(self, name: str, target_dir: str) -> str:
+        """
+        解出單一報告到 target_dir，返回檔案路徑。
+        """
+        os.makedirs(target_dir, exist_ok=True)
+        target = os.path.join(target_dir, name)
+        with open(target, 'wb') as f:
+            f.write(self.read(name))
+        return target
+
+#===================================================================================================
+# Archiver
+#===================================================================================================
+def _acquire_lock(path: str) -> bool:
+    """
+    以 O_EXCL 建立 lock 檔，避免多台電腦同時封存同一天 (超過 LOCK_STALE_SEC 的 lock 視為殘留)。
+    """
+    lock_path = path + LOCK_SUFFIX
+    try:
+        if time.time() - os.path.getmtime(lock_path) > LOCK_STALE_SEC:
+            os.remove(lock_path)
+    except OSError:
+        pass
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        return True
+    except FileExistsError:
+        return False
+
+def _release_lock(path: str):
+    try:
+        os.remove(path + LOCK_SUFFIX)
+    except OSError:
+        pass
+
+def archive_directory(directory: str, before: date = None, archive_dir: str = None) -> list[str]:
+    """
+    把 directory 內 before (不含) 之前的報告依日期封存，驗證後刪除原始檔案，返回有更新的封存檔。
+
+    Args:
+        directory (str):    報告目錄 (REPORT_UPLOAD_PATH 或 REPORT_FILE_PATH)
+        before (date):      (Optional) 只封存這天之前的報告，預設為 REPORT_ARCHIVE_AFTER_DAYS 天前
+        archive_dir (str):  (Optional) 封存檔目錄，預設為 directory/REPORT_ARCHIVE_DIRNAME
+    """
+    before = before or date.today() - timedelta(days=config.REPORT_ARCHIVE_AFTER_DAYS - 1)
+    archive_dir = archive_dir or os.path.join(directory, config.REPORT_ARCHIVE_DIRNAME)
+
+    by_day = {}
+    try:
+        entries = [e for e in os.scandir(directory)
+                   if e.is_file() and e.name.lower().endswith(ARCHIVE_EXTENSIONS)]
+    except FileNotFoundError:
+        return []
+    for entry in entries:
+        day = report_date(entry.path)
+        if day < before:
+            by_day.setdefault(day, []).append(entry.path)
+
+    updated = []
+    for day, paths in sorted(by_day.items()):
+        path = archive_path(archive_dir, day)
+        os.makedirs(archive_dir, exist_ok=True)
+        if not _acquire_lock(path):
+            Log.warn(f"Report archive is locked by another process, skipped: {path}")
+            continue
+        try:
+            archive = ReportArchive(path)
+            names = archive.add_files(sorted(paths))
+            verified = ReportArchive(path)      # 由磁碟重新讀取索引驗證後才刪除原始檔
+            for source, name in zip(sorted(paths), names):
+                with open(source, 'rb') as f:
+                    if verified.read(name) != f.read():
+                        raise IOError(f"Report archive verification failed: {name}")
+            for source in paths:
+                os.remove(source)
+            updated.append(path)
+            Log.info(f"Archived {len(names)} report file(s) to {path}")
+        except Exception as e:
+            Log.error(f"封存報告時發生錯誤 ({day}): {e}", exc_info=True)
+        finally:
+            _release_lock(path)
+    return updated
+
+def find_archived_report(name: str, directories: list[str] = None) -> str | None:
+    """
+    在封存檔中尋找報告並解出到暫存目錄，返回檔案路徑；找不到時返回 None。
+    """
+    directories = directories or [config.REPORT_UPLOAD_PATH, config.REPORT_FILE_PATH]
+    match = _DATE_IN_NAME.search(name)
+    for directory in directories:
+        archive_dir = os.path.join(directory, config.REPORT_ARCHIVE_DIRNAME)
+        if match:
+            candidates = [os.path.join(archive_dir, f"{match.group(1)}{ARCHIVE_SUFFIX}")]
+        else:
+            try:
+                candidates = sorted((e.path for e in os.scandir(archive_dir) if e.name.endswith(ARCHIVE_SUFFIX)),
+                                    reverse=True)
+            except FileNotFoundError:
+                continue
+        for path in candidates:
+            if not os.path.exists(path + INDEX_SUFFIX):
+                continue
+            archive = ReportArchive(path)
+            if name in archive:
+                return archive.extract(name, os.path.join(tempfile.gettempdir(), 'autotesting_reports'))
+    return None
+
+#===================================================================================================
+# Main
+#===================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack daily test reports into compressed archives (nightly task)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    pack = sub.add_parser("pack", help="封存報告目錄內的舊報告")
+    pack.add_argument("directory", nargs="?", default=None, help="報告目錄 (預設 REPORT_UPLOAD_PATH)")
+    pack.add_argument("--days", type=int, default=None, help="封存幾天前的報告 (預設 REPORT_ARCHIVE_AFTER_DAYS)")
+
+    ls = sub.add_parser("list", help="列出封存檔內的報告")
+    ls.add_argument("archive")
+
+    get = sub.add_parser("extract", help="解出單一報告")
+    get.add_argument("archive")
+    get.add_argument("name")
+    get.add_argument("--output", default=".", help="輸出目錄")
+    args = parser.parse_args(argv)
+
+    if args.command == "pack":
+        before = date.today() - timedelta(days=args.days - 1) if args.days else None
+        for path in archive_directory(args.directory or config.REPORT_UPLOAD_PATH, before):
+            print(path)
+    elif args.command == "list":
+        print("\n".join(ReportArchive(args.archive).names()))
+    else:
+        print(ReportArchive(args.archive).extract(args.name, args.output))
+
+if __name__ == "__main__":
+    main()
@@ -1,293 +1,136 @@
-from PySide6.QtWidgets import QWidget, QMessageBox, QInputDialog
-from PySide6.QtCore import Qt
+from dataclasses import dataclass
+from typing import Callable
 
-import src.utils.commonUtils as commonUtils
+from src.utils.validators import DEFAULT_VALIDATORS
 from src.utils.script import Script
 from src.utils.log import Log
 
-def _scan_with_input_dialog(parent_widget: QWidget, prompt: str, title: str ="掃描條碼") -> str:
+#===================================================================================================
+# Scan form (一次顯示所有條碼欄位)
+#===================================================================================================
+@dataclass
+class ScanField:
+    key: str                            # 結果字典的鍵，例如 "$mo1"、"$mac12"
+    barcode_type: str                   # 顯示用類型，例如 "MO"、"MAC-2"
+    device_id: int                      # 設備編號 (1 起算)
+    validator: Callable[[str], bool]    # 已編譯的條碼驗證器
+
+    @property
+    def label(self) -> str:
+        return f"[{self.device_id}] {self.barcode_type}"
+
+def build_scan_fields(script_config: Script) -> tuple[list[ScanField], dict]:
     """
-    使用 PySide6 的 QInputDialog 來模擬掃描條碼。
-
-    Args:
-        parent_widget (QWidget): 呼叫此對話方塊的父視窗元件。
-        prompt (str): 顯示在輸入對話方塊中的提示文字。
-        title (str): 輸入對話方塊的視窗標題。
+    依腳本配置列出需要掃描的條碼欄位 (MO；需要 SN 時再加上 SN 與 MAC，MAC 推算模式只掃描 MAC1)。
 
     Returns:
-        str: 使用者輸入的文字，如果取消或輸入為空，則返回 'N/A'。
-    """
-    if not isinstance(parent_widget, QWidget):
-        Log.error("Invalid parent widget provided for QInputDialog.")
-        # 或者可以引發 TypeError
-        # raise TypeError("parent_widget must be a QWidget instance.")
-        return 'N/A'
-    
-    try:
-        # 顯示文字輸入對話方塊
-        # 返回值是 (text, ok_pressed) 的元組
-        text, ok = QInputDialog.getText(
-            parent_widget, 
-            title, 
-            prompt, 
-            inputMethodHints = Qt.InputMethodHint.ImhNoPredictiveText
-            ) # 增加 ImhNoPredictiveText 避免干擾掃描槍
+        tuple: (欄位列表, 不需掃描但須預填 'N/A' 的結果)
 
-        if ok:
-            # 使用者點擊了 OK
-            cleaned_text = text.strip() if text else "" # 確保 text 不是 None 才 strip
-            if cleaned_text:
-                Log.info(f"Input dialog received: '{cleaned_text}' for prompt: '{prompt}'")
-                return cleaned_text
-            else:
-                Log.warn(f"Input dialog received empty input for prompt: '{prompt}', treating as N/A.")
-                # QMessageBox.warning(parent_widget, "輸入警告", "掃描輸入為空。")
-                # return 'N/A'
-                return cleaned_text
+    Raises:
+        ValueError: 腳本缺少某個設備的產品配置
+    """
+    fields, preset = [], {}
+    num_devices = getattr(script_config, 'pairing', 0) + 1
+    products = getattr(script_config, 'product', [])
+    for i in range(num_devices):
+        device_id = i + 1
+        if device_id > len(products):
+            raise ValueError(f"腳本配置錯誤：找不到第 {device_id} 個產品的配置信息。")
+        product_config = products[i]
+        sn_count = getattr(product_config, 'sn_count', 0)
+        mac_count = getattr(product_config, 'mac_count', 0)
+        validators = {**DEFAULT_VALIDATORS, **(getattr(product_config, 'barcodes', None) or {})}
+
+        fields.append(ScanField(f"$mo{device_id}", "MO", device_id, validators['MO']))
+        if sn_count > 0:
+            fields.append(ScanField(f"$sn{device_id}", "SN", device_id, validators['SN']))
+            if getattr(product_config, 'mac_derivation', '') == 'sequential':
+                mac_count = min(mac_count, 1)   # 其餘 MAC 由 derive_product_macs 推算
+            for mac_index in range(1, mac_count + 1):
+                fields.append(ScanField(f"$mac{device_id}{mac_index}", f"MAC-{mac_index}", device_id, validators['MAC']))
         else:
-            # 使用者點擊了 Cancel
-            Log.warn(f"Input dialog cancelled by user for prompt: '{prompt}'. Returning N/A.")
-            return 'N/A'
+            preset[f"$sn{device_id}"] = 'N/A'
+    return fields, preset
 
-    except Exception as e:
-        Log.error(f"Error displaying input dialog: {e}", exc_info=True)
-        # 顯示錯誤訊息給使用者
-        QMessageBox.critical(parent_widget, "錯誤", f"顯示掃描對話方塊時發生錯誤:\n{e}")
-        return 'N/A'   
-    
-def _maybe_allow_na(barcode_type: str) -> bool:
-    """
-    決定特定類型的條碼是否允許 'N/A' (未掃描/取消)。
-    在這裡你可以根據實際需求自訂邏輯。
-    例如，MO 和 SN 可能不允許 N/A，但 MAC 可以。
+def route_scan(fields: list[ScanField], values: dict, scanned: str, preferred: str = None) -> str | None:
     """
-    if barcode_type in ["MO"]:
-        return False # 不允許 N/A
-    else:
-        return True # 允許 N/A
-    
-def collect_product_barcodes_old(parent_widget: QWidget, script_config: Script) -> dict | None:
-    """
-    根據腳本配置，使用 PySide6 InputDialog 收集條碼。
+    決定掃描值要填入哪個欄位，讓操作員可依任意順序掃描。
+
+    優先順序：目前焦點所在的欄位 (已有值時為重掃覆蓋) -> 第一個格式相符的空欄位。
+    同一個值不會填入兩個欄位。
 
     Args:
-        script_config (dict): 包含腳本設定的字典。
+        fields (list):      build_scan_fields 的欄位列表
+        values (dict):      目前已填入的有效值 {key: value}
+        scanned (str):      掃描值
+        preferred (str):    (Optional) 目前焦點所在欄位的 key
 
     Returns:
-        dict: 包含掃描到的產品資訊的字典，或在出錯時返回 None。
+        str | None: 欄位 key；沒有相符欄位時返回 None
     """
-    product_info = {}
-    active_device_id = 0 # 用於錯誤日誌
-    
-    try:
-        pairing_mode = getattr(script_config, 'pairing', 0) # 取得 pairing 模式，預設為 0 (不配對)
-        num_devices_to_scan = pairing_mode + 1
-        Log.info(f"Starting barcode collection for {num_devices_to_scan} device(s).")
-
-        for i in range(num_devices_to_scan):
-            active_device_id = i + 1
-            Log.info(f"--- Processing Device {active_device_id} ---")
-
-            if i >= len(getattr(script_config, 'product', [])):
-                Log.error(f"Script config 'product' list does not have an element at index {i}.")
-                QMessageBox.critical(parent_widget, "配置錯誤", f"腳本配置缺少第 {i+1} 個產品的資訊。")
-                return None
-            
-            product_config = script_config.product[i]
-            use_sn = getattr(product_config[i],'sn_count', 0)
-            use_mac = getattr(product_config[i], 'mac_count', 0)
-
-            mo_key = f"$mo{active_device_id}"
-            sn_key = f"$sn{active_device_id}"
-
-            # --- 掃描 MO ---
-            result = _scan_with_input_dialog(parent_widget,f"[{active_device_id}] 請掃描 MO 條碼:")
-            if result == 'N/A' and not _maybe_allow_na("MO"): # 如果 MO 不允許 N/A
-                Log.error(f"MO scan for device {active_device_id} failed or was cancelled.")
-                # 可以在此處中止流程或提示重試
-                QMessageBox.critical(parent_widget, "掃描失敗", f"設備 {active_device_id} 的 MO 條碼掃描失敗或被取消，流程中止。")
-                return None # 中止流程
-            product_info[mo_key] = result
-
-            # --- 掃描 SN ---
-            if use_sn:
-                result = _scan_with_input_dialog(parent_widget, f"[{active_device_id}] 請掃描 SN 條碼:")
-                if result == 'N/A' and not _maybe_allow_na("SN"): # 如果 SN 不允許 N/A
-                    Log.error(f"SN scan for device {active_device_id} failed or was cancelled.")
-                    QMessageBox.critical(parent_widget, "掃描失敗", f"設備 {active_device_id} 的 SN 條碼掃描失敗或被取消，流程中止。")
-                    return None
-                product_info[sn_key] = result
-            else:
-                Log.info(f"[{active_device_id}] 不需要掃描 SN.")
-                product_info[sn_key] = 'N/A'
-
-            # --- 掃描 MAC ---
-            if use_sn and use_mac: # 只有需要 SN 且需要 MAC 時才掃描 MAC1
-                for mac_index in range(1, use_mac + 1):
-                    mac_key = f"$mac{active_device_id}{mac_index}"
-                    result = _scan_with_input_dialog(parent_widget, f"[{active_device_id}] 請掃描 MAC-{mac_index} 條碼:")
-                    if result == 'N/A' and not _maybe_allow_na(f"MAC-{mac_index}"): # 如果 MAC1 不允許 N/A
-                        Log.error(f"MAC-1 scan for device {active_device_id} failed or was cancelled.")
-                        QMessageBox.critical(parent_widget, "掃描失敗", f"設備 {active_device_id} 的 MAC-{mac_index} 條碼掃描失敗或被取消，流程中止。")
-                        return None
-                    product_info[mac_key] = result
-
-            Log.info(f"--- Device {active_device_id} processing complete ---")
-
-        Log.info("--- All barcode collection finished ---")
-        Log.info(f"Collected Product Info: {product_info}")
-        return product_info
+    if not scanned or any(value == scanned for key, value in values.items() if key != preferred):
+        return None
+    matching = [f.key for f in fields if f.validator(scanned)]
+    if preferred in matching:
+        return preferred
+    return next((key for key in matching if not values.get(key)), None)
 
-    except Exception as e:
-        Log.error(f"Unexpected error during barcode collection: {e}", exc_info=True)
-        QMessageBox.critical(parent_widget, "嚴重錯誤", f"收集條碼過程中發生意外錯誤:\n{e}")
-        return None # 返回 None 表示流程失敗     
-    
-def collect_product_barcodes(parent_widget: QWidget, script_config: Script) -> dict | None:
+def fill_from_workorder(fields: list[ScanField], values: dict, scanned_key: str) -> dict:
     """
-    根據腳本配置，使用 PySide6 InputDialog 收集條碼。
+    以剛掃描的值查詢工單資料，返回同一設備其他空欄位可帶入的值 (須通過該欄位的驗證器)。
 
     Args:
-        script_config (dict): 包含腳本設定的字典。
+        fields (list):      build_scan_fields 的欄位列表
+        values (dict):      目前已填入的值 (包含剛掃描的欄位)
+        scanned_key (str):  剛掃描的欄位 key
 
     Returns:
-        dict: 包含掃描到的產品資訊的字典，或在出錯時返回 None。
+        dict: {key: value}；查無工單或沒有可帶入的欄位時為空字典
     """
-    product_info = {}
-    active_device_id = 0 # 用於錯誤日誌
-    
-    try:
-        pairing_mode = getattr(script_config, 'pairing', 0) # 取得 pairing 模式，預設為 0 (不配對)
-        num_devices_to_scan = pairing_mode + 1
-        Log.info(f"Starting barcode collection for {num_devices_to_scan} device(s).")
-
-        # --- 嵌套的掃描與驗證輔助函數 ---
-        def _scan_and_validate(
-            barcode_type: str,
-            barcode_key: str,
-            scan_prompt: str,
-            validator, # 驗證函數，例如 validators.is_mo
-            allow_na: bool,
-            validation_args: dict = None # 傳遞給驗證函數的額外參數
-        ) -> bool:
-            """
-            處理單個條碼的掃描、驗證、重試迴圈。
-
-            Args:
-                barcode_type: 條碼類型 (用於日誌和錯誤訊息, e.g., "MO", "SN").
-                barcode_key: 儲存結果時使用的字典鍵 (e.g., "$mo1").
-                scan_prompt: 顯示給使用者的掃描提示。
-                validator: 用於驗證輸入的函數。
-                allow_na: 是否允許此條碼為 'N/A' (使用者取消或空輸入)。
-                validation_args: 傳遞給 validator 函數的關鍵字參數字典。
-
-            Returns:
-                True: 如果掃描和驗證成功 (或允許 N/A)。
-                False: 如果掃描失敗且 *不* 允許 N/A，表示應中止流程。
-            """
-            nonlocal product_info, active_device_id # 允許修改外部的 product_info
-            current_device_id = active_device_id # 捕獲當前設備ID用於錯誤消息
-
-            while True: # 驗證失敗時的重試迴圈
-                scanned_value = _scan_with_input_dialog(parent_widget, scan_prompt)
-
-                if scanned_value == 'N/A':
-                    if not allow_na:
-                        msg = f"設備 {current_device_id} 的必要 {barcode_type} 條碼掃描失敗或被取消，流程中止。"
-                        Log.error(msg)
-                        QMessageBox.critical(parent_widget, "掃描失敗", msg)
-                        return False # 中止信號
-                    else:
-                        Log.warn(f"Optional {barcode_type} scan for device {current_device_id} cancelled or empty.")
-                        product_info[barcode_key] = 'N/A' # 記錄為 N/A
-                        return True # 成功 (因為允許 N/A)
-
-                # --- 執行驗證 ---
-                validation_kwargs = validation_args if validation_args else {}
-                try:
-                    is_valid = validator(scanned_value, **validation_kwargs)
-                except Exception as val_err:
-                    Log.error(f"Validator function for {barcode_type} raised an error: {val_err}", exc_info=True)
-                    QMessageBox.critical(parent_widget,"驗證錯誤",f"驗證 {barcode_type} 時發生內部錯誤。")
-                    # 考慮是否中止流程
-                    return False # 或者 True 如果允許跳過？取決於策略
-
-                if is_valid:
-                    Log.info(f"Validation successful for {barcode_type} (Device {current_device_id}): '{scanned_value}'")
-                    product_info[barcode_key] = scanned_value # 儲存有效值
-                    return True # 成功，跳出重試迴圈
-                else:
-                    # 驗證失敗，提示重試
-                    Log.warn(f"Invalid format for {barcode_type} (Device {current_device_id}): '{scanned_value}'. Please rescan.")
-                    QMessageBox.warning(parent_widget, "輸入格式錯誤",
-                                        f"掃描的 {barcode_type} '{scanned_value}' 格式不正確。\n請重新掃描。")
-                    # 迴圈繼續，再次呼叫 _scan_with_input_dialog
-
-         # --- 主迴圈：處理每個設備 ---
-        for i in range(num_devices_to_scan):
-            active_device_id = i + 1
-            Log.info(f"--- Processing Device {active_device_id} ---")
-
-            if active_device_id > len(getattr(script_config, 'product', [])):
-                msg = f"腳本配置錯誤：找不到第 {active_device_id} 個產品的配置信息。"
-                Log.error(msg)
-                QMessageBox.critical(parent_widget, "配置錯誤", msg)
-                return None
-            
-            product_config = script_config.product[i]
-            sn_count = getattr(product_config,'sn_count', 0)
-            mac_count = getattr(product_config, 'mac_count', 0)
-
-            # --- 掃描 MO ---
-            mo_key = f"$mo{active_device_id}"
-            mo_prompt = f"[{active_device_id}] 請掃描 MO 條碼:"
-            mo_validator = lambda x: commonUtils.is_mo(x) or commonUtils.is_pcb(x) or commonUtils.is_testjig(x) # 允許 MO、PCB 或 TestJig
-            if not _scan_and_validate("MO", mo_key, mo_prompt, mo_validator, allow_na=False):
-                # 如果掃描失敗且不允許 N/A，則中止流程
-                return None
-
-            # --- 掃描 SN ---
-            sn_key = f"$sn{active_device_id}"
-            if sn_count > 0:
-                sn_prompt = f"[{active_device_id}] 請掃描 SN 條碼:"
-                if not _scan_and_validate("SN", sn_key, sn_prompt, commonUtils.is_sn_nosign, allow_na=False):
-                    # 如果掃描失敗且不允許 N/A，則中止流程
-                    return None
-            else:    
-                Log.info(f"[{active_device_id}] Skipping SN scan (sn_count={sn_count}).")
-                product_info[sn_key] = 'N/A' # 確保有 SN 鍵，即使未掃描
-
-            # --- 掃描 MAC ---
-            if sn_count > 0 and mac_count > 0: # 只有需要 SN 且需要 MAC 時才掃描 MAC1
-                Log.info(f"[{active_device_id}] Skipping MAC scan (mac_count={mac_count}).")
-                for mac_index in range(1, mac_count + 1):
-                    mac_key = f"$mac{active_device_id}{mac_index}"
-                    mac_type = f"MAC-{mac_index}"
-                    mac_prompt = f"[{active_device_id}] 請掃描 {mac_type} 條碼:"
-                    mac_validator = lambda x: commonUtils.is_mac(x) or commonUtils.is_mac_nosign(x) # 允許帶符號或不帶符號的 MAC
-                    if not _scan_and_validate(mac_type, mac_key, mac_prompt, mac_validator, allow_na=False):
-                         # 即使 _scan_and_validate 返回 False (理論上在 allow_na=True 時不會)
-                         # 但如果 validator 內部出錯可能返回 False，這裡決定是否中止
-                         Log.error(f"Critical error during optional MAC scan for {mac_key}. Aborting.")
-                         return None # 決定中止
-                    # 如果返回 True, 值已存入 product_info (可能是有效 MAC 或 'N/A')
-            else:
-                # 確保即使不掃描 MAC，後續邏輯也不會因缺少鍵而出錯 (如果需要的話)
-                # 目前做法：不掃描就不添加 MAC 鍵
-                if sn_count > 0:
-                    Log.info(f"[{active_device_id}] 不需要掃描 MAC (sn_count={sn_count}, mac_count={mac_count}).")
-                   
+    from src.utils import workorder # 延遲載入：本模組不直接依賴 config
+    device_id = next((f.device_id for f in fields if f.key == scanned_key), None)
+    record = workorder.lookup(values.get(scanned_key)) if device_id is not None else None
+    if record is None:
+        return {}
+    filled = {}
+    for f in fields:
+        if f.device_id != device_id or values.get(f.key):
+            continue
+        if f.barcode_type == "MO":
+            value = record.mo
+        elif f.barcode_type == "SN":
+            value = record.sn
+        else:
+            mac_index = int(f.barcode_type.split('-')[1])
+            value = record.macs[mac_index - 1] if mac_index <= len(record.macs) else None
+        if value and f.validator(value) and value not in values.values():
+            filled[f.key] = value
+        elif value:
+            Log.warn(f"Work-order value for {f.label} is invalid or duplicated: '{value}', scan required.")
+    if filled:
+        Log.info(f"Work-order lookup for '{values.get(scanned_key)}' filled: {filled}")
+    return filled
+
+def derive_product_macs(script_config: Script, product_info: dict) -> dict:
+    """
+    依產品的 MacDerivation 由 $macN1 推算其餘 MAC ($macN2 ...)，格式與 MAC1 相同。
 
-            Log.info(f"--- Device {active_device_id} processing complete ---")
+    Returns:
+        dict: 推算出的 {key: mac}；沒有設定推算的產品不會出現
 
-        Log.info("--- All barcode collection finished ---")
-        Log.info(f"Collected Product Info: {product_info}")
-        return product_info
-    except AttributeError as ae:
-        Log.error(f"Attribute error during barcode collection: {ae}", exc_info=True)
-        QMessageBox.critical(parent_widget, "配置錯誤", f"腳本配置錯誤:\n{ae}")
-        return None
-    except Exception as e:
-        Log.error(f"Unexpected error during barcode collection: {e}", exc_info=True)
-        QMessageBox.critical(parent_widget, "嚴重錯誤", f"收集條碼過程中發生意外錯誤:\n{e}")
-        return None # 返回 None 表示流程失敗     
\ No newline at end of file
+    Raises:
+        ValueError: MAC1 格式錯誤或推算結果超出 OUI 範圍
+    """
+    from src.utils.macalloc import derive_macs # 延遲載入：本模組不直接依賴 config
+    derived = {}
+    products = getattr(script_config, 'product', [])
+    for i in range(min(getattr(script_config, 'pairing', 0) + 1, len(products))):
+        device_id = i + 1
+        product_config = products[i]
+        mac_count = getattr(product_config, 'mac_count', 0)
+        first_mac = product_info.get(f"$mac{device_id}1")
+        if getattr(product_config, 'mac_derivation', '') != 'sequential' or mac_count < 2 or first_mac in (None, '', 'N/A'):
+            continue
+        for mac_index, mac in enumerate(derive_macs(first_mac, mac_count)[1:], 2):
+            derived[f"$mac{device_id}{mac_index}"] = mac
+    return derived
@@ -5,18 +5,20 @@ import re
 import platform
 
 from PySide6.QtCore import QObject, Signal
+from src.utils.validators import COMPILED, parametrized
 
 #===================================================================================================
 # Execute asdasd
 #===================================================================================================
 class ItemResult:
-    def __init__(self, title, unit, min_val, max_val, value, result):
+    def __init__(self, title, unit, min_val, max_val, value, result, retry_count=0):
         self.title:str = title
         self.unit:str = unit
         self.min:str = min_val
         self.max:str = max_val
         self.value:str = value
         self.result:bool = result
+        self.retry_count:int = retry_count     # 重試次數 (0 代表第一次就完成)
         
 class _Signals(QObject):
     """
@@ -51,6 +53,12 @@ class _Signals(QObject):
     failCountChanged = Signal(int)                    
     """Fail次數"""
 
+    # 報告
+    reportFinished = Signal(bool, str)
+    """背景報告完成(是否成功, 產品名稱)"""
+    uploadBacklogChanged = Signal(int)
+    """等待上傳的報告數量"""
+
     # User訊息
     userNameChanged = Signal(str)
     """更新使用者名稱"""
@@ -85,16 +93,14 @@ def is_mac(check_str: str) -> bool:
     """
     if not isinstance(check_str, str): return False
     # Regex 匹配標準 MAC 格式，允許 : 或 - 作為分隔符
-    pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['mac'].fullmatch(check_str) is not None
 
 def is_mac_nosign(check_str: str) -> bool:
     """
     檢查是否為無符號的 MAC 地址格式 (XXXXXXXXXXXX)。
     """
     if not isinstance(check_str, str): return False
-    pattern = r"^[0-9A-Fa-f]{12}$"
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['mac_nosign'].fullmatch(check_str) is not None
 
 def compare_macs(mac1_str: str, mac2_str: str) -> bool:
     """
@@ -124,17 +130,14 @@ def is_mac_bci(check_str: str) -> bool:
     """
     if not isinstance(check_str, str): return False
     # Regex 匹配 00:19 或 00-19 開頭的 MAC
-    # C# 的 ([0]{2}[:-])([1]{1})([9]{1}) 可以簡化
-    pattern = r"^00[:-]19([:-][0-9A-Fa-f]{2}){4}$"
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['mac_bci'].fullmatch(check_str) is not None
 
 def is_mac_bci_nosign(check_str: str) -> bool:
     """
     檢查是否為無符號的 BCI MAC 地址格式 (0019XXXXXXXX)。
     """
     if not isinstance(check_str, str): return False
-    pattern = r"^0019([0-9A-Fa-f]{2}){4}$"
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['mac_bci_nosign'].fullmatch(check_str) is not None
 
 def is_version(check_str: str) -> bool:
     """
@@ -142,27 +145,22 @@ def is_version(check_str: str) -> bool:
     """
     if not isinstance(check_str, str): return False
     # 匹配數字 + (.-) + 兩位數字
-    pattern = r"^\d{1}[.-]\d{2}$"
-    # C# 的 [0-9]{1} 等同於 \d{1} 或 \d
-    # C# 的 [0-9]{2} 等同於 \d{2}
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['version'].fullmatch(check_str) is not None
 
 def is_sn_nosign(check_str: str, length: int = 11) -> bool:
     """
     檢查是否為指定長度的純數字 SN。
     """
     if not isinstance(check_str, str): return False
-    # 匹配指定長度的數字
-    pattern = fr"^\d{{{length}}}$" # 使用 f-string 插入長度
-    return bool(re.fullmatch(pattern, check_str))
+    # 匹配指定長度的數字 (同一長度的格式只編譯一次)
+    return parametrized('digits', length).fullmatch(check_str) is not None
 
 def is_mo(check_str: str) -> bool:
     """
     檢查是否為 MO 格式 (M 或 m 開頭，後跟 10 位數字)。
     """
     if not isinstance(check_str, str): return False
-    pattern = r"^[Mm]\d{10}$"
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['mo'].fullmatch(check_str) is not None
 
 def is_pcb(check_str: str) -> bool:
     """
@@ -170,37 +168,28 @@ def is_pcb(check_str: str) -> bool:
     注意：C# 的 [0-9A-Za-f-] 在 Python 中可以直接用，但如果允許所有字母，用 [0-9A-Za-z-]
     """
     if not isinstance(check_str, str): return False
-    pattern = r"^[Mm][0-9A-Za-z-]{21}$" # 假設允許所有字母而不僅僅是 A-F
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['pcb'].fullmatch(check_str) is not None # 假設允許所有字母而不僅僅是 A-F
 
 def is_testjig(check_str: str) -> bool:
     """
     檢查是否為 JIG 格式 (J 或 j 開頭，後跟 6 位數字)。
     """
     if not isinstance(check_str, str): return False
-    pattern =  r"^TestJig.*$"
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['testjig'].fullmatch(check_str) is not None
 
 def is_ip(check_str: str) -> bool:
     """
     檢查是否為標準 IPv4 地址格式。
     """
     if not isinstance(check_str, str): return False
-    # C# 的 IP Regex 可以直接用，但可以稍微簡化
-    # (?:...) 表示非捕獲組
-    octet = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)" # 更精確的 octet 匹配
-    pattern = fr"^{octet}\.{octet}\.{octet}\.{octet}$"
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['ip'].fullmatch(check_str) is not None
 
 def is_local_ip(check_str: str) -> bool:
     """
     檢查是否為 192.168.100.xxx 格式的 IP。
     """
     if not isinstance(check_str, str): return False
-    # C# 的實現略顯繁瑣，可以簡化
-    octet_last = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
-    pattern = fr"^192\.168\.100\.{octet_last}$"
-    return bool(re.fullmatch(pattern, check_str))
+    return COMPILED['local_ip'].fullmatch(check_str) is not None
 
 def is_valid_filename(check_str: str) -> bool:
     """
@@ -0,0 +1,153 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import argparse
+import threading
+from datetime import datetime, date
+
+from src.config import config
+from src.utils.log import Log
+from src.utils.database import DatabaseManager
+from src.utils.journal import DatabaseWriter
+from src.utils import template as template_cache
+
+UNKNOWN_STATION = 'Unknown'     # 與良率統計表相同的預設值
+
+#===================================================================================================
+# Data
+#===================================================================================================
+def _rate(part: int, total: int) -> float | None:
+    return part / total * 100 if total else None
+
+def dashboard_path(day: date, station: str) -> str:
+    safe_station = "".join(c if c.isalnum() or c in '-_' else "_" for c in station)
+    return os.path.join(config.DASHBOARD_PATH, f"{day:%Y%m%d}_{safe_station}.html")
+
+def build_dashboard_data(db_manager: DatabaseManager, day: date, station: str) -> dict:
+    """
+    由每日良率統計表 (Session 結束時累加) 組成總覽資料，不需要重新查詢當天的量測紀錄。
+
+    Returns:
+        dict: 模板資料 (各腳本版本良率、不良項目排行、重試次數與測試時間直方圖)。
+    """
+    sessions = db_manager.get_yield_summary(day, day, station=station)
+    items = db_manager.get_yield_summary(day, day, station=station, by_item=True)
+    histogram = db_manager.get_cycle_time_histogram(day, day, station=station)
+
+    versions = []
+    for row in sorted(sessions, key=lambda r: r['script_version']):
+        total = row['pass_count'] + row['fail_count']
+        versions.append({
+            'script_version': row['script_version'],
+            'total': total,
+            'pass_count': row['pass_count'],
+            'fail_count': row['fail_count'],
+            'retried_count': row['retried_count'],
+            'yield': _rate(row['pass_count'], total),
+            'avg_time_sec': row['total_time_sec_sum'] / total if total else None,
+        })
+    total = sum(v['total'] for v in versions)
+    pass_count = sum(v['pass_count'] for v in versions)
+    time_sum = sum(row['total_time_sec_sum'] for row in sessions)
+
+    # 各版本的同名項目合併計算
+    merged = {}
+    for row in items:
+        item = merged.setdefault(row['item_title'], {'item_title': row['item_title'], 'pass_count': 0,
+                                                     'fail_count': 0, 'retried_count': 0})
+        item['pass_count'] += row['pass_count']
+        item['fail_count'] += row['fail_count']
+        item['retried_count'] += row['retried_count']
+    for item in merged.values():
+        item['fail_rate'] = _rate(item['fail_count'], item['pass_count'] + item['fail_count'])
+
+    top_failing = sorted((i for i in merged.values() if i['fail_count']),
+                         key=lambda i: (-i['fail_count'], i['item_title']))[:config.DASHBOARD_TOP_ITEMS]
+    top_retried = sorted((i for i in merged.values() if i['retried_count']),
+                         key=lambda i: (-i['retried_count'], i['item_title']))[:config.DASHBOARD_TOP_ITEMS]
+
+    bucket_width = config.DASHBOARD_CYCLE_BUCKET_SEC
+    max_count = max(histogram.values(), default=0)
+    cycle_time = [{'label': f"{bucket}-{bucket + bucket_width}s", 'count': count,
+                   'width': count / max_count * 100 if max_count else 0}
+                  for bucket, count in sorted(histogram.items())]
+
+    return {
+        'report_title': f"Daily Dashboard - {station} - {day:%Y-%m-%d}",
+        'station': station,
+        'day': f"{day:%Y-%m-%d}",
+        'generated': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'total': total,
+        'pass_count': pass_count,
+        'fail_count': total - pass_count,
+        'retried_count': sum(v['retried_count'] for v in versions),
+        'yield': _rate(pass_count, total),
+        'avg_time_sec': time_sum / total if total else None,
+        'versions': versions,
+        'top_failing': top_failing,
+        'top_retried': top_retried,
+        'cycle_time': cycle_time,
+    }
+
+#===================================================================================================
+# Report
+#===================================================================================================
+def generate_dashboard(day: date, station: str, db_manager: DatabaseManager = None, output_path: str = None) -> str:
+    """
+    產生 (或覆蓋) 單一 HTML 總覽檔案，返回輸出路徑；先寫暫存檔再改名，瀏覽中的檔案不會看到一半的內容。
+    """
+    station = station or UNKNOWN_STATION
+    db_manager = db_manager or DatabaseManager()
+    output_path = output_path or dashboard_path(day, station)
+
+    report_data = build_dashboard_data(db_manager, day, station)
+    html_output = template_cache.get_template(config.DASHBOARD_TEMPLATE_FILE).render(**report_data)
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(html_output)
+    os.replace(tmp_path, output_path)
+    Log.info(f"Dashboard updated: {output_path}")
+    return output_path
+
+_pending = set()
+_pending_lock = threading.Lock()
+
+def _update_job(key: tuple):
+    with _pending_lock:
+        _pending.discard(key)
+    try:
+        generate_dashboard(*key)
+    except Exception as e:
+        Log.error(f"生成每日總覽時發生錯誤: {e}", exc_info=True)
+
+def schedule_dashboard_update(end_time: datetime, station: str):
+    """
+    (不阻塞) Session 結束後排入背景寫入執行緒重新產生當天總覽；排隊中的相同總覽只產生一次。
+    """
+    key = (end_time.date(), station or UNKNOWN_STATION)
+    with _pending_lock:
+        if key in _pending:
+            return
+        _pending.add(key)
+    DatabaseWriter.instance().submit(_update_job, key)
+
+#===================================================================================================
+# Main
+#===================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate daily dashboard per station from results.db")
+    parser.add_argument("--date", default=None, help="日期 YYYY-MM-DD (預設今天)")
+    parser.add_argument("--station", default=None, help="測試站 (預設當天所有測試站)")
+    args = parser.parse_args(argv)
+
+    day = datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else date.today()
+    db_manager = DatabaseManager()
+    stations = [args.station] if args.station else sorted({row['station'] for row in db_manager.get_yield_summary(day, day)})
+    for station in stations:
+        print(generate_dashboard(day, station, db_manager))
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 # Import the necessary modules
 #===================================================================================================
 import os
+import math
+import hashlib
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import create_engine, inspect, text, func, Column, Integer, Float, Text, Date, DateTime, ForeignKey, Boolean, Index, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 
@@ -12,17 +14,38 @@ from src.config import config
 from src.config.setting import Setting
 from src.utils.commonUtils import ItemResult
 
+try:
+    import zstandard
+except ImportError:     # 未安裝時以未壓縮格式儲存
+    zstandard = None
+
 #===================================================================================================
 # Define SQLAlchemy Models
 #===================================================================================================
 Base = declarative_base()
 
+class ScriptRecord(Base):
+    """
+    腳本維度表，以腳本內容雜湊 (sha256) 為唯一鍵；同名同版但內容不同的腳本視為不同紀錄。
+    """
+    __tablename__ = 'scripts'
+
+    script_id = Column(Integer, primary_key=True, autoincrement=True)
+    content_hash = Column(Text, nullable=False, unique=True)
+    name = Column(Text)
+    version = Column(Text)
+    file_name = Column(Text)
+    created_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (Index('ix_scripts_name_version', 'name', 'version'),)
+
 class TestSession(Base):
     __tablename__ = 'test_sessions'
     
     session_id = Column(Integer, primary_key=True, autoincrement=True)
+    script_id = Column(Integer, ForeignKey('scripts.script_id'), index=True)
     total_tests = Column(Integer)
-    script_name = Column(Text)
+    script_name = Column(Text)                      # 舊欄位，保留給既有查詢/匯出
     script_version = Column(Text, nullable=False)
 
     product_mo_tx = Column(Text)
@@ -41,10 +64,51 @@ class TestSession(Base):
     end_time = Column(DateTime)
     total_time_sec = Column(Integer)
     final_result = Column(Boolean, default=False)
+
+    # 中央複製：Session 結束或之後補寫項目時 change_seq 加 1 並標記待送出，
+    # 複製代理送出後只在 change_seq 未變時清除標記 (送出期間的新變更會再送一次)
+    change_seq = Column(Integer, default=0)
+    replication_pending = Column(Boolean, default=True, index=True)
     
     # 定義與 TestItemResult 的關聯關係
     items = relationship("TestItemResult", back_populates="session")
-    
+    duts = relationship("Dut", back_populates="session", order_by="Dut.slot")
+
+class Dut(Base):
+    """
+    Session 中每個待測物 (slot 從 1 開始，不限數量)。
+    """
+    __tablename__ = 'duts'
+
+    dut_id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(Integer, ForeignKey('test_sessions.session_id'), nullable=False)
+    slot = Column(Integer, nullable=False)
+    mo = Column(Text)
+    sn = Column(Text)
+
+    session = relationship("TestSession", back_populates="duts")
+    macs = relationship("DutMac", back_populates="dut", order_by="DutMac.idx")
+
+    __table_args__ = (
+        Index('ix_duts_session_slot', 'session_id', 'slot', unique=True),
+        Index('ix_duts_sn', 'sn'),
+        Index('ix_duts_mo', 'mo'),
+    )
+
+class DutMac(Base):
+    """
+    待測物的 MAC 位址 (idx 從 1 開始，不限數量)。
+    """
+    __tablename__ = 'dut_macs'
+
+    dut_id = Column(Integer, ForeignKey('duts.dut_id'), primary_key=True)
+    idx = Column(Integer, primary_key=True)
+    mac = Column(Text, nullable=False)
+
+    dut = relationship("Dut", back_populates="macs")
+
+    __table_args__ = (Index('ix_dut_macs_mac', 'mac'),)
+
 class TestItemResult(Base):
     __tablename__ = 'test_items_results'
     
@@ -56,11 +120,153 @@ class TestItemResult(Base):
     item_max_valid = Column(Text)
     item_value = Column(Text)
     item_result = Column(Boolean, default=False)
+    item_retry_count = Column(Integer, default=0)
+    item_seq = Column(Integer)                      # Session 內的順序 (對應 journal，用於重播去重)
     timestamp = Column(DateTime, default=datetime.now)
     
     # 定義與 TestSession 的關聯關係
     session = relationship("TestSession", back_populates="items")
 
+class OutputBlob(Base):
+    """
+    工具原始輸出內容 (以 sha256 去重，zstd 壓縮)。
+    """
+    __tablename__ = 'output_blobs'
+
+    blob_hash = Column(Text, primary_key=True)
+    codec = Column(Text, nullable=False)            # 'zstd' 或 'raw'
+    size = Column(Integer, nullable=False)          # 原始 (截斷後) 大小
+    stored_size = Column(Integer, nullable=False)
+    truncated = Column(Boolean, default=False)
+    data = Column(LargeBinary)                      # 超過總容量上限時為 NULL
+
+class ItemAttempt(Base):
+    """
+    每個項目每次執行 (含重試) 的結束碼與 stdout/stderr。
+    """
+    __tablename__ = 'item_attempts'
+
+    attempt_id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(Integer, ForeignKey('test_sessions.session_id'), nullable=False)
+    item_title = Column(Text, nullable=False)
+    attempt = Column(Integer, default=0)            # 0 為第一次執行，之後為重試次數
+    exit_code = Column(Integer)
+    crashed = Column(Boolean, default=False)
+    stdout_hash = Column(Text, ForeignKey('output_blobs.blob_hash'))
+    stderr_hash = Column(Text, ForeignKey('output_blobs.blob_hash'))
+    timestamp = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (Index('ix_item_attempts_session_item', 'session_id', 'item_title'),)
+
+class YieldSessionSummary(Base):
+    """
+    每日 Session 良率統計 (date, station, script_version)，於 Session 結束時累加。
+    """
+    __tablename__ = 'yield_session_summary'
+
+    summary_date = Column(Date, primary_key=True)
+    station = Column(Text, primary_key=True)
+    script_version = Column(Text, primary_key=True)
+    pass_count = Column(Integer, default=0)
+    fail_count = Column(Integer, default=0)
+    retried_count = Column(Integer, default=0)      # 有任何項目重試過的 Session 數
+    total_time_sec_sum = Column(Float, default=0.0)
+
+class YieldItemSummary(Base):
+    """
+    每日測試項目良率統計 (date, station, script_version, item_title)，
+    另外累加數值結果的總和與平方和，用於計算平均值與標準差。
+    """
+    __tablename__ = 'yield_item_summary'
+
+    summary_date = Column(Date, primary_key=True)
+    station = Column(Text, primary_key=True)
+    script_version = Column(Text, primary_key=True)
+    item_title = Column(Text, primary_key=True)
+    pass_count = Column(Integer, default=0)
+    fail_count = Column(Integer, default=0)
+    retried_count = Column(Integer, default=0)      # 經過重試才完成的次數
+    value_count = Column(Integer, default=0)
+    value_sum = Column(Float, default=0.0)
+    value_sumsq = Column(Float, default=0.0)
+
+class YieldCycleTimeSummary(Base):
+    """
+    每日測試時間直方圖 (date, station, script_version, bucket)，bucket 為 DASHBOARD_CYCLE_BUCKET_SEC 的區間起點 (秒)。
+    """
+    __tablename__ = 'yield_cycle_time_summary'
+
+    summary_date = Column(Date, primary_key=True)
+    station = Column(Text, primary_key=True)
+    script_version = Column(Text, primary_key=True)
+    bucket_sec = Column(Integer, primary_key=True)
+    session_count = Column(Integer, default=0)
+
+def _to_number(value):
+    """
+    將測試值轉為 float，無法轉換或非有限數值時返回 None。
+    """
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return None
+    return number if math.isfinite(number) else None
+
+def _cap_output(data: bytes, max_bytes: int) -> tuple[bytes, bool]:
+    """
+    超過上限時保留開頭與結尾 (錯誤訊息多在最後)，返回 (內容, 是否截斷)。
+    """
+    if len(data) <= max_bytes:
+        return data, False
+    marker = f"\n...[{len(data) - max_bytes} bytes truncated]...\n".encode()
+    head = max(max_bytes // 4, 0)
+    tail = max(max_bytes - head - len(marker), 0)
+    return data[:head] + marker + (data[-tail:] if tail else b''), True
+
+def _compress(data: bytes) -> tuple[str, bytes]:
+    if zstandard is None:
+        return 'raw', data
+    return 'zstd', zstandard.ZstdCompressor(level=config.OUTPUT_ZSTD_LEVEL).compress(data)
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == 'raw':
+        return data
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("Output blob is zstd-compressed but 'zstandard' is not installed.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown output blob codec: {codec}")
+
+def _is_value(value) -> bool:
+    return value not in (None, '', 'N/A')
+
+def legacy_duts(product_info: dict) -> list[dict]:
+    """
+    將舊格式 product_info (mo_tx ... mac_rx_2) 轉為 duts 列表，略過完全沒有資料的 slot。
+    """
+    duts = []
+    for slot, prefix in ((1, 'tx'), (2, 'rx')):
+        dut = {
+            'slot': slot,
+            'mo': product_info.get(f'mo_{prefix}'),
+            'sn': product_info.get(f'sn_{prefix}'),
+            'macs': [product_info.get(f'mac_{prefix}_1'), product_info.get(f'mac_{prefix}_2')],
+        }
+        if _is_value(dut['mo']) or _is_value(dut['sn']) or any(_is_value(m) for m in dut['macs']):
+            duts.append(dut)
+    return duts
+
+def script_content_hash(script_info: dict) -> str:
+    """
+    返回腳本內容雜湊；舊資料/未提供內容雜湊時以名稱與版本產生替代鍵。
+    """
+    if script_info.get('content_hash'):
+        return script_info['content_hash']
+    key = f"{script_info.get('script_name') or ''}\0{script_info.get('script_version') or ''}"
+    return 'legacy:' + hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+SUMMARY_TABLES = ('yield_session_summary', 'yield_item_summary', 'yield_cycle_time_summary')
+
 #===================================================================================================
 # Execute
 #===================================================================================================
@@ -78,6 +284,8 @@ class DatabaseManager:
         return cls._instance
     
     def __init__(self):
+        if getattr(self, 'engine', None) is not None:
+            return  # 單例已初始化，避免重設背景寫入執行緒正在使用的連線
         self.engine = None
         self.Session = None
         self.db_session = None
@@ -85,7 +293,10 @@ class DatabaseManager:
     def initialize_database(self):
         """
         初始化資料庫，如果資料庫檔案不存在則建立，並建立必要的表格。
+        已連線時直接返回：重建 engine 會清除維度快取，且背景寫入執行緒可能仍在使用舊的連線池。
         """
+        if getattr(self, 'engine', None) is not None:
+            return
         # db_dir = Setting.GetDataPath()
         db_dir = config.DATABASE_PATH
         if not os.path.isdir(db_dir):
@@ -96,20 +307,56 @@ class DatabaseManager:
         
         self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
         self.Session = sessionmaker(bind=self.engine)
+        self._script_ids = {}   # content_hash -> script_id 快取
+        self._blob_bytes = None # output_blobs 已使用容量 (延遲計算)
 
+        # 舊資料庫第一次建立統計表時需要由歷史 Session 重新計算 (呼叫端排入背景 rebuild_yield_summary)
+        inspector = inspect(self.engine)
+        self.summary_rebuild_pending = db_exists and inspector.has_table('test_sessions') and \
+            not all(inspector.has_table(name) for name in SUMMARY_TABLES)
+
+        Base.metadata.create_all(self.engine)  # 建立缺少的表格 (既有表格不受影響)
         if not db_exists:
-            Base.metadata.create_all(self.engine)  # 建立所有表格
             Log.info("Database created and tables initialized.")
         else:
+            self._upgrade_schema()
             Log.info("Database connected.")
 
-    def create_test_session(self, script_info, product_info, tester_info, mode):
+    def _upgrade_schema(self):
+        """
+        為舊版資料庫補上新增的欄位 (ALTER TABLE ADD COLUMN) 與索引。
+        """
+        inspector = inspect(self.engine)
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                if not inspector.has_table(table.name):
+                    continue
+                existing = {col['name'] for col in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing:
+                        continue
+                    col_type = column.type.compile(dialect=self.engine.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}'))
+                    Log.info(f"Database column added: {table.name}.{column.name}")
+                    if (table.name, column.name) == ('test_sessions', 'replication_pending'):
+                        # 既有 Session 全部標記待送出 (複製代理會依舊的 high-water mark 清除已送出的部分)
+                        conn.execute(text("UPDATE test_sessions SET replication_pending = 1, "
+                                          "change_seq = coalesce(change_seq, 0)"))
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+
+    def create_test_session(self, script_info, product_info, tester_info, mode, start_time=None):
         """
         建立新的測試 Session，並返回 session_id。
+        start_time 預設為現在時間 (journal 重播時使用原始時間)。
+
+        product_info 可包含 'duts': [{'slot', 'mo', 'sn', 'macs': [...]}, ...]，
+        未提供時由舊格式欄位 (mo_tx ... mac_rx_2) 轉換。
         """
         try:
             session = self.Session()
             new_session = TestSession(
+                script_id=self._get_script_id(session, script_info),
                 total_tests=script_info.get('total_tests'),
                 script_name=script_info.get('script_name'),
                 script_version=script_info.get('script_version'),
@@ -125,43 +372,258 @@ class DatabaseManager:
                 product_mac_rx_1 = product_info.get('mac_rx_1', 'N/A'),
                 product_mac_rx_2 = product_info.get('mac_rx_2', 'N/A'),
             )
+            if start_time is not None:
+                new_session.start_time = start_time
 
             session.add(new_session)
+            session.flush()
+            self._add_duts(session, new_session.session_id, product_info.get('duts') or legacy_duts(product_info))
             session.commit()
             session_id = new_session.session_id  # 獲取剛剛插入的 session_id
             session.close()
             return session_id
         except Exception as e:
             Log.error(f"Database session creation error: {e}")
+            self._script_ids.clear()    # 可能快取了已 rollback 的腳本 ID
             if session:
                 session.rollback()
                 session.close()
             return None
 
+    def _get_script_id(self, session, script_info: dict) -> int:
+        """
+        取得 (必要時建立) 腳本維度 ID，結果快取於記憶體。
+        """
+        content_hash = script_content_hash(script_info)
+        script_id = self._script_ids.get(content_hash)
+        if script_id is not None:
+            return script_id
+
+        record = session.query(ScriptRecord).filter_by(content_hash=content_hash).first()
+        if record is None:
+            record = ScriptRecord(content_hash=content_hash, name=script_info.get('script_name'),
+                                  version=script_info.get('script_version'), file_name=script_info.get('file_name'))
+            session.add(record)
+            session.flush()
+        self._script_ids[content_hash] = record.script_id
+        return record.script_id
+
+    @staticmethod
+    def _add_duts(session, session_id, duts: list[dict]):
+        for dut in duts:
+            new_dut = Dut(session_id=session_id, slot=dut['slot'], mo=dut.get('mo'), sn=dut.get('sn'))
+            session.add(new_dut)
+            session.flush()
+            for idx, mac in enumerate(dut.get('macs') or [], 1):
+                if _is_value(mac):
+                    session.add(DutMac(dut_id=new_dut.dut_id, idx=idx, mac=mac))
+
+    def migrate_dimensions_batch(self, batch_size: int = 500) -> int:
+        """
+        將一批舊 Session (script_id 為空) 轉入 scripts / duts / dut_macs (一個 transaction)；
+        返回轉換的 Session 數，沒有待轉換的 Session 或失敗時返回 0。
+        """
+        session = None
+        try:
+            session = self.Session()
+            batch = (session.query(TestSession).filter(TestSession.script_id.is_(None))
+                     .order_by(TestSession.session_id).limit(batch_size).all())
+            for test_session in batch:
+                test_session.script_id = self._get_script_id(session, {
+                    'script_name': test_session.script_name,
+                    'script_version': test_session.script_version,
+                })
+                if session.query(Dut.dut_id).filter_by(session_id=test_session.session_id).first() is None:
+                    self._add_duts(session, test_session.session_id, legacy_duts({
+                        'mo_tx': test_session.product_mo_tx, 'sn_tx': test_session.product_sn_tx,
+                        'mac_tx_1': test_session.product_mac_tx_1, 'mac_tx_2': test_session.product_mac_tx_2,
+                        'mo_rx': test_session.product_mo_rx, 'sn_rx': test_session.product_sn_rx,
+                        'mac_rx_1': test_session.product_mac_rx_1, 'mac_rx_2': test_session.product_mac_rx_2,
+                    }))
+            session.commit()
+            session.close()
+            return len(batch)
+        except Exception as e:
+            Log.error(f"Database dimension migration error: {e}")
+            self._script_ids.clear()    # 失敗批次中新增的 ID 已 rollback
+            if session:
+                session.rollback()
+                session.close()
+            return 0
+
+    def migrate_dimensions(self, batch_size: int = 500) -> int:
+        """
+        連續轉換所有舊 Session，返回轉換的 Session 數 (程式執行中請用 journal.schedule_dimension_migration，
+        每個背景寫入工作只處理一批)。
+        """
+        migrated = 0
+        while True:
+            count = self.migrate_dimensions_batch(batch_size)
+            if not count:
+                break
+            migrated += count
+        if migrated:
+            Log.info(f"Database dimension migration: {migrated} session(s) migrated.")
+        return migrated
+
+    def find_sessions_by_dut(self, sn: str = None, mac: str | list[str] = None, passed_only: bool = False) -> list[int]:
+        """
+        依待測物序號或 MAC 查詢 Session ID (使用 duts / dut_macs 索引)。
+
+        Args:
+            sn (str):               (Optional) 序號
+            mac (str | list):       (Optional) MAC，傳入列表時符合任一格式即可
+            passed_only (bool):     (Optional) 只返回最終結果為 Pass 的 Session
+        """
+        session = None
+        try:
+            session = self.Session()
+            query = session.query(Dut.session_id).distinct()
+            if sn is not None:
+                query = query.filter(Dut.sn == sn)
+            if mac is not None:
+                query = query.join(DutMac, DutMac.dut_id == Dut.dut_id)
+                query = query.filter(DutMac.mac.in_(mac) if isinstance(mac, (list, tuple)) else DutMac.mac == mac)
+            if passed_only:
+                query = query.join(TestSession, TestSession.session_id == Dut.session_id).filter(TestSession.final_result == True)
+            session_ids = [session_id for (session_id,) in query.order_by(Dut.session_id)]
+            session.close()
+            return session_ids
+        except Exception as e:
+            Log.error(f"Database DUT query error: {e}")
+            if session:
+                session.close()
+            return []
+
+    def find_passed_duts(self, sn: str | list[str] = None, mac: str | list[str] = None) -> list[tuple[int, str, list[str]]]:
+        """
+        依序號或 MAC 查詢通過 Session 的待測物 (用於判斷條碼是否已貼在另一片板子上)。
+
+        Args:
+            sn (str | list):        (Optional) 序號，傳入列表時符合任一格式即可
+            mac (str | list):       (Optional) MAC，傳入列表時符合任一格式即可
+
+        Returns:
+            list[tuple]: [(session_id, sn, [mac, ...]), ...]
+        """
+        session = None
+        try:
+            session = self.Session()
+            query = session.query(Dut.dut_id, Dut.session_id, Dut.sn) \
+                .join(TestSession, TestSession.session_id == Dut.session_id).filter(TestSession.final_result == True)
+            if sn is not None:
+                query = query.filter(Dut.sn.in_(sn) if isinstance(sn, (list, tuple)) else Dut.sn == sn)
+            if mac is not None:
+                macs = session.query(DutMac.dut_id).filter(
+                    DutMac.mac.in_(mac) if isinstance(mac, (list, tuple)) else DutMac.mac == mac)
+                query = query.filter(Dut.dut_id.in_(macs))
+            rows = query.order_by(Dut.session_id).all()
+            dut_macs = {dut_id: [] for dut_id, _, _ in rows}
+            if dut_macs:
+                for dut_id, dut_mac in session.query(DutMac.dut_id, DutMac.mac) \
+                        .filter(DutMac.dut_id.in_(list(dut_macs))).order_by(DutMac.dut_id, DutMac.idx):
+                    dut_macs[dut_id].append(dut_mac)
+            session.close()
+            return [(session_id, dut_sn, dut_macs[dut_id]) for dut_id, session_id, dut_sn in rows]
+        except Exception as e:
+            Log.error(f"Database DUT query error: {e}")
+            if session:
+                session.close()
+            return []
+
+    def count_passed_duts(self) -> int:
+        """
+        返回通過 Session 的待測物數量 (用於估算重複檢查 Bloom filter 的大小)。
+        """
+        session = None
+        try:
+            session = self.Session()
+            count = session.query(func.count(Dut.dut_id)).join(TestSession, TestSession.session_id == Dut.session_id) \
+                .filter(TestSession.final_result == True).scalar()
+            session.close()
+            return count or 0
+        except Exception as e:
+            Log.error(f"Database DUT count error: {e}")
+            if session:
+                session.close()
+            return 0
+
+    def iter_passed_identifiers(self, batch_size: int = 10000):
+        """
+        (背景執行緒) 逐批返回通過 Session 的 ('sn', 序號) 與 ('mac', MAC)，不一次載入記憶體。
+        """
+        session = self.Session()
+        try:
+            sns = session.query(Dut.sn).join(TestSession, TestSession.session_id == Dut.session_id) \
+                .filter(TestSession.final_result == True, Dut.sn.isnot(None))
+            for (sn,) in sns.yield_per(batch_size):
+                yield 'sn', sn
+            macs = session.query(DutMac.mac).join(Dut, Dut.dut_id == DutMac.dut_id) \
+                .join(TestSession, TestSession.session_id == Dut.session_id).filter(TestSession.final_result == True)
+            for (mac,) in macs.yield_per(batch_size):
+                yield 'mac', mac
+        finally:
+            session.close()
+
     def update_test_session_end(self, session_id, end_time, final_result:bool):
         """
-        更新測試 Session 的結束時間和最終結果。
+        更新測試 Session 的結束時間和最終結果，成功返回 True。
         """
         try:
             session = self.Session()
             test_session = session.query(TestSession).filter_by(session_id=session_id).first()
+            updated = test_session is not None
             if test_session:
+                if test_session.end_time is not None:
+                    self._accumulate_yield_summary(session, test_session, sign=-1)  # 再次結束 (重播)：先扣除原本的統計
                 test_session.end_time = end_time
                 test_session.total_time_sec = (test_session.end_time - test_session.start_time).total_seconds()
                 test_session.final_result = final_result
+                test_session.change_seq = (test_session.change_seq or 0) + 1
+                test_session.replication_pending = True
+                self._accumulate_yield_summary(session, test_session)  # 與 Session 結束同一個 transaction
                 session.commit()
             
             session.close()
+            return updated
         except Exception as e:
             Log.error(f"Database session update error: {e}")
             if session:
                 session.rollback()
                 session.close()
-            return None
+            return False
+
+    def reopen_test_session(self, session_id) -> bool:
+        """
+        重新開啟已結束的 Session (journal 重播補寫項目前)：扣除原本的良率統計並清除結束時間，
+        補寫完成後由 update_test_session_end 重新結束並累加。Session 未結束時不做任何事，成功返回 True。
+        """
+        try:
+            session = self.Session()
+            test_session = session.query(TestSession).filter_by(session_id=session_id).first()
+            updated = test_session is not None
+            if test_session is not None and test_session.end_time is not None:
+                self._accumulate_yield_summary(session, test_session, sign=-1)
+                test_session.end_time = None
+                session.commit()
+            session.close()
+            return updated
+        except Exception as e:
+            Log.error(f"Database session reopen error: {e}")
+            if session:
+                session.rollback()
+                session.close()
+            return False
 
-    def insert_test_item_result(self, session_id, result: ItemResult):
+    def insert_test_item_result(self, session_id, result: ItemResult, seq=None, timestamp=None):
         """
-        插入單個測試項目的結果。
+        插入單個測試項目的結果，成功返回 True。
+
+        Args:
+            session_id (int):       Session ID
+            result (ItemResult):    項目結果
+            seq (int):              (Optional) Session 內的順序 (journal 序號)
+            timestamp (datetime):   (Optional) 量測時間，預設為現在時間
         """
         try:
             session = self.Session()
@@ -173,17 +635,306 @@ class DatabaseManager:
                 item_min_valid=result.min,
                 item_max_valid=result.max,
                 item_value=result.value,
-                item_result=result.result
+                item_result=result.result,
+                item_retry_count=getattr(result, 'retry_count', 0),
+                item_seq=seq
             )
+            if timestamp is not None:
+                new_item_result.timestamp = timestamp
             
             session.add(new_item_result)
+            # 補寫到已結束的 Session：標記重新送到中央資料庫
+            (session.query(TestSession)
+             .filter(TestSession.session_id == session_id, TestSession.end_time.is_not(None))
+             .update({TestSession.change_seq: func.coalesce(TestSession.change_seq, 0) + 1,
+                      TestSession.replication_pending: True}, synchronize_session=False))
             session.commit()
             session.close()
+            return True
         except Exception as e:
             Log.error(f"Database item result insertion error: {e}")
             if session:
                 session.rollback()
                 session.close()
+            return False
+
+    def get_item_seqs(self, session_id) -> set | None:
+        """
+        返回 Session 已寫入的項目序號集合；Session 不存在或查詢失敗返回 None。
+        """
+        try:
+            session = self.Session()
+            if session.get(TestSession, session_id) is None:
+                session.close()
+                return None
+            seqs = {seq for (seq,) in session.query(TestItemResult.item_seq).filter_by(session_id=session_id)}
+            session.close()
+            return seqs
+        except Exception as e:
+            Log.error(f"Database item query error: {e}")
+            if session:
+                session.close()
+            return None
+
+    def _accumulate_yield_summary(self, session, test_session: TestSession, sign: int = 1):
+        """
+        把一個已結束 Session 的結果累加到良率統計表 (呼叫者負責 commit)；
+        sign=-1 時扣除 (Session 重新結束或重新開啟前先扣除原本的統計)。
+        """
+        summary_date = test_session.end_time.date()
+        station = test_session.station or 'Unknown'
+        script_version = test_session.script_version or 'N/A'
+        items = session.query(TestItemResult).filter_by(session_id=test_session.session_id).all()
+
+        session_key = (summary_date, station, script_version)
+        session_summary = session.get(YieldSessionSummary, session_key)
+        if session_summary is None:
+            session_summary = YieldSessionSummary(summary_date=summary_date, station=station, script_version=script_version,
+                                                  pass_count=0, fail_count=0, retried_count=0, total_time_sec_sum=0.0)
+            session.add(session_summary)
+        if test_session.final_result:
+            session_summary.pass_count += sign
+        else:
+            session_summary.fail_count += sign
+        if any(item.item_retry_count for item in items):
+            session_summary.retried_count += sign
+        session_summary.total_time_sec_sum += sign * (test_session.total_time_sec or 0.0)
+
+        bucket_width = config.DASHBOARD_CYCLE_BUCKET_SEC
+        bucket_sec = int(max(test_session.total_time_sec or 0.0, 0.0) // bucket_width * bucket_width)
+        cycle_summary = session.get(YieldCycleTimeSummary, session_key + (bucket_sec,))
+        if cycle_summary is None:
+            cycle_summary = YieldCycleTimeSummary(summary_date=summary_date, station=station, script_version=script_version,
+                                                  bucket_sec=bucket_sec, session_count=0)
+            session.add(cycle_summary)
+        cycle_summary.session_count += sign
+
+        item_summaries = {}
+        for item in items:
+            item_summary = item_summaries.get(item.item_title)
+            if item_summary is None:
+                item_key = (summary_date, station, script_version, item.item_title)
+                item_summary = session.get(YieldItemSummary, item_key)
+                if item_summary is None:
+                    item_summary = YieldItemSummary(summary_date=summary_date, station=station, script_version=script_version,
+                                                    item_title=item.item_title, pass_count=0, fail_count=0, retried_count=0,
+                                                    value_count=0, value_sum=0.0, value_sumsq=0.0)
+                    session.add(item_summary)
+                item_summaries[item.item_title] = item_summary
+
+            if item.item_result:
+                item_summary.pass_count += sign
+            else:
+                item_summary.fail_count += sign
+            if item.item_retry_count:
+                item_summary.retried_count += sign
+
+            value = _to_number(item.item_value)
+            if value is not None:
+                item_summary.value_count += sign
+                item_summary.value_sum += sign * value
+                item_summary.value_sumsq += sign * value * value
+
+    def rebuild_yield_summary(self):
+        """
+        清空並依所有已結束的 Session 重新計算良率統計 (用於舊資料庫第一次升級)。
+        """
+        try:
+            session = self.Session()
+            session.query(YieldItemSummary).delete()
+            session.query(YieldSessionSummary).delete()
+            session.query(YieldCycleTimeSummary).delete()
+            for test_session in session.query(TestSession).filter(TestSession.end_time.is_not(None)).yield_per(500):
+                self._accumulate_yield_summary(session, test_session)
+                session.flush()
+            session.commit()
+            session.close()
+            self.summary_rebuild_pending = False
+            Log.info("Yield summary rebuilt.")
+        except Exception as e:
+            Log.error(f"Database yield summary rebuild error: {e}")
+            if session:
+                session.rollback()
+                session.close()
+
+    def get_yield_summary(self, start_date, end_date, station=None, script_version=None, by_item=False) -> list[dict]:
+        """
+        查詢日期區間內的良率統計。
+
+        Args:
+            start_date (date):      起始日期 (含)
+            end_date (date):        結束日期 (含)
+            station (str):          (Optional) 測試站
+            script_version (str):   (Optional) 腳本版本
+            by_item (bool):         True 返回測試項目統計，False 返回 Session 統計
+
+        Returns:
+            list[dict]: 每列統計資料；項目統計另外包含 mean 與 stdev。
+        """
+        model = YieldItemSummary if by_item else YieldSessionSummary
+        try:
+            session = self.Session()
+            query = session.query(model).filter(model.summary_date >= start_date, model.summary_date <= end_date)
+            if station is not None:
+                query = query.filter(model.station == station)
+            if script_version is not None:
+                query = query.filter(model.script_version == script_version)
+
+            rows = []
+            for summary in query.all():
+                if not (summary.pass_count or summary.fail_count):
+                    continue    # 扣除後歸零的統計列 (Session 重新結束時移到其他日期)
+                row = {col.name: getattr(summary, col.name) for col in model.__table__.columns}
+                if by_item:
+                    n = summary.value_count or 0
+                    row['mean'] = summary.value_sum / n if n else None
+                    row['stdev'] = (math.sqrt(max(summary.value_sumsq / n - row['mean'] ** 2, 0.0) * n / (n - 1))
+                                    if n > 1 else None)
+                rows.append(row)
+            session.close()
+            return rows
+        except Exception as e:
+            Log.error(f"Database yield summary query error: {e}")
+            if session:
+                session.close()
+            return []
+
+    def get_cycle_time_histogram(self, start_date, end_date, station=None, script_version=None) -> dict[int, int]:
+        """
+        查詢日期區間內的測試時間直方圖，返回 {區間起點 (秒): Session 數}。
+        """
+        try:
+            session = self.Session()
+            query = (session.query(YieldCycleTimeSummary.bucket_sec, func.sum(YieldCycleTimeSummary.session_count))
+                     .filter(YieldCycleTimeSummary.summary_date >= start_date, YieldCycleTimeSummary.summary_date <= end_date))
+            if station is not None:
+                query = query.filter(YieldCycleTimeSummary.station == station)
+            if script_version is not None:
+                query = query.filter(YieldCycleTimeSummary.script_version == script_version)
+            histogram = {bucket: int(count) for bucket, count in query.group_by(YieldCycleTimeSummary.bucket_sec)
+                         if count}      # 扣除後歸零的區間 (Session 重新結束時測試時間改變)
+            session.close()
+            return histogram
+        except Exception as e:
+            Log.error(f"Database cycle time query error: {e}")
+            if session:
+                session.close()
+            return {}
+
+    def _store_output(self, session, data: bytes) -> str | None:
+        """
+        儲存一段輸出並返回 blob_hash，相同內容只存一份 (呼叫者負責 commit)。
+        容量已滿時只記錄 hash (data 為 NULL)，之後相同內容再出現且有空間時補存資料。
+        """
+        if not data:
+            return None
+        data, truncated = _cap_output(data, config.OUTPUT_CAPTURE_MAX_BYTES)
+        blob_hash = hashlib.sha256(data).hexdigest()
+        blob = session.get(OutputBlob, blob_hash)
+        if blob is not None and blob.data is not None:
+            return blob_hash
+
+        if self._blob_bytes is None:
+            self._blob_bytes = session.query(func.coalesce(func.sum(OutputBlob.stored_size), 0)).scalar()
+        codec, stored = _compress(data)
+        if self._blob_bytes + len(stored) > config.OUTPUT_BLOB_STORE_MAX_BYTES:
+            Log.warn(f"Output blob store is full ({self._blob_bytes} bytes), keeping hash only.")
+            stored = None
+        if blob is None:
+            session.add(OutputBlob(blob_hash=blob_hash, codec=codec, size=len(data),
+                                   stored_size=len(stored) if stored is not None else 0,
+                                   truncated=truncated, data=stored))
+        elif stored is not None:
+            blob.codec, blob.stored_size, blob.data = codec, len(stored), stored
+        if stored is not None:
+            self._blob_bytes += len(stored)
+        return blob_hash
+
+    def insert_item_attempt(self, session_id, item_title: str, attempt: int, exit_code, crashed: bool,
+                            stdout: bytes, stderr: bytes, timestamp=None) -> bool:
+        """
+        記錄一次項目執行的原始輸出 (壓縮在呼叫的執行緒進行，請由背景寫入執行緒呼叫)，成功返回 True。
+        """
+        session = None
+        try:
+            session = self.Session()
+            new_attempt = ItemAttempt(
+                session_id=session_id,
+                item_title=item_title,
+                attempt=attempt,
+                exit_code=exit_code,
+                crashed=crashed,
+                stdout_hash=self._store_output(session, stdout),
+                stderr_hash=self._store_output(session, stderr),
+            )
+            if timestamp is not None:
+                new_attempt.timestamp = timestamp
+            session.add(new_attempt)
+            session.commit()
+            session.close()
+            return True
+        except Exception as e:
+            Log.error(f"Database item attempt insertion error: {e}")
+            self._blob_bytes = None
+            if session:
+                session.rollback()
+                session.close()
+            return False
+
+    def get_item_attempts(self, session_id, item_title: str = None) -> list[dict]:
+        """
+        列出 Session (可指定項目) 的所有執行紀錄，不含輸出內容。
+        """
+        session = None
+        try:
+            session = self.Session()
+            query = session.query(ItemAttempt).filter_by(session_id=session_id)
+            if item_title is not None:
+                query = query.filter_by(item_title=item_title)
+            attempts = [{
+                'attempt_id': a.attempt_id, 'item_title': a.item_title, 'attempt': a.attempt,
+                'exit_code': a.exit_code, 'crashed': a.crashed, 'timestamp': a.timestamp,
+            } for a in query.order_by(ItemAttempt.attempt_id)]
+            session.close()
+            return attempts
+        except Exception as e:
+            Log.error(f"Database item attempt query error: {e}")
+            if session:
+                session.close()
+            return []
+
+    def get_attempt_output(self, attempt_id) -> dict | None:
+        """
+        取得並解壓縮一次執行的 stdout/stderr。
+
+        Returns:
+            dict: {'stdout': bytes, 'stderr': bytes, 'stdout_truncated': bool, 'stderr_truncated': bool,
+                   'exit_code': int, 'crashed': bool}；找不到時返回 None。
+                   內容因容量上限未保存時，對應欄位為 None。
+        """
+        session = None
+        try:
+            session = self.Session()
+            attempt = session.get(ItemAttempt, attempt_id)
+            if attempt is None:
+                session.close()
+                return None
+            output = {'exit_code': attempt.exit_code, 'crashed': attempt.crashed}
+            for stream in ('stdout', 'stderr'):
+                blob_hash = getattr(attempt, f'{stream}_hash')
+                blob = session.get(OutputBlob, blob_hash) if blob_hash else None
+                if blob is None:
+                    output[stream], output[f'{stream}_truncated'] = b'', False
+                else:
+                    output[stream] = _decompress(blob.codec, blob.data) if blob.data is not None else None
+                    output[f'{stream}_truncated'] = blob.truncated
+            session.close()
+            return output
+        except Exception as e:
+            Log.error(f"Database attempt output query error: {e}")
+            if session:
+                session.close()
+            return None
 
     def close_connection(self):
         """
@@ -192,5 +943,6 @@ class DatabaseManager:
         if self.engine:
             try:
                 self.engine.dispose()  # 關閉 SQLAlchemy 引擎
+                self.engine = None     # 之後可再次 initialize_database
             except Exception as e:
                 Log.error(f"Error closing database connection: {e}")
\ No newline at end of file
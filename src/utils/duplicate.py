@@ -0,0 +1,210 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import re
+import math
+import hashlib
+import threading
+
+from src.config import config
+from src.utils.log import Log
+from src.utils.database import DatabaseManager
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+_HEX_ONLY = re.compile(r'[^0-9A-Fa-f]')
+_SN_KEY = re.compile(r'\$sn(\d+)')
+_MAC_KEY = re.compile(r'\$mac(\d)\d+')       # $mac<設備><序號>
+
+def _is_value(value) -> bool:
+    return value not in (None, '', 'N/A')
+
+def _normalize(kind: str, value: str) -> str:
+    """SN 不分大小寫；MAC 忽略分隔符 (00:19:AB... 與 0019AB... 視為相同)。"""
+    value = value.strip().upper()
+    return _HEX_ONLY.sub('', value) if kind == 'mac' else value
+
+def _session_text(session_id: int) -> str:
+    return f"Session: {session_id}" if session_id else "本次執行"
+
+def mac_variants(mac: str) -> list[str]:
+    """
+    MAC 在資料庫中可能的儲存格式 (帶 :/- 或不帶分隔符、大小寫)，用於索引查詢。
+    """
+    hex_only = _HEX_ONLY.sub('', mac)
+    if len(hex_only) != 12:
+        return [mac]
+    variants = {mac}
+    for digits in (hex_only.upper(), hex_only.lower()):
+        pairs = [digits[i:i + 2] for i in range(0, 12, 2)]
+        variants.update((digits, ":".join(pairs), "-".join(pairs)))
+    return sorted(variants)
+
+#===================================================================================================
+# Bloom filter
+#===================================================================================================
+class BloomFilter:
+    """
+    固定大小的 Bloom filter：不存在時必定返回 False，存在時可能誤判 (機率約 error_rate)。
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(int(capacity), 1)
+        self.num_bits = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # 以 double hashing 由一次 blake2b 推導 k 個位置
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+#===================================================================================================
+# Execute
+#===================================================================================================
+class DuplicateGuard:
+    """
+    測試前的 SN/MAC 重複檢查：所有通過產品的 SN/MAC 載入 Bloom filter，未命中時直接放行；
+    可能命中時才以資料庫索引 (ix_duts_sn / ix_dut_macs_mac) 確認。
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, db_manager: DatabaseManager = None):
+        self.db_manager = db_manager
+        self._lock = threading.Lock()
+        self._bloom = None          # 載入完成前為 None (直接查資料庫)
+        self._recent = {}           # 本次執行新增的通過紀錄 {(kind, 正規化值): [(0, sn, macs), ...]}，資料庫寫入前也能判斷
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def load_in_background(cls):
+        """
+        程式啟動時於背景載入歷史資料，不延遲主視窗顯示。
+        """
+        if not config.DUPLICATE_CHECK_ENABLED:
+            return
+        guard = cls.instance()
+        threading.Thread(target=guard.load, name="DuplicateGuardLoad", daemon=True).start()
+
+    def _db(self) -> DatabaseManager:
+        if self.db_manager is None:
+            self.db_manager = DatabaseManager()
+        return self.db_manager
+
+    def load(self) -> int:
+        """
+        由資料庫建立 Bloom filter，返回載入的筆數。
+        """
+        try:
+            db = self._db()
+            capacity = max(db.count_passed_duts() * 6, config.DUPLICATE_BLOOM_MIN_CAPACITY)   # SN + MAC，預留成長空間
+            bloom = BloomFilter(capacity, config.DUPLICATE_BLOOM_ERROR_RATE)
+            for kind, value in db.iter_passed_identifiers():
+                if _is_value(value):
+                    bloom.add(f"{kind}:{_normalize(kind, value)}")
+            with self._lock:
+                for kind, key in self._recent:   # 載入期間新增的通過紀錄
+                    bloom.add(f"{kind}:{key}")
+                self._bloom = bloom
+            Log.info(f"Duplicate guard loaded: {bloom.count} identifier(s), {len(bloom.bits) // 1024} KiB")
+            return bloom.count
+        except Exception as e:
+            Log.error(f"Duplicate guard load failed, falling back to database lookups: {e}", exc_info=True)
+            return 0
+
+    def add_duts(self, duts: list[dict]):
+        """
+        加入通過產品的 SN/MAC (Session 結束、Final Pass 時呼叫)。
+
+        Args:
+            duts (list[dict]): [{'sn': ..., 'macs': [...]}, ...]
+        """
+        with self._lock:
+            for dut in duts:
+                owner = (0, dut.get('sn'), [mac for mac in dut.get('macs') or [] if _is_value(mac)])
+                identifiers = [('sn', dut.get('sn'))] + [('mac', mac) for mac in owner[2]]
+                for kind, value in identifiers:
+                    if not _is_value(value):
+                        continue
+                    key = _normalize(kind, value)
+                    self._recent.setdefault((kind, key), []).append(owner)
+                    if self._bloom is not None:
+                        self._bloom.add(f"{kind}:{key}")
+
+    def _owners(self, kind: str, value: str) -> list[tuple[int, str, list[str]]]:
+        """
+        返回使用此 SN/MAC 的通過產品 [(session_id, sn, [mac, ...]), ...] (session_id 0 代表本次執行)。
+        """
+        key = _normalize(kind, value)
+        with self._lock:
+            bloom, owners = self._bloom, list(self._recent.get((kind, key), []))
+        if bloom is not None and f"{kind}:{key}" not in bloom:
+            return owners
+        db = self._db()
+        if kind == 'sn':
+            return owners + db.find_passed_duts(sn=sorted({value.strip(), key}))
+        return owners + db.find_passed_duts(mac=mac_variants(value.strip()))
+
+    def check(self, product_info: dict) -> list[str]:
+        """
+        檢查掃描的條碼是否已貼在另一片通過的產品上：MAC 屬於不同 SN，或 SN 對應完全不同的 MAC。
+        同一產品 (SN 與 MAC 皆相同) 重測或執行其他腳本時不視為重複；沒有 SN 時無法判斷，不檢查。
+
+        Args:
+            product_info (dict): 條碼收集結果 {'$sn1': ..., '$mac11': ...}
+
+        Returns:
+            list[str]: 重複項目的說明，沒有重複時為空列表
+        """
+        if not config.DUPLICATE_CHECK_ENABLED:
+            return []
+        devices = {}    # device_id -> (sn, [mac, ...])
+        for barcode_key, value in product_info.items():
+            if not _is_value(value) or not isinstance(value, str):
+                continue
+            match = _SN_KEY.fullmatch(barcode_key)
+            if match:
+                devices.setdefault(match.group(1), [None, []])[0] = value
+                continue
+            match = _MAC_KEY.fullmatch(barcode_key)
+            if match:
+                devices.setdefault(match.group(1), [None, []])[1].append(value)
+
+        conflicts = []
+        for sn, macs in devices.values():
+            if sn is None:
+                continue
+            sn_key = _normalize('sn', sn)
+            mac_keys = {_normalize('mac', mac) for mac in macs}
+            for session_id, _, owner_macs in self._owners('sn', sn):
+                owner_keys = {_normalize('mac', mac) for mac in owner_macs}
+                if mac_keys and owner_keys and not (mac_keys & owner_keys):
+                    conflicts.append(f"SN {sn} 已用於 MAC {', '.join(owner_macs)} 的通過產品 ({_session_text(session_id)})")
+            for mac in macs:
+                for session_id, owner_sn, _ in self._owners('mac', mac):
+                    if _is_value(owner_sn) and _normalize('sn', owner_sn) != sn_key:
+                        conflicts.append(f"MAC {mac} 已用於 SN {owner_sn} 的通過產品 ({_session_text(session_id)})")
+        conflicts = list(dict.fromkeys(conflicts))
+        if conflicts:
+            Log.warn(f"Duplicate barcode(s) detected: {conflicts}")
+        return conflicts
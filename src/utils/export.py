@@ -0,0 +1,199 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import csv
+import json
+import argparse
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+
+from src.config import config
+from src.utils.log import Log
+from src.utils.database import TestSession, TestItemResult, Dut, DutMac
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:     # Parquet 為選用功能
+    pa = None
+    pq = None
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+CHUNK_SIZE = 50_000     # 每批從資料庫讀取並寫出的列數
+IN_BATCH_SIZE = 900     # 每個 IN (...) 查詢的 ID 數 (低於舊版 SQLite 999 個參數的上限)
+
+SESSION_COLUMNS = (
+    'session_id', 'station', 'script_name', 'script_version', 'mode', 'tester_user',
+    'product_mo_tx', 'product_sn_tx', 'product_mac_tx_1', 'product_mac_tx_2',
+    'product_mo_rx', 'product_sn_rx', 'product_mac_rx_1', 'product_mac_rx_2',
+    'start_time', 'end_time', 'total_time_sec', 'final_result',
+)
+ITEM_COLUMNS = (
+    'result_id', 'item_title', 'item_unit', 'item_min_valid', 'item_max_valid',
+    'item_value', 'item_result', 'item_retry_count', 'timestamp',
+)
+# 所有待測物 (duts/dut_macs，不限數量) 攤平成 JSON 字串，例如
+# [{"slot":1,"mo":"M1234567890","sn":"12345678901","macs":["0019ABCDEF01","0019ABCDEF02"]}]
+DUTS_COLUMN = 'duts'
+EXPORT_COLUMNS = SESSION_COLUMNS + (DUTS_COLUMN,) + ITEM_COLUMNS
+
+#===================================================================================================
+# Execute
+#===================================================================================================
+def _build_query(start_time: datetime, end_time: datetime, script_name: str = None, script_version: str = None):
+    sessions = TestSession.__table__
+    items = TestItemResult.__table__
+
+    query = (select(*[sessions.c[name] for name in SESSION_COLUMNS], *[items.c[name] for name in ITEM_COLUMNS])
+             .select_from(sessions.join(items, items.c.session_id == sessions.c.session_id))
+             .where(sessions.c.start_time >= start_time)
+             .where(sessions.c.start_time < end_time))
+    if script_name is not None:
+        query = query.where(sessions.c.script_name == script_name)
+    if script_version is not None:
+        query = query.where(sessions.c.script_version == script_version)
+    return query.order_by(sessions.c.session_id, items.c.result_id)
+
+def _load_duts(conn, session_ids) -> dict:
+    """
+    讀取多個 Session 的待測物與 MAC，返回 {session_id: JSON 字串}。
+    Session ID 分成每次 IN_BATCH_SIZE 個查詢，不會超過 SQLite 的參數數量上限。
+    """
+    duts = Dut.__table__
+    macs = DutMac.__table__
+    session_ids = sorted(session_ids)
+    grouped = {}
+    for i in range(0, len(session_ids), IN_BATCH_SIZE):
+        query = (select(duts.c.session_id, duts.c.dut_id, duts.c.slot, duts.c.mo, duts.c.sn, macs.c.mac)
+                 .select_from(duts.outerjoin(macs, macs.c.dut_id == duts.c.dut_id))
+                 .where(duts.c.session_id.in_(session_ids[i:i + IN_BATCH_SIZE]))
+                 .order_by(duts.c.session_id, duts.c.slot, macs.c.idx))
+        for session_id, dut_id, slot, mo, sn, mac in conn.execute(query):
+            entries = grouped.setdefault(session_id, {})
+            entry = entries.setdefault(dut_id, {'slot': slot, 'mo': mo, 'sn': sn, 'macs': []})
+            if mac is not None:
+                entry['macs'].append(mac)
+    return {session_id: json.dumps(list(entries.values()), ensure_ascii=False, separators=(',', ':'))
+            for session_id, entries in grouped.items()}
+
+def iter_export_chunks(engine, start_time: datetime, end_time: datetime, script_name: str = None,
+                       script_version: str = None, chunk_size: int = CHUNK_SIZE):
+    """
+    以伺服器端游標 (stream_results + yield_per) 分批讀取 Session 與項目結果的 join。
+
+    Yields:
+        list[tuple]: 每批最多 chunk_size 列，欄位順序為 EXPORT_COLUMNS。
+    """
+    query = _build_query(start_time, end_time, script_name, script_version)
+    dut_index = len(SESSION_COLUMNS)
+    # 待測物以另一個連線查詢，不干擾串流中的游標
+    with engine.connect() as conn, engine.connect() as dut_conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(query)
+        for rows in result.partitions():
+            duts = _load_duts(dut_conn, {row[0] for row in rows})
+            yield [tuple(row[:dut_index]) + (duts.get(row[0]),) + tuple(row[dut_index:]) for row in rows]
+
+def export_csv(engine, output_path: str, start_time: datetime, end_time: datetime,
+               script_name: str = None, script_version: str = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    匯出為 CSV (UTF-8 with BOM，方便 Excel 開啟)，返回匯出列數。
+    """
+    total = 0
+    with open(output_path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        for rows in iter_export_chunks(engine, start_time, end_time, script_name, script_version, chunk_size):
+            writer.writerows(rows)
+            total += len(rows)
+    return total
+
+def _parquet_schema():
+    types = {
+        'session_id': pa.int64(), 'result_id': pa.int64(), 'total_time_sec': pa.float64(),
+        'item_retry_count': pa.int32(), 'final_result': pa.bool_(), 'item_result': pa.bool_(),
+        'start_time': pa.timestamp('ms'), 'end_time': pa.timestamp('ms'), 'timestamp': pa.timestamp('ms'),
+    }
+    return pa.schema([(name, types.get(name, pa.string())) for name in EXPORT_COLUMNS])
+
+def export_parquet(engine, output_path: str, start_time: datetime, end_time: datetime,
+                   script_name: str = None, script_version: str = None, chunk_size: int = CHUNK_SIZE,
+                   compression: str = 'zstd') -> int:
+    """
+    匯出為 Parquet (欄式、壓縮)，每批寫成一個 row group，返回匯出列數。
+    """
+    if pa is None:
+        raise RuntimeError("Parquet export requires 'pyarrow' (pip install pyarrow).")
+
+    schema = _parquet_schema()
+    total = 0
+    with pq.ParquetWriter(output_path, schema, compression=compression) as writer:
+        for rows in iter_export_chunks(engine, start_time, end_time, script_name, script_version, chunk_size):
+            columns = list(zip(*rows))
+            arrays = [pa.array(columns[i], type=schema.field(i).type) for i in range(len(EXPORT_COLUMNS))]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            total += len(rows)
+    return total
+
+EXPORTERS = {
+    'csv': export_csv,
+    'parquet': export_parquet,
+}
+
+def export_results(output_path: str, start_time: datetime, end_time: datetime, fmt: str = 'csv',
+                   script_name: str = None, script_version: str = None, engine=None, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    匯出日期區間 [start_time, end_time) 的測試資料。
+
+    Args:
+        output_path (str):      輸出檔案路徑
+        start_time (datetime):  Session 起始時間下限 (含)
+        end_time (datetime):    Session 起始時間上限 (不含)
+        fmt (str):              'csv' 或 'parquet'
+        script_name (str):      (Optional) 只匯出指定腳本
+        script_version (str):   (Optional) 只匯出指定腳本版本
+        engine:                 (Optional) SQLAlchemy engine，預設為本機 results.db
+
+    Returns:
+        int: 匯出列數。
+    """
+    if fmt not in EXPORTERS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    own_engine = engine is None
+    if own_engine:
+        db_path = os.path.join(config.DATABASE_PATH, config.DATABASE_NAME)
+        engine = create_engine(f'sqlite:///{db_path}')
+
+    try:
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        total = EXPORTERS[fmt](engine, output_path, start_time, end_time, script_name, script_version, chunk_size)
+        Log.info(f"Exported {total} row(s) to {output_path}")
+        return total
+    finally:
+        if own_engine:
+            engine.dispose()
+
+#===================================================================================================
+# Main
+#===================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export test sessions and item results from results.db "
+                                                 "(all DUTs and MACs are in the 'duts' column as JSON)")
+    parser.add_argument("--start", required=True, type=lambda s: datetime.strptime(s, "%Y-%m-%d"), help="起始日期 YYYY-MM-DD (含)")
+    parser.add_argument("--end", required=True, type=lambda s: datetime.strptime(s, "%Y-%m-%d"), help="結束日期 YYYY-MM-DD (含)")
+    parser.add_argument("--format", dest="fmt", choices=sorted(EXPORTERS), default="csv")
+    parser.add_argument("--script", dest="script_name", default=None, help="只匯出指定腳本名稱")
+    parser.add_argument("--version", dest="script_version", default=None, help="只匯出指定腳本版本")
+    parser.add_argument("--output", required=True, help="輸出檔案")
+    args = parser.parse_args(argv)
+
+    total = export_results(args.output, args.start, args.end + timedelta(days=1), args.fmt,
+                           args.script_name, args.script_version)
+    print(f"{total} rows -> {args.output}")
+
+if __name__ == "__main__":
+    main()
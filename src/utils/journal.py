@@ -0,0 +1,309 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import json
+import time
+import glob
+import queue
+import threading
+from datetime import datetime
+
+from src.config import config
+from src.utils.log import Log
+from src.utils.commonUtils import ItemResult
+from src.utils.database import DatabaseManager
+
+#===================================================================================================
+# Journal
+#===================================================================================================
+class ResultJournal:
+    """
+    單一測試 Session 的 write-ahead journal (JSON Lines)。
+
+    每筆結果先 append 到 journal (只寫入 OS 緩衝區)，fsync 依筆數/時間批次進行，
+    資料庫全部寫入成功後才刪除 journal；程式中斷時，下次啟動由 replay_pending_journals 補寫。
+    """
+    SUFFIX = '.jsonl'
+
+    def __init__(self, path: str, fsync_every: int = None, fsync_interval: float = None):
+        self.path = path
+        self.fsync_every = fsync_every or config.JOURNAL_FSYNC_EVERY
+        self.fsync_interval = fsync_interval if fsync_interval is not None else config.JOURNAL_FSYNC_INTERVAL_SEC
+        self.failed = False                 # 任一筆寫入資料庫失敗時保留 journal
+        self._next_seq = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    @classmethod
+    def create(cls, session_id, script_info: dict, product_info: dict, tester_info: dict, mode: str,
+               start_time: datetime, journal_dir: str = None):
+        """
+        建立新的 journal 並寫入 Session 標頭。
+        """
+        journal_dir = journal_dir or config.JOURNAL_PATH
+        os.makedirs(journal_dir, exist_ok=True)
+        name = f"{start_time:%Y%m%d_%H%M%S_%f}_{os.getpid()}_{session_id if session_id is not None else 'pending'}"
+        journal = cls(os.path.join(journal_dir, name + cls.SUFFIX))
+        journal._write({
+            'type': 'session',
+            'session_id': session_id,
+            'script_info': script_info,
+            'product_info': product_info,
+            'tester_info': tester_info,
+            'mode': mode,
+            'start_time': start_time.isoformat(),
+        })
+        journal.sync(force=True)
+        return journal
+
+    def _write(self, record: dict):
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+            self._file.flush()              # 交給 OS，程式當掉也不會遺失
+            self._unsynced += 1
+
+    def append_item(self, item_result: ItemResult, timestamp: datetime) -> int:
+        """
+        寫入一筆項目結果，返回序號。
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        self._write({
+            'type': 'item',
+            'seq': seq,
+            'title': item_result.title,
+            'unit': item_result.unit,
+            'min': item_result.min,
+            'max': item_result.max,
+            'value': item_result.value,
+            'result': item_result.result,
+            'retry_count': getattr(item_result, 'retry_count', 0),
+            'timestamp': timestamp.isoformat(),
+        })
+        return seq
+
+    def append_end(self, end_time: datetime, final_result: bool):
+        self._write({'type': 'end', 'end_time': end_time.isoformat(), 'final_result': final_result})
+
+    def sync(self, force: bool = False):
+        """
+        依批次條件 fsync (force=True 時立即)。
+        """
+        with self._lock:
+            if self._file.closed or self._unsynced == 0:
+                return
+            if not force and self._unsynced < self.fsync_every and time.monotonic() - self._last_sync < self.fsync_interval:
+                return
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+
+    def complete(self):
+        """
+        資料庫已完整寫入：關閉並刪除 journal (有失敗紀錄時保留給下次重播)。
+        """
+        self.close()
+        if self.failed:
+            Log.warn(f"Journal kept for replay: {self.path}")
+            return
+        try:
+            os.remove(self.path)
+        except OSError as e:
+            Log.error(f"Error removing journal '{self.path}': {e}")
+
+def read_journal(path: str) -> list[dict]:
+    """
+    讀取 journal，忽略中斷時寫了一半的最後一行。
+    """
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                Log.warn(f"Skipping corrupted journal line {line_no} in {path}")
+    return records
+
+#===================================================================================================
+# Background database writer
+#===================================================================================================
+class DatabaseWriter:
+    """
+    單一背景執行緒依序執行資料庫寫入工作 (FIFO)，讓測試流程只需要 append journal。
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="DatabaseWriter", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def submit(self, func, *args, **kwargs):
+        self._queue.put((func, args, kwargs))
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        等待目前排入的工作全部完成，返回是否在 timeout 內完成。
+        """
+        done = threading.Event()
+        self._queue.put((done.set, (), {}))
+        return done.wait(timeout)
+
+    def _run(self):
+        while True:
+            func, args, kwargs = self._queue.get()
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                Log.error(f"Database writer job error: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+def write_with_retry(func, *args, retries: int = None, delay: float = None, **kwargs) -> bool:
+    """
+    執行返回 bool 的資料庫寫入函數，失敗時 (例如 SQLite locked) 延遲重試。
+    """
+    retries = config.JOURNAL_DB_RETRIES if retries is None else retries
+    delay = config.JOURNAL_DB_RETRY_DELAY_SEC if delay is None else delay
+    for attempt in range(retries + 1):
+        if func(*args, **kwargs):
+            return True
+        if attempt < retries:
+            time.sleep(delay * (attempt + 1))
+    return False
+
+#===================================================================================================
+# Replay
+#===================================================================================================
+def _record_session_id(path: str, session_id: int):
+    """
+    重播時建立的 Session ID 寫回 journal (fsync)，之後的項目寫入失敗時下次重播沿用同一個 Session。
+    """
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'type': 'session_id', 'session_id': session_id}, separators=(',', ':')) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+def replay_journal(db_manager, path: str) -> bool:
+    """
+    將單一 journal 中尚未寫入資料庫的紀錄補寫，完成後刪除 journal。
+
+    Returns:
+        bool: 成功重播 (或 journal 無內容) 返回 True。
+    """
+    records = read_journal(path)
+    header = next((r for r in records if r.get('type') == 'session'), None)
+    if header is None:
+        Log.warn(f"Journal without session header, removed: {path}")
+        os.remove(path)
+        return True
+
+    start_time = datetime.fromisoformat(header['start_time'])
+    session_id = header.get('session_id')
+    for record in records:
+        if record.get('type') == 'session_id':     # 先前的重播已建立 Session
+            session_id = record['session_id']
+    existing = None
+    if session_id is None:
+        session_id = db_manager.create_test_session(header['script_info'], header['product_info'],
+                                                    header['tester_info'], header['mode'], start_time=start_time)
+        if session_id is None:
+            return False
+        _record_session_id(path, session_id)
+    else:
+        existing = db_manager.get_item_seqs(session_id)
+        if existing is None:
+            Log.error(f"Journal replay: session {session_id} not available, keep {path}")
+            return False
+
+    items = [r for r in records if r.get('type') == 'item']
+    if existing is None:
+        existing = set()
+    elif any(record['seq'] not in existing for record in items):
+        # Session 可能已結束 (項目寫入失敗但 Session 已結束)：補寫前先扣除良率統計，重新結束時再累加
+        if not db_manager.reopen_test_session(session_id):
+            return False
+    for record in items:
+        if record['seq'] in existing:
+            continue
+        item_result = ItemResult(record['title'], record['unit'], record['min'], record['max'],
+                                 record['value'], record['result'], record.get('retry_count', 0))
+        if not db_manager.insert_test_item_result(session_id, item_result, seq=record['seq'],
+                                                  timestamp=datetime.fromisoformat(record['timestamp'])):
+            return False
+
+    end = next((r for r in records if r.get('type') == 'end'), None)
+    if end is not None:
+        end_time, final_result = datetime.fromisoformat(end['end_time']), end['final_result']
+    else:
+        # 程式在測試中途結束：以最後一筆紀錄時間關閉 Session，結果為 Fail
+        end_time = datetime.fromisoformat(items[-1]['timestamp']) if items else start_time
+        final_result = False
+    if not db_manager.update_test_session_end(session_id, end_time, final_result):
+        return False
+
+    os.remove(path)
+    Log.info(f"Journal replayed: session {session_id}, {len(items) - len(existing)} item(s) recovered from {path}")
+    return True
+
+def replay_pending_journals(db_manager, journal_dir: str = None) -> int:
+    """
+    重播上次執行遺留的 journal (略過本程序正在使用的 journal)，返回成功重播的數量。
+    """
+    journal_dir = journal_dir or config.JOURNAL_PATH
+    own_marker = f"_{os.getpid()}_"
+    replayed = 0
+    for path in sorted(glob.glob(os.path.join(journal_dir, '*' + ResultJournal.SUFFIX))):
+        if own_marker in os.path.basename(path):
+            continue
+        try:
+            if replay_journal(db_manager, path):
+                replayed += 1
+        except Exception as e:
+            Log.error(f"Journal replay error '{path}': {e}", exc_info=True)
+    return replayed
+
+def schedule_journal_replay():
+    """
+    啟動時在背景執行緒重播遺留的 journal (不阻塞 UI)。
+    """
+    def _replay():
+        db_manager = DatabaseManager()
+        count = replay_pending_journals(db_manager)
+        if count:
+            Log.info(f"{count} pending journal(s) replayed into database")
+    DatabaseWriter.instance().submit(_replay)
+
+def schedule_dimension_migration(batch_size: int = 500):
+    """
+    舊 Session 分批轉入維度表：每個背景寫入工作只轉換一批，完成後再排入下一批，
+    期間的項目結果、Session 結束等寫入工作不需要等待整個轉換完成。
+    """
+    def _migrate_batch(migrated: int):
+        count = DatabaseManager().migrate_dimensions_batch(batch_size)
+        if count:
+            DatabaseWriter.instance().submit(_migrate_batch, migrated + count)
+        elif migrated:
+            Log.info(f"Database dimension migration: {migrated} session(s) migrated.")
+    DatabaseWriter.instance().submit(_migrate_batch, 0)
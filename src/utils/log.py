@@ -2,11 +2,68 @@
 # Import the necessary modules
 #===================================================================================================
 import os
-import time
+import copy
+import json
+import queue
+import atexit
 import logging
+import threading
+from datetime import datetime
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 
 from src.config.setting import Setting
 from src.config import config
+from src.utils.log_rotation import DailyRotatingFileHandler
+
+#===================================================================================================
+# Structured log context
+#===================================================================================================
+# 目前執行的關聯資訊 (station, session, item, attempt, mo, sn)，由 PerformManager 設定
+_log_context: ContextVar[dict] = ContextVar('log_context', default={})
+
+class _ContextFilter(logging.Filter):
+    """
+    在呼叫端執行緒把 context 附加到紀錄上 (之後由背景執行緒寫出時 context 可能已改變)。
+    """
+    def filter(self, record):
+        record.context = _log_context.get()
+        return True
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    每筆紀錄輸出一行精簡 JSON (ts, level, file, line, func, msg + context 欄位，例外時加上 exc)，供日誌收集程式直接匯入。
+    """
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'file': record.filename,
+            'line': record.lineno,
+            'func': record.funcName,
+            'msg': record.getMessage(),
+        }
+        entry.update(getattr(record, 'context', None) or {})
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=str)
+
+class _QueueHandler(QueueHandler):
+    """
+    放入佇列前先格式化訊息，例外另外保留在 exc_text (標準 QueueHandler 會併入 msg 並清除)：
+    文字 handler 仍會在訊息後附加 traceback，JSON handler 則輸出為 exc 欄位。
+    """
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None      # traceback 物件不能跨執行緒保留
+        return record
 
 #===================================================================================================
 # Execute
@@ -18,35 +75,82 @@ class Log:
     _initialized = False # 標記是否已初始化
     ch = None # StreamHandler
     fh = None # FileHandler
+    jh = None # JSON-lines FileHandler (config.LOG_JSON_ENABLED)
+    qh = None # QueueHandler (呼叫端只放入佇列，不等待磁碟/控制台)
+    listener = None # QueueListener (背景執行緒，擁有 ch/fh/install_filter 的 handler)
+    _lock = threading.Lock()
         
     @classmethod                                            # 使用 classmethod，如果需要存取 class 屬性
     def init(cls):                                          # 方法名改為小寫開頭，更符合 Python 慣例
         if cls._initialized:                                # 檢查是否已初始化
             return                                          # 如果已初始化，直接返回，避免重複初始化
 
+        cls.logger.setLevel(config.LOG_LEVEL)               # 高於 DEBUG 時 Log.debug 不建立紀錄也不格式化
         formatter = logging.Formatter("%(asctime)s - %(filename)s[line:%(lineno)d] - %(levelname)s: %(message)s")
 
         # StreamHandler (輸出到控制台)
         cls.ch = logging.StreamHandler()
         cls.ch.setLevel(logging.DEBUG)                      # StreamHandler 預設等級
         cls.ch.setFormatter(formatter)
-        cls.logger.addHandler(cls.ch)
 
-        # FileHandler (輸出到檔案)
+        # FileHandler (輸出到檔案 YYYYMMDD.log，午夜或超過大小時切換，換下的檔案在背景壓縮並依保留設定刪除)
         # log_path = Setting.GetLogPath()                     # 從 Setting 取得日誌路徑
         log_path = config.LOG_PATH
         if not os.path.isdir(log_path):
             os.makedirs(log_path)
-        day = time.strftime('%Y%m%d', time.localtime(time.time()))
-        log_file = os.path.join(log_path, day + ".log")
-        cls.fh = logging.FileHandler(log_file, mode='a', encoding="utf-8")
+        cls.fh = DailyRotatingFileHandler(log_path,
+                                          max_bytes=config.LOG_MAX_BYTES,
+                                          compression=config.LOG_COMPRESSION,
+                                          zstd_level=config.LOG_ZSTD_LEVEL,
+                                          retention_days=config.LOG_RETENTION_DAYS,
+                                          retention_bytes=int(config.LOG_RETENTION_MAX_GB * 1024 ** 3))
         cls.fh.setLevel(logging.INFO) # FileHandler 預設等級
         file_formatter = logging.Formatter("%(asctime)s - %(filename)s[line:%(lineno)d] - %(levelname)s: %(message)s") # 變數名修改
         cls.fh.setFormatter(file_formatter)
-        cls.logger.addHandler(cls.fh)
+        handlers = [cls.ch, cls.fh]
+
+        # JSON-lines (YYYYMMDD.jsonl，每筆紀錄帶有 Log.set_context 設定的關聯欄位)
+        if config.LOG_JSON_ENABLED:
+            cls.jh = DailyRotatingFileHandler(config.LOG_JSON_PATH,
+                                              max_bytes=config.LOG_MAX_BYTES,
+                                              compression=config.LOG_COMPRESSION,
+                                              zstd_level=config.LOG_ZSTD_LEVEL,
+                                              retention_days=config.LOG_RETENTION_DAYS,
+                                              retention_bytes=int(config.LOG_RETENTION_MAX_GB * 1024 ** 3),
+                                              suffix='.jsonl')
+            cls.jh.setLevel(logging.INFO)
+            cls.jh.setFormatter(JsonLinesFormatter())
+            handlers.append(cls.jh)
+        cls.logger.addFilter(_ContextFilter())
+
+        # 所有紀錄經由佇列交給背景執行緒寫出，Qt 主執行緒不會因慢速磁碟或控制台阻塞
+        log_queue = queue.SimpleQueue()
+        cls.listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        cls.qh = _QueueHandler(log_queue)
+        cls.qh.setLevel(logging.DEBUG)
+        cls.logger.addHandler(cls.qh)
+        cls.listener.start()
+        atexit.register(cls.shutdown)                       # 正常結束時確保佇列中的紀錄全部寫出
 
         cls._initialized = True                             # 標記為已初始化
 
+    @classmethod
+    def shutdown(cls):
+        """
+        停止背景寫出執行緒：先處理完佇列中的所有紀錄再 flush，之後改為直接寫出 (可重複呼叫)。
+        """
+        with cls._lock:
+            listener, cls.listener = cls.listener, None
+            if listener is None:
+                return
+            cls.logger.removeHandler(cls.qh)
+            # 之後的紀錄直接寫到原本的 handler (例如 atexit 期間的訊息)
+            for handler in listener.handlers:
+                cls.logger.addHandler(handler)
+            listener.stop()                                 # 放入結束標記並等待執行緒處理完佇列
+            for handler in listener.handlers:
+                handler.flush()
+
     @classmethod
     def update_logging_level(cls):
         log_level = logging.DEBUG                           # 預設等級
@@ -57,21 +161,43 @@ class Log:
         if cls.fh:
             cls.fh.setLevel(log_level)                      # 同步 FileHandler 等級
 
+    @staticmethod
+    def set_context(**fields):
+        """
+        更新之後紀錄附帶的關聯欄位 (例如 session=12, item=3, attempt=0)，值為 None 時移除該欄位。
+        """
+        context = dict(_log_context.get())
+        context.update(fields)
+        _log_context.set({key: value for key, value in context.items() if value is not None})
+
+    @staticmethod
+    def clear_context():
+        _log_context.set({})
+
+    @staticmethod
+    def is_debug() -> bool:
+        """
+        DEBUG 紀錄是否會輸出；組合大量內容 (stdout、product_info 等) 前先檢查。
+        """
+        return Log.logger.isEnabledFor(logging.DEBUG)
+
+    # 訊息可使用 % 格式參數，例如 Log.debug("Stdout: %s", output)；等級未啟用時不會格式化
+    # stacklevel=2：紀錄的檔名/行號/函數為呼叫 Log.xxx 的位置，而不是本檔案
     @staticmethod # 如果 Debug, Info, Warn, Error 確實不需要存取 class 狀態，可以保留 staticmethod
-    def debug(message):
-        Log.logger.debug(message)
+    def debug(message, *args):
+        Log.logger.debug(message, *args, stacklevel=2)
 
     @staticmethod
-    def info(message):
-        Log.logger.info(message)
+    def info(message, *args):
+        Log.logger.info(message, *args, stacklevel=2)
 
     @staticmethod
-    def warn(message):
-        Log.logger.warning(message)
+    def warn(message, *args):
+        Log.logger.warning(message, *args, stacklevel=2)
 
     @staticmethod
-    def error(message, exc_info=False): # 方法名改為小寫, error 方法預設不包含 exc_info，需要時再傳入 True
-        Log.logger.error(message, exc_info=exc_info) 
+    def error(message, *args, exc_info=False): # 方法名改為小寫, error 方法預設不包含 exc_info，需要時再傳入 True
+        Log.logger.error(message, *args, exc_info=exc_info, stacklevel=2)
 
     @staticmethod
     def install_filter(stream2): # 方法名改為小寫
@@ -94,4 +220,8 @@ class Log:
         ch2 = Stream2Handler(stream2) # 變數名修改，避免與 Init 方法中的 ch 衝突
         ch2.setLevel(logging.DEBUG)
         ch2.setFormatter(formatter)
-        Log.logger.addHandler(ch2)
+        with Log._lock:
+            if Log.listener is not None:
+                Log.listener.handlers = Log.listener.handlers + (ch2,)  # 由背景執行緒寫出
+            else:
+                Log.logger.addHandler(ch2)
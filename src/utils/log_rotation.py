@@ -0,0 +1,240 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import re
+import sys
+import gzip
+import queue
+import shutil
+import threading
+import traceback
+from functools import lru_cache
+from datetime import datetime, date, time as dtime, timedelta
+from logging.handlers import BaseRotatingHandler
+
+try:
+    import zstandard
+except ImportError:     # 未安裝時改用 gzip
+    zstandard = None
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+LOG_SUFFIX = '.log'
+COMPRESSED_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz'}
+PART_SUFFIX = '.part'               # 壓縮中的暫存檔 (中斷時下次整理會刪除)
+
+#===================================================================================================
+# Functions
+#===================================================================================================
+@lru_cache(maxsize=None)
+def _name_pattern(suffix: str) -> re.Pattern:
+    return re.compile(r'^(\d{8})(?:\.(\d+))?' + re.escape(suffix) + r'(\.zst|\.gz)?$')
+
+def log_files(log_path: str, suffix: str = LOG_SUFFIX) -> list[tuple[str, str, int, str]]:
+    """
+    列出日誌目錄中的日誌檔 (YYYYMMDD<suffix>、YYYYMMDD.N<suffix> 及其壓縮檔)，由舊到新排序。
+
+    Returns:
+        list[tuple]: (檔名, 日期 YYYYMMDD, 分段序號 (當天最後一段為 0), 壓縮副檔名 ('' 代表未壓縮))
+    """
+    try:
+        names = os.listdir(log_path)
+    except FileNotFoundError:
+        return []
+    pattern = _name_pattern(suffix)
+    files = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            files.append((name, match.group(1), int(match.group(2) or 0), match.group(3) or ''))
+    # 同一天的分段 (1, 2, ...) 早於最後寫入的 YYYYMMDD.log
+    return sorted(files, key=lambda f: (f[1], f[2] or sys.maxsize))
+
+def compress_log(path: str, compression: str = 'zstd', zstd_level: int = 9) -> str:
+    """
+    壓縮日誌檔並刪除原檔 (先寫入暫存檔再改名，中斷時不會留下不完整的壓縮檔)。
+
+    Returns:
+        str: 壓縮後的檔案路徑
+    """
+    if compression == 'zstd' and zstandard is None:
+        compression = 'gzip'
+    target = path + COMPRESSED_SUFFIXES[compression]
+    temp = target + PART_SUFFIX
+    with open(path, 'rb') as src:
+        if compression == 'zstd':
+            with open(temp, 'wb') as dst:
+                zstandard.ZstdCompressor(level=zstd_level).copy_stream(src, dst)
+        else:
+            with gzip.open(temp, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+    stat = os.stat(path)
+    os.utime(temp, (stat.st_atime, stat.st_mtime))
+    os.replace(temp, target)
+    os.remove(path)
+    return target
+
+#===================================================================================================
+# Execute
+#===================================================================================================
+class DailyRotatingFileHandler(BaseRotatingHandler):
+    """
+    依日期寫入 <log_path>/YYYYMMDD<suffix>：午夜換到新的一天，超過 max_bytes 時目前內容改名為 YYYYMMDD.N<suffix>。
+    換下來的檔案由背景執行緒壓縮，並依保留天數與總容量刪除最舊的檔案。
+    """
+    def __init__(self, log_path: str, max_bytes: int = 0, compression: str = 'zstd', zstd_level: int = 9,
+                 retention_days: int = 0, retention_bytes: int = 0, suffix: str = LOG_SUFFIX, encoding: str = 'utf-8'):
+        if compression and compression not in COMPRESSED_SUFFIXES:
+            raise ValueError(f"Unsupported log compression: '{compression}'")
+        self.log_path = log_path
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.compression = compression
+        self.zstd_level = zstd_level
+        self.retention_days = retention_days
+        self.retention_bytes = retention_bytes
+
+        now = datetime.now()
+        self.day = now.strftime('%Y%m%d')
+        self.rollover_at = self._next_midnight(now)
+        self._record_time = now.timestamp()
+        os.makedirs(log_path, exist_ok=True)
+        super().__init__(self._day_file(self.day), 'a', encoding=encoding)
+
+        self._requests = queue.Queue()
+        self._worker = threading.Thread(target=self._maintenance_loop, name="LogMaintenance", daemon=True)
+        self._worker.start()
+        self._requests.put(self.baseFilename)   # 啟動時處理上次執行留下的檔案 (前一天未壓縮的日誌等)
+
+    def _day_file(self, day: str) -> str:
+        return os.path.join(self.log_path, day + self.suffix)
+
+    @staticmethod
+    def _next_midnight(now: datetime) -> float:
+        return datetime.combine(now.date() + timedelta(days=1), dtime.min).timestamp()
+
+    def shouldRollover(self, record) -> bool:
+        self._record_time = record.created
+        if record.created >= self.rollover_at:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            # 以寫入前的位置判斷，檔案最多超出一筆紀錄，不需要為每筆紀錄多格式化一次
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        now = datetime.fromtimestamp(self._record_time)
+        day = now.strftime('%Y%m%d')
+        if day == self.day and os.path.exists(self.baseFilename):
+            # 大小上限：目前的內容改名為下一個分段，之後繼續寫入 YYYYMMDD.log
+            index = max([f[2] for f in log_files(self.log_path, self.suffix) if f[1] == day] + [0]) + 1
+            os.replace(self.baseFilename, os.path.join(self.log_path, f"{day}.{index}{self.suffix}"))
+
+        self.day = day
+        self.rollover_at = self._next_midnight(now)
+        self.baseFilename = self._day_file(day)
+        self.stream = self._open()
+        # 在 handler 鎖內取得目前檔名交給背景執行緒，避免背景整理讀到換檔前的舊檔名
+        self._requests.put(self.baseFilename)
+
+    #-----------------------------------------------------------------------------------------------
+    # Background maintenance
+    #-----------------------------------------------------------------------------------------------
+    def _maintenance_loop(self):
+        while True:
+            request = self._requests.get()
+            try:
+                if request is None:
+                    return
+                self.maintain(request)
+            except Exception:
+                # 不能經由 logging 回報 (可能在寫出日誌的執行緒上遞迴)
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                self._requests.task_done()
+
+    def _active_file(self, active: str | None) -> str:
+        if active is None:
+            with self.lock:
+                active = self.baseFilename
+        return active
+
+    def _protected(self, active: str) -> set[str]:
+        """
+        不可壓縮或刪除的檔案：目前寫入的檔案，以及最新一天的 YYYYMMDD<suffix> (換檔後可能已是寫入中的檔案)。
+        """
+        files = log_files(self.log_path, self.suffix)
+        protected = {os.path.basename(active)}
+        if files:
+            newest = max(f[1] for f in files)
+            protected.update(f[0] for f in files if f[1] == newest and f[2] == 0 and not f[3])
+        return protected
+
+    def maintain(self, active: str | None = None) -> int:
+        """
+        壓縮已換下的日誌並依保留設定刪除舊檔。
+
+        Args:
+            active (str | None): 送出整理要求時寫入中的檔案 (None 代表目前的檔案)
+
+        Returns:
+            int: 刪除的檔案數
+        """
+        active = self._active_file(active)
+        protected = self._protected(active)
+        for name in os.listdir(self.log_path):
+            if name.endswith(PART_SUFFIX) and _name_pattern(self.suffix).match(name[:-len(PART_SUFFIX)]):
+                os.remove(os.path.join(self.log_path, name))
+        if self.compression:
+            for name, _, _, suffix in log_files(self.log_path, self.suffix):
+                if not suffix and name not in protected:
+                    compress_log(os.path.join(self.log_path, name), self.compression, self.zstd_level)
+        return self.prune(active)
+
+    def prune(self, active: str | None = None) -> int:
+        """
+        刪除超過保留天數的日誌，總容量超過 retention_bytes 時再由最舊的開始刪除 (不刪除目前寫入的檔案)。
+        """
+        active = self._active_file(active)
+        protected = self._protected(active)
+        files = [f for f in log_files(self.log_path, self.suffix) if f[0] not in protected]
+        removed = 0
+        if self.retention_days > 0:
+            cutoff = (date.today() - timedelta(days=self.retention_days)).strftime('%Y%m%d')
+            for f in [f for f in files if f[1] < cutoff]:
+                os.remove(os.path.join(self.log_path, f[0]))
+                files.remove(f)
+                removed += 1
+        if self.retention_bytes > 0:
+            sizes = {f[0]: os.path.getsize(os.path.join(self.log_path, f[0])) for f in files}
+            total = sum(sizes.values())
+            for name in protected:
+                if os.path.exists(os.path.join(self.log_path, name)):
+                    total += os.path.getsize(os.path.join(self.log_path, name))
+            for f in files:
+                if total <= self.retention_bytes:
+                    break
+                os.remove(os.path.join(self.log_path, f[0]))
+                total -= sizes[f[0]]
+                removed += 1
+        return removed
+
+    def wait(self):
+        """
+        等待背景壓縮/清理完成。
+        """
+        self._requests.join()
+
+    def close(self):
+        if self._worker.is_alive():
+            self._requests.put(None)
+            self._worker.join(timeout=30)
+        super().close()
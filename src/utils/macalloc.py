@@ -0,0 +1,320 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import re
+import sqlite3
+import argparse
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from src.config import config
+from src.utils.log import Log
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+MAC_MAX = (1 << 48) - 1
+DERIVATION_MODES = ('none', 'sequential')
+_HEX_ONLY = re.compile(r'[^0-9A-Fa-f]')
+_SEPARATOR = re.compile(r'[:-]')
+
+#===================================================================================================
+# Functions
+#===================================================================================================
+def mac_to_int(mac: str) -> int:
+    """
+    MAC (帶或不帶 :/- 分隔符) 轉為 48-bit 整數。
+
+    Raises:
+        ValueError: 不是 12 位 16 進位
+    """
+    hex_only = _HEX_ONLY.sub('', mac or '')
+    if len(hex_only) != 12:
+        raise ValueError(f"Invalid MAC address: '{mac}'")
+    return int(hex_only, 16)
+
+def int_to_mac(value: int, template: str = "00:00:00:00:00:00") -> str:
+    """
+    48-bit 整數轉為 MAC，分隔符與大小寫沿用 template 的格式。
+    """
+    if not 0 <= value <= MAC_MAX:
+        raise ValueError(f"MAC value out of range: {value:#x}")
+    digits = f"{value:012X}" if not any(c.islower() for c in template) else f"{value:012x}"
+    separator = _SEPARATOR.search(template)
+    if separator is None:
+        return digits
+    return separator.group(0).join(digits[i:i + 2] for i in range(0, 12, 2))
+
+def derive_macs(first_mac: str, count: int, mode: str = 'sequential') -> list[str]:
+    """
+    由第一個 MAC 推算整組 MAC (sequential：依序 +1)。
+
+    Args:
+        first_mac (str):    第一個 MAC
+        count (int):        MAC 總數 (含第一個)
+        mode (str):         推算方式 ('sequential')
+
+    Returns:
+        list[str]: 與 first_mac 相同格式的 MAC 列表
+
+    Raises:
+        ValueError: MAC 格式錯誤、未知的推算方式，或超出同一 OUI (前 24 bits) 的範圍
+    """
+    if mode != 'sequential':
+        raise ValueError(f"Unsupported MAC derivation: '{mode}'")
+    start = mac_to_int(first_mac)
+    end = start + count - 1
+    if end > MAC_MAX or (start >> 24) != (end >> 24):
+        raise ValueError(f"MAC block {first_mac} + {count - 1} crosses the OUI boundary")
+    return [first_mac] + [int_to_mac(value, first_mac) for value in range(start + 1, end + 1)]
+
+def mac_blocks(macs: list[str]) -> list[tuple[int, int]]:
+    """
+    把 MAC 列表合併為連續區段 [(start, end), ...] (略過 N/A)。
+    """
+    values = sorted({mac_to_int(mac) for mac in macs if mac not in (None, '', 'N/A')})
+    blocks = []
+    for value in values:
+        if blocks and value == blocks[-1][1] + 1:
+            blocks[-1] = (blocks[-1][0], value)
+        else:
+            blocks.append((value, value))
+    return blocks
+
+#===================================================================================================
+# Execute
+#===================================================================================================
+class MacAllocator:
+    """
+    已配置的 MAC 區段：SQLite 永久保存，記憶體中以排序的 start/end 陣列 (array('Q')) 做區間索引，
+    重疊檢查為 O(log n) 的二分搜尋。區段之間互不重疊，同一 owner (SN) 重測時可重新配置。
+
+    測試前的配置為暫時 (provisional)：測試通過時以 commit 確認，失敗或中止時以 release 釋放；
+    程式中斷留下的暫時配置在下次啟動時刪除。
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str = None):
+        self.path = path or config.MAC_ALLOCATION_PATH
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS mac_blocks ("
+                           "start INTEGER PRIMARY KEY, end INTEGER NOT NULL, owner TEXT NOT NULL, created TEXT NOT NULL, "
+                           "provisional INTEGER NOT NULL DEFAULT 0)")
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(mac_blocks)")}
+        if 'provisional' not in columns:    # 舊版資料庫
+            self._conn.execute("ALTER TABLE mac_blocks ADD COLUMN provisional INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_mac_blocks_owner ON mac_blocks (owner)")
+        removed = self._conn.execute("DELETE FROM mac_blocks WHERE provisional = 1").rowcount
+        self._conn.commit()
+        if removed:
+            Log.info(f"Released {removed} provisional MAC block(s) left by an interrupted test.")
+        self._starts, self._ends, self._owners = array('Q'), array('Q'), []
+        for start, end, owner in self._conn.execute("SELECT start, end, owner FROM mac_blocks ORDER BY start"):
+            self._starts.append(start)
+            self._ends.append(end)
+            self._owners.append(owner)
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        return len(self._starts)
+
+    def _overlapping(self, start: int, end: int) -> list[int]:
+        # 區段互不重疊且依 start 排序，因此 end 也遞增：從最後一個 start <= end 的區段往前找
+        indexes = []
+        i = bisect_right(self._starts, end) - 1
+        while i >= 0 and self._ends[i] >= start:
+            indexes.append(i)
+            i -= 1
+        return indexes
+
+    def find_overlap(self, start: int, end: int) -> tuple[int, int, str] | None:
+        """
+        返回與 [start, end] 重疊的一個已配置區段 (start, end, owner)，沒有時返回 None。
+        """
+        with self._lock:
+            indexes = self._overlapping(start, end)
+            if not indexes:
+                return None
+            i = indexes[0]
+            return self._starts[i], self._ends[i], self._owners[i]
+
+    def _remove(self, starts):
+        for start in sorted(starts, reverse=True):
+            i = bisect_left(self._starts, start)
+            del self._starts[i], self._ends[i], self._owners[i]
+
+    def reserve_blocks(self, blocks: list[tuple[int, int, str]], provisional: bool = False) -> list[tuple]:
+        """
+        一次配置多個區段 [(start, end, owner), ...]：先全部檢查，任一區段與其他 owner 的區段 (含同一批) 重疊時全部不配置。
+        同一 owner 先前重疊的區段會被取代 (重新貼標)，與請求完全相同的區段 (重測) 保留原狀。
+
+        Returns:
+            list[tuple]: 重疊的 ((start, end, owner), (已配置 start, end, owner))，全部配置成功時為空列表
+        """
+        with self._lock:
+            conflicts = []
+            for k, (start, end, owner) in enumerate(blocks):
+                others = [(self._starts[i], self._ends[i], self._owners[i]) for i in self._overlapping(start, end)]
+                others += [b for b in blocks[:k] if b[0] <= end and start <= b[1]]
+                overlap = next((b for b in others if b[2] != owner), None)
+                if overlap is not None:
+                    conflicts.append(((start, end, owner), overlap))
+            if conflicts:
+                return conflicts
+
+            replaced, inserted = set(), []
+            for start, end, owner in blocks:
+                indexes = self._overlapping(start, end)
+                if [(self._starts[i], self._ends[i]) for i in indexes] == [(start, end)]:
+                    continue
+                replaced.update(self._starts[i] for i in indexes)
+                inserted.append((start, end, owner))
+            created = datetime.now().isoformat(timespec='seconds')
+            with self._conn:
+                self._conn.executemany("DELETE FROM mac_blocks WHERE start = ?", [(start,) for start in replaced])
+                self._conn.executemany("INSERT INTO mac_blocks (start, end, owner, created, provisional) VALUES (?, ?, ?, ?, ?)",
+                                       [(start, end, owner, created, int(provisional)) for start, end, owner in inserted])
+            self._remove(replaced)
+            for start, end, owner in inserted:
+                i = bisect_right(self._starts, start)
+                self._starts.insert(i, start)
+                self._ends.insert(i, end)
+                self._owners.insert(i, owner)
+            return []
+
+    def reserve(self, start: int, end: int, owner: str, provisional: bool = False) -> tuple[int, int, str] | None:
+        """
+        配置區段給 owner；與其他 owner 的區段重疊時不配置並返回該區段，成功返回 None。
+        """
+        conflicts = self.reserve_blocks([(start, end, owner)], provisional)
+        return conflicts[0][1] if conflicts else None
+
+    def commit(self, owner: str) -> int:
+        """
+        確認 owner 的暫時配置 (測試通過)，返回確認的區段數。
+        """
+        with self._lock, self._conn:
+            return self._conn.execute("UPDATE mac_blocks SET provisional = 0 WHERE owner = ? AND provisional = 1",
+                                      (owner,)).rowcount
+
+    def release(self, owner: str, provisional_only: bool = False) -> int:
+        """
+        釋放 owner 的區段 (provisional_only=True 時只釋放暫時配置)，返回釋放的區段數。
+        """
+        condition = "owner = ? AND provisional = 1" if provisional_only else "owner = ?"
+        with self._lock:
+            with self._conn:
+                starts = [row[0] for row in self._conn.execute(f"SELECT start FROM mac_blocks WHERE {condition}", (owner,))]
+                self._conn.executemany("DELETE FROM mac_blocks WHERE start = ?", [(start,) for start in starts])
+            self._remove(starts)
+            return len(starts)
+
+    def blocks(self, owner: str) -> list[tuple[int, int, bool]]:
+        """
+        返回 owner 的區段 [(start, end, provisional), ...]。
+        """
+        with self._lock:
+            return [(start, end, bool(provisional)) for start, end, provisional in self._conn.execute(
+                "SELECT start, end, provisional FROM mac_blocks WHERE owner = ? ORDER BY start", (owner,))]
+
+def _product_owners(product_info: dict) -> dict[str, tuple[list[int], list[str]]]:
+    """
+    依 SN 分組每個設備的 MAC ($macNM，owner 為 $snN；沒有 SN 的設備略過)，返回 {sn: ([設備編號], [MAC])}。
+    """
+    devices = {}
+    for key, value in product_info.items():
+        match = re.fullmatch(r'\$mac(\d)(\d+)', key)
+        if match:
+            devices.setdefault(int(match.group(1)), []).append(value)
+    owners = {}
+    for device_id, macs in sorted(devices.items()):
+        owner = product_info.get(f"$sn{device_id}")
+        if owner in (None, '', 'N/A'):
+            continue
+        device_ids, owner_macs = owners.setdefault(owner, ([], []))
+        device_ids.append(device_id)
+        owner_macs.extend(macs)
+    return owners
+
+def reserve_product_macs(product_info: dict, allocator: MacAllocator = None) -> list[str]:
+    """
+    測試前為每個設備的 MAC 暫時配置區段：全部設備檢查通過才在同一個交易中配置，
+    測試結束時由 settle_product_macs 確認 (通過) 或釋放 (失敗/中止)。
+
+    Returns:
+        list[str]: 與其他產品重疊的說明，全部配置成功時為空列表 (有重疊時不配置任何區段)
+    """
+    if not config.MAC_ALLOCATION_ENABLED:
+        return []
+    if allocator is None:    # 空的 MacAllocator 為 falsy (__len__)，不能用 or
+        allocator = MacAllocator.instance()
+    blocks, labels = [], {}
+    for owner, (device_ids, macs) in _product_owners(product_info).items():
+        try:
+            owner_blocks = mac_blocks(macs)
+        except ValueError as e:     # 腳本 Barcodes 允許非 MAC 格式時不配置
+            Log.warn(f"Skipping MAC allocation for device {device_ids}: {e}")
+            continue
+        labels[owner] = ",".join(str(device_id) for device_id in device_ids)
+        blocks += [(start, end, owner) for start, end in owner_blocks]
+
+    return [f"[{labels[owner]}] MAC {int_to_mac(start)} ~ {int_to_mac(end)} 與 {overlap[2]} 的 "
+            f"{int_to_mac(overlap[0])} ~ {int_to_mac(overlap[1])} 重疊"
+            for (start, end, owner), overlap in allocator.reserve_blocks(blocks, provisional=True)]
+
+def settle_product_macs(product_info: dict, passed: bool, allocator: MacAllocator = None):
+    """
+    測試結束：通過時確認暫時配置的 MAC 區段，失敗或中止時釋放 (SN 掃錯時不會永久佔用區段)。
+    """
+    if not config.MAC_ALLOCATION_ENABLED or not product_info:
+        return
+    if allocator is None:
+        allocator = MacAllocator.instance()
+    for owner in _product_owners(product_info):
+        if passed:
+            allocator.commit(owner)
+        else:
+            allocator.release(owner, provisional_only=True)
+
+#===================================================================================================
+# Main
+#===================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List or release MAC blocks allocated to a product SN")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ls = sub.add_parser("list", help="列出 SN 的 MAC 區段")
+    ls.add_argument("sn")
+    release = sub.add_parser("release", help="釋放 SN 的 MAC 區段 (例如 SN 掃錯)")
+    release.add_argument("sn")
+    args = parser.parse_args(argv)
+
+    allocator = MacAllocator()
+    try:
+        if args.command == "list":
+            for start, end, provisional in allocator.blocks(args.sn):
+                print(f"{int_to_mac(start)} ~ {int_to_mac(end)}{'  (provisional)' if provisional else ''}")
+        else:
+            count = allocator.release(args.sn)
+            Log.info(f"Released {count} MAC block(s) of {args.sn}")
+            print(f"{count} MAC block(s) released.")
+    finally:
+        allocator.close()
+
+if __name__ == "__main__":
+    main()
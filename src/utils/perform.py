@@ -77,6 +77,7 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
 
         # 設置MAC和SN
         self._perform_data.product_info = product_info or {} # 產品資訊
+        self._set_log_context()
 
         # 將Items轉換為queueue，並加上index用於執行
         convert_execute_items = self._convert_execute_items(
@@ -94,10 +95,24 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         UiUpdater.scriptProgressChanged.emit(0, self._total_items_to_run)
         UiUpdater.itemProgressChanged.emit(0,5) # 5 steps: Prepare, Start, Running, Validate, Finish
 
-        Log.info(f'Starting execution with {self._total_items_to_run} items.')
+        Log.info('Starting execution with %d items.', self._total_items_to_run)
         self._is_running = True
         self._execute_next_item()   # Start the first item
 
+    def _set_log_context(self):
+        """
+        設定本次執行的日誌關聯欄位 (JSON-lines 日誌中的 station, session, mo, sn)。
+        """
+        product_info = self._perform_data.product_info
+        def values(prefix):
+            found = [value for key, value in sorted(product_info.items())
+                     if key.startswith(prefix) and key[len(prefix):].isdigit() and value not in (None, '', 'N/A')]
+            return list(dict.fromkeys(found)) or None
+        Log.clear_context()
+        Log.set_context(station=config.STATION_NAME,
+                        session=getattr(self._perform_data.report, 'db_session_id', None),
+                        mo=values('$mo'), sn=values('$sn'))
+
     def _convert_execute_items(self, all_items:list[TestItems], selected_item_indices=None):
         """
         執行項目，加上新index用於執行
@@ -150,10 +165,10 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
                 self._execute_next_item()
                 return
         
-            Log.info(f"Executing item index {self._current_item_original_index}: '{self._current_item_object.title}'")
+            Log.info("Executing item index %s: '%s'", self._current_item_original_index, self._current_item_object.title)
             self._prepare_and_run_process()
         except Exception as e:
-            Log.error(f'Error executing next item: {e}', exc_info=True)
+            Log.error('Error executing next item: %s', e, exc_info=True)
 
     def _should_skip_item(self, item_title: str) -> bool:
         """
@@ -162,7 +177,7 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         if hasattr(self._perform_data.script, 'test_mode') and self._perform_data.script.test_mode in config.SKIP_MODE:
             skip_keyword = config.SKIP_MODE.get(self._perform_data.script.test_mode)
             if skip_keyword and skip_keyword in item_title:
-                Log.info(f"根據測試模式 '{self._perform_data.script.test_mode.name}'，跳過測試項目 '{item_title}'")
+                Log.info("根據測試模式 '%s'，跳過測試項目 '%s'", self._perform_data.script.test_mode.name, item_title)
                 return True
         return False
     
@@ -174,6 +189,7 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
             return
         
         item = self._current_item_object
+        Log.set_context(item=self._current_item_original_index, attempt=self._current_retry_count)
 
         UiUpdater.itemProgressChanged.emit(0, 5) # Step 0: Prepare
         UiUpdater.currentItemChanged.emit(item.title + (f" (Retry {self._current_retry_count})" if self._current_retry_count > 0 else ""))
@@ -188,7 +204,7 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         executable_path = os.path.join(config.API_TOOLS_PATH, self._current_command.split()[0]) # Basic split, might need refinement
         args = self._current_command.split()[1:]
 
-        Log.debug(f"Attempting to run command: '{executable_path}' with args: {args}")
+        Log.debug("Attempting to run command: '%s' with args: %s", executable_path, args)
         UiUpdater.itemProgressChanged.emit(1, 5) # Step 1: Start
 
         # Ensure QProcess is not already running
@@ -240,11 +256,15 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         item_title = self._current_item_object.title
         item_index = self._current_item_original_index
 
-        Log.info(f"Item '{self._current_item_object.title}' finished.")
-        Log.debug(f"  Exit Code: {exitCode}, Exit Status: {exitStatus}")
-        Log.debug(f"  Stdout: {result_value}")
+        self._save_attempt_output(item_title, exitCode, exitStatus == QProcess.CrashExit,
+                                  output_bytes.data(), error_bytes.data())
+
+        Log.info("Item '%s' finished.", item_title)
+        if Log.is_debug():  # stdout 可能很長，DEBUG 未啟用時不組合
+            Log.debug("  Exit Code: %s, Exit Status: %s", exitCode, exitStatus)
+            Log.debug("  Stdout: %s", result_value)
         if error_output:
-            Log.warn(f"  Stderr: {error_output}")
+            Log.warn("  Stderr: %s", error_output)
 
         # --- Unified Failure Handling Logic ---
         failure_reason = None
@@ -253,11 +273,11 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         # Check process execution status
         if exitStatus == QProcess.CrashExit:
             failure_reason = f"Process crashed. Stderr: {error_output}"
-            Log.error(f"Process crashed for item {item_index}: {failure_reason}")
+            Log.error("Process crashed for item %s: %s", item_index, failure_reason)
             # self._handle_item_failure(f"Process crashed. Stderr: {error_output}", False) # Crashes are likely not retryable
         elif exitCode != 0:
             failure_reason = f"Non-zero exit code ({exitCode}). Stderr: {error_output}"
-            Log.error(f"Process exited abnormally for item {item_index}: {failure_reason}")
+            Log.error("Process exited abnormally for item %s: %s", item_index, failure_reason)
             # Non-zero exit might be retryable depending on the script's design
             # Let's assume for now it means failure, but check retry logic
             # self._handle_item_failure(f"Exit code {exitCode}. Stderr: {error_output}", True) # Check if retryable
@@ -272,10 +292,10 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
             # --- Decision Point ---
             if not validation_passed:
                 failure_reason = f"Validation failed (Value: '{result_value}')"
-                Log.warn(f"Item {item_index} FAILED validation: {failure_reason}")
+                Log.warn("Item %s FAILED validation: %s", item_index, failure_reason)
 
             if validation_passed and failure_reason is None:
-                Log.info(f"Item {self._current_item_original_index} PASSED validation.")
+                Log.info("Item %s PASSED validation.", item_index)
                 self._handle_item_success(result_value)
             else:
                 self._handle_item_failure(result_value, allow_retry=True) # Always allow retry check
@@ -293,7 +313,7 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         item_title = self._current_item_object.title
         item_index = self._current_item_original_index
 
-        Log.error(f"QProcess start error for item {item_index} ('{item_title}'): {error} - {error_string}")
+        Log.error("QProcess start error for item %s ('%s'): %s - %s", item_index, item_title, error, error_string)
 
         # Treat process start error as a failure case that should attempt retries
         failure_reason = f"Process start error: {error_string}"
@@ -331,7 +351,7 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
 
         except (ValueError, TypeError):
             # If conversion fails, it's not within a numerical range
-            Log.warn(f"Cannot compare value '{result_str}' numerically with range [{min_val_str}, {max_val_str}]")
+            Log.warn("Cannot compare value '%s' numerically with range [%s, %s]", result_str, min_val_str, max_val_str)
             # Optional: Could add string comparison logic here if needed
             # If min/max are also strings, maybe check for exact match?
             # if str(min_val_str).strip() != "" and str(min_val_str) == str(max_val_str):
@@ -370,7 +390,7 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         if allow_retry and self._current_retry_count < retry_limit:
             # Perform retry
             self._current_retry_count += 1
-            Log.info(f"Retrying item {original_index} (Attempt {self._current_retry_count}/{retry_limit})")
+            Log.info("Retrying item %s (Attempt %d/%d)", original_index, self._current_retry_count, retry_limit)
 
             # Update UI Table to show "Retrying" or similar? (Optional)
             UiUpdater.itemsTableChanged.emit(original_index, f"Retrying...", False) # Indicate retry in table
@@ -385,7 +405,7 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
             # Don't proceed to save/update final counts yet
         else:
             # No more retries allowed or needed
-            Log.error(f"Item {original_index} definitively FAILED after {self._current_retry_count} retries.")
+            Log.error("Item %s definitively FAILED after %d retries.", original_index, self._current_retry_count)
 
              # Save final result (Fail)
             self._save_execution_result(item, result_or_error, False)
@@ -431,14 +451,26 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         
         try:
             self._perform_data.report.add_test_result(
-                ItemResult(item.title, item.unit, item.valid_min, item.valid_max, value, check_result)
+                ItemResult(item.title, item.unit, item.valid_min, item.valid_max, value, check_result, self._current_retry_count)
             )
         except Exception as e:
-            Log.error(f"Error saving result for item '{item.title}': {e}", exc_info=True)
+            Log.error("Error saving result for item '%s': %s", item.title, e, exc_info=True)
+
+    def _save_attempt_output(self, item_title: str, exit_code, crashed: bool, stdout: bytes, stderr: bytes):
+        """
+        保存本次執行 (含重試) 的原始輸出，供失敗分析。
+        """
+        if not self._perform_data.report:
+            return
+        try:
+            self._perform_data.report.add_attempt_output(item_title, self._current_retry_count, exit_code, crashed,
+                                                         bytes(stdout), bytes(stderr))
+        except Exception as e:
+            Log.error("Error saving output for item '%s': %s", item_title, e, exc_info=True)
 
     def _handle_execution_complete(self, overall_success: bool):
         """Handles the completion of the entire test sequence."""
-        Log.info(f"Execution sequence complete. Overall Success: {overall_success}")
+        Log.info("Execution sequence complete. Overall Success: %s", overall_success)
         result = f"測試結束。\n成功: {self._pass_count}, 失敗: {self._fail_count}, 總計: {self._total_items_to_run}"
         Log.info(result)
 
@@ -486,8 +518,9 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         if self._perform_data.report:
              # Pass counts accurately reflecting completed items before stop
              final_item_count = self._total_items_to_run
-             self._perform_data.report.End_Record_and_Create_Report(final_result, final_item_count, self._pass_count, self._fail_count)
-             Log.info(f"Final report generated: {self._perform_data.report.final_result}")
+             # 資料庫更新、報告生成與上傳在背景執行，不阻塞 GUI
+             self._perform_data.report.End_Record_and_Create_Report_Async(final_result, final_item_count, self._pass_count, self._fail_count)
+             Log.info("Final report queued: %s", self._perform_data.report.final_result)
         else:
              Log.warn("No report object to finalize.")
 
@@ -500,4 +533,5 @@ class PerformManager(QObject):                   # 繼承 QObject，如果需要
         Log.info('Execution stopped.')
         UiUpdater.currentItemChanged.emit("已停止測試")
         UiUpdater.startBtnChanged.emit("Start") # Reset button state to "Start" 
-        self._handle_execution_complete(final_result)
\ No newline at end of file
+        self._handle_execution_complete(final_result)
+        Log.clear_context()
\ No newline at end of file
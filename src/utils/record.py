@@ -3,21 +3,62 @@
 #===================================================================================================
 import os
 import shutil
+import hashlib
+import tempfile
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader, BaseLoader
-from PySide6.QtCore import QFile, QIODevice
+from jinja2 import Environment, FileSystemLoader
+from PySide6.QtCore import QThreadPool
 
 from res import res_rc
 from src.config import config
 from src.utils.log import Log
-from src.utils.commonUtils import ItemResult
+from src.utils.commonUtils import ItemResult, UiUpdater
 from src.utils.database import DatabaseManager
+from src.utils.journal import ResultJournal, DatabaseWriter, write_with_retry
+from src.utils.replication import ReplicationAgent
+from src.utils.upload import UploadSpool
+from src.utils.dashboard import schedule_dashboard_update
+from src.utils.duplicate import DuplicateGuard
+from src.utils.macalloc import settle_product_macs
+from src.utils.result_writer import result_items, write_json_result, write_junit_result
+from src.utils.report_index import ReportIndex
 from src.utils.script import Script
+from src.utils import template as template_cache
+
+REPORT_OBJECT_DIR = '.objects'     # 報告內容 (以 sha256 命名) 的暫存目錄
+LIVE_INCOMPLETE_SUFFIX = '_INCOMPLETE'
+
+#===================================================================================================
+# Live report recovery
+#===================================================================================================
+def recover_live_reports():
+    """
+    程式啟動時把上次未完成 (當機或被強制結束) 的即時報告移到報告目錄，檔名加上 _INCOMPLETE。
+    """
+    try:
+        entries = list(os.scandir(config.REPORT_LIVE_PATH))
+    except FileNotFoundError:
+        return
+    current = f"_{os.getpid()}.html"
+    for entry in entries:
+        if not entry.is_file() or not entry.name.endswith('.html') or entry.name.endswith(current):
+            continue
+        stem = os.path.splitext(entry.name)[0]
+        target = os.path.join(config.REPORT_FILE_PATH, f"{stem}{LIVE_INCOMPLETE_SUFFIX}.html")
+        try:
+            with open(entry.path, "a", encoding="utf-8") as f:
+                f.write('\n<tr><td colspan="6" class="status-false">Test interrupted, report incomplete.</td></tr>\n')
+            os.replace(entry.path, target)
+            Log.warn(f"Incomplete live report recovered: {target}")
+        except OSError as e:
+            Log.error(f"Failed to recover live report {entry.path}: {e}")
 
 #===================================================================================================
 # Execute
 #===================================================================================================
 class ReportGenerator:
+    _report_pool = None     # 報告收尾專用執行緒 (單一執行緒，報告依序寫出/上傳)
+
     def __init__(self, script: Script, product_info, tester_name, station):
         """
         初始化測試報告。
@@ -60,22 +101,26 @@ class ReportGenerator:
         self.pass_tests_count = 0
         self.final_result = True
         self.items_result = []
+        self.items_time = []        # 每個項目完成的時間 (JSON/JUnit 輸出的項目時間)
 
         # --- Database Integration ---
         self.db_manager = None
         self.db_session_id = None
+        self.journal = None     # write-ahead journal，資料庫寫入完成前保存結果
+
+        # --- Live Report ---
+        self.live_path = None   # 測試中持續更新的報告 (完成時以 rename 換成最終報告)
+        self.live_file = None
 
         self.db_init()
+        self._live_init()
 
     def db_init(self):
         """
         初始化資料庫連線，並建立新的測試 Session。
         """
+        script_in_for_db = product_in_for_db = tester_in_for_db = None
         try:
-            Log.debug("Initializing database connection...")
-            self.db_manager = DatabaseManager()
-            self.db_manager.initialize_database()
-
             # --- 準備 Script Info ---
             script_name = getattr(self,'product_name', 'N/A')
             script_version = getattr(self.script, 'version', 'N/A')
@@ -84,6 +129,8 @@ class ReportGenerator:
                 "script_name": script_name,
                 "script_version": script_version,
                 "total_tests": len(script_items),
+                "content_hash": getattr(self.script, 'content_hash', ''),
+                "file_name": os.path.basename(getattr(self.script, 'file_name', '') or ''),
             }
 
             # --- 準備 Product Info ---
@@ -98,14 +145,20 @@ class ReportGenerator:
             else:
                 product_in_for_db.update({"mo_rx": "N/A", "sn_rx": "N/A", "mac_rx_1": "N/A", "mac_rx_2": "N/A"})
 
+            # 所有 DUT (不限數量與 MAC 數) 寫入 duts / dut_macs
+            product_in_for_db["duts"] = self._get_db_duts()
+
             # --- 準備 Tester Info ---
             tester_in_for_db = {
                 "user": getattr(self, 'tester_name', 'Unknown'),
                 "station": getattr(self, 'station', 'Unknown')
             }
 
+            Log.debug("Initializing database connection...")
+            self.db_manager = DatabaseManager()     # 單例，首次建立時連線
+
             # --- 建立資料庫 Session ---
-            Log.debug(f"Creating test session in database for '{self.script.version}'...")
+            Log.debug("Creating test session in database for '%s'...", self.script.version)
             self.db_session_id = self.db_manager.create_test_session(
                 script_info = script_in_for_db,
                 product_info = product_in_for_db,
@@ -123,6 +176,43 @@ class ReportGenerator:
             self.db_manager = None
             self.db_session_id = None
 
+        if tester_in_for_db is not None:
+            self._journal_init(script_in_for_db, product_in_for_db, tester_in_for_db)
+
+    def _journal_init(self, script_info, product_info, tester_info):
+        """
+        建立本次測試的 journal；Session 建立失敗時仍記錄 (pending)，下次啟動重播寫入資料庫。
+        """
+        try:
+            self.journal = ResultJournal.create(self.db_session_id, script_info, product_info, tester_info,
+                                                self.mode, self.start_time)
+            self.journal.failed = self.db_session_id is None
+            Log.debug("Result journal created: %s", self.journal.path)
+        except Exception as e:
+            Log.error(f"Error creating result journal: {e}", exc_info=True)
+            self.journal = None
+
+    def _get_db_duts(self):
+        """
+        依腳本產品設定產生所有 DUT 的資料庫資料。
+
+        Returns:
+            list[dict]: [{'slot': 1, 'mo': ..., 'sn': ..., 'macs': [...]}, ...]
+        """
+        product_info = self.product_info or {}
+        products = getattr(self.script, 'product', []) or []
+        num_duts = min(self.script.pairing + 1, len(products))
+        duts = []
+        for slot in range(1, num_duts + 1):
+            mac_count = max(getattr(products[slot - 1], 'mac_count', 0) or 0, 2)
+            duts.append({
+                'slot': slot,
+                'mo': product_info.get(f"$mo{slot}") or 'N/A',
+                'sn': product_info.get(f"$sn{slot}") or 'N/A',
+                'macs': [product_info.get(f"$mac{slot}{i}") or 'N/A' for i in range(1, mac_count + 1)],
+            })
+        return duts
+
     def _get_db_product_fields(self, dut_id, db_prefix):
         """
         輔助函式，根據 DUT ID (1 or 2) 和資料庫欄位前綴 (tx or rx)
@@ -171,28 +261,156 @@ class ReportGenerator:
 
         Param:    items_result (ItemResult): 單個測試項目的結果對象
         """
+        timestamp = datetime.now()
         self.items_result.append(item_result)  # 將測試結果加入列表
-        Log.debug(f"Added item result '{item_result.title}' to internal list.")
+        self.items_time.append(timestamp)
+        Log.debug("Added item result '%s' to internal list.", item_result.title)
 
-        self._db_add_test_result(item_result)  # 將測試結果寫入資料庫
+        self._db_add_test_result(item_result, timestamp)  # 將測試結果寫入資料庫
+        self._live_append(item_result)  # 附加到即時報告
 
-    def _db_add_test_result(self, item_result : ItemResult):
+    #===================================================================================================
+    # Live report
+    #===================================================================================================
+    def _live_init(self):
+        """
+        建立即時報告：先寫入表頭 (尚無結束時間與統計)，之後每個項目完成時只附加一列，不重新渲染整份報告。
         """
-        新增測試結果到資料庫
+        if not config.REPORT_LIVE_ENABLED:
+            return
+        try:
+            os.makedirs(config.REPORT_LIVE_PATH, exist_ok=True)
+            station_str = self.station if self.station else "NoStation"
+            name = f"{station_str}_{self.start_time:%Y%m%d_%H%M%S}_{os.getpid()}.html"
+            self.live_path = os.path.join(config.REPORT_LIVE_PATH, name)
+
+            report_data = self._create_data()
+            report_data.update(live=True, test_results=[], final_result=None, end_time=None, total_time=None)
+            self.live_file = open(self.live_path, "w", encoding="utf-8")
+            self.live_file.write(self._load_template().render(**report_data))
+            self.live_file.flush()
+            Log.debug("Live report started: %s", self.live_path)
+        except Exception as e:
+            Log.error(f"建立即時報告時發生錯誤: {e}", exc_info=True)
+            self._live_discard()
+
+    def _live_append(self, item_result: ItemResult):
+        if self.live_file is None:
+            return
+        try:
+            self.live_file.write(self._load_template().module.item_row(item_result) + "\n")
+            self.live_file.flush()
+        except Exception as e:
+            Log.error(f"更新即時報告時發生錯誤: {e}", exc_info=True)
+            self._live_discard()
+
+    def _live_finish(self, output_data: str) -> str | None:
+        """
+        以完整報告取代即時報告 (先寫暫存檔再 rename，不會出現寫一半的檔案)，返回檔案路徑；沒有即時報告時返回 None。
+        """
+        live_path = getattr(self, 'live_path', None)
+        if live_path is None:
+            return None
+        if self.live_file is not None:
+            self.live_file.close()
+            self.live_file = None
+        tmp_path = live_path + '.tmp'
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(output_data)
+        os.replace(tmp_path, live_path)
+        self.live_path = None
+        return live_path
+
+    def _live_discard(self):
+        if getattr(self, 'live_file', None) is not None:
+            self.live_file.close()
+            self.live_file = None
+        if getattr(self, 'live_path', None) is not None:
+            try:
+                os.remove(self.live_path)
+            except OSError:
+                pass
+            self.live_path = None
+
+    def _db_add_test_result(self, item_result : ItemResult, timestamp: datetime = None):
+        """
+        新增測試結果到資料庫 (先寫入 journal，資料庫寫入交給背景執行緒)
 
         Param:    items_result (ItemResult): 單個測試項目的結果對象
         """
+        if self.journal is not None:
+            try:
+                timestamp = timestamp or datetime.now()
+                seq = self.journal.append_item(item_result, timestamp)
+                self.journal.sync()
+                if self.db_manager and self.db_session_id is not None:
+                    DatabaseWriter.instance().submit(self._db_insert_job, item_result, seq, timestamp)
+                return
+            except Exception as err:
+                Log.error(f"Journal error appending item result '{item_result.title}': {err}", exc_info=True)
+
         if self.db_manager and self.db_session_id is not None:
             try:
                 # 將測試結果寫入資料庫
-                Log.debug(f"Inserting item result '{item_result.title}' into database (Session ID: {self.db_session_id}).")
+                Log.debug("Inserting item result '%s' into database (Session ID: %s).", item_result.title, self.db_session_id)
                 self.db_manager.insert_test_item_result(self.db_session_id, item_result)
             except Exception as err:
                 Log.error(f"Database error inserting item result '{item_result.title}': {err}", exc_info=True)
         else:
             Log.warn(f"Cannot save item result '{item_result.title}' to database: DB session not available.")
+
+    def add_attempt_output(self, item_title: str, attempt: int, exit_code, crashed: bool, stdout: bytes, stderr: bytes):
+        """
+        保存一次執行的原始 stdout/stderr (壓縮與寫入在背景寫入執行緒進行，不阻塞 UI)。
+        """
+        if self.db_manager and self.db_session_id is not None:
+            DatabaseWriter.instance().submit(self.db_manager.insert_item_attempt, self.db_session_id, item_title,
+                                             attempt, exit_code, crashed, stdout, stderr, datetime.now())
+
+    def _db_insert_job(self, item_result: ItemResult, seq: int, timestamp: datetime):
+        """
+        (背景執行緒) 寫入單筆項目結果，重試仍失敗時保留 journal。
+        """
+        if not write_with_retry(self.db_manager.insert_test_item_result, self.db_session_id, item_result,
+                                seq=seq, timestamp=timestamp):
+            Log.error(f"Item result '{item_result.title}' kept in journal for replay (Session ID: {self.db_session_id}).")
+            self.journal.failed = True
     
-    def End_Record_and_Create_Report(self, final_result, total_items, pass_items, fail_items):
+    @classmethod
+    def _pool(cls) -> QThreadPool:
+        if cls._report_pool is None:
+            cls._report_pool = QThreadPool()
+            cls._report_pool.setMaxThreadCount(1)
+        return cls._report_pool
+
+    @classmethod
+    def wait_for_reports(cls, msecs: int = -1) -> bool:
+        """
+        等待所有背景報告完成 (關閉程式前呼叫)，返回是否在時限內完成。
+        """
+        if cls._report_pool is None:
+            return True
+        return cls._report_pool.waitForDone(msecs)
+
+    def End_Record_and_Create_Report_Async(self, final_result, total_items, pass_items, fail_items):
+        """
+        在背景執行緒結束測試記錄並生成/上傳報告，完成後發出 UiUpdater.reportFinished。
+        結束時間與最終結果在呼叫當下決定，GUI 可立即開始下一個測試。
+        """
+        self.end_time = datetime.now()
+        self.final_result = final_result
+
+        def _run():
+            try:
+                ok = self.End_Record_and_Create_Report(final_result, total_items, pass_items, fail_items, self.end_time)
+            except Exception as e:
+                Log.error(f"Background report error: {e}", exc_info=True)
+                ok = False
+            UiUpdater.reportFinished.emit(bool(ok), self.product_name)
+
+        self._pool().start(_run)
+
+    def End_Record_and_Create_Report(self, final_result, total_items, pass_items, fail_items, end_time=None):
         """
         設定測試結束時間、最終結果，更新資料庫 Session，並生成 HTML 報告。
 
@@ -201,10 +419,11 @@ class ReportGenerator:
             total_items (int): 執行的總項目數。
             pass_items (int): 通過的項目數。
             fail_items (int): 失敗的項目數。
+            end_time (datetime): (Optional) 測試結束時間，預設為現在時間。
         """
         Log.info("Ending test record and creating report...")
 
-        self.end_time = datetime.now()  # 取得當前日期時間
+        self.end_time = end_time or datetime.now()  # 取得當前日期時間
         self.end_time_str = self.end_time.strftime("%H:%M:%S")  # 格式化時間
         self._calculate_total_time()  # 計算測試總時間
 
@@ -215,7 +434,8 @@ class ReportGenerator:
         # 最終測試結果
         # self.final_result = (self.fail_tests_count == 0 and self.pass_tests_count == self.total_tests_count and self.total_tests_count > 0)
         self.final_result = final_result  # 使用傳入的最終結果
-        Log.info(f"Test finished: {self.final_result}, {self.total_tests_count} tests, {self.fail_tests_count} failed, {self.pass_tests_count} Passed")
+        Log.info("Test finished: %s, %d tests, %d failed, %d Passed",
+                 self.final_result, self.total_tests_count, self.fail_tests_count, self.pass_tests_count)
         
         # --- Update Database Session ---
         self._db_end_record()  # 結束資料庫 Session
@@ -227,15 +447,50 @@ class ReportGenerator:
         """
         結束測試記錄，並更新資料庫 Session。
         """
+        if self.final_result:
+            DuplicateGuard.instance().add_duts(self._get_db_duts())    # 資料庫寫入前即可擋下重複的 SN/MAC
+        try:
+            settle_product_macs(self.product_info, self.final_result)  # 通過時確認 MAC 區段，失敗/中止時釋放
+        except Exception as e:
+            Log.error(f"Error settling MAC allocation: {e}", exc_info=True)
+
+        if self.journal is not None:
+            try:
+                self.journal.append_end(self.end_time, self.final_result)
+                self.journal.sync(force=True)
+                if self.db_manager and self.db_session_id is not None:
+                    Log.info(f"Ending database test session {self.db_session_id}.")
+                    DatabaseWriter.instance().submit(self._db_end_job)
+                else:
+                    self.journal.close()
+                    Log.warn(f"Database session not available, results kept in journal: {self.journal.path}")
+                return
+            except Exception as e:
+                Log.error(f"Journal error ending session: {e}", exc_info=True)
+
         if self.db_manager and self.db_session_id is not None:
             try:
                 Log.info(f"Ending database test session {self.db_session_id}.")
                 self.db_manager.update_test_session_end(self.db_session_id, self.end_time, self.final_result)
+                ReplicationAgent.notify()   # 通知背景複製代理送出新資料 (不阻塞)
+                schedule_dashboard_update(self.end_time, self.station)
             except Exception as e:
                 Log.error(f"Unexpected error ending session for ID {self.db_session_id}: {e}", exc_info=True)
         else:
             Log.warn("Cannot end database session: DB session not available.")
 
+    def _db_end_job(self):
+        """
+        (背景執行緒) 排在所有項目之後執行：結束 Session，全部成功後刪除 journal。
+        """
+        if not write_with_retry(self.db_manager.update_test_session_end, self.db_session_id,
+                                self.end_time, self.final_result):
+            Log.error(f"Failed to end database session {self.db_session_id}, kept in journal for replay.")
+            self.journal.failed = True
+        self.journal.complete()
+        ReplicationAgent.notify()   # 通知背景複製代理送出新資料 (不阻塞)
+        schedule_dashboard_update(self.end_time, self.station)  # 排在 Session 結束之後，由統計表重新產生當天總覽
+
     def _calculate_total_time(self):
         """
         計算測試總時間。
@@ -248,7 +503,7 @@ class ReportGenerator:
             minutes, seconds = divmod(remainder, 60)
             self.total_time_str = "{:02}:{:02}:{:06.3f}".format(int(hours), int(minutes), seconds)
             self.total_time = time_diff # Store the timedelta object if needed
-            Log.debug(f"Calculated total time: {self.total_time_str}")
+            Log.debug("Calculated total time: %s", self.total_time_str)
         else:
              self.total_time_str = "N/A"
              Log.warn("Could not calculate total time: start or end time missing.")
@@ -270,21 +525,15 @@ class ReportGenerator:
             return False
         
     def _load_template_old(self):
-        Log.debug(f"Loading report template from: {config.REPORT_TEMPLATE_PATH}, file: {config.REPORT_TEMPLATE_FILE}")
+        Log.debug("Loading report template from: %s, file: %s", config.REPORT_TEMPLATE_PATH, config.REPORT_TEMPLATE_FILE)
         env = Environment(loader=FileSystemLoader(config.REPORT_TEMPLATE_PATH))         # 設定 Jinja2 環境
         return env.get_template(config.REPORT_TEMPLATE_FILE)                            # 載入新的模板
     
     def _load_template(self):
-        file = QFile(config.REPORT_FILE)
-        if not file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
-            Log.error(f"無法打開報告模板文件: {config.REPORT_FILE}")
-            return None
-        
-        template_content = str(file.readAll().data().decode('utf-8'))
-        file.close()
-
-        env = Environment(loader=BaseLoader())  # 使用 BaseLoader 來處理字符串內容
-        return env.from_string(template_content)  # 從字符串創建模板對象
+        """
+        從共用模板快取取得已編譯的報告模板 (只有第一次或 resource 變更時才讀取與編譯)。
+        """
+        return template_cache.get_template(os.path.basename(config.REPORT_FILE))
     
     def _create_data(self):
         duts_for_template = []
@@ -398,19 +647,23 @@ class ReportGenerator:
                         should_save = True  # TEST_MODE.PAIR 時儲存所有 DUT
 
                     if should_save:
-                        # 寫入檔案
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            f.write(output_data)
                         created_files.append(file_path)
+
+                # 報告只寫入一次，多個 DUT 的檔名共用同一份內容
+                created_files = self._write_report_links(output_data, created_files)
+                created_files += self._write_result_files(created_files)
             else:
                 file_path = os.path.join(config.REPORT_FILE_PATH, f"{filename}.html")
 
                 # 寫入檔案
                 with open(file_path, "w", encoding="utf-8") as f:
                     f.write(output_data)     
+                self._live_discard()
+                self._write_result_files([file_path])
             
+            self._index_reports([path for path in created_files if path.endswith('.html')])
             for path in created_files:
-                Log.info(f"HTML 報告已生成: {path}")
+                Log.info(f"報告已生成: {path}")
                 self.upload_report(path)  # 上傳報告
                 
             return bool(created_files)  # 如果創建了至少一個檔案，返回True
@@ -421,25 +674,118 @@ class ReportGenerator:
             Log.error(f"生成報告時發生錯誤: '{file_path}': {e}", exc_info=True)
             return False # Indicate failure
         
+    def _write_report_links(self, output_data: str, file_paths: list[str]) -> list[str]:
+        """
+        把報告寫入一次 (content-addressed，以內容 sha256 命名)，各 DUT 的檔名以 hardlink 指向同一份內容；
+        檔案系統不支援 hardlink 時改為複製。有即時報告時直接以它作為這份內容。
+        """
+        if not file_paths:
+            self._live_discard()
+            return []
+
+        live_path = self._live_finish(output_data)
+        if live_path is not None:
+            return self._link_report_object(live_path, file_paths)
+
+        object_dir = os.path.join(config.REPORT_FILE_PATH, REPORT_OBJECT_DIR)
+        os.makedirs(object_dir, exist_ok=True)
+        digest = hashlib.sha256(output_data.encode('utf-8')).hexdigest()
+        object_path = os.path.join(object_dir, f"{digest}.html")
+        with open(object_path, "w", encoding="utf-8") as f:
+            f.write(output_data)
+        return self._link_report_object(object_path, file_paths)
+
+    @staticmethod
+    def _link_report_object(object_path: str, file_paths: list[str]) -> list[str]:
+        """
+        以 hardlink (不支援時複製) 建立每個檔名，完成後移除暫存的 object 檔。
+        """
+        try:
+            for path in file_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+                try:
+                    os.link(object_path, path)
+                except OSError:
+                    shutil.copyfile(object_path, path)
+        finally:
+            os.remove(object_path)  # 各檔名仍指向同一份資料
+        return file_paths
+
+    def _index_reports(self, html_paths: list[str]):
+        """
+        把報告的 MO/SN/MAC、測試站、腳本與不良項目加入全文索引 (失敗不影響報告)。
+        """
+        if not html_paths:
+            return
+        try:
+            index = ReportIndex.instance()
+            duts = self._get_db_duts()
+            failed_items = [item.title for item in self.items_result if not item.result]
+            for path in html_paths:
+                index.add(os.path.basename(path), self.station, f"{self.product_name} {self.version}",
+                          duts, failed_items, self.final_result, self.end_time)
+        except Exception as e:
+            Log.error(f"建立報告索引時發生錯誤: {e}", exc_info=True)
+
+    def _create_result_header(self) -> dict:
+        """
+        JSON/JUnit 輸出的 Session 資訊 (產品、測試站、時間與統計)。
+        """
+        total_time_sec = (self.end_time - self.start_time).total_seconds() if self.end_time else None
+        return {
+            "product_name": self.product_name,
+            "script_version": self.version,
+            "script_hash": getattr(self.script, 'content_hash', ''),
+            "session_id": self.db_session_id,
+            "station": self.station,
+            "tester_name": self.tester_name,
+            "mode": self.mode,
+            "duts": self._create_data()['duts'],
+            "start_time": self.start_time.isoformat(timespec='milliseconds'),
+            "end_time": self.end_time.isoformat(timespec='milliseconds') if self.end_time else None,
+            "total_time_sec": total_time_sec,
+            "total_tests": len(self.items_result),
+            "pass_tests": sum(1 for item in self.items_result if item.result),
+            "fail_tests": sum(1 for item in self.items_result if not item.result),
+            "final_result": bool(self.final_result),
+        }
+
+    def _write_result_files(self, html_paths: list[str]) -> list[str]:
+        """
+        在每個 HTML 報告旁產生機器可讀的 .json 與 JUnit .xml (串流寫出一次，多個檔名以 hardlink 共用)。
+        """
+        writers = []
+        if config.REPORT_JSON_ENABLED:
+            writers.append(('.json', write_json_result))
+        if config.REPORT_JUNIT_ENABLED:
+            writers.append(('.xml', write_junit_result))
+        if not html_paths or not writers:
+            return []
+
+        object_dir = os.path.join(config.REPORT_FILE_PATH, REPORT_OBJECT_DIR)
+        os.makedirs(object_dir, exist_ok=True)
+        header = self._create_result_header()
+        created_files = []
+        for ext, writer in writers:
+            paths = [os.path.splitext(path)[0] + ext for path in html_paths]
+            fd, object_path = tempfile.mkstemp(suffix=ext, dir=object_dir)
+            os.close(fd)
+            try:
+                writer(object_path, header, result_items(self.items_result, self.items_time, self.start_time))
+            except Exception:
+                os.remove(object_path)
+                raise
+            created_files += self._link_report_object(object_path, paths)
+        return created_files
+
     def upload_report(self, source_file):
         """
-        上傳報告到指定的路徑 (目前是本地端的路徑)
+        把報告放入上傳佇列 (spool)，由背景執行緒上傳到 REPORT_UPLOAD_PATH 並驗證。
         """
         try:
-            # 轉換為網絡路徑格式
-            network_path = config.REPORT_UPLOAD_PATH
-            os.makedirs(network_path, exist_ok=True)
-
-            # 獲取文件名
-            file_name = os.path.basename(source_file)
-
-            # 完整的目標路徑
-            destination_path = os.path.join(network_path, file_name)
-            if os.path.exists(network_path):
-                Log.info(f"上傳報告到: {network_path}")
-                # 這裡可以加入上傳的邏輯，例如使用 FTP 或其他協議
-                shutil.move(source_file, destination_path)
+            UploadSpool.instance().enqueue(source_file)
         except Exception as e:
             Log.error(f"上傳報告時發生錯誤: {e}", exc_info=True)
             return False # Indicate failure
-        return True # Indicate success
\ No newline at end of file
+        return True # Indicate success
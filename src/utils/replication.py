@@ -0,0 +1,304 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import json
+import threading
+from sqlalchemy import create_engine, inspect, text, select, update, bindparam, func, MetaData, Table, Column, Integer, Text
+
+from src.utils.log import Log
+from src.config import config
+from src.utils.database import TestSession, TestItemResult, Dut, DutMac
+
+#===================================================================================================
+# Central schema
+#===================================================================================================
+# 送到中央資料庫的欄位 (明確列出，本機專用欄位如 script_id / scripts 維度表不送出)
+# 本機新增欄位需要同步時加在這裡，連線時會為中央既有表格 ALTER TABLE 補上
+CENTRAL_COLUMNS = {
+    'test_sessions': (('session_id',), (
+        'total_tests', 'script_name', 'script_version',
+        'product_mo_tx', 'product_sn_tx', 'product_mac_tx_1', 'product_mac_tx_2',
+        'product_mo_rx', 'product_sn_rx', 'product_mac_rx_1', 'product_mac_rx_2',
+        'tester_user', 'mode', 'start_time', 'end_time', 'total_time_sec', 'final_result')),
+    'test_items_results': (('result_id',), (
+        'session_id', 'item_title', 'item_unit', 'item_min_valid', 'item_max_valid', 'item_value',
+        'item_result', 'item_retry_count', 'item_seq', 'timestamp')),
+    'duts': (('dut_id',), ('session_id', 'slot', 'mo', 'sn')),
+    'dut_macs': (('dut_id', 'idx'), ('mac',)),
+}
+
+def _central_table(metadata: MetaData, local_table) -> Table:
+    """
+    依 CENTRAL_COLUMNS 建立中央資料庫表格 (型別沿用本機表格)，主鍵為 (station, 本機主鍵)。
+    """
+    key_columns, data_columns = CENTRAL_COLUMNS[local_table.name]
+    columns = [Column('station', Text, primary_key=True)]
+    columns += [Column(name, Integer, primary_key=True, autoincrement=False) for name in key_columns]
+    columns += [Column(name, local_table.c[name].type) for name in data_columns]
+    return Table(local_table.name, metadata, *columns)
+
+def _central_rows(table: Table, rows: list[dict], station_of) -> list[dict]:
+    """
+    只保留中央表格的欄位並加上 station。
+    """
+    names = [col.name for col in table.columns if col.name != 'station']
+    return [{'station': station_of(row), **{name: row.get(name) for name in names}} for row in rows]
+
+_central_tables = None
+
+def central_tables() -> tuple[MetaData, Table, Table, Table, Table]:
+    """
+    延遲建立中央資料庫表格 (metadata, sessions, items, duts, dut_macs)。
+    """
+    global _central_tables
+    if _central_tables is None:
+        metadata = MetaData()
+        _central_tables = (metadata,) + tuple(_central_table(metadata, model.__table__)
+                                              for model in (TestSession, TestItemResult, Dut, DutMac))
+    return _central_tables
+
+def _create_central_schema(engine):
+    """
+    建立中央資料庫表格，並為既有表格補上本機新增的欄位。
+    """
+    metadata = central_tables()[0]
+    metadata.create_all(engine)
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            existing = {col['name'] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    col_type = column.type.compile(dialect=engine.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}'))
+                    Log.info(f"Central database column added: {table.name}.{column.name}")
+
+def _upsert(conn, table: Table, rows: list[dict]):
+    """
+    以主鍵做冪等 upsert (支援 PostgreSQL 與 SQLite)。
+    """
+    if not rows:
+        return
+    dialect = conn.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Unsupported central database dialect: {dialect}")
+
+    stmt = insert(table)
+    keys = [col.name for col in table.primary_key.columns]
+    stmt = stmt.on_conflict_do_update(
+        index_elements=keys,
+        set_={col.name: stmt.excluded[col.name] for col in table.columns if col.name not in keys}
+    )
+    conn.execute(stmt, rows)
+
+#===================================================================================================
+# Execute
+#===================================================================================================
+class ReplicationAgent:
+    """
+    Store-and-forward 複製代理：在背景執行緒把本機 results.db 中已結束的
+    test_sessions / test_items_results / duts / dut_macs 批次 upsert 到中央資料庫。
+
+    進度記錄在每個 Session 的 replication_pending / change_seq (Session 結束或補寫項目時標記)，
+    Session 不依 ID 順序結束或之後才補寫項目時也會送出；網路中斷時以指數退避重試，
+    恢復後繼續送出尚未完成的 Session；測試流程只會呼叫 notify()，永遠不會被阻塞。
+    """
+    _instance = None
+
+    def __init__(self, central_url: str, local_url: str = None, station: str = None,
+                 state_file: str = None, batch_size: int = None, interval_sec: float = None):
+        if local_url is None:
+            local_url = f"sqlite:///{os.path.join(config.DATABASE_PATH, config.DATABASE_NAME)}"
+
+        self.central_url = central_url
+        self.local_url = local_url
+        self.station = station or config.STATION_NAME
+        self.state_file = state_file or config.REPLICATION_STATE_FILE
+        self.batch_size = batch_size or config.REPLICATION_BATCH_SIZE
+        self.interval_sec = interval_sec if interval_sec is not None else config.REPLICATION_INTERVAL_SEC
+
+        self._local_engine = None
+        self._central_engine = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread = None
+        self._failures = 0
+
+    @classmethod
+    def start_if_configured(cls):
+        """
+        如果 config 有設定中央資料庫，啟動全域複製代理並返回；否則返回 None。
+        """
+        if not config.CENTRAL_DATABASE_URL:
+            Log.info("Central database not configured, replication disabled.")
+            return None
+        if cls._instance is None:
+            cls._instance = cls(config.CENTRAL_DATABASE_URL)
+            cls._instance.start()
+        return cls._instance
+
+    @classmethod
+    def notify(cls):
+        """
+        通知全域複製代理有新的資料 (不阻塞，未啟用時不做任何事)。
+        """
+        if cls._instance is not None:
+            cls._instance._wakeup.set()
+
+    @classmethod
+    def shutdown(cls):
+        """
+        停止全域複製代理。
+        """
+        if cls._instance is not None:
+            cls._instance.stop()
+            cls._instance = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ReplicationAgent", daemon=True)
+        self._thread.start()
+        Log.info(f"Replication agent started: station={self.station}")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        for engine in (self._local_engine, self._central_engine):
+            if engine is not None:
+                engine.dispose()
+        self._local_engine = None
+        self._central_engine = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self.sync_once():
+                self._failures = 0
+                wait_sec = self.interval_sec
+            else:
+                self._failures += 1
+                wait_sec = min(self.interval_sec * (2 ** self._failures), config.REPLICATION_MAX_BACKOFF_SEC)
+                Log.warn(f"Replication failed {self._failures} time(s), retry in {wait_sec} sec.")
+
+            self._wakeup.wait(wait_sec)
+            self._wakeup.clear()
+
+    #===================================================================================================
+    # Legacy high-water mark
+    #===================================================================================================
+    def load_high_water_mark(self) -> int:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return int(json.load(f).get('last_session_id', 0))
+        except FileNotFoundError:
+            return 0
+        except (ValueError, TypeError, OSError) as e:
+            Log.error(f"Invalid replication state file '{self.state_file}': {e}")
+            return 0
+
+    def _migrate_high_water_mark(self):
+        """
+        舊版以 REPLICATION_STATE_FILE 記錄已送出的最大 Session ID：轉為每個 Session 的標記後刪除狀態檔。
+        """
+        if not os.path.exists(self.state_file):
+            return
+        high_water_mark = self.load_high_water_mark()
+        sessions_table = TestSession.__table__
+        with self._local_engine.begin() as local_conn:
+            local_conn.execute(update(sessions_table)
+                               .where(sessions_table.c.session_id <= high_water_mark)
+                               .values(replication_pending=False))
+        os.remove(self.state_file)
+        Log.info(f"Replication state migrated: sessions up to {high_water_mark} marked as replicated.")
+
+    #===================================================================================================
+    # Sync
+    #===================================================================================================
+    def sync_once(self) -> bool:
+        """
+        把標記為待送出、已結束的 Session 全部送出。
+
+        Returns:
+            bool: 成功 (包含沒有新資料) 返回 True，連線或寫入失敗返回 False。
+        """
+        try:
+            if self._local_engine is None:
+                self._local_engine = create_engine(self.local_url)
+                self._migrate_high_water_mark()
+            if self._central_engine is None:
+                self._central_engine = create_engine(self.central_url, pool_pre_ping=True)
+                _create_central_schema(self._central_engine)
+
+            while not self._stop.is_set():
+                sent = self._sync_batch()
+                if sent < self.batch_size:
+                    break
+            return True
+        except Exception as e:
+            Log.error(f"Replication to central database error: {e}")
+            if self._central_engine is not None:
+                self._central_engine.dispose()  # 丟棄失效連線，下次重新建立
+                self._central_engine = None
+            return False
+
+    def _sync_batch(self) -> int:
+        """
+        送出一個批次，返回送出的 Session 數量。
+        """
+        sessions_table = TestSession.__table__
+        items_table = TestItemResult.__table__
+
+        with self._local_engine.connect() as local_conn:
+            sessions = [dict(row) for row in local_conn.execute(
+                select(sessions_table)
+                .where(sessions_table.c.replication_pending.is_(True))
+                .where(sessions_table.c.end_time.is_not(None))
+                .order_by(sessions_table.c.session_id)
+                .limit(self.batch_size)
+            ).mappings()]
+
+            if not sessions:
+                return 0
+
+            session_ids = [row['session_id'] for row in sessions]
+            items = [dict(row) for row in local_conn.execute(
+                select(items_table).where(items_table.c.session_id.in_(session_ids))
+            ).mappings()]
+            duts = [dict(row) for row in local_conn.execute(
+                select(Dut.__table__).where(Dut.__table__.c.session_id.in_(session_ids))
+            ).mappings()]
+            dut_macs = [dict(row) for row in local_conn.execute(
+                select(DutMac.__table__).where(DutMac.__table__.c.dut_id.in_([row['dut_id'] for row in duts]))
+            ).mappings()] if duts else []
+
+        station_of = {row['session_id']: row.get('station') or self.station for row in sessions}
+        station_of_dut = {row['dut_id']: station_of[row['session_id']] for row in duts}
+        by_session = lambda row: station_of[row['session_id']]
+
+        _, central_sessions, central_items, central_duts, central_dut_macs = central_tables()
+        with self._central_engine.begin() as central_conn:
+            _upsert(central_conn, central_sessions, _central_rows(central_sessions, sessions, by_session))
+            _upsert(central_conn, central_duts, _central_rows(central_duts, duts, by_session))
+            _upsert(central_conn, central_dut_macs,
+                    _central_rows(central_dut_macs, dut_macs, lambda row: station_of_dut[row['dut_id']]))
+            _upsert(central_conn, central_items, _central_rows(central_items, items, by_session))
+
+        # 只清除送出期間沒有再變更的 Session (change_seq 相同)，其餘下一批再送
+        with self._local_engine.begin() as local_conn:
+            local_conn.execute(
+                update(sessions_table)
+                .where(sessions_table.c.session_id == bindparam('b_session_id'))
+                .where(func.coalesce(sessions_table.c.change_seq, 0) == bindparam('b_change_seq'))
+                .values(replication_pending=False),
+                [{'b_session_id': row['session_id'], 'b_change_seq': row['change_seq'] or 0} for row in sessions])
+        Log.info(f"Replicated {len(sessions)} session(s), {len(items)} item(s), {len(duts)} DUT(s).")
+        return len(sessions)
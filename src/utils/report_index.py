@@ -0,0 +1,215 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import re
+import sqlite3
+import argparse
+import threading
+import webbrowser
+from datetime import datetime
+
+from src.config import config
+from src.utils.log import Log
+from src.utils.archive import find_archived_report
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+SEARCH_COLUMNS = ('mo', 'sn', 'mac', 'station', 'script', 'failed_items')
+_SCHEMA = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS reports USING fts5(
+        file_name UNINDEXED, created UNINDEXED, final_result UNINDEXED,
+        {', '.join(SEARCH_COLUMNS)},
+        tokenize = "unicode61 tokenchars '-_:.'"
+    )
+"""
+_HEX_ONLY = re.compile(r'[^0-9A-Fa-f]')
+
+#===================================================================================================
+# Helpers
+#===================================================================================================
+def _join(values) -> str:
+    return " ".join(str(v) for v in values if v and v != 'N/A')
+
+def _mac_terms(macs: list[str]) -> list[str]:
+    """
+    MAC 同時索引原始格式與純 16 進位 (00:19:AB... 與 0019AB... 都能搜尋)。
+    """
+    terms = []
+    for mac in macs:
+        if not mac or mac == 'N/A':
+            continue
+        terms.append(mac)
+        hex_only = _HEX_ONLY.sub('', mac)
+        if hex_only and hex_only != mac:
+            terms.append(hex_only)
+    return terms
+
+def build_query(text: str) -> str:
+    """
+    把使用者輸入轉為 FTS5 查詢：每個詞做前綴比對 (AND)，支援 sn:XXX 這類欄位限定。
+    """
+    terms = []
+    for word in text.split():
+        column = None
+        field, sep, value = word.partition(':')
+        if sep and field.lower() in SEARCH_COLUMNS and value:
+            column, word = field.lower(), value
+        phrase = '"' + word.replace('"', '""') + '"*'
+        terms.append(f"{column} : {phrase}" if column else phrase)
+    return " ".join(terms)
+
+def _run_with_timeout(func, timeout: float, description: str):
+    """
+    在背景執行緒執行 func，超過 timeout 秒 (網路路徑緩慢或無法連線) 視為找不到，返回 None。
+    """
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        Log.warn(f"Network report path did not respond within {timeout} sec: {description}")
+        return None
+    return result[0] if result else None
+
+def _find_archived(file_name: str, directories: list[str]) -> str | None:
+    try:
+        return find_archived_report(file_name, directories)
+    except Exception as e:
+        Log.error(f"讀取封存報告時發生錯誤: {e}")
+        return None
+
+def _locate_on_share(file_name: str) -> str | None:
+    path = os.path.join(config.REPORT_UPLOAD_PATH, file_name)
+    if os.path.exists(path):
+        return path
+    return _find_archived(file_name, [config.REPORT_UPLOAD_PATH])
+
+def locate_report(file_name: str) -> str | None:
+    """
+    依序在本機報告目錄、上傳佇列、本機封存檔與網路路徑 (含其封存檔) 尋找報告，返回第一個存在的檔案；
+    已封存的報告會從封存檔解出到暫存目錄。網路路徑最後檢查且整段查詢有逾時，不會讓搜尋視窗卡住。
+    """
+    local_directories = [config.REPORT_FILE_PATH, config.REPORT_SPOOL_PATH]
+    for directory in local_directories:
+        path = os.path.join(directory, file_name)
+        if os.path.exists(path):
+            return path
+    path = _find_archived(file_name, local_directories)
+    if path is not None:
+        return path
+    return _run_with_timeout(lambda: _locate_on_share(file_name), config.REPORT_NETWORK_TIMEOUT_SEC,
+                             config.REPORT_UPLOAD_PATH)
+
+#===================================================================================================
+# Execute
+#===================================================================================================
+class ReportIndex:
+    """
+    報告全文索引 (SQLite FTS5)：報告寫出時加入 MO、SN、MAC、測試站、腳本與不良項目，搜尋時不需讀取報告檔案。
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str = None):
+        self.path = path or config.REPORT_INDEX_PATH
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")      # 搜尋 (UI/CLI) 與寫入 (報告執行緒) 互不阻塞
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add(self, file_name: str, station: str, script: str, duts: list[dict], failed_items: list[str],
+            final_result: bool, created: datetime = None):
+        """
+        加入一份報告 (同名報告會先移除)。
+
+        Args:
+            file_name (str):        報告檔名 (不含路徑，開啟時以 locate_report 尋找)
+            station (str):          測試站
+            script (str):           腳本名稱與版本
+            duts (list[dict]):      [{'mo': ..., 'sn': ..., 'macs': [...]}, ...]
+            failed_items (list):    不良項目名稱
+            final_result (bool):    最終結果
+            created (datetime):     (Optional) 報告時間，預設為現在時間
+        """
+        row = (
+            file_name,
+            (created or datetime.now()).isoformat(timespec='seconds'),
+            int(bool(final_result)),
+            _join(dut.get('mo') for dut in duts),
+            _join(dut.get('sn') for dut in duts),
+            _join(_mac_terms([mac for dut in duts for mac in dut.get('macs', [])])),
+            station or '',
+            script or '',
+            "\n".join(dict.fromkeys(failed_items)),
+        )
+        with self._lock:
+            self._conn.execute("DELETE FROM reports WHERE file_name = ?", (file_name,))
+            self._conn.execute(f"INSERT INTO reports (file_name, created, final_result, {', '.join(SEARCH_COLUMNS)}) "
+                               f"VALUES ({', '.join('?' * len(row))})", row)
+            self._conn.commit()
+
+    def search(self, text: str, limit: int = 200) -> list[dict]:
+        """
+        搜尋報告，依相關度排序 (同分時新的在前)；查詢語法錯誤時返回空列表。
+        """
+        query = build_query(text)
+        if not query:
+            return []
+        columns = ('file_name', 'created', 'final_result') + SEARCH_COLUMNS
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(columns)} FROM reports WHERE reports MATCH ? "
+                    f"ORDER BY rank, created DESC LIMIT ?", (query, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            Log.warn(f"Report search failed for '{text}': {e}")
+            return []
+        results = [dict(zip(columns, row)) for row in rows]
+        for result in results:
+            result['final_result'] = bool(result['final_result'])
+        return results
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM reports").fetchone()[0]
+
+#===================================================================================================
+# Main
+#===================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search test reports by MO, SN, MAC, station, script or failed item")
+    parser.add_argument("query", help="搜尋文字，例如 00:19:AB、SN123 或 sn:SN123 station:ST01")
+    parser.add_argument("--limit", type=int, default=50, help="最多顯示筆數")
+    parser.add_argument("--open", action="store_true", help="以瀏覽器開啟第一筆結果")
+    args = parser.parse_args(argv)
+
+    results = ReportIndex().search(args.query, args.limit)
+    for result in results:
+        verdict = "PASS" if result['final_result'] else "FAIL"
+        print(f"{result['created']}  {verdict}  {result['station']}  {result['sn']}  {result['file_name']}")
+    print(f"{len(results)} report(s) found.")
+
+    if args.open and results:
+        path = locate_report(results[0]['file_name'])
+        if path:
+            webbrowser.open(f"file:///{os.path.abspath(path)}")
+        else:
+            print(f"Report file not found: {results[0]['file_name']}")
+
+if __name__ == "__main__":
+    main()
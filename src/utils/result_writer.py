@@ -0,0 +1,124 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import re
+import json
+from datetime import datetime
+from typing import Iterable
+from xml.sax.saxutils import XMLGenerator
+
+from src.utils.commonUtils import ItemResult
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+RESULT_SCHEMA_VERSION = "1.0"       # 欄位變更時遞增 (新增欄位: minor，更名/移除: major)
+_JSON_SEPARATORS = (',', ':')
+# XML 1.0 不允許的字元 (工具輸出中的控制字元會讓整個 JUnit 檔無法解析)，以 U+FFFD 取代
+_XML_INVALID = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+#===================================================================================================
+# Helpers
+#===================================================================================================
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=_JSON_SEPARATORS, default=str)
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat(timespec='milliseconds') if value else None
+
+def result_items(items: list[ItemResult], timestamps: list[datetime], start_time: datetime) -> Iterable[dict]:
+    """
+    逐筆產生項目結果 (不建立完整列表)，duration_sec 為與前一個項目 (或測試開始) 的時間差。
+    """
+    previous = start_time
+    for seq, item in enumerate(items):
+        timestamp = timestamps[seq] if seq < len(timestamps) else None
+        duration = (timestamp - previous).total_seconds() if timestamp and previous else None
+        previous = timestamp or previous
+        yield {
+            'seq': seq,
+            'title': item.title,
+            'unit': item.unit,
+            'min': item.min,
+            'max': item.max,
+            'value': item.value,
+            'result': bool(item.result),
+            'retry_count': getattr(item, 'retry_count', 0),
+            'timestamp': _iso(timestamp),
+            'duration_sec': duration,
+        }
+
+#===================================================================================================
+# Writers
+#===================================================================================================
+def write_json_result(path: str, header: dict, items: Iterable[dict]) -> str:
+    """
+    串流寫出精簡 JSON：{"schema_version": ..., <header>..., "items": [...]}，每個項目各自序列化後直接寫入檔案。
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'{{"schema_version":{_dumps(RESULT_SCHEMA_VERSION)}')
+        for key, value in header.items():
+            f.write(f',{_dumps(key)}:{_dumps(value)}')
+        f.write(',"items":[')
+        for i, item in enumerate(items):
+            if i:
+                f.write(',')
+            f.write(_dumps(item))
+        f.write(']}\n')
+    return path
+
+def _attr(value) -> str:
+    return '' if value is None else _XML_INVALID.sub('\ufffd', str(value))
+
+def write_junit_result(path: str, header: dict, items: Iterable[dict]) -> str:
+    """
+    串流寫出 JUnit XML (testsuites/testsuite/testcase)，量測值與上下限放在每個 testcase 的 properties。
+
+    header 需要包含 total_tests、fail_tests 與 total_time_sec (testsuite 屬性必須在項目之前寫出)。
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        xml = XMLGenerator(f, encoding='utf-8', short_empty_elements=True)
+        xml.startDocument()
+        suite_name = _attr(f"{header.get('product_name', '')} {header.get('script_version', '')}".strip())
+        xml.startElement('testsuites', {'name': suite_name})
+        xml.startElement('testsuite', {
+            'name': suite_name,
+            'tests': _attr(header.get('total_tests', 0)),
+            'failures': _attr(header.get('fail_tests', 0)),
+            'errors': '0',
+            'skipped': '0',
+            'time': _attr(header.get('total_time_sec')),
+            'timestamp': _attr(header.get('start_time')),
+            'hostname': _attr(header.get('station')),
+        })
+
+        xml.startElement('properties', {})
+        xml.startElement('property', {'name': 'schema_version', 'value': RESULT_SCHEMA_VERSION})
+        xml.endElement('property')
+        for key, value in header.items():
+            if isinstance(value, (list, dict)):
+                value = _dumps(value)
+            xml.startElement('property', {'name': _attr(key), 'value': _attr(value)})
+            xml.endElement('property')
+        xml.endElement('properties')
+
+        for item in items:
+            xml.startElement('testcase', {'name': _attr(item['title']), 'classname': suite_name,
+                                          'time': _attr(item['duration_sec'])})
+            xml.startElement('properties', {})
+            for key in ('seq', 'unit', 'min', 'max', 'value', 'retry_count', 'timestamp'):
+                xml.startElement('property', {'name': key, 'value': _attr(item[key])})
+                xml.endElement('property')
+            xml.endElement('properties')
+            if not item['result']:
+                xml.startElement('failure', {'message': _attr(f"{item['title']}: {_attr(item['value'])} "
+                                                              f"(min {_attr(item['min'])}, max {_attr(item['max'])})"),
+                                             'type': 'FAIL'})
+                xml.endElement('failure')
+            xml.endElement('testcase')
+            f.write('\n')
+
+        xml.endElement('testsuite')
+        xml.endElement('testsuites')
+        xml.endDocument()
+    return path
@@ -3,11 +3,14 @@
 #===================================================================================================
 import os
 import yaml
+import hashlib
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 from src.utils.log import Log
 from src.config import config
+from src.utils.validators import BarcodeValidator, compile_barcodes
+from src.utils.macalloc import DERIVATION_MODES
 
 #===================================================================================================
 # Execute
@@ -23,6 +26,8 @@ class Product:
     sn_count: int = 0           # SN數量
     version: str = ""           # 產品版本
     other_message: str = ""     # 備註
+    mac_derivation: str = ""    # MAC 推算方式 ('sequential'：只掃描 MAC1，其餘依序 +1)
+    barcodes: Dict[str, BarcodeValidator] = field(default_factory=dict)  # 條碼驗證器 (載入時由 Barcodes 編譯)
 
 @dataclass
 class TestItems:
@@ -40,6 +45,7 @@ class Script:
     version: str = ""                       # 版本號
     release_note: str = ""                  # 進版備註
     file_name: str = ""                     # 檔案名稱
+    content_hash: str = ""                  # 腳本內容 sha256 (資料庫腳本維度鍵)
     pairing: int = 0                        # 配對或單側
     test_mode: config.TEST_MODE = config.TEST_MODE.BOTH   # 測試模式
     product: List[Product] = field(default_factory=list)
@@ -66,7 +72,8 @@ class ScriptManager:
                 return None
      
             with open(filename, 'r', encoding='utf-8') as file:
-                script_data: Dict[str, Any] = yaml.safe_load(file)
+                content = file.read()
+            script_data: Dict[str, Any] = yaml.safe_load(content)
 
             if script_data is None: # YAML 檔案為空或只有空白字元時 yaml.safe_load 會返回 None
                 error_message = "驗證錯誤: YAML 檔案為空或僅包含空白字元"
@@ -82,7 +89,8 @@ class ScriptManager:
                 version=script_info.get("Version", ""),
                 pairing=script_info.get("Pairing", 0),
                 release_note=script_info.get("ReleaseNote", ""),
-                file_name=filename
+                file_name=filename,
+                content_hash=hashlib.sha256(content.encode('utf-8')).hexdigest()
             )
 
             # 填充 Product 物件
@@ -138,13 +146,26 @@ class ScriptManager:
         for product_data in products_data:
             if not isinstance(product_data, dict):
                 raise ScriptValidationError("Each item in 'items' list must be a YAML object (dictionary).")
-            
+
+            # 條碼驗證規格，例如 Barcodes: {MO: mo|pcb|testjig, SN: digits(11), MAC: mac}
+            try:
+                barcodes = compile_barcodes(product_data.get("Barcodes") or {})
+            except ValueError as e:
+                raise ScriptValidationError(f"Invalid 'Barcodes' for product '{product_data.get('Name', '')}': {e}")
+
+            mac_derivation = str(product_data.get("MacDerivation") or "").strip().lower()
+            if mac_derivation and mac_derivation not in DERIVATION_MODES:
+                raise ScriptValidationError(f"Invalid 'MacDerivation' for product '{product_data.get('Name', '')}': "
+                                            f"{mac_derivation} (expected one of {', '.join(DERIVATION_MODES)})")
+
             products.append(Product(
                 model_name = str(product_data.get("Name", "")),
                 mac_count = int(product_data.get("UseMac", 0)),
                 sn_count = int(product_data.get("UseSn", 0)),
                 version = str(product_data.get("Version", "")),
-                other_message = str(product_data.get("OtherMessage", ""))
+                other_message = str(product_data.get("OtherMessage", "")),
+                mac_derivation = "" if mac_derivation == "none" else mac_derivation,
+                barcodes = barcodes
             ))
         return products
 
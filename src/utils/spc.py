@@ -0,0 +1,400 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import create_engine, select
+
+from src.config import config
+from src.utils.log import Log
+from src.utils.database import TestSession, TestItemResult
+from src.utils import template as template_cache
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+SPC_TEMPLATE_FILE = 'spc_template.html'
+CHUNK_SIZE = 100_000            # 每次從資料庫讀取的列數
+EWMA_BLOCK = 64                 # EWMA 向量化區塊大小 (避免 (1-λ)^-k 溢位)
+D2_MR = 1.128                   # 移動全距 (n=2) 的 d2 常數
+PERCENTILES = (0.135, 1, 5, 50, 95, 99, 99.865)
+
+#===================================================================================================
+# Data
+#===================================================================================================
+@dataclass
+class Measurements:
+    item_title: str = ""
+    values: np.ndarray = field(default_factory=lambda: np.empty(0))                             # 數值量測
+    timestamps: np.ndarray = field(default_factory=lambda: np.empty(0, dtype='datetime64[ms]'))
+    lsl: float | None = None     # 下限 (取最後一筆紀錄)
+    usl: float | None = None     # 上限 (取最後一筆紀錄)
+    skipped: int = 0             # 非數值 (PASS/FAIL 等) 筆數
+
+@dataclass
+class SpcResult:
+    n: int = 0
+    mean: float = float('nan')
+    sigma: float = float('nan')             # 整體標準差 (Pp/Ppk)
+    sigma_within: float = float('nan')      # 組內標準差 (MR-bar / d2，用於 Cp/Cpk 與管制界限)
+    cp: float | None = None
+    cpk: float | None = None
+    pp: float | None = None
+    ppk: float | None = None
+    center: float = float('nan')            # 管制中心線 (基準期平均)
+    ucl: float = float('nan')
+    lcl: float = float('nan')
+    percentiles: dict = field(default_factory=dict)
+    violations: dict = field(default_factory=dict)      # rule -> 違規點索引 (np.ndarray)
+    ewma: np.ndarray = field(default_factory=lambda: np.empty(0))
+    ewma_drift: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    windows: list = field(default_factory=list)        # 滑動視窗統計
+
+#===================================================================================================
+# Load
+#===================================================================================================
+def _to_float_array(raw_values: list) -> tuple[np.ndarray, np.ndarray]:
+    """
+    將字串列表轉為 float 陣列，返回 (values, 有效遮罩)。
+    """
+    try:
+        values = np.asarray(raw_values, dtype=np.float64)
+        return values, np.isfinite(values)
+    except (ValueError, TypeError):
+        values = np.empty(len(raw_values), dtype=np.float64)
+        for i, raw in enumerate(raw_values):
+            try:
+                values[i] = float(raw)
+            except (ValueError, TypeError):
+                values[i] = np.nan
+        return values, np.isfinite(values)
+
+def _to_limit(raw):
+    try:
+        return float(raw)
+    except (ValueError, TypeError):
+        return None
+
+def load_measurements(engine, item_title: str, start_time: datetime = None, end_time: datetime = None,
+                      station: str = None, script_version: str = None, chunk_size: int = CHUNK_SIZE) -> Measurements:
+    """
+    以串流方式分批讀取某個測試項目的數值量測，組成 NumPy 陣列。
+
+    Args:
+        engine:                 SQLAlchemy engine (results.db)
+        item_title (str):       測試項目名稱
+        start_time (datetime):  (Optional) 起始時間
+        end_time (datetime):    (Optional) 結束時間
+        station (str):          (Optional) 測試站
+        script_version (str):   (Optional) 腳本版本
+        chunk_size (int):       每批讀取列數
+
+    Returns:
+        Measurements: 依時間排序的量測資料。
+    """
+    items = TestItemResult.__table__
+    sessions = TestSession.__table__
+
+    query = (select(items.c.item_value, items.c.timestamp, items.c.item_min_valid, items.c.item_max_valid)
+             .where(items.c.item_title == item_title))
+    if station is not None or script_version is not None:
+        query = query.join(sessions, sessions.c.session_id == items.c.session_id)
+        if station is not None:
+            query = query.where(sessions.c.station == station)
+        if script_version is not None:
+            query = query.where(sessions.c.script_version == script_version)
+    if start_time is not None:
+        query = query.where(items.c.timestamp >= start_time)
+    if end_time is not None:
+        query = query.where(items.c.timestamp < end_time)
+    query = query.order_by(items.c.result_id)
+
+    value_chunks, time_chunks = [], []
+    skipped = 0
+    last_min, last_max = None, None
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(query)
+        for rows in result.partitions():
+            raw_values, raw_times, _, _ = zip(*rows)
+            last_min, last_max = rows[-1][2], rows[-1][3]
+
+            values, valid = _to_float_array(raw_values)
+            times = np.asarray(raw_times, dtype='datetime64[ms]')
+            skipped += int(np.count_nonzero(~valid))
+            value_chunks.append(values[valid])
+            time_chunks.append(times[valid])
+
+    measurements = Measurements(item_title=item_title, skipped=skipped,
+                                lsl=_to_limit(last_min), usl=_to_limit(last_max))
+    if value_chunks:
+        measurements.values = np.concatenate(value_chunks)
+        measurements.timestamps = np.concatenate(time_chunks)
+    Log.info(f"Loaded {measurements.values.size} measurement(s) for '{item_title}' ({skipped} non-numeric skipped).")
+    return measurements
+
+#===================================================================================================
+# Statistics
+#===================================================================================================
+def _run_counts(mask: np.ndarray, window: int) -> np.ndarray:
+    """
+    每個位置 (含) 往前 window 點內 mask 為 True 的數量；前 window-1 點為 0。
+    """
+    csum = np.cumsum(mask, dtype=np.int64)
+    counts = np.zeros(mask.size, dtype=np.int64)
+    if mask.size >= window:
+        counts[window - 1:] = csum[window - 1:] - np.concatenate(([0], csum[:-window]))
+    return counts
+
+def western_electric(values: np.ndarray, center: float, sigma: float) -> dict:
+    """
+    Western Electric 判異規則，返回各規則違規點 (視窗最後一點) 的索引。
+
+    rule1: 1 點超出 3σ
+    rule2: 連續 3 點中 2 點在同側 2σ 之外
+    rule3: 連續 5 點中 4 點在同側 1σ 之外
+    rule4: 連續 8 點在中心線同側
+    """
+    if values.size == 0 or not np.isfinite(sigma) or sigma <= 0:
+        return {f'rule{i}': np.empty(0, dtype=np.int64) for i in range(1, 5)}
+
+    z = (values - center) / sigma
+    rule2 = (_run_counts(z > 2, 3) >= 2) | (_run_counts(z < -2, 3) >= 2)
+    rule3 = (_run_counts(z > 1, 5) >= 4) | (_run_counts(z < -1, 5) >= 4)
+    rule4 = (_run_counts(z > 0, 8) == 8) | (_run_counts(z < 0, 8) == 8)
+    return {
+        'rule1': np.flatnonzero(np.abs(z) > 3),
+        'rule2': np.flatnonzero(rule2),
+        'rule3': np.flatnonzero(rule3),
+        'rule4': np.flatnonzero(rule4),
+    }
+
+def ewma(values: np.ndarray, lam: float = 0.2, start: float = None, block: int = EWMA_BLOCK) -> np.ndarray:
+    """
+    向量化 EWMA：z[t] = λ·x[t] + (1-λ)·z[t-1]，z[-1] = start (預設為平均值)。
+
+    以固定大小區塊計算，區塊內用累加和向量化，只有區塊之間的進位需要逐一計算。
+    """
+    n = values.size
+    if n == 0:
+        return np.empty(0)
+    if start is None:
+        start = float(values.mean())
+
+    a = 1.0 - lam
+    if a <= 0:
+        return values.astype(np.float64, copy=True)
+    n_blocks = -(-n // block)
+    padded = np.zeros(n_blocks * block)
+    padded[:n] = values
+    x = padded.reshape(n_blocks, block)
+
+    k = np.arange(block)
+    a_pow = a ** k                       # a^k
+    inner = lam * np.cumsum(x / a_pow, axis=1) * a_pow      # 區塊內 λ Σ a^(k-i) x_i
+    carry_weight = a ** (k + 1)          # 上一區塊結尾的權重
+
+    carries = np.empty(n_blocks)
+    prev = start
+    last_inner = inner[:, -1]
+    a_block = a ** block
+    for b in range(n_blocks):
+        carries[b] = prev
+        prev = a_block * prev + last_inner[b]
+
+    z = inner + carries[:, None] * carry_weight
+    return z.reshape(-1)[:n]
+
+def window_stats(values: np.ndarray, window: int, lsl: float = None, usl: float = None) -> list[dict]:
+    """
+    非重疊滑動視窗的平均、標準差與 Cpk (用於觀察趨勢)。
+    """
+    n_windows = values.size // window
+    if window < 2 or n_windows == 0:
+        return []
+
+    x = values[:n_windows * window].reshape(n_windows, window)
+    means = x.mean(axis=1)
+    sigmas = x.std(axis=1, ddof=1)
+    cpks = _cpk_array(means, sigmas, lsl, usl)
+    return [{'start': i * window, 'end': (i + 1) * window - 1, 'mean': float(means[i]),
+             'sigma': float(sigmas[i]), 'cpk': None if cpks is None else float(cpks[i])}
+            for i in range(n_windows)]
+
+def _cpk_array(mean, sigma, lsl, usl):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sides = []
+        if usl is not None:
+            sides.append((usl - mean) / (3 * sigma))
+        if lsl is not None:
+            sides.append((mean - lsl) / (3 * sigma))
+    if not sides:
+        return None
+    return np.minimum.reduce(sides) if len(sides) > 1 else sides[0]
+
+def _capability(mean: float, sigma: float, lsl: float, usl: float) -> tuple:
+    """
+    返回 (Cp, Cpk)；規格或 sigma 不足時為 None。
+    """
+    if not np.isfinite(sigma) or sigma <= 0:
+        return None, None
+    cp = (usl - lsl) / (6 * sigma) if lsl is not None and usl is not None else None
+    cpk = _cpk_array(mean, sigma, lsl, usl)
+    return cp, (None if cpk is None else float(cpk))
+
+def _sigma_within(values: np.ndarray, fallback: float) -> float:
+    """
+    以移動全距估計組內標準差 (MR-bar / d2)，無法估計時使用 fallback。
+    """
+    if values.size > 1:
+        sigma = float(np.abs(np.diff(values)).mean() / D2_MR)
+        if np.isfinite(sigma) and sigma > 0:
+            return sigma
+    return fallback
+
+def compute_spc(values: np.ndarray, lsl: float = None, usl: float = None,
+                ewma_lambda: float = 0.2, ewma_l: float = 3.0, window: int = 0, baseline: int = 0) -> SpcResult:
+    """
+    計算 SPC 統計 (平均、σ、Cp/Cpk、百分位數、管制界限、判異規則與 EWMA 漂移)。
+
+    Args:
+        values (np.ndarray):    依時間排序的量測值
+        lsl (float):            規格下限
+        usl (float):            規格上限
+        ewma_lambda (float):    EWMA 平滑係數 λ
+        ewma_l (float):         EWMA 管制界限倍數 L
+        window (int):           滑動視窗大小，0 代表不計算
+        baseline (int):         用前 baseline 點建立管制界限 (Phase I)，0 代表使用全部資料
+
+    Returns:
+        SpcResult
+    """
+    values = np.asarray(values, dtype=np.float64)
+    result = SpcResult(n=int(values.size))
+    if values.size == 0:
+        return result
+
+    result.mean = float(values.mean())
+    result.sigma = float(values.std(ddof=1)) if values.size > 1 else float('nan')
+    result.sigma_within = _sigma_within(values, result.sigma)
+
+    result.cp, result.cpk = _capability(result.mean, result.sigma_within, lsl, usl)
+    result.pp, result.ppk = _capability(result.mean, result.sigma, lsl, usl)
+    result.percentiles = dict(zip(PERCENTILES, np.percentile(values, PERCENTILES).tolist()))
+
+    # 管制界限：有基準期時以基準期估計，否則使用全部資料
+    if 1 < baseline < values.size:
+        reference = values[:baseline]
+        result.center = float(reference.mean())
+        control_sigma = _sigma_within(reference, float(reference.std(ddof=1)))
+    else:
+        result.center = result.mean
+        control_sigma = result.sigma_within
+    result.ucl = result.center + 3 * control_sigma
+    result.lcl = result.center - 3 * control_sigma
+    result.violations = western_electric(values, result.center, control_sigma)
+
+    result.ewma = ewma(values, ewma_lambda, start=result.center)
+    if np.isfinite(control_sigma) and control_sigma > 0:
+        t = np.arange(1, values.size + 1)
+        ewma_sigma = control_sigma * np.sqrt(ewma_lambda / (2 - ewma_lambda) * (1 - (1 - ewma_lambda) ** (2 * t)))
+        result.ewma_drift = np.flatnonzero(np.abs(result.ewma - result.center) > ewma_l * ewma_sigma)
+
+    if window:
+        result.windows = window_stats(values, window, lsl, usl)
+    return result
+
+#===================================================================================================
+# Report
+#===================================================================================================
+def _svg_points(series: np.ndarray, lower: float, upper: float, width: int, height: int, max_points: int) -> str:
+    """
+    將數列降採樣後轉成 SVG polyline 座標字串。
+    """
+    if series.size == 0:
+        return ""
+    step = max(1, series.size // max_points)
+    sampled = series[::step]
+    span = (upper - lower) or 1.0
+    xs = np.linspace(0, width, sampled.size) if sampled.size > 1 else np.zeros(1)
+    ys = height - (np.clip(sampled, lower, upper) - lower) / span * height
+    return " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+
+def generate_spc_report(measurements: Measurements, result: SpcResult, output_path: str,
+                        max_points: int = 1000, max_violations: int = 50) -> str:
+    """
+    使用 Jinja 模板產生 SPC HTML 報告，返回輸出檔案路徑。
+    """
+    width, height = 900, 300
+    limits = [v for v in (result.lcl, result.ucl, measurements.lsl, measurements.usl) if v is not None and np.isfinite(v)]
+    values = measurements.values
+    lower = min([float(values.min())] + limits) if values.size else 0.0
+    upper = max([float(values.max())] + limits) if values.size else 1.0
+
+    def y_of(v):
+        return None if v is None or not np.isfinite(v) else height - (v - lower) / ((upper - lower) or 1.0) * height
+
+    report_data = {
+        "report_title": f"SPC Report - {measurements.item_title}",
+        "item_title": measurements.item_title,
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "first_time": str(measurements.timestamps[0]) if values.size else 'N/A',
+        "last_time": str(measurements.timestamps[-1]) if values.size else 'N/A',
+        "skipped": measurements.skipped,
+        "lsl": measurements.lsl,
+        "usl": measurements.usl,
+        "result": result,
+        "violations": {rule: {'count': int(idx.size), 'first': idx[:max_violations].tolist()}
+                       for rule, idx in result.violations.items()},
+        "drift_count": int(result.ewma_drift.size),
+        "first_drift": int(result.ewma_drift[0]) if result.ewma_drift.size else None,
+        "chart": {
+            "width": width, "height": height,
+            "values": _svg_points(values, lower, upper, width, height, max_points),
+            "ewma": _svg_points(result.ewma, lower, upper, width, height, max_points),
+            "lines": [(name, y_of(v)) for name, v in (("UCL", result.ucl), ("Mean", result.center), ("LCL", result.lcl),
+                                                     ("USL", measurements.usl), ("LSL", measurements.lsl))
+                      if y_of(v) is not None],
+        },
+    }
+
+    html_output = template_cache.get_template(SPC_TEMPLATE_FILE).render(**report_data)
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html_output)
+    Log.info(f"SPC 報告已生成: {output_path}")
+    return output_path
+
+#===================================================================================================
+# Main
+#===================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate SPC report for a test item from results.db")
+    parser.add_argument("item_title", help="測試項目名稱 (Title)")
+    parser.add_argument("--days", type=int, default=30, help="往前統計的天數")
+    parser.add_argument("--station", default=None, help="只統計指定測試站")
+    parser.add_argument("--version", dest="script_version", default=None, help="只統計指定腳本版本")
+    parser.add_argument("--window", type=int, default=500, help="趨勢視窗大小")
+    parser.add_argument("--baseline", type=int, default=0, help="用前 N 筆建立管制界限 (0 代表全部)")
+    parser.add_argument("--output", default=None, help="輸出 HTML 檔案")
+    args = parser.parse_args(argv)
+
+    db_path = os.path.join(config.DATABASE_PATH, config.DATABASE_NAME)
+    engine = create_engine(f'sqlite:///{db_path}')
+    end_time = datetime.now()
+    measurements = load_measurements(engine, args.item_title, end_time - timedelta(days=args.days), end_time,
+                                     station=args.station, script_version=args.script_version)
+    engine.dispose()
+
+    result = compute_spc(measurements.values, measurements.lsl, measurements.usl, window=args.window, baseline=args.baseline)
+    safe_title = "".join(c if c.isalnum() else "_" for c in args.item_title)
+    output = args.output or os.path.join(config.REPORT_FILE_PATH, 'spc', f"SPC_{safe_title}_{end_time:%Y%m%d_%H%M%S}.html")
+    print(generate_spc_report(measurements, result, output))
+
+if __name__ == "__main__":
+    main()
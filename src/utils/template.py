@@ -0,0 +1,97 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import argparse
+import threading
+from jinja2 import Environment, BaseLoader, ChoiceLoader, FileSystemLoader, ModuleLoader, TemplateNotFound
+from PySide6.QtCore import QFile, QFileInfo, QIODevice
+
+from res import res_rc
+from src.config import config
+from src.utils.log import Log
+
+#===================================================================================================
+# Loaders
+#===================================================================================================
+class QtResourceLoader(BaseLoader):
+    """
+    從 Qt resource (例如 ':report/report_template.html') 讀取模板，
+    以 resource 的大小與修改時間判斷是否需要重新編譯。
+    """
+    def __init__(self, prefix: str):
+        self.prefix = prefix.rstrip('/')
+
+    def _stamp(self, path: str):
+        info = QFileInfo(path)
+        return info.size(), info.lastModified().toMSecsSinceEpoch()
+
+    def get_source(self, environment, template):
+        path = f"{self.prefix}/{template}"
+        file = QFile(path)
+        if not file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+            raise TemplateNotFound(template)
+        try:
+            source = file.readAll().data().decode('utf-8')
+        finally:
+            file.close()
+        stamp = self._stamp(path)
+        return source, path, lambda: QFile.exists(path) and self._stamp(path) == stamp
+
+#===================================================================================================
+# Cache
+#===================================================================================================
+_PACKAGED = '__compiled__' in globals()     # Nuitka 打包後才使用預編譯模板，開發時永遠讀取來源
+_lock = threading.Lock()
+_env = None
+_env_key = None
+
+def _source_loaders():
+    return [QtResourceLoader(os.path.dirname(config.REPORT_FILE)), FileSystemLoader(config.REPORT_TEMPLATE_PATH)]
+
+def get_environment() -> Environment:
+    """
+    返回全程式共用的 Jinja2 Environment (已編譯的模板會被快取，並在來源變更時自動重新編譯)。
+
+    打包後的程式若存在 REPORT_TEMPLATE_COMPILED (compile_report_templates 產生的預編譯模板)，優先使用。
+    """
+    global _env, _env_key
+    key = (config.REPORT_FILE, config.REPORT_TEMPLATE_PATH, config.REPORT_TEMPLATE_COMPILED, _PACKAGED)
+    with _lock:
+        if _env is None or _env_key != key:
+            loaders = _source_loaders()
+            if _PACKAGED and os.path.exists(config.REPORT_TEMPLATE_COMPILED):
+                loaders.insert(0, ModuleLoader(config.REPORT_TEMPLATE_COMPILED))
+                Log.debug(f"Using precompiled report templates: {config.REPORT_TEMPLATE_COMPILED}")
+            _env = Environment(loader=ChoiceLoader(loaders), auto_reload=True)
+            _env_key = key
+        return _env
+
+def get_template(name: str):
+    """
+    取得已編譯的模板，只有第一次 (或來源變更後) 會讀檔與編譯。
+    """
+    return get_environment().get_template(name)
+
+def compile_report_templates(target: str = None) -> str:
+    """
+    把所有報告模板預編譯成 Python 模組 (zip)，供打包時一併發佈。
+    """
+    target = target or config.REPORT_TEMPLATE_COMPILED
+    env = Environment(loader=FileSystemLoader(config.REPORT_TEMPLATE_PATH))
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    env.compile_templates(target, extensions=['html'], zip='deflated', ignore_errors=False)
+    Log.info(f"Report templates compiled: {target}")
+    return target
+
+#===================================================================================================
+# Main
+#===================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompile report templates for release packaging")
+    parser.add_argument("--output", default=None, help="輸出 zip 路徑 (預設 REPORT_TEMPLATE_COMPILED)")
+    args = parser.parse_args(argv)
+    print(compile_report_templates(args.output))
+
+if __name__ == "__main__":
+    main()
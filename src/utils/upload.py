@@ -0,0 +1,269 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import shutil
+import hashlib
+import threading
+
+from src.config import config
+from src.utils.log import Log
+from src.utils.commonUtils import UiUpdater
+
+COPY_BUFFER_SIZE = 1024 * 1024
+PART_SUFFIX = '.part'
+
+#===================================================================================================
+# Helpers
+#===================================================================================================
+def _copy_with_hash(source: str, destination: str) -> tuple[int, str]:
+    """
+    串流複製檔案並同時計算 sha256，返回 (大小, hash)。
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        while chunk := src.read(COPY_BUFFER_SIZE):
+            digest.update(chunk)
+            dst.write(chunk)
+            size += len(chunk)
+        dst.flush()
+        os.fsync(dst.fileno())
+    return size, digest.hexdigest()
+
+def _is_unc_path(path: str) -> bool:
+    return path.startswith('\\\\') or path.startswith('//')
+
+def _file_hash(path: str) -> tuple[int, str]:
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        while chunk := f.read(COPY_BUFFER_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return size, digest.hexdigest()
+
+#===================================================================================================
+# Execute
+#===================================================================================================
+class UploadSpool:
+    """
+    報告上傳佇列：報告先移到本機 spool 目錄 (程式重啟後仍保留)，由背景執行緒批次上傳到網路路徑。
+
+    每個檔案先寫成 .part，比對大小與 sha256 後才改名為正式檔名並刪除 spool 檔；
+    網路路徑無法使用時以指數退避重試，測試流程只會呼叫 enqueue()，不會被慢速的 SMB 阻塞。
+    網路路徑可用但單一檔案持續失敗時，超過 UPLOAD_MAX_ATTEMPTS 次後移到 quarantine 目錄。
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, destination: str, spool_dir: str = None, batch_size: int = None, interval_sec: float = None):
+        self.destination = destination
+        self.spool_dir = spool_dir or config.REPORT_SPOOL_PATH
+        self.batch_size = batch_size or config.UPLOAD_BATCH_SIZE
+        self.interval_sec = interval_sec if interval_sec is not None else config.UPLOAD_RETRY_INTERVAL_SEC
+
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread = None
+        self._failures = 0
+        self._remote_links = {}     # 本機 hardlink 身分 -> 已上傳的遠端路徑 (同一份報告只傳一次)
+        # SMB 分享 (UNC 路徑) 無法建立 hardlink，os.link 只會失敗後改為完整複製，因此直接略過
+        self._remote_link_enabled = not _is_unc_path(destination)
+        self._attempts = {}         # spool 路徑 -> 連續失敗次數 (只記錄在記憶體，重新啟動時歸零)
+        self.quarantine_dir = os.path.join(self.spool_dir, config.UPLOAD_QUARANTINE_DIRNAME)
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+    @classmethod
+    def instance(cls):
+        """
+        返回全域上傳佇列 (第一次呼叫時啟動背景執行緒，並接續上次未上傳的檔案)。
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(config.REPORT_UPLOAD_PATH)
+                cls._instance.start()
+            return cls._instance
+
+    @classmethod
+    def shutdown(cls):
+        """
+        停止全域上傳佇列 (尚未上傳的檔案保留在 spool，下次啟動繼續)。
+        """
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.stop()
+                cls._instance = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="UploadSpool", daemon=True)
+        self._thread.start()
+        self._emit_backlog()
+        Log.info(f"Upload spool started: {self.spool_dir} -> {self.destination}")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    #===================================================================================================
+    # Queue
+    #===================================================================================================
+    def pending(self) -> list[str]:
+        """
+        返回等待上傳的檔案 (依放入順序)。
+        """
+        try:
+            entries = [e for e in os.scandir(self.spool_dir) if e.is_file() and not e.name.endswith('.tmp')]
+        except FileNotFoundError:
+            return []
+        return [e.path for e in sorted(entries, key=lambda e: (e.stat().st_mtime_ns, e.name))]
+
+    def backlog(self) -> int:
+        return len(self.pending())
+
+    def _emit_backlog(self):
+        UiUpdater.uploadBacklogChanged.emit(self.backlog())
+
+    def enqueue(self, source_file: str) -> str:
+        """
+        把檔案移入 spool 並喚醒上傳執行緒，返回 spool 中的路徑。
+        """
+        name = os.path.basename(source_file)
+        spool_path = os.path.join(self.spool_dir, name)
+        stem, ext = os.path.splitext(name)
+        counter = 1
+        while os.path.exists(spool_path):   # 同名檔案尚未上傳時避免覆蓋
+            spool_path = os.path.join(self.spool_dir, f"{stem}_{counter}{ext}")
+            counter += 1
+        tmp_path = spool_path + '.tmp'
+        shutil.move(source_file, tmp_path)      # 跨磁碟時為複製，完成後才改名讓上傳執行緒看到
+        os.replace(tmp_path, spool_path)
+        Log.info(f"Report queued for upload: {spool_path}")
+        self._emit_backlog()
+        self._wakeup.set()
+        return spool_path
+
+    def notify(self):
+        self._wakeup.set()
+
+    #===================================================================================================
+    # Worker
+    #===================================================================================================
+    def _run(self):
+        while not self._stop.is_set():
+            if self.upload_once():
+                self._failures = 0
+                wait_sec = None if self.backlog() == 0 else 0
+            else:
+                self._failures += 1
+                wait_sec = min(self.interval_sec * (2 ** self._failures), config.UPLOAD_MAX_BACKOFF_SEC)
+                Log.warn(f"Report upload failed {self._failures} time(s), retry in {wait_sec} sec.")
+
+            self._wakeup.wait(wait_sec)
+            self._wakeup.clear()
+
+    def upload_once(self) -> bool:
+        """
+        上傳一批 (最多 batch_size 個) 檔案。
+
+        Returns:
+            bool: 全部成功 (包含沒有檔案) 返回 True，遇到錯誤返回 False (剩餘檔案留待重試)。
+        """
+        batch = self.pending()[:self.batch_size]
+        if not batch:
+            self._remote_links.clear()
+            return True
+        try:
+            os.makedirs(self.destination, exist_ok=True)
+        except Exception as e:
+            Log.error(f"上傳報告時發生錯誤: {e}")
+            return False
+
+        success = True
+        for spool_path in batch:
+            if self._stop.is_set():
+                break
+            try:
+                self._upload_file(spool_path)
+                self._attempts.pop(spool_path, None)
+            except Exception as e:
+                # 網路路徑可用，問題在這個檔案：記錄次數後繼續上傳後面的檔案
+                Log.error(f"上傳報告時發生錯誤: {e}")
+                success = False
+                if not os.path.isdir(self.destination):
+                    break   # 上傳途中網路路徑中斷
+                self._record_failure(spool_path)
+            self._emit_backlog()
+        return success
+
+    def _record_failure(self, spool_path: str):
+        attempts = self._attempts.get(spool_path, 0) + 1
+        if attempts < config.UPLOAD_MAX_ATTEMPTS:
+            self._attempts[spool_path] = attempts
+            return
+        self._attempts.pop(spool_path, None)
+        try:
+            os.makedirs(self.quarantine_dir, exist_ok=True)
+            target = os.path.join(self.quarantine_dir, os.path.basename(spool_path))
+            os.replace(spool_path, target)
+            Log.error(f"Report upload failed {attempts} time(s), moved to quarantine: {target}")
+        except OSError as e:
+            Log.error(f"Error moving report to quarantine '{spool_path}': {e}")
+
+    @staticmethod
+    def _link_key(stat: os.stat_result):
+        # 同一份內容的 hardlink 擁有相同 inode 與修改時間 (加上大小避免 inode 重複使用的誤判)
+        return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _link_remote(self, remote_path: str, final_path: str, size: int) -> bool:
+        """
+        在遠端以 hardlink 建立同內容的檔案 (不需再次傳輸)，失敗時返回 False 改用複製。
+        """
+        try:
+            if not os.path.exists(remote_path):
+                return False
+            if os.path.exists(final_path):
+                os.remove(final_path)
+            os.link(remote_path, final_path)
+            return os.path.getsize(final_path) == size
+        except OSError as e:
+            Log.debug(f"Remote hardlink not available ({e}), copying instead.")
+            return False
+
+    def _upload_file(self, spool_path: str):
+        """
+        複製到 .part、驗證大小與 hash、改名為正式檔名，最後刪除 spool 檔。
+        與已上傳檔案為同一份內容 (本機 hardlink) 時，優先在遠端建立 hardlink。
+        """
+        name = os.path.basename(spool_path)
+        final_path = os.path.join(self.destination, name)
+        part_path = final_path + PART_SUFFIX
+
+        stat = os.stat(spool_path)
+        link_key = self._link_key(stat)
+        remote_path = self._remote_links.get(link_key) if self._remote_link_enabled else None
+        if remote_path and self._link_remote(remote_path, final_path, stat.st_size):
+            os.remove(spool_path)
+            Log.info(f"上傳報告到: {final_path} (hardlink)")
+            return
+
+        size, digest = _copy_with_hash(spool_path, part_path)
+        remote_size, remote_digest = _file_hash(part_path)
+        if (remote_size, remote_digest) != (size, digest):
+            os.remove(part_path)
+            raise IOError(f"Upload verification failed for {name}: "
+                          f"size {remote_size}/{size}, sha256 {remote_digest[:12]}/{digest[:12]}")
+
+        os.replace(part_path, final_path)
+        if stat.st_nlink > 1 and self._remote_link_enabled:
+            if len(self._remote_links) > 256:
+                self._remote_links.clear()
+            self._remote_links[link_key] = final_path
+        os.remove(spool_path)
+        Log.info(f"上傳報告到: {final_path}")
@@ -0,0 +1,107 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+#===================================================================================================
+# Patterns
+#===================================================================================================
+# 條碼格式 (不含 ^$，一律以 fullmatch 比對)；模組載入時編譯一次
+_OCTET = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+PATTERNS = {
+    'mac':              r"(?:[0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}",    # XX:XX:XX:XX:XX:XX 或 XX-XX-XX-XX-XX-XX
+    'mac_nosign':       r"[0-9A-Fa-f]{12}",                            # XXXXXXXXXXXX
+    'mac_bci':          r"00[:-]19(?:[:-][0-9A-Fa-f]{2}){4}",           # 00:19:XX:XX:XX:XX
+    'mac_bci_nosign':   r"0019[0-9A-Fa-f]{8}",                          # 0019XXXXXXXX
+    'version':          r"\d[.-]\d{2}",                                 # 1.23 或 1-23
+    'mo':               r"[Mm]\d{10}",                                  # M + 10 位數字
+    'pcb':              r"[Mm][0-9A-Za-z-]{21}",                        # M + 21 個字母、數字或連字符
+    'testjig':          r"TestJig.*",                                   # TestJig 開頭
+    'ip':               fr"{_OCTET}\.{_OCTET}\.{_OCTET}\.{_OCTET}",     # IPv4
+    'local_ip':         fr"192\.168\.100\.{_OCTET}",                    # 192.168.100.xxx
+}
+COMPILED = {name: re.compile(pattern) for name, pattern in PATTERNS.items()}
+
+# 帶長度參數的格式，例如 digits(11)
+PARAMETRIZED = {
+    'digits':   lambda n: fr"\d{{{n}}}",                                # n 位數字
+    'hex':      lambda n: fr"[0-9A-Fa-f]{{{n}}}",                       # n 位 16 進位
+    'alnum':    lambda n: fr"[0-9A-Za-z]{{{n}}}",                       # n 位字母或數字
+}
+
+# 腳本 Product 未宣告 Barcodes 時的預設規格 (與原本 collect_product_barcodes 的行為相同)
+DEFAULT_BARCODES = {
+    'MO':   'mo|pcb|testjig',
+    'SN':   'digits(11)',
+    'MAC':  'mac|mac_nosign',
+}
+
+_TOKEN = re.compile(r"\s*([A-Za-z_]\w*)\s*(?:\(\s*(\d+)\s*\))?\s*")
+
+#===================================================================================================
+# Functions
+#===================================================================================================
+@lru_cache(maxsize=None)
+def parametrized(name: str, length: int) -> re.Pattern:
+    """
+    取得帶長度參數的已編譯格式 (同一組參數只編譯一次)。
+    """
+    return re.compile(PARAMETRIZED[name](length))
+
+def _token_pattern(token: str) -> str:
+    match = _TOKEN.fullmatch(token)
+    if not match:
+        raise ValueError(f"Invalid barcode validator '{token}'")
+    name, length = match.group(1).lower(), match.group(2)
+    if length is None:
+        if name not in PATTERNS:
+            raise ValueError(f"Unknown barcode validator '{name}'")
+        return PATTERNS[name]
+    if name not in PARAMETRIZED:
+        raise ValueError(f"Unknown parametrized barcode validator '{name}({length})'")
+    return PARAMETRIZED[name](int(length))
+
+@dataclass(frozen=True)
+class BarcodeValidator:
+    """
+    已編譯的條碼驗證器：規格中的所有格式合併為單一 regex，一次 fullmatch 即完成驗證。
+    """
+    spec: str
+    pattern: re.Pattern
+
+    def __call__(self, value) -> bool:
+        return isinstance(value, str) and self.pattern.fullmatch(value) is not None
+
+@lru_cache(maxsize=128)
+def compile_spec(spec: str) -> BarcodeValidator:
+    """
+    編譯驗證規格，例如 "mo|pcb|testjig" 或 "digits(11)"。
+
+    Raises:
+        ValueError: 規格為空、格式錯誤或包含未知的格式名稱
+    """
+    patterns = [_token_pattern(token) for token in str(spec).split('|')]
+    combined = patterns[0] if len(patterns) == 1 else "|".join(f"(?:{p})" for p in patterns)
+    return BarcodeValidator(spec=str(spec), pattern=re.compile(combined))
+
+def compile_barcodes(specs: dict = None) -> dict[str, BarcodeValidator]:
+    """
+    編譯產品的條碼規格 (腳本 Product 的 Barcodes 區塊)，未宣告的類型使用 DEFAULT_BARCODES。
+
+    Args:
+        specs (dict): {條碼類型: 規格}，例如 {'MO': 'mo|pcb', 'SN': 'digits(12)'}
+
+    Returns:
+        dict: {條碼類型 (大寫): BarcodeValidator}
+    """
+    if specs is None:
+        specs = {}
+    if not isinstance(specs, dict):
+        raise ValueError("'Barcodes' must be a mapping of barcode type to validator spec.")
+    merged = dict(DEFAULT_BARCODES)
+    merged.update({str(key).upper(): value for key, value in specs.items()})
+    return {key: compile_spec(str(spec)) for key, spec in merged.items()}
+
+DEFAULT_VALIDATORS = compile_barcodes()
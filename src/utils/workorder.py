@@ -0,0 +1,247 @@
+#===================================================================================================
+# Import the necessary modules
+#===================================================================================================
+import os
+import re
+import csv
+import json
+import sqlite3
+import argparse
+import threading
+import urllib.request
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable
+
+from src.config import config
+from src.utils.log import Log
+
+#===================================================================================================
+# Constants
+#===================================================================================================
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS work_orders (
+        sn      TEXT PRIMARY KEY,
+        mo      TEXT NOT NULL,
+        macs    TEXT NOT NULL DEFAULT '',
+        source  TEXT NOT NULL,
+        updated TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS ix_work_orders_mo ON work_orders (mo);
+"""
+_HEX_ONLY = re.compile(r'[^0-9A-Fa-f]')
+
+def _mac_key(mac: str) -> str:
+    return _HEX_ONLY.sub('', mac).upper()
+
+#===================================================================================================
+# Providers
+#===================================================================================================
+@dataclass
+class WorkOrderRecord:
+    mo: str
+    sn: str
+    macs: list[str] = field(default_factory=list)
+
+class WorkOrderProvider:
+    """
+    工單資料來源：fetch() 返回該來源的全部紀錄，WorkOrderCache.refresh 以批次方式整批取代。
+    """
+    name = "base"
+
+    def fetch(self) -> Iterable[WorkOrderRecord]:
+        raise NotImplementedError
+
+class CsvWorkOrderProvider(WorkOrderProvider):
+    """
+    CSV 工單檔，欄位：MO, SN, MAC1, MAC2, ... (標題不分大小寫，MAC 欄位可為空)。
+    """
+    name = "csv"
+
+    def __init__(self, path: str = None):
+        self.path = path or config.WORKORDER_CSV_PATH
+
+    def fetch(self) -> Iterable[WorkOrderRecord]:
+        with open(self.path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            columns = {name.strip().upper(): name for name in reader.fieldnames or []}
+            if 'MO' not in columns or 'SN' not in columns:
+                raise ValueError(f"Work-order CSV must have MO and SN columns: {self.path}")
+            mac_columns = sorted((name for name in columns if re.fullmatch(r'MAC\d+', name)), key=lambda n: int(n[3:]))
+            for row in reader:
+                sn = (row[columns['SN']] or '').strip()
+                if not sn:
+                    continue
+                macs = [(row[columns[name]] or '').strip() for name in mac_columns]
+                while macs and not macs[-1]:
+                    macs.pop()
+                yield WorkOrderRecord((row[columns['MO']] or '').strip(), sn, macs)
+
+class MesWorkOrderProvider(WorkOrderProvider):
+    """
+    MES 工單 API 的替代實作：GET WORKORDER_MES_URL，回傳 [{"mo": ..., "sn": ..., "macs": [...]}, ...]。
+    正式 MES 介面確定後只需替換 fetch()。
+    """
+    name = "mes"
+
+    def __init__(self, url: str = None, timeout: float = None):
+        self.url = url or config.WORKORDER_MES_URL
+        self.timeout = timeout or config.WORKORDER_MES_TIMEOUT_SEC
+
+    def fetch(self) -> Iterable[WorkOrderRecord]:
+        with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+            rows = json.load(response)
+        for row in rows:
+            sn = str(row.get('sn') or '').strip()
+            if sn:
+                yield WorkOrderRecord(str(row.get('mo') or '').strip(), sn, [str(mac) for mac in row.get('macs') or []])
+
+def configured_providers() -> list[WorkOrderProvider]:
+    providers = []
+    if os.path.exists(config.WORKORDER_CSV_PATH):
+        providers.append(CsvWorkOrderProvider())
+    if config.WORKORDER_MES_URL:
+        providers.append(MesWorkOrderProvider())
+    return providers
+
+#===================================================================================================
+# Execute
+#===================================================================================================
+class WorkOrderCache:
+    """
+    本機工單快取 (SQLite)，查詢時使用記憶體中的 SN/MAC/MO 索引，掃描當下不需存取磁碟或網路。
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str = None):
+        self.path = path or config.WORKORDER_CACHE_PATH
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._tables = None     # (by_sn, by_mac, by_mo)，refresh 後整組替換
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def refresh(self, provider: WorkOrderProvider) -> int:
+        """
+        以 provider 的全部紀錄取代該來源在快取中的資料 (單一交易)，返回筆數。
+        """
+        records = list(provider.fetch())
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = [(r.sn, r.mo, "\n".join(r.macs), provider.name, now) for r in records]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM work_orders WHERE source = ?", (provider.name,))
+                self._conn.executemany("INSERT OR REPLACE INTO work_orders (sn, mo, macs, source, updated) "
+                                       "VALUES (?, ?, ?, ?, ?)", rows)
+            self._tables = None
+        Log.info(f"Work-order cache refreshed from {provider.name}: {len(rows)} record(s)")
+        return len(rows)
+
+    def _load(self):
+        with self._lock:
+            if self._tables is not None:
+                return self._tables
+            by_sn, by_mac, by_mo = {}, {}, {}
+            for sn, mo, macs in self._conn.execute("SELECT sn, mo, macs FROM work_orders"):
+                record = WorkOrderRecord(mo, sn, macs.split("\n") if macs else [])
+                by_sn[sn.upper()] = record
+                for mac in record.macs:
+                    if mac:
+                        by_mac[_mac_key(mac)] = record
+                by_mo.setdefault(mo.upper(), []).append(record)
+            self._tables = (by_sn, by_mac, by_mo)
+            return self._tables
+
+    def lookup(self, value: str) -> WorkOrderRecord | None:
+        """
+        以 SN、MAC (帶或不帶分隔符) 或 MO 查詢；MO 只在對應唯一一台產品時返回。
+        """
+        if not value:
+            return None
+        by_sn, by_mac, by_mo = self._load()
+        key = value.strip().upper()
+        mac_key = _mac_key(key)
+        record = by_sn.get(key) or (by_mac.get(mac_key) if len(mac_key) == 12 else None)
+        if record is None:
+            units = by_mo.get(key, [])
+            record = units[0] if len(units) == 1 else None
+        return record
+
+    def count(self) -> int:
+        return len(self._load()[0])
+
+#===================================================================================================
+# Functions
+#===================================================================================================
+def lookup(value: str) -> WorkOrderRecord | None:
+    """
+    掃描時使用的查詢入口；未啟用或尚未建立快取時返回 None (改為逐一掃描)。
+    """
+    if not config.WORKORDER_ENABLED or not os.path.exists(config.WORKORDER_CACHE_PATH):
+        return None
+    try:
+        return WorkOrderCache.instance().lookup(value)
+    except Exception as e:
+        Log.error(f"Work-order lookup failed for '{value}': {e}")
+        return None
+
+def refresh_configured() -> int:
+    """
+    從設定的來源 (CSV、MES) 批次更新快取；單一來源失敗不影響其他來源。
+    """
+    total = 0
+    for provider in configured_providers():
+        try:
+            total += WorkOrderCache.instance().refresh(provider)
+        except Exception as e:
+            Log.error(f"Work-order refresh from {provider.name} failed: {e}")
+    return total
+
+def schedule_workorder_refresh():
+    """
+    程式啟動時於背景更新工單快取，不延遲主視窗顯示。
+    """
+    if not config.WORKORDER_ENABLED or not configured_providers():
+        return
+    threading.Thread(target=refresh_configured, name="WorkOrderRefresh", daemon=True).start()
+
+#===================================================================================================
+# Main
+#===================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Work-order cache (SN/MO/MAC lookup for barcode collection)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    refresh = sub.add_parser("refresh", help="批次更新工單快取")
+    refresh.add_argument("--csv", help="CSV 工單檔 (預設使用 WORKORDER_CSV_PATH 與 WORKORDER_MES_URL)")
+    find = sub.add_parser("lookup", help="以 SN、MO 或 MAC 查詢")
+    find.add_argument("value")
+    args = parser.parse_args(argv)
+
+    if args.command == "refresh":
+        if args.csv:
+            count = WorkOrderCache.instance().refresh(CsvWorkOrderProvider(args.csv))
+        else:
+            count = refresh_configured()
+        print(f"{count} work-order record(s) loaded.")
+    else:
+        record = WorkOrderCache.instance().lookup(args.value)
+        if record is None:
+            print(f"Not found: {args.value}")
+        else:
+            print(f"MO={record.mo}  SN={record.sn}  MAC={', '.join(record.macs) or 'N/A'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'reportSearchDialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.1
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QHBoxLayout,
+    QHeaderView, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QTableWidget, QTableWidgetItem, QVBoxLayout,
+    QWidget)
+
+class Ui_FormReportSearchDialog(object):
+    def setupUi(self, FormReportSearchDialog):
+        if not FormReportSearchDialog.objectName():
+            FormReportSearchDialog.setObjectName(u"FormReportSearchDialog")
+        FormReportSearchDialog.resize(900, 520)
+        self.verticalLayout = QVBoxLayout(FormReportSearchDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.Le_Query = QLineEdit(FormReportSearchDialog)
+        self.Le_Query.setObjectName(u"Le_Query")
+        self.Le_Query.setClearButtonEnabled(True)
+
+        self.horizontalLayout.addWidget(self.Le_Query)
+
+        self.Btn_Search = QPushButton(FormReportSearchDialog)
+        self.Btn_Search.setObjectName(u"Btn_Search")
+
+        self.horizontalLayout.addWidget(self.Btn_Search)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.Table_Reports = QTableWidget(FormReportSearchDialog)
+        self.Table_Reports.setObjectName(u"Table_Reports")
+        self.Table_Reports.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.Table_Reports.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.Table_Reports.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+
+        self.verticalLayout.addWidget(self.Table_Reports)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.Lb_Status = QLabel(FormReportSearchDialog)
+        self.Lb_Status.setObjectName(u"Lb_Status")
+
+        self.horizontalLayout_2.addWidget(self.Lb_Status)
+
+        self.Btn_Open = QPushButton(FormReportSearchDialog)
+        self.Btn_Open.setObjectName(u"Btn_Open")
+
+        self.horizontalLayout_2.addWidget(self.Btn_Open)
+
+        self.Btn_Close = QPushButton(FormReportSearchDialog)
+        self.Btn_Close.setObjectName(u"Btn_Close")
+
+        self.horizontalLayout_2.addWidget(self.Btn_Close)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+
+
+        self.retranslateUi(FormReportSearchDialog)
+
+        QMetaObject.connectSlotsByName(FormReportSearchDialog)
+    # setupUi
+
+    def retranslateUi(self, FormReportSearchDialog):
+        FormReportSearchDialog.setWindowTitle(QCoreApplication.translate("FormReportSearchDialog", u"Search Reports", None))
+        self.Le_Query.setPlaceholderText(QCoreApplication.translate("FormReportSearchDialog", u"MO / SN / MAC / Station / Failed item (ex. sn:SN123 00:19:AB)", None))
+        self.Btn_Search.setText(QCoreApplication.translate("FormReportSearchDialog", u"\u641c\u5c0b", None))
+        self.Lb_Status.setText("")
+        self.Btn_Open.setText(QCoreApplication.translate("FormReportSearchDialog", u"\u958b\u555f\u5831\u544a", None))
+        self.Btn_Close.setText(QCoreApplication.translate("FormReportSearchDialog", u"\u95dc\u9589", None))
+    # retranslateUi
+
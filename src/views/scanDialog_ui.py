@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'scanDialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.1
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_FormScanDialog(object):
+    def setupUi(self, FormScanDialog):
+        if not FormScanDialog.objectName():
+            FormScanDialog.setObjectName(u"FormScanDialog")
+        FormScanDialog.resize(560, 360)
+        self.verticalLayout = QVBoxLayout(FormScanDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.Lb_Prompt = QLabel(FormScanDialog)
+        self.Lb_Prompt.setObjectName(u"Lb_Prompt")
+        self.Lb_Prompt.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.Lb_Prompt)
+
+        self.Layout_Fields = QFormLayout()
+        self.Layout_Fields.setObjectName(u"Layout_Fields")
+
+        self.verticalLayout.addLayout(self.Layout_Fields)
+
+        self.verticalSpacer = QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.Lb_Status = QLabel(FormScanDialog)
+        self.Lb_Status.setObjectName(u"Lb_Status")
+
+        self.horizontalLayout.addWidget(self.Lb_Status)
+
+        self.Btn_Clear = QPushButton(FormScanDialog)
+        self.Btn_Clear.setObjectName(u"Btn_Clear")
+        self.Btn_Clear.setAutoDefault(False)
+
+        self.horizontalLayout.addWidget(self.Btn_Clear)
+
+        self.Btn_Cancel = QPushButton(FormScanDialog)
+        self.Btn_Cancel.setObjectName(u"Btn_Cancel")
+        self.Btn_Cancel.setAutoDefault(False)
+
+        self.horizontalLayout.addWidget(self.Btn_Cancel)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+
+        self.retranslateUi(FormScanDialog)
+
+        QMetaObject.connectSlotsByName(FormScanDialog)
+    # setupUi
+
+    def retranslateUi(self, FormScanDialog):
+        FormScanDialog.setWindowTitle(QCoreApplication.translate("FormScanDialog", u"\u6383\u63cf\u689d\u78bc", None))
+        self.Lb_Prompt.setText(QCoreApplication.translate("FormScanDialog", u"\u8acb\u4f9d\u4efb\u610f\u9806\u5e8f\u6383\u63cf\u689d\u78bc\uff0c\u7cfb\u7d71\u6703\u4f9d\u683c\u5f0f\u81ea\u52d5\u586b\u5165\u5c0d\u61c9\u6b04\u4f4d\u3002", None))
+        self.Lb_Status.setText("")
+        self.Btn_Clear.setText(QCoreApplication.translate("FormScanDialog", u"\u6e05\u9664", None))
+        self.Btn_Cancel.setText(QCoreApplication.translate("FormScanDialog", u"\u53d6\u6d88", None))
+    # retranslateUi
+
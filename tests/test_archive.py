@@ -0,0 +1,103 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from datetime import date
+from unittest.mock import patch
+
+from src.config import config
+from src.utils import archive
+from src.utils.archive import ReportArchive, archive_directory, archive_path, find_archived_report
+
+CSS = "body { color: #333; }\n" * 200
+
+def _html(sn):
+    return f"<html><head><style>{CSS}</style></head><body><p>{sn}</p></body></html>".encode()
+
+class TestReportArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.reports = os.path.join(self.tmp_dir.name, 'reports')
+        os.makedirs(self.reports)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, data):
+        path = os.path.join(self.reports, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_css_is_stored_once(self):
+        paths = [self._write(f"ST01_MO_20240501_08000{i}.html", _html(f"SN{i}")) for i in range(5)]
+        pack = ReportArchive(os.path.join(self.tmp_dir.name, 'day.rpa'))
+        pack.add_files(paths)
+
+        self.assertEqual(len(pack._index['shared']), 1)
+        reopened = ReportArchive(pack.path)
+        self.assertEqual(reopened.read("ST01_MO_20240501_080003.html"), _html("SN3"))
+        if archive.zstandard is not None:
+            self.assertLess(os.path.getsize(pack.path), len(CSS) * 2)
+
+    def test_append_and_replace(self):
+        pack = ReportArchive(os.path.join(self.tmp_dir.name, 'day.rpa'))
+        pack.add_files([self._write("a.json", b'{"v":1}')])
+        pack.add_files([self._write("b.xml", b'<testsuites/>'), self._write("a.json", b'{"v":2}')])
+
+        reopened = ReportArchive(pack.path)
+        self.assertEqual(reopened.names(), ['a.json', 'b.xml'])
+        self.assertEqual(reopened.read('a.json'), b'{"v":2}')
+        with self.assertRaises(KeyError):
+            reopened.read('missing.html')
+
+    def test_corruption_is_detected(self):
+        pack = ReportArchive(os.path.join(self.tmp_dir.name, 'day.rpa'))
+        with patch.object(archive, '_compress', side_effect=lambda data: ('raw', data)):
+            pack.add_files([self._write("a.html", b"<html>ok</html>")])
+        with open(pack.path, 'r+b') as f:
+            f.seek(7)
+            f.write(b'X')
+        with self.assertRaises(IOError):
+            pack.read('a.html')
+
+    def test_archive_directory_by_day(self):
+        self._write("ST01_MO_20240501_080000.html", _html("SN1"))
+        self._write("ST01_MO_20240501_080000.json", b'{}')
+        self._write("ST01_MO_20240502_080000.html", _html("SN2"))
+        self._write("ST01_MO_20240503_080000.html", _html("SN3"))
+        self._write("notes.txt", b'keep')
+
+        updated = archive_directory(self.reports, before=date(2024, 5, 3))
+        archive_dir = os.path.join(self.reports, config.REPORT_ARCHIVE_DIRNAME)
+        self.assertEqual(updated, [archive_path(archive_dir, date(2024, 5, 1)), archive_path(archive_dir, date(2024, 5, 2))])
+        self.assertEqual(sorted(e.name for e in os.scandir(self.reports) if e.is_file()),
+                         ["ST01_MO_20240503_080000.html", "notes.txt"])
+        self.assertEqual(ReportArchive(updated[0]).names(),
+                         ["ST01_MO_20240501_080000.html", "ST01_MO_20240501_080000.json"])
+        self.assertFalse(os.path.exists(updated[0] + archive.LOCK_SUFFIX))
+
+    def test_locked_day_is_skipped(self):
+        self._write("ST01_MO_20240501_080000.html", _html("SN1"))
+        archive_dir = os.path.join(self.reports, config.REPORT_ARCHIVE_DIRNAME)
+        os.makedirs(archive_dir)
+        with open(archive_path(archive_dir, date(2024, 5, 1)) + archive.LOCK_SUFFIX, 'w'):
+            pass
+        self.assertEqual(archive_directory(self.reports, before=date(2024, 5, 3)), [])
+        self.assertTrue(os.path.exists(os.path.join(self.reports, "ST01_MO_20240501_080000.html")))
+
+    def test_find_archived_report(self):
+        self._write("ST01_MO_20240501_080000.html", _html("SN1"))
+        archive_directory(self.reports, before=date(2024, 5, 3))
+
+        path = find_archived_report("ST01_MO_20240501_080000.html", [self.reports])
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), _html("SN1"))
+        self.assertIsNone(find_archived_report("ST01_MO_20240509_080000.html", [self.reports]))
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
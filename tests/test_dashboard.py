@@ -0,0 +1,92 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from datetime import datetime, date, timedelta
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.commonUtils import ItemResult
+from src.utils.database import DatabaseManager
+from src.utils import dashboard
+
+class TestDashboard(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patchers = [patch.object(config, 'DATABASE_PATH', self.tmp_dir.name),
+                         patch.object(config, 'DASHBOARD_PATH', os.path.join(self.tmp_dir.name, 'dashboard'))]
+        for patcher in self.patchers:
+            patcher.start()
+        DatabaseManager._instance = None
+        self.db = DatabaseManager()
+        self.db.initialize_database()
+
+    def tearDown(self):
+        self.db.close_connection()
+        DatabaseManager._instance = None
+        for patcher in self.patchers:
+            patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _run_session(self, values, final_result=True, seconds=5, station='ST01', retries=0):
+        session_id = self.db.create_test_session(
+            {'script_name': 'S', 'script_version': '1.00', 'total_tests': len(values)},
+            {}, {'user': 'op', 'station': station}, 'BOTH')
+        for title, value, result in values:
+            self.db.insert_test_item_result(session_id, ItemResult(title, 'mV', 1, 10, value, result, retries))
+        self.db.update_test_session_end(session_id, datetime.now() + timedelta(seconds=seconds), final_result)
+        return session_id
+
+    def test_cycle_time_histogram(self):
+        self._run_session([('Volt', '2', True)], seconds=3)
+        self._run_session([('Volt', '2', True)], seconds=8)
+        self._run_session([('Volt', '2', True)], seconds=25)
+        today = date.today()
+        self.assertEqual(self.db.get_cycle_time_histogram(today, today), {0: 2, 20: 1})
+
+        self.db.rebuild_yield_summary()
+        self.assertEqual(self.db.get_cycle_time_histogram(today, today), {0: 2, 20: 1})
+
+    def test_dashboard_data(self):
+        self._run_session([('Volt', '2', True), ('Link', 'PASS', True)])
+        self._run_session([('Volt', '2', True), ('Link', 'FAIL', False)], final_result=False, retries=1)
+        self._run_session([('Volt', '2', True)], station='ST02')
+
+        data = dashboard.build_dashboard_data(self.db, date.today(), 'ST01')
+        self.assertEqual((data['total'], data['pass_count'], data['fail_count']), (2, 1, 1))
+        self.assertAlmostEqual(data['yield'], 50.0)
+        self.assertEqual(data['retried_count'], 1)
+        self.assertEqual([i['item_title'] for i in data['top_failing']], ['Link'])
+        self.assertEqual({i['item_title'] for i in data['top_retried']}, {'Volt', 'Link'})
+        self.assertEqual(sum(b['count'] for b in data['cycle_time']), 2)
+
+    def test_generate_dashboard_html(self):
+        self._run_session([('Link', 'FAIL', False)], final_result=False)
+        path = dashboard.generate_dashboard(date.today(), 'ST01', self.db)
+
+        self.assertEqual(path, dashboard.dashboard_path(date.today(), 'ST01'))
+        self.assertFalse(os.path.exists(path + '.tmp'))
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        self.assertIn('ST01', html)
+        self.assertIn('Link', html)
+
+    def test_schedule_coalesces_pending_updates(self):
+        with patch.object(dashboard.DatabaseWriter, 'instance') as mock_writer:
+            dashboard.schedule_dashboard_update(datetime.now(), 'ST01')
+            dashboard.schedule_dashboard_update(datetime.now(), 'ST01')
+            self.assertEqual(mock_writer.return_value.submit.call_count, 1)
+
+            job, key = mock_writer.return_value.submit.call_args.args
+            with patch.object(dashboard, 'generate_dashboard') as mock_generate:
+                job(key)
+            mock_generate.assert_called_once_with(date.today(), 'ST01')
+            dashboard.schedule_dashboard_update(datetime.now(), 'ST01')
+            self.assertEqual(mock_writer.return_value.submit.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
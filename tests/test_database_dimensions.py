@@ -0,0 +1,119 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+import threading
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.database import DatabaseManager, ScriptRecord, TestSession, Dut, DutMac, legacy_duts
+from src.utils.journal import DatabaseWriter, schedule_dimension_migration
+
+TESTER_INFO = {'user': 'op', 'station': 'ST01'}
+
+class TestDimensionTables(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patcher = patch.object(config, 'DATABASE_PATH', self.tmp_dir.name)
+        self.patcher.start()
+        DatabaseManager._instance = None
+        self.db = DatabaseManager()
+        self.db.initialize_database()
+
+    def tearDown(self):
+        self.db.close_connection()
+        DatabaseManager._instance = None
+        self.patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _count(self, model):
+        session = self.db.Session()
+        count = session.query(model).count()
+        session.close()
+        return count
+
+    def test_singleton_keeps_connection(self):
+        engine = self.db.engine
+        self.assertIs(DatabaseManager(), self.db)
+        self.assertIs(self.db.engine, engine)
+
+    def test_initialize_database_is_idempotent(self):
+        script_info = {'script_name': 'S', 'script_version': '1.00', 'content_hash': 'abc'}
+        self.db.create_test_session(script_info, {}, TESTER_INFO, 'BOTH')
+        engine, script_ids = self.db.engine, dict(self.db._script_ids)
+        self.db.initialize_database()
+        self.assertIs(self.db.engine, engine)
+        self.assertEqual(self.db._script_ids, script_ids)
+        self.assertTrue(script_ids)
+
+    def test_multi_dut_session(self):
+        script_info = {'script_name': 'S', 'script_version': '1.00', 'content_hash': 'abc'}
+        duts = [{'slot': slot, 'mo': f'MO{slot}', 'sn': f'SN{slot}', 'macs': [f'M{slot}1', f'M{slot}2', f'M{slot}3']}
+                for slot in (1, 2, 3)]
+        session_id = self.db.create_test_session(script_info, {'duts': duts}, TESTER_INFO, 'BOTH')
+        self.db.create_test_session(script_info, {'duts': duts[:1]}, TESTER_INFO, 'BOTH')
+
+        self.assertEqual(self._count(ScriptRecord), 1)
+        self.assertEqual(self._count(Dut), 4)
+        self.assertEqual(self._count(DutMac), 12)
+        self.assertEqual(self.db.find_sessions_by_dut(mac='M33'), [session_id])
+        self.assertEqual(len(self.db.find_sessions_by_dut(sn='SN1')), 2)
+
+    def test_same_version_different_content(self):
+        base = {'script_name': 'S', 'script_version': '1.00'}
+        self.db.create_test_session({**base, 'content_hash': 'a'}, {}, TESTER_INFO, 'BOTH')
+        self.db.create_test_session({**base, 'content_hash': 'b'}, {}, TESTER_INFO, 'BOTH')
+        self.assertEqual(self._count(ScriptRecord), 2)
+
+    def test_legacy_duts_skips_empty_slot(self):
+        duts = legacy_duts({'mo_tx': 'MO1', 'sn_tx': 'SN1', 'mac_tx_1': 'N/A', 'mac_tx_2': 'N/A',
+                            'mo_rx': 'N/A', 'sn_rx': 'N/A', 'mac_rx_1': 'N/A', 'mac_rx_2': 'N/A'})
+        self.assertEqual([d['slot'] for d in duts], [1])
+
+    def _add_legacy_sessions(self, count):
+        session = self.db.Session()
+        for i in range(count):
+            session.add(TestSession(script_name='S', script_version=f'1.0{i % 2}',
+                                    product_mo_tx=f'MO{i}', product_sn_tx=f'SN{i}',
+                                    product_mac_tx_1=f'MAC{i}', product_mac_tx_2='N/A',
+                                    product_mo_rx=f'MO{i}', product_sn_rx=f'RX{i}',
+                                    product_mac_rx_1='N/A', product_mac_rx_2='N/A'))
+        session.commit()
+        session.close()
+
+    def _unmigrated(self):
+        session = self.db.Session()
+        count = session.query(TestSession).filter(TestSession.script_id.is_(None)).count()
+        session.close()
+        return count
+
+    def test_scheduled_migration_runs_one_batch_per_job(self):
+        self._add_legacy_sessions(5)
+        writer = DatabaseWriter.instance()
+        gate = threading.Event()
+        writer.submit(gate.wait, 5)     # 先暫停寫入執行緒，確保下面的工作依序排入
+        schedule_dimension_migration(batch_size=2)
+        seen = []
+        writer.submit(lambda: seen.append(self._unmigrated()))
+        gate.set()
+        for _ in range(4):
+            self.assertTrue(writer.flush(timeout=10))
+        self.assertEqual(seen, [3])     # 第一批之後其他寫入工作就能執行
+        self.assertEqual(self._unmigrated(), 0)
+
+    def test_migrate_legacy_sessions_in_batches(self):
+        self._add_legacy_sessions(5)
+
+        self.assertEqual(self.db.migrate_dimensions(batch_size=2), 5)
+        self.assertEqual(self.db.migrate_dimensions(batch_size=2), 0)
+        self.assertEqual(self._count(ScriptRecord), 2)
+        self.assertEqual(self._count(Dut), 10)
+        self.assertEqual(self._count(DutMac), 5)
+        self.assertEqual(len(self.db.find_sessions_by_dut(sn='RX3')), 1)
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,117 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from datetime import datetime, date, timedelta
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.commonUtils import ItemResult
+from sqlalchemy import text
+
+from src.utils.database import DatabaseManager, SUMMARY_TABLES
+
+class TestYieldSummary(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patcher = patch.object(config, 'DATABASE_PATH', self.tmp_dir.name)
+        self.patcher.start()
+        DatabaseManager._instance = None
+        self.db = DatabaseManager()
+        self.db.initialize_database()
+
+    def tearDown(self):
+        self.db.close_connection()
+        DatabaseManager._instance = None
+        self.patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _run_session(self, values, final_result=True, retries=0):
+        session_id = self.db.create_test_session(
+            {'script_name': 'S', 'script_version': '1.00', 'total_tests': len(values)},
+            {}, {'user': 'op', 'station': 'ST01'}, 'BOTH')
+        for title, value, result in values:
+            self.db.insert_test_item_result(session_id, ItemResult(title, 'mV', 1, 10, value, result, retries))
+        self.db.update_test_session_end(session_id, datetime.now() + timedelta(seconds=5), final_result)
+        return session_id
+
+    def test_session_and_item_counts(self):
+        self._run_session([('Volt', '2', True), ('Link', 'PASS', True)])
+        self._run_session([('Volt', '4', True), ('Link', 'FAIL', False)], final_result=False, retries=1)
+
+        today = date.today()
+        sessions = self.db.get_yield_summary(today, today)
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(sessions[0]['pass_count'], 1)
+        self.assertEqual(sessions[0]['fail_count'], 1)
+        self.assertEqual(sessions[0]['retried_count'], 1)
+
+        items = {row['item_title']: row for row in self.db.get_yield_summary(today, today, by_item=True)}
+        self.assertEqual(items['Volt']['pass_count'], 2)
+        self.assertEqual(items['Volt']['value_count'], 2)
+        self.assertAlmostEqual(items['Volt']['value_sum'], 6.0)
+        self.assertAlmostEqual(items['Volt']['value_sumsq'], 20.0)
+        self.assertAlmostEqual(items['Volt']['mean'], 3.0)
+        self.assertAlmostEqual(items['Volt']['stdev'], 2 ** 0.5)
+        self.assertEqual(items['Link']['fail_count'], 1)
+        self.assertEqual(items['Link']['value_count'], 0)
+
+    def test_end_twice_is_counted_once(self):
+        session_id = self._run_session([('Volt', '2', True)])
+        self.db.update_test_session_end(session_id, datetime.now() + timedelta(seconds=6), True)
+
+        today = date.today()
+        self.assertEqual(self.db.get_yield_summary(today, today)[0]['pass_count'], 1)
+
+    def test_upgraded_database_needs_rebuild(self):
+        self.assertFalse(self.db.summary_rebuild_pending)
+        self._run_session([('Volt', '2', True)])
+        with self.db.engine.begin() as conn:
+            for name in SUMMARY_TABLES:
+                conn.execute(text(f'DROP TABLE {name}'))
+        self.db.close_connection()
+        DatabaseManager._instance = None
+        self.db = DatabaseManager()
+        self.assertTrue(self.db.summary_rebuild_pending)
+        self.db.rebuild_yield_summary()
+        self.assertFalse(self.db.summary_rebuild_pending)
+        today = date.today()
+        self.assertEqual(self.db.get_yield_summary(today, today)[0]['pass_count'], 1)
+
+    def test_rebuild_matches_incremental(self):
+        self._run_session([('Volt', '2', True)])
+        self._run_session([('Volt', '3', True)])
+        today = date.today()
+        before = self.db.get_yield_summary(today, today, by_item=True)
+
+        self.db.rebuild_yield_summary()
+        self.assertEqual(self.db.get_yield_summary(today, today, by_item=True), before)
+
+    def test_items_replayed_into_closed_session(self):
+        session_id = self._run_session([('Volt', '2', True)], final_result=False)
+        # journal 重播：Session 已結束後才補寫項目並再次結束
+        self.assertTrue(self.db.reopen_test_session(session_id))
+        self.db.insert_test_item_result(session_id, ItemResult('Volt', 'mV', 1, 10, '4', True, 1))
+        self.db.insert_test_item_result(session_id, ItemResult('Link', '', None, None, 'PASS', True))
+        self.db.update_test_session_end(session_id, datetime.now() + timedelta(seconds=7), True)
+
+        today = date.today()
+        sessions = self.db.get_yield_summary(today, today)
+        self.assertEqual((sessions[0]['pass_count'], sessions[0]['fail_count'], sessions[0]['retried_count']), (1, 0, 1))
+        items = {row['item_title']: row for row in self.db.get_yield_summary(today, today, by_item=True)}
+        self.assertEqual(items['Volt']['value_count'], 2)
+        self.assertAlmostEqual(items['Volt']['value_sum'], 6.0)
+        self.assertEqual(items['Link']['pass_count'], 1)
+
+        incremental = (self.db.get_yield_summary(today, today, by_item=True),
+                       self.db.get_cycle_time_histogram(today, today))
+        self.db.rebuild_yield_summary()
+        self.assertEqual((self.db.get_yield_summary(today, today, by_item=True),
+                          self.db.get_cycle_time_histogram(today, today)), incremental)
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,110 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import time
+import unittest
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.database import DatabaseManager
+from src.utils.duplicate import BloomFilter, DuplicateGuard, mac_variants
+
+TESTER_INFO = {'user': 'op', 'station': 'ST01'}
+SCRIPT_INFO = {'script_name': 'S', 'script_version': '1.00', 'content_hash': 'abc'}
+
+class TestBloomFilter(unittest.TestCase):
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(10000, 0.001)
+        keys = [f"sn:{i:011d}" for i in range(10000)]
+        for key in keys:
+            bloom.add(key)
+        self.assertTrue(all(key in bloom for key in keys))
+        false_positives = sum(f"sn:X{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 50)
+
+    def test_mac_variants(self):
+        variants = mac_variants("0019abcdef01")
+        self.assertIn("00:19:AB:CD:EF:01", variants)
+        self.assertIn("00-19-ab-cd-ef-01", variants)
+        self.assertIn("0019ABCDEF01", variants)
+        self.assertEqual(mac_variants("bad"), ["bad"])
+
+class TestDuplicateGuard(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patcher = patch.object(config, 'DATABASE_PATH', self.tmp_dir.name)
+        self.patcher.start()
+        DatabaseManager._instance = None
+        self.db = DatabaseManager()
+        self.db.initialize_database()
+
+        passed = self._session('12345678901', ['00:19:AB:CD:EF:01', 'N/A'], True)
+        self._session('12345678902', ['00:19:AB:CD:EF:02'], False)
+        self.passed_id = passed
+        self.guard = DuplicateGuard(self.db)
+
+    def tearDown(self):
+        self.db.close_connection()
+        DatabaseManager._instance = None
+        self.patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _session(self, sn, macs, final_result):
+        duts = [{'slot': 1, 'mo': 'M1234567890', 'sn': sn, 'macs': macs}]
+        session_id = self.db.create_test_session(SCRIPT_INFO, {'duts': duts}, TESTER_INFO, 'BOTH')
+        self.db.update_test_session_end(session_id, datetime.now(), final_result)
+        return session_id
+
+    def test_same_unit_can_be_retested(self):
+        self.assertEqual(self.guard.load(), 2)
+        self.assertEqual(self.guard.check({'$mo1': 'M1234567890', '$sn1': '12345678901', '$mac11': '0019abcdef01'}), [])
+        self.assertEqual(self.guard.check({'$sn1': '12345678901'}), [])
+
+    def test_label_reused_on_different_board(self):
+        self.guard.load()
+        conflicts = self.guard.check({'$sn1': '99999999999', '$mac11': '00:19:AB:CD:EF:01'})
+        self.assertEqual(len(conflicts), 1)
+        self.assertIn('12345678901', conflicts[0])
+        self.assertIn(str(self.passed_id), conflicts[0])
+        conflicts = self.guard.check({'$sn1': '12345678901', '$mac11': '00:19:AB:CD:EF:99'})
+        self.assertEqual(len(conflicts), 1)
+        self.assertTrue(conflicts[0].startswith('SN 12345678901'))
+
+    def test_failed_and_new_identifiers_pass(self):
+        self.guard.load()
+        self.assertEqual(self.guard.check({'$sn1': '12345678902', '$mac11': '00:19:AB:CD:EF:02',
+                                           '$sn2': '99999999999', '$mac21': 'N/A'}), [])
+
+    def test_check_before_load_uses_database(self):
+        self.assertEqual(len(self.guard.check({'$sn1': '99999999999', '$mac11': '00-19-AB-CD-EF-01'})), 1)
+
+    def test_recent_pass_is_checked_before_db_write(self):
+        self.guard.load()
+        self.guard.add_duts([{'sn': '55555555555', 'macs': ['0019ABCDEF55']}])
+        self.assertEqual(self.guard.check({'$sn1': '55555555555', '$mac11': '00:19:ab:cd:ef:55'}), [])
+        conflicts = self.guard.check({'$sn1': '66666666666', '$mac11': '00:19:ab:cd:ef:55'})
+        self.assertEqual(len(conflicts), 1)
+        self.assertIn('本次執行', conflicts[0])
+
+    def test_negative_check_is_fast(self):
+        self.guard.load()
+        with patch.object(self.db, 'find_passed_duts') as query:
+            start = time.perf_counter()
+            for i in range(1000):
+                self.guard.check({'$sn1': f'{i:011d}', '$mac11': f'0019ABCD{i:04X}'})
+            elapsed = (time.perf_counter() - start) / 1000
+        self.assertLess(elapsed, 0.001)
+        self.assertLess(query.call_count, 10)
+
+    def test_disabled(self):
+        with patch.object(config, 'DUPLICATE_CHECK_ENABLED', False):
+            self.assertEqual(self.guard.check({'$sn1': '12345678901'}), [])
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
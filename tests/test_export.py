@@ -0,0 +1,100 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import csv
+import json
+import unittest
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.utils.database import Base, TestSession, TestItemResult, Dut, DutMac
+from src.utils import export
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.tmp_dir.name, 'results.db')}")
+        Base.metadata.create_all(self.engine)
+        session = sessionmaker(bind=self.engine)()
+        for day, script_name in ((1, 'A'), (2, 'A'), (3, 'B'), (10, 'A')):
+            start = datetime(2025, 4, day, 9, 0, 0)
+            test_session = TestSession(script_name=script_name, script_version='1.00', station='ST01',
+                                       start_time=start, end_time=start + timedelta(seconds=20),
+                                       total_time_sec=20, final_result=True)
+            session.add(test_session)
+            session.flush()
+            if day == 1:
+                for slot in (1, 2, 3):
+                    dut = Dut(session_id=test_session.session_id, slot=slot, mo=f'MO{slot}', sn=f'SN{slot}')
+                    session.add(dut)
+                    session.flush()
+                    for idx in (1, 2, 3):
+                        session.add(DutMac(dut_id=dut.dut_id, idx=idx, mac=f'M{slot}{idx}'))
+            for i in range(3):
+                session.add(TestItemResult(session_id=test_session.session_id, item_title=f'Item {i}',
+                                           item_value=str(i), item_result=True, timestamp=start))
+        session.commit()
+        session.close()
+        self.start = datetime(2025, 4, 1)
+        self.end = datetime(2025, 4, 5)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def test_chunks_are_bounded(self):
+        chunks = list(export.iter_export_chunks(self.engine, self.start, self.end, chunk_size=4))
+        self.assertEqual([len(c) for c in chunks], [4, 4, 1])
+        self.assertEqual(len(chunks[0][0]), len(export.EXPORT_COLUMNS))
+
+    def test_export_csv_with_script_filter(self):
+        output = os.path.join(self.tmp_dir.name, 'out', 'a.csv')
+        total = export.export_results(output, self.start, self.end, 'csv', script_name='A',
+                                      engine=self.engine, chunk_size=2)
+        self.assertEqual(total, 6)
+        with open(output, encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[0]['script_name'], 'A')
+        self.assertEqual(rows[0]['item_title'], 'Item 0')
+
+    @unittest.skipIf(export.pa is None, "pyarrow not installed")
+    def test_export_parquet(self):
+        output = os.path.join(self.tmp_dir.name, 'all.parquet')
+        total = export.export_results(output, self.start, self.end, 'parquet', engine=self.engine, chunk_size=4)
+        self.assertEqual(total, 9)
+        parquet_file = export.pq.ParquetFile(output)
+        self.assertEqual(parquet_file.metadata.num_rows, 9)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        self.assertEqual(parquet_file.schema_arrow.field('final_result').type, export.pa.bool_())
+
+    def test_duts_are_flattened(self):
+        output = os.path.join(self.tmp_dir.name, 'duts.csv')
+        export.export_results(output, self.start, self.end, 'csv', engine=self.engine, chunk_size=2)
+        with open(output, encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.DictReader(f))
+        duts = json.loads(rows[0]['duts'])
+        self.assertEqual([d['slot'] for d in duts], [1, 2, 3])
+        self.assertEqual(duts[2], {'slot': 3, 'mo': 'MO3', 'sn': 'SN3', 'macs': ['M31', 'M32', 'M33']})
+        self.assertEqual(rows[2]['duts'], rows[0]['duts'])     # 跨批次的同一 Session
+        self.assertEqual(rows[3]['duts'], '')
+
+    def test_dut_lookup_is_split_into_batches(self):
+        with patch.object(export, 'IN_BATCH_SIZE', 1), self.engine.connect() as conn:
+            duts = export._load_duts(conn, {1, 2, 3})
+        self.assertEqual(list(duts), [1])
+        self.assertEqual(len(json.loads(duts[1])), 3)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export.export_results('x.json', self.start, self.end, 'json', engine=self.engine)
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
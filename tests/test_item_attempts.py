@@ -0,0 +1,85 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.database import DatabaseManager, OutputBlob
+
+class TestItemAttempts(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patcher = patch.object(config, 'DATABASE_PATH', self.tmp_dir.name)
+        self.patcher.start()
+        DatabaseManager._instance = None
+        self.db = DatabaseManager()
+        self.db.initialize_database()
+        self.session_id = self.db.create_test_session({'script_name': 'S', 'script_version': '1.00'}, {},
+                                                      {'user': 'op', 'station': 'ST01'}, 'BOTH')
+
+    def tearDown(self):
+        self.db.close_connection()
+        DatabaseManager._instance = None
+        self.patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _blob_count(self):
+        session = self.db.Session()
+        count = session.query(OutputBlob).count()
+        session.close()
+        return count
+
+    def test_roundtrip_and_dedup(self):
+        stdout = b'link up\n' * 1000
+        for attempt in range(3):
+            self.assertTrue(self.db.insert_item_attempt(self.session_id, 'Link', attempt, 1, False,
+                                                        stdout, b'timeout\n'))
+        self.assertEqual(self._blob_count(), 2)
+
+        attempts = self.db.get_item_attempts(self.session_id, 'Link')
+        self.assertEqual([a['attempt'] for a in attempts], [0, 1, 2])
+        output = self.db.get_attempt_output(attempts[-1]['attempt_id'])
+        self.assertEqual(output['stdout'], stdout)
+        self.assertEqual(output['stderr'], b'timeout\n')
+        self.assertEqual(output['exit_code'], 1)
+        self.assertFalse(output['stdout_truncated'])
+
+    def test_empty_output_has_no_blob(self):
+        self.db.insert_item_attempt(self.session_id, 'Volt', 0, 0, False, b'3.3', b'')
+        output = self.db.get_attempt_output(self.db.get_item_attempts(self.session_id)[0]['attempt_id'])
+        self.assertEqual(output['stderr'], b'')
+        self.assertEqual(self._blob_count(), 1)
+
+    def test_size_caps(self):
+        with patch.object(config, 'OUTPUT_CAPTURE_MAX_BYTES', 1000):
+            self.db.insert_item_attempt(self.session_id, 'Dump', 0, 0, False, b'A' * 500 + os.urandom(5000) + b'END', b'')
+        output = self.db.get_attempt_output(self.db.get_item_attempts(self.session_id)[0]['attempt_id'])
+        self.assertTrue(output['stdout_truncated'])
+        self.assertLessEqual(len(output['stdout']), 1000)
+        self.assertTrue(output['stdout'].startswith(b'A' * 250))
+        self.assertTrue(output['stdout'].endswith(b'END'))
+
+        with patch.object(config, 'OUTPUT_BLOB_STORE_MAX_BYTES', 0):
+            self.db.insert_item_attempt(self.session_id, 'Dump', 1, 0, False, b'new output', b'')
+        output = self.db.get_attempt_output(self.db.get_item_attempts(self.session_id)[1]['attempt_id'])
+        self.assertIsNone(output['stdout'])
+
+    def test_hash_only_blob_is_refilled(self):
+        with patch.object(config, 'OUTPUT_BLOB_STORE_MAX_BYTES', 0):
+            self.db.insert_item_attempt(self.session_id, 'Link', 0, 0, False, b'link up', b'')
+        self.db.insert_item_attempt(self.session_id, 'Link', 1, 0, False, b'link up', b'')
+        attempts = self.db.get_item_attempts(self.session_id, 'Link')
+        self.assertEqual(self._blob_count(), 1)
+        self.assertEqual(self.db.get_attempt_output(attempts[0]['attempt_id'])['stdout'], b'link up')
+        self.assertEqual(self.db.get_attempt_output(attempts[1]['attempt_id'])['stdout'], b'link up')
+
+    def test_unknown_attempt(self):
+        self.assertIsNone(self.db.get_attempt_output(999))
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,135 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.commonUtils import ItemResult
+from src.utils.database import DatabaseManager, TestSession, TestItemResult
+from src.utils.journal import ResultJournal, DatabaseWriter, read_journal, replay_journal, write_with_retry
+
+SCRIPT_INFO = {'script_name': 'S', 'script_version': '1.00', 'total_tests': 3}
+TESTER_INFO = {'user': 'op', 'station': 'ST01'}
+
+class TestResultJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patcher = patch.object(config, 'DATABASE_PATH', self.tmp_dir.name)
+        self.patcher.start()
+        DatabaseManager._instance = None
+        self.db = DatabaseManager()
+        self.db.initialize_database()
+        self.journal_dir = os.path.join(self.tmp_dir.name, 'journal')
+        self.start = datetime(2025, 4, 1, 9, 0, 0)
+
+    def tearDown(self):
+        self.db.close_connection()
+        DatabaseManager._instance = None
+        self.patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _write_journal(self, session_id, count, end=True):
+        journal = ResultJournal.create(session_id, SCRIPT_INFO, {}, TESTER_INFO, 'BOTH', self.start, self.journal_dir)
+        for i in range(count):
+            journal.append_item(ItemResult(f'Item {i}', 'mV', 1, 10, str(i), True), self.start + timedelta(seconds=i))
+        if end:
+            journal.append_end(self.start + timedelta(seconds=count), True)
+        journal.close()
+        return journal
+
+    def _items(self, session_id):
+        session = self.db.Session()
+        items = session.query(TestItemResult).filter_by(session_id=session_id).order_by(TestItemResult.item_seq).all()
+        session.close()
+        return items
+
+    def test_truncated_line_is_ignored(self):
+        journal = self._write_journal(None, 2, end=False)
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"type":"item","se')
+        records = read_journal(journal.path)
+        self.assertEqual([r['type'] for r in records], ['session', 'item', 'item'])
+
+    def test_replay_pending_session(self):
+        journal = self._write_journal(None, 3)
+        self.assertTrue(replay_journal(self.db, journal.path))
+        self.assertFalse(os.path.exists(journal.path))
+
+        session = self.db.Session()
+        test_session = session.query(TestSession).one()
+        session.close()
+        self.assertEqual(test_session.start_time, self.start)
+        self.assertTrue(test_session.final_result)
+        self.assertEqual([i.item_seq for i in self._items(test_session.session_id)], [0, 1, 2])
+
+    def test_replay_skips_committed_items_and_closes_crashed_session(self):
+        session_id = self.db.create_test_session(SCRIPT_INFO, {}, TESTER_INFO, 'BOTH', start_time=self.start)
+        self.db.insert_test_item_result(session_id, ItemResult('Item 0', 'mV', 1, 10, '0', True), seq=0)
+        journal = self._write_journal(session_id, 3, end=False)
+
+        self.assertTrue(replay_journal(self.db, journal.path))
+        self.assertEqual([i.item_seq for i in self._items(session_id)], [0, 1, 2])
+
+        session = self.db.Session()
+        test_session = session.get(TestSession, session_id)
+        session.close()
+        self.assertFalse(test_session.final_result)
+        self.assertEqual(test_session.end_time, self.start + timedelta(seconds=2))
+
+    def test_failed_replay_reuses_created_session(self):
+        journal = self._write_journal(None, 3)
+        insert = self.db.insert_test_item_result
+        def fail_seq_1(session_id, item_result, **kwargs):
+            return False if kwargs.get('seq') == 1 else insert(session_id, item_result, **kwargs)
+        with patch.object(self.db, 'insert_test_item_result', side_effect=fail_seq_1):
+            self.assertFalse(replay_journal(self.db, journal.path))
+        self.assertTrue(os.path.exists(journal.path))
+        self.assertTrue(replay_journal(self.db, journal.path))
+
+        session = self.db.Session()
+        sessions = session.query(TestSession).all()
+        session.close()
+        self.assertEqual(len(sessions), 1)
+        self.assertTrue(sessions[0].final_result)
+        self.assertEqual([i.item_seq for i in self._items(sessions[0].session_id)], [0, 1, 2])
+
+    def test_replay_into_closed_session_updates_summary(self):
+        session_id = self.db.create_test_session(SCRIPT_INFO, {}, TESTER_INFO, 'BOTH', start_time=self.start)
+        self.db.insert_test_item_result(session_id, ItemResult('Item 0', 'mV', 1, 10, '0', True), seq=0)
+        self.db.update_test_session_end(session_id, self.start + timedelta(seconds=1), True)
+        journal = self._write_journal(session_id, 3)
+
+        self.assertTrue(replay_journal(self.db, journal.path))
+        day = self.start.date()
+        sessions = self.db.get_yield_summary(day, day)
+        self.assertEqual((len(sessions), sessions[0]['pass_count']), (1, 1))
+        items = {row['item_title']: row['pass_count'] for row in self.db.get_yield_summary(day, day, by_item=True)}
+        self.assertEqual(items, {'Item 0': 1, 'Item 1': 1, 'Item 2': 1})
+
+    def test_complete_keeps_failed_journal(self):
+        journal = self._write_journal(1, 1)
+        journal.failed = True
+        journal.complete()
+        self.assertTrue(os.path.exists(journal.path))
+
+    def test_writer_runs_jobs_in_order(self):
+        done = []
+        writer = DatabaseWriter.instance()
+        for i in range(5):
+            writer.submit(done.append, i)
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(done, [0, 1, 2, 3, 4])
+
+    def test_write_with_retry(self):
+        attempts = iter([False, False, True])
+        self.assertTrue(write_with_retry(lambda: next(attempts), retries=2, delay=0))
+        self.assertFalse(write_with_retry(lambda: False, retries=1, delay=0))
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,82 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.commonUtils import ItemResult
+from src.utils.record import ReportGenerator, recover_live_reports, LIVE_INCOMPLETE_SUFFIX
+
+class TestLiveReport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.live_dir = os.path.join(self.tmp_dir.name, 'live')
+        self.patchers = [patch.object(config, 'REPORT_FILE_PATH', self.tmp_dir.name),
+                         patch.object(config, 'REPORT_LIVE_PATH', self.live_dir),
+                         patch.object(ReportGenerator, '_create_data',
+                                      return_value={'product_name': 'Product', 'duts': [], 'station': 'ST01'})]
+        for patcher in self.patchers:
+            patcher.start()
+
+        self.generator = ReportGenerator.__new__(ReportGenerator)
+        self.generator.station = 'ST01'
+        self.generator.start_time = datetime(2024, 5, 1, 8, 0, 0)
+        self.generator.live_path = self.generator.live_file = None
+        self.generator._live_init()
+
+    def tearDown(self):
+        self.generator._live_discard()
+        for patcher in self.patchers:
+            patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _read(self, path):
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def test_rows_are_appended(self):
+        self.generator._live_append(ItemResult('Volt', 'mV', '1', '10', '5', True))
+        self.generator._live_append(ItemResult('Link', '', '', '', 'FAIL', False))
+
+        html = self._read(self.generator.live_path)
+        self.assertIn('Testing in progress', html)
+        self.assertLess(html.index('Volt'), html.index('Link'))
+        self.assertIn('status-false', html)
+        self.assertNotIn('</html>', html)
+
+    def test_finish_replaces_live_report(self):
+        live_path = self.generator.live_path
+        self.generator._live_append(ItemResult('Volt', 'mV', '1', '10', '5', True))
+        paths = [os.path.join(self.tmp_dir.name, 'a.html'), os.path.join(self.tmp_dir.name, 'b.html')]
+
+        self.generator._write_report_links('<html>final</html>', paths)
+        self.assertFalse(os.path.exists(live_path))
+        self.assertEqual(os.listdir(self.live_dir), [])
+        self.assertEqual(self._read(paths[0]), '<html>final</html>')
+        self.assertEqual(os.stat(paths[0]).st_ino, os.stat(paths[1]).st_ino)
+
+    def test_recover_incomplete_report(self):
+        self.generator._live_append(ItemResult('Volt', 'mV', '1', '10', '5', True))
+        live_path = self.generator.live_path
+        self.generator.live_file.close()        # 模擬當機：檔案留在 live 目錄
+        self.generator.live_path = self.generator.live_file = None
+
+        recover_live_reports()
+        self.assertTrue(os.path.exists(live_path))      # 目前程序的報告不處理
+
+        with patch.object(os, 'getpid', return_value=-1):
+            recover_live_reports()
+        name = os.path.splitext(os.path.basename(live_path))[0] + LIVE_INCOMPLETE_SUFFIX + '.html'
+        html = self._read(os.path.join(self.tmp_dir.name, name))
+        self.assertIn('Volt', html)
+        self.assertIn('report incomplete', html)
+        self.assertEqual(os.listdir(self.live_dir), [])
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
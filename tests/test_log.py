@@ -144,23 +144,23 @@ class TestLogMethods(unittest.TestCase):
 
     def test_debug(self):
         Log.debug("Debug message")
-        Log.logger.debug.assert_called_once_with("Debug message")
+        Log.logger.debug.assert_called_once_with("Debug message", stacklevel=2)
 
     def test_info(self):
         Log.info("Info message")
-        Log.logger.info.assert_called_once_with("Info message")
+        Log.logger.info.assert_called_once_with("Info message", stacklevel=2)
 
     def test_warn(self):
         Log.warn("Warn message")
-        Log.logger.warning.assert_called_once_with("Warn message") # Note: maps to warning
+        Log.logger.warning.assert_called_once_with("Warn message", stacklevel=2) # Note: maps to warning
 
     def test_error(self):
         Log.error("Error message")
-        Log.logger.error.assert_called_once_with("Error message", exc_info=False)
+        Log.logger.error.assert_called_once_with("Error message", exc_info=False, stacklevel=2)
 
     def test_error_with_exc_info(self):
         Log.error("Error message with info", exc_info=True)
-        Log.logger.error.assert_called_once_with("Error message with info", exc_info=True)
+        Log.logger.error.assert_called_once_with("Error message with info", exc_info=True, stacklevel=2)
 
     @patch('logging.Formatter')
     @patch('src.utils.log.Stream2Handler') # Patch the custom handler class
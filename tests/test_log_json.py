@@ -0,0 +1,130 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import io
+import json
+import logging
+import unittest
+import tempfile
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.log import Log
+from src.utils.perform import PerformManager
+
+class TestJsonLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.tmp_dir.name, 'json')
+        self.patchers = [patch.object(config, 'LOG_PATH', self.tmp_dir.name),
+                         patch.object(config, 'LOG_JSON_PATH', self.json_path),
+                         patch.object(config, 'LOG_JSON_ENABLED', True)]
+        for patcher in self.patchers:
+            patcher.start()
+        self.saved = (Log.logger, Log._initialized, Log.ch, Log.fh, Log.jh, Log.qh, Log.listener)
+        Log.logger = logging.getLogger(f"{__name__}.{self.id()}")
+        Log.logger.propagate = False
+        Log._initialized = False
+        Log.listener = None
+        Log.clear_context()
+        with patch('sys.stderr', io.StringIO()):
+            Log.init()
+
+    def tearDown(self):
+        Log.shutdown()
+        Log.clear_context()
+        for handler in list(Log.logger.handlers):
+            Log.logger.removeHandler(handler)
+            handler.close()
+        Log.logger, Log._initialized, Log.ch, Log.fh, Log.jh, Log.qh, Log.listener = self.saved
+        for patcher in self.patchers:
+            patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _entries(self):
+        Log.shutdown()
+        with open(Log.jh.baseFilename, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_records_carry_context(self):
+        self.assertIn(Log.jh, Log.listener.handlers)
+        Log.info("before run")
+        Log.set_context(station='ST01', session=12, mo=['M1234567890'], sn=['12345678901'])
+        Log.set_context(item=3, attempt=0)
+        Log.info("Item '%s' finished.", "TX Power")
+        Log.set_context(attempt=1)
+        Log.warn("retry")
+        Log.set_context(item=None)
+        Log.debug("debug is not written")
+        Log.info("item cleared")
+        entries = self._entries()
+        self.assertEqual([e['msg'] for e in entries], ["before run", "Item 'TX Power' finished.", "retry", "item cleared"])
+        self.assertNotIn('session', entries[0])
+        self.assertEqual({k: entries[1][k] for k in ('station', 'session', 'item', 'attempt', 'mo', 'sn', 'level')},
+                         {'station': 'ST01', 'session': 12, 'item': 3, 'attempt': 0, 'mo': ['M1234567890'],
+                          'sn': ['12345678901'], 'level': 'INFO'})
+        self.assertEqual(entries[2]['attempt'], 1)
+        self.assertNotIn('item', entries[3])
+
+    def test_compact_single_line_with_exception(self):
+        Log.set_context(session=7)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            Log.error("failed", exc_info=True)
+        Log.shutdown()
+        with open(Log.jh.baseFilename, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertNotIn(': ', lines[0].split('"msg"')[0])
+        entry = json.loads(lines[0])
+        self.assertEqual(entry['session'], 7)
+        self.assertEqual(entry['msg'], "failed")
+        self.assertIn("ValueError: boom", entry['exc'])
+
+    def test_records_point_at_caller(self):
+        line = sys._getframe().f_lineno + 1
+        Log.warn("from test %s", 1)
+        entry = self._entries()[0]
+        self.assertEqual((entry['file'], entry['line'], entry['func']),
+                         (os.path.basename(__file__), line, 'test_records_point_at_caller'))
+
+    def test_text_log_keeps_traceback(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            Log.error("failed", exc_info=True)
+        Log.shutdown()
+        with open(Log.fh.baseFilename, encoding='utf-8') as f:
+            text = f.read()
+        self.assertIn("test_log_json.py[line:", text)
+        self.assertIn("ValueError: boom", text)
+
+    def test_context_is_per_thread(self):
+        Log.set_context(session=1)
+        thread = threading.Thread(target=Log.info, args=("from worker",))
+        thread.start()
+        thread.join()
+        entries = self._entries()
+        self.assertNotIn('session', entries[0])
+
+    def test_perform_manager_sets_run_context(self):
+        perform = SimpleNamespace(_perform_data=SimpleNamespace(
+            report=SimpleNamespace(db_session_id=42),
+            product_info={'$mo1': 'M1234567890', '$sn1': '12345678901', '$mac11': '0019ABCDEF01',
+                          '$mo2': 'M1234567890', '$sn2': 'N/A'}))
+        Log.set_context(item=5)
+        PerformManager._set_log_context(perform)
+        Log.info("start")
+        entry = self._entries()[0]
+        self.assertEqual(entry['station'], config.STATION_NAME)
+        self.assertEqual((entry['session'], entry['mo'], entry['sn']), (42, ['M1234567890'], ['12345678901']))
+        self.assertNotIn('item', entry)
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,73 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import io
+import time
+import logging
+import unittest
+
+from src.utils.log import Log
+
+class _Expensive:
+    """__str__ 被呼叫的次數 (模擬組合大型 stdout/product_info 的成本)"""
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "x" * 20000
+
+class TestLazyLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = Log.logger
+        Log.logger = logging.getLogger(f"{__name__}.{self.id()}")
+        Log.logger.propagate = False
+        self.stream = io.StringIO()
+        handler = logging.StreamHandler(self.stream)
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        Log.logger.addHandler(handler)
+
+    def tearDown(self):
+        for handler in list(Log.logger.handlers):
+            Log.logger.removeHandler(handler)
+        Log.logger = self.saved
+
+    def test_args_are_formatted_when_enabled(self):
+        Log.logger.setLevel(logging.DEBUG)
+        self.assertTrue(Log.is_debug())
+        Log.debug("Stdout: %s", "42")
+        Log.info("Item %s (Attempt %d/%d)", 3, 1, 2)
+        Log.warn("100% done")       # 沒有參數時不做 % 格式化
+        Log.error("failed: %s", "boom")
+        self.assertEqual(self.stream.getvalue().splitlines(),
+                         ["DEBUG: Stdout: 42", "INFO: Item 3 (Attempt 1/2)", "WARNING: 100% done", "ERROR: failed: boom"])
+
+    def test_disabled_debug_is_not_formatted(self):
+        Log.logger.setLevel(logging.INFO)
+        self.assertFalse(Log.is_debug())
+        value = _Expensive()
+        for _ in range(100):
+            Log.debug("Stdout: %s", value)
+        self.assertEqual(value.calls, 0)
+        self.assertEqual(self.stream.getvalue(), "")
+
+    def test_disabled_debug_overhead(self):
+        # f-string 在呼叫前就組合字串；% 參數在等級未啟用時直接返回
+        Log.logger.setLevel(logging.INFO)
+        value = _Expensive()
+        start = time.perf_counter()
+        for _ in range(2000):
+            Log.debug(f"Stdout: {value}")
+        eager = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(2000):
+            Log.debug("Stdout: %s", value)
+        lazy = time.perf_counter() - start
+        self.assertEqual(value.calls, 2000)
+        self.assertLess(lazy, eager)
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,92 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import io
+import time
+import logging
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.log import Log
+
+class _SlowStream(io.StringIO):
+    def write(self, s):
+        time.sleep(0.02)
+        return super().write(s)
+
+class TestQueueLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patcher = patch.object(config, 'LOG_PATH', self.tmp_dir.name)
+        self.patcher.start()
+        self.saved = (Log.logger, Log._initialized, Log.ch, Log.fh, Log.qh, Log.listener)
+        Log.logger = logging.getLogger(f"{__name__}.{self.id()}")
+        Log.logger.setLevel(logging.DEBUG)
+        Log.logger.propagate = False
+        Log._initialized = False
+        Log.listener = None
+        self.console = io.StringIO()
+        with patch('sys.stderr', self.console):
+            Log.init()
+
+    def tearDown(self):
+        Log.shutdown()
+        for handler in list(Log.logger.handlers):
+            Log.logger.removeHandler(handler)
+            handler.close()
+        Log.logger, Log._initialized, Log.ch, Log.fh, Log.qh, Log.listener = self.saved
+        self.patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def _log_lines(self):
+        with open(Log.fh.baseFilename, encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    def test_records_go_through_queue(self):
+        self.assertEqual(Log.logger.handlers, [Log.qh])
+        self.assertEqual(Log.listener.handlers, (Log.ch, Log.fh))
+
+    def test_shutdown_flushes_all_records(self):
+        for i in range(2000):
+            Log.info(f"record {i}")
+            Log.debug(f"debug {i}")     # FileHandler 等級為 INFO
+        Log.shutdown()
+        lines = self._log_lines()
+        self.assertEqual(len(lines), 2000)
+        self.assertTrue(lines[-1].endswith("record 1999"))
+        self.assertEqual(self.console.getvalue().count("\n"), 4000)
+
+    def test_slow_stream_does_not_block_caller(self):
+        stream = _SlowStream()
+        Log.install_filter(stream)
+        self.assertEqual(len(Log.listener.handlers), 3)
+        start = time.perf_counter()
+        for i in range(20):
+            Log.info(f"slow {i}")
+        self.assertLess(time.perf_counter() - start, 0.2)
+        Log.shutdown()
+        self.assertEqual(stream.getvalue().count("slow"), 20)
+
+    def test_exception_text_is_kept(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            Log.error("failed", exc_info=True)
+        Log.shutdown()
+        text = "\n".join(self._log_lines())
+        self.assertIn("ERROR: failed", text)
+        self.assertIn("ValueError: boom", text)
+
+    def test_logging_after_shutdown_is_synchronous(self):
+        Log.shutdown()
+        Log.shutdown()
+        Log.info("after shutdown")
+        self.assertTrue(self._log_lines()[-1].endswith("after shutdown"))
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
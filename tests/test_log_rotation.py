@@ -0,0 +1,119 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import gzip
+import logging
+import unittest
+import tempfile
+from datetime import datetime, timedelta
+
+import zstandard
+
+from src.utils.log_rotation import DailyRotatingFileHandler, log_files
+
+class TestDailyRotatingFileHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = self.tmp_dir.name
+        self.today = datetime.now().strftime('%Y%m%d')
+        self.handler = None
+
+    def tearDown(self):
+        if self.handler is not None:
+            self.handler.close()
+        self.tmp_dir.cleanup()
+
+    def _handler(self, **kwargs):
+        self.handler = DailyRotatingFileHandler(self.path, **kwargs)
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+        return self.handler
+
+    def _emit(self, message, created=None):
+        record = logging.LogRecord('test', logging.INFO, __file__, 0, message, None, None)
+        if created is not None:
+            record.created = created
+        self.handler.handle(record)
+
+    def _read(self, name):
+        with open(os.path.join(self.path, name), 'rb') as f:
+            data = f.read()
+        if name.endswith('.zst'):
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        elif name.endswith('.gz'):
+            data = gzip.decompress(data)
+        return data.decode('utf-8').splitlines()
+
+    def test_size_rollover_compresses_parts(self):
+        self._handler(max_bytes=1000)
+        for i in range(200):
+            self._emit(f"record {i:04d} " + "x" * 20)
+        self.handler.wait()
+        names = [f[0] for f in log_files(self.path)]
+        self.assertEqual(names[-1], f"{self.today}.log")
+        self.assertTrue(all(name.endswith('.log.zst') for name in names[:-1]))
+        self.assertEqual(names[0], f"{self.today}.1.log.zst")
+        lines = [line for name in names for line in self._read(name)]
+        self.assertEqual(lines, [f"record {i:04d} " + "x" * 20 for i in range(200)])
+
+    def test_midnight_rollover(self):
+        self._handler(compression='gzip')
+        self._emit("today")
+        tomorrow = datetime.now() + timedelta(days=1)
+        self._emit("tomorrow", created=tomorrow.timestamp())
+        self.handler.wait()
+        self.assertEqual(self._read(f"{self.today}.log.gz"), ["today"])
+        self.assertEqual(self.handler.baseFilename, os.path.join(self.path, tomorrow.strftime('%Y%m%d') + ".log"))
+        self.assertEqual(self._read(tomorrow.strftime('%Y%m%d') + ".log"), ["tomorrow"])
+
+    def test_stale_active_name_keeps_newest_day(self):
+        self._handler(compression='gzip')
+        self._emit("today")
+        stale = self.handler.baseFilename
+        tomorrow = (datetime.now() + timedelta(days=1))
+        self._emit("tomorrow", created=tomorrow.timestamp())
+        self.handler.wait()
+        # 午夜換檔前送出的整理要求仍帶著舊檔名
+        self.handler.maintain(stale)
+        self._emit("still tomorrow", created=tomorrow.timestamp())
+        self.assertEqual(self._read(tomorrow.strftime('%Y%m%d') + ".log"), ["tomorrow", "still tomorrow"])
+        self.assertEqual(self._read(f"{self.today}.log.gz"), ["today"])
+
+    def test_startup_cleans_previous_run(self):
+        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y%m%d')
+        with open(os.path.join(self.path, yesterday + ".log"), 'w', encoding='utf-8') as f:
+            f.write("left over\n")
+        open(os.path.join(self.path, yesterday + ".1.log.zst.part"), 'wb').close()
+        open(os.path.join(self.path, "notes.txt"), 'w').close()
+        self._handler()
+        self.handler.wait()
+        self.assertEqual(sorted(os.listdir(self.path)),
+                         sorted([f"{self.today}.log", f"{yesterday}.log.zst", "notes.txt"]))
+        self.assertEqual(self._read(f"{yesterday}.log.zst"), ["left over"])
+
+    def test_retention_days(self):
+        old = (datetime.now() - timedelta(days=40)).strftime('%Y%m%d')
+        recent = (datetime.now() - timedelta(days=5)).strftime('%Y%m%d')
+        for name in (f"{old}.log.gz", f"{old}.1.log.zst", f"{recent}.log.zst"):
+            open(os.path.join(self.path, name), 'wb').close()
+        self._handler(retention_days=30)
+        self.handler.wait()
+        self.assertEqual([f[0] for f in log_files(self.path)], [f"{recent}.log.zst", f"{self.today}.log"])
+
+    def test_retention_bytes_removes_oldest(self):
+        for day in ('20240101', '20240102', '20240103'):
+            with open(os.path.join(self.path, f"{day}.log.zst"), 'wb') as f:
+                f.write(b"\0" * 400)
+        self._handler(retention_bytes=1000)
+        self.handler.wait()
+        self.assertEqual([f[0] for f in log_files(self.path)],
+                         ['20240102.log.zst', '20240103.log.zst', f"{self.today}.log"])
+
+    def test_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            DailyRotatingFileHandler(self.path, compression='bz2')
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,151 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import random
+import sqlite3
+import unittest
+import tempfile
+
+from src.utils.macalloc import (MacAllocator, derive_macs, int_to_mac, mac_blocks, mac_to_int, reserve_product_macs,
+                                settle_product_macs)
+from src.utils.barcode import build_scan_fields, derive_product_macs
+from src.utils.script import Script, Product, ScriptManager, ScriptValidationError
+
+class TestMacDerivation(unittest.TestCase):
+
+    def test_int_round_trip_keeps_format(self):
+        self.assertEqual(mac_to_int("00:19:AB:CD:EF:01"), 0x0019ABCDEF01)
+        self.assertEqual(int_to_mac(0x0019ABCDEF02, "00-19-ab-cd-ef-01"), "00-19-ab-cd-ef-02")
+        self.assertEqual(int_to_mac(0x0019ABCDEF02, "0019ABCDEF01"), "0019ABCDEF02")
+        with self.assertRaises(ValueError):
+            mac_to_int("0019ABCDEF0")
+
+    def test_sequential_carries_across_octets(self):
+        self.assertEqual(derive_macs("00:19:AB:CD:EF:FF", 3), ["00:19:AB:CD:EF:FF", "00:19:AB:CD:F0:00", "00:19:AB:CD:F0:01"])
+
+    def test_oui_boundary(self):
+        with self.assertRaises(ValueError):
+            derive_macs("0019ABFFFFFF", 2)
+        with self.assertRaises(ValueError):
+            derive_macs("0019ABCDEF01", 2, mode='random')
+
+    def test_mac_blocks(self):
+        self.assertEqual(mac_blocks(["0019ABCDEF02", "00:19:AB:CD:EF:01", "N/A", "0019ABCDEF05"]),
+                         [(0x0019ABCDEF01, 0x0019ABCDEF02), (0x0019ABCDEF05, 0x0019ABCDEF05)])
+
+    def test_script_derivation(self):
+        products = ScriptManager()._parse_product([{'Name': 'TX', 'UseMac': 2, 'UseSn': 1, 'MacDerivation': 'Sequential'}])
+        self.assertEqual(products[0].mac_derivation, 'sequential')
+        with self.assertRaises(ScriptValidationError):
+            ScriptManager()._parse_product([{'Name': 'TX', 'MacDerivation': 'random'}])
+
+        script = Script(product=products)
+        fields, _ = build_scan_fields(script)
+        self.assertEqual([f.key for f in fields], ['$mo1', '$sn1', '$mac11'])
+        self.assertEqual(derive_product_macs(script, {'$mac11': '00:19:AB:CD:EF:01'}), {'$mac12': '00:19:AB:CD:EF:02'})
+        self.assertEqual(derive_product_macs(Script(product=[Product("RX", 2, 1)]), {'$mac11': '00:19:AB:CD:EF:01'}), {})
+
+class TestMacAllocator(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'mac_blocks.db')
+        self.allocator = MacAllocator(self.path)
+
+    def tearDown(self):
+        self.allocator.close()
+        self.tmp_dir.cleanup()
+
+    def test_overlap_detection(self):
+        self.assertIsNone(self.allocator.reserve(100, 101, 'SN1'))
+        self.assertIsNone(self.allocator.reserve(110, 119, 'SN2'))
+        self.assertEqual(self.allocator.reserve(101, 102, 'SN3'), (100, 101, 'SN1'))
+        self.assertEqual(self.allocator.reserve(90, 200, 'SN3'), (110, 119, 'SN2'))
+        self.assertIsNone(self.allocator.reserve(102, 109, 'SN3'))
+        self.assertIsNone(self.allocator.find_overlap(120, 130))
+        self.assertEqual(len(self.allocator), 3)
+
+    def test_same_owner_replaces_block(self):
+        self.allocator.reserve(100, 101, 'SN1')
+        self.assertIsNone(self.allocator.reserve(101, 102, 'SN1'))
+        self.assertEqual(len(self.allocator), 1)
+        self.assertIsNone(self.allocator.find_overlap(100, 100))
+
+    def test_persisted_and_reloaded(self):
+        self.allocator.reserve(100, 101, 'SN1')
+        self.allocator.reserve(50, 51, 'SN2')
+        reloaded = MacAllocator(self.path)
+        self.assertEqual(reloaded.find_overlap(51, 60), (50, 51, 'SN2'))
+        reloaded.close()
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        blocks = []
+        for i in range(500):
+            start = rng.randrange(0, 100000)
+            end = start + rng.randrange(0, 4)
+            if self.allocator.reserve(start, end, f'SN{i}') is None:
+                blocks.append((start, end))
+        for _ in range(500):
+            start = rng.randrange(0, 100000)
+            end = start + rng.randrange(0, 50)
+            expected = any(s <= end and start <= e for s, e in blocks)
+            self.assertEqual(self.allocator.find_overlap(start, end) is not None, expected)
+
+    def test_reserve_product_macs(self):
+        info = {'$sn1': '12345678901', '$mac11': '00:19:AB:CD:EF:01', '$mac12': '00:19:AB:CD:EF:02',
+                '$sn2': '12345678902', '$mac21': '00:19:AB:CD:EF:02'}
+        conflicts = reserve_product_macs(info, self.allocator)
+        self.assertEqual(len(conflicts), 1)
+        self.assertIn('12345678901', conflicts[0])
+        self.assertEqual(len(self.allocator), 0)    # 有重疊時整批都不配置
+        self.assertEqual(reserve_product_macs({'$sn1': '12345678901', '$mac11': '0019ABCDEF01', '$mac12': '0019ABCDEF02'},
+                                              self.allocator), [])
+
+    def test_later_device_conflict_reserves_nothing(self):
+        self.allocator.reserve(0x0019ABCDEF10, 0x0019ABCDEF10, 'OTHER')
+        info = {'$sn1': 'SN1', '$mac11': '0019ABCDEF01', '$sn2': 'SN2', '$mac21': '0019ABCDEF10'}
+        self.assertEqual(len(reserve_product_macs(info, self.allocator)), 1)
+        self.assertEqual(self.allocator.blocks('SN1'), [])
+
+    def test_failed_run_releases_provisional_block(self):
+        wrong = {'$sn1': 'WRONG-SN', '$mac11': '0019ABCDEF01'}
+        self.assertEqual(reserve_product_macs(wrong, self.allocator), [])
+        self.assertEqual(self.allocator.blocks('WRONG-SN'), [(0x0019ABCDEF01, 0x0019ABCDEF01, True)])
+        settle_product_macs(wrong, False, self.allocator)
+        self.assertEqual(len(self.allocator), 0)
+
+        right = {'$sn1': 'SN1', '$mac11': '0019ABCDEF01'}
+        self.assertEqual(reserve_product_macs(right, self.allocator), [])
+        settle_product_macs(right, True, self.allocator)
+        self.assertEqual(self.allocator.blocks('SN1'), [(0x0019ABCDEF01, 0x0019ABCDEF01, False)])
+
+        # 通過過的產品重測失敗時保留原本確認的區段
+        self.assertEqual(reserve_product_macs(right, self.allocator), [])
+        settle_product_macs(right, False, self.allocator)
+        self.assertEqual(self.allocator.blocks('SN1'), [(0x0019ABCDEF01, 0x0019ABCDEF01, False)])
+
+    def test_release_and_interrupted_reservations(self):
+        self.allocator.reserve(100, 101, 'SN1')
+        self.allocator.reserve(200, 201, 'SN2', provisional=True)
+        reloaded = MacAllocator(self.path)
+        self.assertIsNone(reloaded.find_overlap(200, 201))      # 程式中斷留下的暫時配置
+        self.assertEqual(reloaded.release('SN1'), 1)
+        self.assertIsNone(reloaded.reserve(100, 101, 'SN3'))
+        reloaded.close()
+
+    def test_legacy_table_is_upgraded(self):
+        legacy = os.path.join(self.tmp_dir.name, 'legacy.db')
+        conn = sqlite3.connect(legacy)
+        conn.execute("CREATE TABLE mac_blocks (start INTEGER PRIMARY KEY, end INTEGER NOT NULL, owner TEXT NOT NULL, created TEXT NOT NULL)")
+        conn.execute("INSERT INTO mac_blocks VALUES (100, 101, 'SN1', '2025-01-01T00:00:00')")
+        conn.commit()
+        conn.close()
+        allocator = MacAllocator(legacy)
+        self.assertEqual(allocator.blocks('SN1'), [(100, 101, False)])
+        allocator.close()
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
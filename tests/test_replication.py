@@ -0,0 +1,172 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import json
+import unittest
+import tempfile
+from unittest.mock import patch
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, inspect, select, func, text
+from sqlalchemy.orm import sessionmaker
+
+from src.config import config
+from src.utils.commonUtils import ItemResult
+from src.utils.database import Base, DatabaseManager, TestSession, TestItemResult, Dut, DutMac
+from src.utils.replication import ReplicationAgent, central_tables
+
+class TestReplicationAgent(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        local_path = os.path.join(self.tmp_dir.name, 'results.db')
+        central_path = os.path.join(self.tmp_dir.name, 'central.db')
+        self.local_url = f"sqlite:///{local_path}"
+        self.central_url = f"sqlite:///{central_path}"
+        self.state_file = os.path.join(self.tmp_dir.name, 'state', 'replication_state.json')
+
+        self.local_engine = create_engine(self.local_url)
+        Base.metadata.create_all(self.local_engine)
+        self.Session = sessionmaker(bind=self.local_engine)
+
+        self.agent = ReplicationAgent(self.central_url, local_url=self.local_url, station='ST01',
+                                      state_file=self.state_file, batch_size=2, interval_sec=0)
+
+    def tearDown(self):
+        self.agent.stop()
+        self.local_engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def _add_session(self, closed=True, items=2):
+        session = self.Session()
+        start = datetime(2025, 4, 1, 8, 0, 0)
+        test_session = TestSession(script_version='1.00', station='ST01', start_time=start,
+                                   end_time=start + timedelta(seconds=30) if closed else None,
+                                   final_result=True)
+        session.add(test_session)
+        session.flush()
+        for i in range(items):
+            session.add(TestItemResult(session_id=test_session.session_id, item_title=f'Item {i}',
+                                       item_value=str(i), item_result=True))
+        session.commit()
+        session_id = test_session.session_id
+        session.close()
+        return session_id
+
+    def _pending(self):
+        session = self.Session()
+        ids = [row.session_id for row in session.query(TestSession).filter(TestSession.replication_pending.is_(True))]
+        session.close()
+        return ids
+
+    def _central_count(self, index):
+        table = central_tables()[index]
+        engine = create_engine(self.central_url)
+        with engine.connect() as conn:
+            count = conn.execute(select(func.count()).select_from(table)).scalar()
+        engine.dispose()
+        return count
+
+    def test_sync_closed_sessions_in_batches(self):
+        for _ in range(3):
+            self._add_session()
+        open_id = self._add_session(closed=False)
+
+        self.assertTrue(self.agent.sync_once())
+
+        self.assertEqual(self._central_count(1), 3)
+        self.assertEqual(self._central_count(2), 6)
+        self.assertEqual(self._pending(), [open_id])
+
+    def test_sync_is_idempotent(self):
+        self._add_session()
+        self.assertTrue(self.agent.sync_once())
+        with self.local_engine.begin() as conn:     # 重送相同資料
+            conn.execute(text("UPDATE test_sessions SET replication_pending = 1"))
+        self.assertTrue(self.agent.sync_once())
+
+        self.assertEqual(self._central_count(1), 1)
+        self.assertEqual(self._central_count(2), 2)
+
+    def test_resume_after_outage(self):
+        self._add_session()
+        self.agent.central_url = "sqlite:////nonexistent_dir/central.db"
+        self.assertFalse(self.agent.sync_once())
+        self.assertEqual(len(self._pending()), 1)
+
+        self.agent.central_url = self.central_url
+        self.assertTrue(self.agent.sync_once())
+        self.assertEqual(self._central_count(1), 1)
+
+    def test_duts_are_replicated(self):
+        session_id = self._add_session()
+        session = self.Session()
+        dut = Dut(session_id=session_id, slot=1, mo='M1', sn='SN1')
+        session.add(dut)
+        session.flush()
+        session.add_all([DutMac(dut_id=dut.dut_id, idx=1, mac='AA'), DutMac(dut_id=dut.dut_id, idx=2, mac='BB')])
+        session.commit()
+        session.close()
+
+        self.assertTrue(self.agent.sync_once())
+        self.assertEqual(self._central_count(3), 1)
+        self.assertEqual(self._central_count(4), 2)
+
+    def test_existing_central_table_gets_new_columns(self):
+        engine = create_engine(self.central_url)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE test_sessions (station TEXT, session_id INTEGER, script_version TEXT, "
+                              "PRIMARY KEY (station, session_id))"))
+        engine.dispose()
+        self._add_session()
+        self.assertTrue(self.agent.sync_once())
+
+        engine = create_engine(self.central_url)
+        columns = {col['name'] for col in inspect(engine).get_columns('test_sessions')}
+        engine.dispose()
+        self.assertIn('final_result', columns)
+        self.assertNotIn('script_id', columns)
+        self.assertEqual(self._central_count(1), 1)
+
+    def test_sessions_closed_out_of_order_and_late_items(self):
+        with patch.object(config, 'DATABASE_PATH', self.tmp_dir.name):
+            DatabaseManager._instance = None
+            db = DatabaseManager()
+            try:
+                script_info = {'script_name': 'S', 'script_version': '1.00', 'content_hash': 'abc'}
+                tester_info = {'user': 'op', 'station': 'ST01'}
+                first = db.create_test_session(script_info, {}, tester_info, 'BOTH')
+                second = db.create_test_session(script_info, {}, tester_info, 'BOTH')
+                db.update_test_session_end(second, datetime.now(), True)
+                self.assertTrue(self.agent.sync_once())
+                self.assertEqual(self._central_count(1), 1)
+
+                # 較早的 Session 之後才結束 (例如 journal 重播)，已送出的 Session 補寫項目
+                db.update_test_session_end(first, datetime.now(), False)
+                self.assertTrue(db.insert_test_item_result(second, ItemResult('Late', '', None, None, '1', True)))
+                self.assertTrue(self.agent.sync_once())
+                self.assertEqual(self._central_count(1), 2)
+                self.assertEqual(self._central_count(2), 1)
+                self.assertEqual(self._pending(), [])
+            finally:
+                db.close_connection()
+                DatabaseManager._instance = None
+
+    def test_legacy_state_file_is_migrated(self):
+        self._add_session()
+        second = self._add_session()
+        os.makedirs(os.path.dirname(self.state_file))
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump({'last_session_id': second - 1}, f)
+
+        self.assertTrue(self.agent.sync_once())
+        self.assertEqual(self._central_count(1), 1)
+        self.assertFalse(os.path.exists(self.state_file))
+
+    def test_notify_without_agent(self):
+        ReplicationAgent._instance = None
+        ReplicationAgent.notify()   # 未啟用時不應拋出例外
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,59 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from PySide6.QtCore import QCoreApplication
+
+from src.utils.commonUtils import UiUpdater
+from src.utils.record import ReportGenerator
+
+class TestAsyncReport(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.finished = []
+        UiUpdater.reportFinished.connect(self._on_finished)
+        self.generator = ReportGenerator.__new__(ReportGenerator)
+        self.generator.product_name = 'Product'
+
+    def tearDown(self):
+        UiUpdater.reportFinished.disconnect(self._on_finished)
+
+    def _on_finished(self, success, product_name):
+        self.finished.append((success, product_name))
+
+    def _wait(self):
+        self.assertTrue(ReportGenerator.wait_for_reports(5000))
+        QCoreApplication.processEvents()
+
+    def test_report_runs_in_background(self):
+        threads = []
+        def end_record(*args):
+            threads.append(threading.get_ident())
+            return True
+
+        with patch.object(ReportGenerator, 'End_Record_and_Create_Report', side_effect=end_record) as mock_end:
+            self.generator.End_Record_and_Create_Report_Async(True, 5, 5, 0)
+            self._wait()
+
+        self.assertNotEqual(threads, [threading.get_ident()])
+        self.assertTrue(self.generator.final_result)
+        mock_end.assert_called_once_with(True, 5, 5, 0, self.generator.end_time)
+        self.assertEqual(self.finished, [(True, 'Product')])
+
+    def test_report_error_emits_failure(self):
+        with patch.object(ReportGenerator, 'End_Record_and_Create_Report', side_effect=OSError("share offline")):
+            self.generator.End_Record_and_Create_Report_Async(False, 5, 4, 1)
+            self._wait()
+        self.assertEqual(self.finished, [(False, 'Product')])
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
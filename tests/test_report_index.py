@@ -0,0 +1,113 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import time
+import unittest
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.report_index import ReportIndex, build_query, locate_report
+
+DUTS = [{'mo': 'MO-1001', 'sn': 'SN0001', 'macs': ['00:19:AB:CD:EF:01', 'N/A']},
+        {'mo': 'MO-1001', 'sn': 'SN0002', 'macs': ['00:19:AB:CD:EF:02']}]
+
+class TestReportIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index = ReportIndex(os.path.join(self.tmp_dir.name, 'index.db'))
+        self.index.add('ST01_MO_1001_a.html', 'ST01', 'N2612-SA 1.2', DUTS, ['TX Power', 'TX Power'], False,
+                       datetime(2024, 5, 1, 8, 0))
+        self.index.add('ST02_MO_2002_b.html', 'ST02', 'N2612-SA 1.2',
+                       [{'mo': 'MO-2002', 'sn': 'SN0100', 'macs': ['00:19:AB:00:00:10']}], [], True,
+                       datetime(2024, 5, 2, 8, 0))
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp_dir.cleanup()
+
+    def _names(self, text):
+        return [r['file_name'] for r in self.index.search(text)]
+
+    def test_search_by_fields(self):
+        self.assertEqual(self._names('SN0002'), ['ST01_MO_1001_a.html'])
+        self.assertEqual(self._names('MO-2002'), ['ST02_MO_2002_b.html'])
+        self.assertEqual(self._names('00:19:AB:CD:EF:02'), ['ST01_MO_1001_a.html'])
+        self.assertEqual(self._names('0019ABCDEF01'), ['ST01_MO_1001_a.html'])
+        self.assertEqual(self._names('power'), ['ST01_MO_1001_a.html'])
+
+    def test_prefix_and_column_filter(self):
+        self.assertEqual(sorted(self._names('00:19:AB')), ['ST01_MO_1001_a.html', 'ST02_MO_2002_b.html'])
+        self.assertEqual(self._names('station:ST02 00:19'), ['ST02_MO_2002_b.html'])
+        self.assertEqual(self._names('sn:ST01'), [])
+
+    def test_result_fields(self):
+        result = self.index.search('SN0001')[0]
+        self.assertFalse(result['final_result'])
+        self.assertEqual(result['failed_items'], 'TX Power')
+        self.assertEqual(result['created'], '2024-05-01T08:00:00')
+
+    def test_reindex_same_file_replaces_row(self):
+        self.index.add('ST01_MO_1001_a.html', 'ST01', 'N2612-SA 1.2', DUTS, [], True)
+        self.assertEqual(self.index.count(), 2)
+        self.assertTrue(self.index.search('SN0001')[0]['final_result'])
+
+    def test_bad_input_is_safe(self):
+        self.assertEqual(build_query('  '), '')
+        self.assertEqual(self._names('"unbalanced'), [])
+        self.assertEqual(self._names('AND OR NOT'), [])
+
+    def test_locate_report(self):
+        local = os.path.join(self.tmp_dir.name, 'local')
+        os.makedirs(local)
+        with open(os.path.join(local, 'r.html'), 'w') as f:
+            f.write('')
+        with patch.object(config, 'REPORT_UPLOAD_PATH', os.path.join(self.tmp_dir.name, 'share')), \
+             patch.object(config, 'REPORT_FILE_PATH', local):
+            self.assertEqual(locate_report('r.html'), os.path.join(local, 'r.html'))
+            self.assertIsNone(locate_report('missing.html'))
+
+    def test_locate_report_prefers_local_and_bounds_network_wait(self):
+        share = os.path.join(self.tmp_dir.name, 'share')
+        os.makedirs(share)
+        with open(os.path.join(share, 'r.html'), 'w') as f:
+            f.write('')
+        real_exists = os.path.exists
+        def slow_share(path):
+            if path.startswith(share):
+                time.sleep(1)
+            return real_exists(path)
+        with patch.object(config, 'REPORT_UPLOAD_PATH', share), \
+             patch.object(config, 'REPORT_FILE_PATH', os.path.join(self.tmp_dir.name, 'local')), \
+             patch.object(config, 'REPORT_NETWORK_TIMEOUT_SEC', 0.1), \
+             patch('os.path.exists', side_effect=slow_share):
+            start = time.perf_counter()
+            self.assertIsNone(locate_report('r.html'))
+            self.assertLess(time.perf_counter() - start, 0.5)
+        with patch.object(config, 'REPORT_UPLOAD_PATH', share), \
+             patch.object(config, 'REPORT_FILE_PATH', os.path.join(self.tmp_dir.name, 'local')):
+            self.assertEqual(locate_report('r.html'), os.path.join(share, 'r.html'))
+
+    def test_locate_dated_report_does_not_block_on_share_archive(self):
+        share = os.path.join(self.tmp_dir.name, 'share')
+        os.makedirs(os.path.join(share, config.REPORT_ARCHIVE_DIRNAME))
+        real_exists = os.path.exists
+        def slow_share(path):
+            if path.startswith(share):
+                time.sleep(1)
+            return real_exists(path)
+        with patch.object(config, 'REPORT_UPLOAD_PATH', share), \
+             patch.object(config, 'REPORT_FILE_PATH', os.path.join(self.tmp_dir.name, 'local')), \
+             patch.object(config, 'REPORT_SPOOL_PATH', os.path.join(self.tmp_dir.name, 'spool')), \
+             patch.object(config, 'REPORT_NETWORK_TIMEOUT_SEC', 0.1), \
+             patch('os.path.exists', side_effect=slow_share):
+            start = time.perf_counter()
+            self.assertIsNone(locate_report('ST01_MO_1001_20240501_080000.html'))
+            self.assertLess(time.perf_counter() - start, 0.5)
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,100 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import json
+import unittest
+import tempfile
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.config import config
+from src.utils.commonUtils import ItemResult
+from src.utils.record import ReportGenerator, REPORT_OBJECT_DIR
+from src.utils.result_writer import RESULT_SCHEMA_VERSION, result_items, write_json_result, write_junit_result
+
+START = datetime(2024, 5, 1, 8, 0, 0)
+ITEMS = [ItemResult('Volt', 'mV', '1', '10', '5', True),
+         ItemResult('Link', '', '', '', 'FAIL', False, 2)]
+TIMES = [START + timedelta(seconds=2), START + timedelta(seconds=5)]
+HEADER = {'product_name': 'Product', 'script_version': '1.00', 'station': 'ST01', 'duts': [{'sn': 'SN1'}],
+          'start_time': START.isoformat(), 'total_time_sec': 5.0, 'total_tests': 2, 'fail_tests': 1}
+
+class TestResultWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_result_items_timing(self):
+        items = list(result_items(ITEMS, TIMES, START))
+        self.assertEqual([i['duration_sec'] for i in items], [2.0, 3.0])
+        self.assertEqual(items[1]['retry_count'], 2)
+        self.assertFalse(items[1]['result'])
+
+    def test_json_output(self):
+        path = write_json_result(os.path.join(self.tmp_dir.name, 'r.json'), HEADER, result_items(ITEMS, TIMES, START))
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['schema_version'], RESULT_SCHEMA_VERSION)
+        self.assertEqual(data['duts'], [{'sn': 'SN1'}])
+        self.assertEqual([i['title'] for i in data['items']], ['Volt', 'Link'])
+        self.assertEqual(data['items'][0]['value'], '5')
+
+    def test_json_output_without_items(self):
+        path = write_json_result(os.path.join(self.tmp_dir.name, 'r.json'), {}, iter(()))
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'schema_version': RESULT_SCHEMA_VERSION, 'items': []})
+
+    def test_junit_output(self):
+        path = write_junit_result(os.path.join(self.tmp_dir.name, 'r.xml'), HEADER, result_items(ITEMS, TIMES, START))
+        suite = ET.parse(path).getroot().find('testsuite')
+        self.assertEqual((suite.get('tests'), suite.get('failures'), suite.get('hostname')), ('2', '1', 'ST01'))
+        properties = {p.get('name'): p.get('value') for p in suite.find('properties')}
+        self.assertEqual(properties['schema_version'], RESULT_SCHEMA_VERSION)
+
+        cases = suite.findall('testcase')
+        self.assertEqual([c.get('name') for c in cases], ['Volt', 'Link'])
+        self.assertIsNone(cases[0].find('failure'))
+        self.assertIsNotNone(cases[1].find('failure'))
+        self.assertEqual(cases[1].get('time'), '3.0')
+        values = {p.get('name'): p.get('value') for p in cases[0].find('properties')}
+        self.assertEqual((values['value'], values['min'], values['max']), ('5', '1', '10'))
+
+    def test_junit_strips_invalid_xml_characters(self):
+        items = [ItemResult('Dump\x01', '', '', '', 'out\x00put\x1b[0m\tok', False)]
+        header = {**HEADER, 'product_name': 'Prod\x0c', 'total_tests': 1}
+        path = write_junit_result(os.path.join(self.tmp_dir.name, 'r.xml'), header, result_items(items, TIMES, START))
+        suite = ET.parse(path).getroot().find('testsuite')
+        case = suite.find('testcase')
+        self.assertEqual(case.get('name'), 'Dump\ufffd')
+        values = {p.get('name'): p.get('value') for p in case.find('properties')}
+        self.assertEqual(values['value'], 'out\ufffdput\ufffd[0m\tok')
+        self.assertIn('\ufffd', case.find('failure').get('message'))
+
+    def test_report_generator_writes_siblings(self):
+        generator = ReportGenerator.__new__(ReportGenerator)
+        generator.items_result, generator.items_time = ITEMS, TIMES
+        generator.start_time, generator.end_time = START, START + timedelta(seconds=5)
+        generator.product_name, generator.version, generator.script = 'Product', '1.00', None
+        generator.db_session_id, generator.station, generator.tester_name, generator.mode = 7, 'ST01', 'op', 'BOTH'
+        generator.final_result = False
+
+        html_paths = [os.path.join(self.tmp_dir.name, 'a.html'), os.path.join(self.tmp_dir.name, 'b.html')]
+        with patch.object(config, 'REPORT_FILE_PATH', self.tmp_dir.name), \
+             patch.object(ReportGenerator, '_create_data', return_value={'duts': []}):
+            created = generator._write_result_files(html_paths)
+
+        self.assertEqual(sorted(os.path.basename(p) for p in created), ['a.json', 'a.xml', 'b.json', 'b.xml'])
+        self.assertEqual(os.stat(created[0]).st_ino, os.stat(created[1]).st_ino)
+        self.assertEqual(os.listdir(os.path.join(self.tmp_dir.name, REPORT_OBJECT_DIR)), [])
+        with open(os.path.join(self.tmp_dir.name, 'b.json'), encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual((data['session_id'], data['fail_tests'], data['final_result']), (7, 1, False))
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
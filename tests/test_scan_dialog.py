@@ -0,0 +1,78 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from PySide6.QtWidgets import QApplication
+
+from src.config import config
+from src.utils.workorder import WorkOrderCache, WorkOrderProvider, WorkOrderRecord
+from src.utils.script import Script, Product
+from src.controllers.dialog.scanDialog import ScanDialog
+
+class _Provider(WorkOrderProvider):
+    name = "csv"
+
+    def __init__(self, records):
+        self.records = records
+
+    def fetch(self):
+        return self.records
+
+class TestScanDialog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = WorkOrderCache(os.path.join(self.tmp_dir.name, 'workorder.db'))
+        self.cache.refresh(_Provider([WorkOrderRecord("M1234567890", "12345678901", ["00:19:AB:CD:EF:01"])]))
+        self.patchers = [patch.object(config, 'WORKORDER_CACHE_PATH', self.cache.path),
+                         patch.object(WorkOrderCache, '_instance', self.cache)]
+        for patcher in self.patchers:
+            patcher.start()
+        script = Script(product=[Product("TX", mac_count=2, sn_count=1, mac_derivation='sequential')])
+        self.dialog = ScanDialog(script)
+        self.results = []
+        self.dialog.completed.connect(self.results.append)
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def _scan(self, key, value):
+        field = next(f for f in self.dialog._fields if f.key == key)
+        self.dialog._edits[key].setText(value)
+        self.dialog._on_scan(field)
+
+    def test_workorder_fill_and_mac_derivation(self):
+        self._scan('$sn1', "12345678901")
+        self.assertEqual(self.results, [{'$mo1': "M1234567890", '$sn1': "12345678901",
+                                         '$mac11': "00:19:AB:CD:EF:01", '$mac12': "00:19:AB:CD:EF:02"}])
+
+    def test_unknown_sn_requires_scanning_remaining_fields(self):
+        self._scan('$sn1', "12345678999")
+        self.assertEqual(self.results, [])
+        self._scan('$mo1', "M1234567899")
+        self._scan('$mac11', "0019ABCDEF10")
+        self.assertEqual(self.results[0]['$mac12'], "0019ABCDEF11")
+
+    def test_derivation_error_clears_mac1(self):
+        self._scan('$mo1', "M1234567899")
+        self._scan('$sn1', "12345678999")
+        self._scan('$mac11', "0019ABFFFFFF")
+        self.assertEqual(self.results, [])
+        self.assertNotIn('$mac11', self.dialog._values)
+        self.assertIn("MAC 推算錯誤", self.dialog.Lb_Status.text())
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
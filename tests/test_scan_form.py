@@ -0,0 +1,62 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+
+from src.utils.barcode import build_scan_fields, route_scan
+from src.utils.script import Script, Product
+from src.utils.validators import compile_barcodes
+
+def _paired_script():
+    return Script(name="N2612-SA", pairing=1,
+                  product=[Product("TX", mac_count=2, sn_count=1), Product("RX", mac_count=1, sn_count=1)])
+
+class TestScanForm(unittest.TestCase):
+
+    def test_build_scan_fields(self):
+        fields, preset = build_scan_fields(_paired_script())
+        self.assertEqual([f.key for f in fields],
+                         ['$mo1', '$sn1', '$mac11', '$mac12', '$mo2', '$sn2', '$mac21'])
+        self.assertEqual(fields[3].label, "[1] MAC-2")
+        self.assertEqual(preset, {})
+
+    def test_build_scan_fields_without_sn(self):
+        script = Script(product=[Product("CPHD", mac_count=1, sn_count=0)])
+        fields, preset = build_scan_fields(script)
+        self.assertEqual([f.key for f in fields], ['$mo1'])
+        self.assertEqual(preset, {'$sn1': 'N/A'})
+
+    def test_missing_product_raises(self):
+        with self.assertRaises(ValueError):
+            build_scan_fields(Script(pairing=1, product=[Product("TX")]))
+
+    def test_route_any_order(self):
+        fields, _ = build_scan_fields(_paired_script())
+        values = {}
+        for scanned in ("0019ABCDEF01", "12345678901", "M1234567890", "00:19:AB:CD:EF:02"):
+            values[route_scan(fields, values, scanned, preferred='$mo1')] = scanned
+        self.assertEqual(values, {'$mac11': "0019ABCDEF01", '$sn1': "12345678901",
+                                  '$mo1': "M1234567890", '$mac12': "00:19:AB:CD:EF:02"})
+
+    def test_route_prefers_focused_field(self):
+        fields, _ = build_scan_fields(_paired_script())
+        self.assertEqual(route_scan(fields, {}, "M1234567890", preferred='$mo2'), '$mo2')
+        self.assertEqual(route_scan(fields, {'$mo1': "M1234567890"}, "M0000000001", preferred='$mo1'), '$mo1')
+
+    def test_route_rejects_invalid_and_duplicate(self):
+        fields, _ = build_scan_fields(_paired_script())
+        self.assertIsNone(route_scan(fields, {}, "garbage", preferred='$mo1'))
+        self.assertIsNone(route_scan(fields, {'$sn1': "12345678901"}, "12345678901", preferred='$sn2'))
+        self.assertIsNone(route_scan(fields, {}, "", preferred='$mo1'))
+
+    def test_route_uses_product_validators(self):
+        script = Script(product=[Product("TX", mac_count=0, sn_count=1,
+                                         barcodes=compile_barcodes({'SN': 'alnum(8)'}))])
+        fields, _ = build_scan_fields(script)
+        self.assertEqual(route_scan(fields, {}, "AB12CD34"), '$sn1')
+        self.assertIsNone(route_scan(fields, {}, "12345678901"))
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,108 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.config import config
+from src.utils.database import Base, TestSession, TestItemResult
+from src.utils import spc
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'res', 'report')
+
+class TestSpcStatistics(unittest.TestCase):
+
+    def test_ewma_matches_recursive(self):
+        values = np.random.default_rng(1).normal(10, 2, 1000)
+        expected = np.empty(values.size)
+        prev = 10.0
+        for i, v in enumerate(values):
+            prev = 0.2 * v + 0.8 * prev
+            expected[i] = prev
+        np.testing.assert_allclose(spc.ewma(values, 0.2, start=10.0), expected, rtol=1e-9)
+
+    def test_western_electric_rules(self):
+        values = np.zeros(20)
+        values[3] = 3.5                         # rule1
+        values[10:12] = 2.5                     # rule2
+        values[12:20] = 0.5                     # rule4 (8 點同側)
+        violations = spc.western_electric(values, 0.0, 1.0)
+        self.assertEqual(violations['rule1'].tolist(), [3])
+        self.assertIn(11, violations['rule2'].tolist())
+        self.assertIn(19, violations['rule4'].tolist())
+
+    def test_compute_spc_capability(self):
+        values = np.random.default_rng(2).normal(5.0, 0.1, 5000)
+        result = spc.compute_spc(values, lsl=4.4, usl=5.6, window=1000)
+        self.assertEqual(result.n, 5000)
+        self.assertAlmostEqual(result.mean, 5.0, places=2)
+        self.assertAlmostEqual(result.cp, 2.0, delta=0.1)
+        self.assertLessEqual(result.cpk, result.cp)
+        self.assertEqual(len(result.windows), 5)
+        self.assertEqual(result.ewma.size, 5000)
+
+    def test_compute_spc_detects_drift(self):
+        values = np.concatenate([np.full(200, 1.0), np.full(200, 1.5)])
+        values += np.random.default_rng(3).normal(0, 0.05, values.size)
+        result = spc.compute_spc(values, baseline=100)
+        self.assertGreater(result.ewma_drift.size, 0)
+        self.assertGreaterEqual(result.ewma_drift[0], 180)
+
+    def test_compute_spc_empty(self):
+        result = spc.compute_spc(np.empty(0), 1, 2)
+        self.assertEqual(result.n, 0)
+        self.assertIsNone(result.cpk)
+
+class TestSpcLoadAndReport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.tmp_dir.name, 'results.db')}")
+        Base.metadata.create_all(self.engine)
+        session = sessionmaker(bind=self.engine)()
+        test_session = TestSession(script_version='1.00', station='ST01')
+        session.add(test_session)
+        session.flush()
+        start = datetime(2025, 4, 1)
+        for i in range(25):
+            value = 'PASS' if i % 5 == 0 else str(1000 + i)
+            session.add(TestItemResult(session_id=test_session.session_id, item_title='Volt', item_value=value,
+                                       item_min_valid='900', item_max_valid='1100',
+                                       timestamp=start + timedelta(minutes=i)))
+        session.commit()
+        session.close()
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def test_load_measurements_in_chunks(self):
+        measurements = spc.load_measurements(self.engine, 'Volt', station='ST01', chunk_size=7)
+        self.assertEqual(measurements.values.size, 20)
+        self.assertEqual(measurements.skipped, 5)
+        self.assertEqual(measurements.lsl, 900.0)
+        self.assertEqual(measurements.usl, 1100.0)
+        self.assertEqual(measurements.values[0], 1001.0)
+
+    def test_generate_report(self):
+        measurements = spc.load_measurements(self.engine, 'Volt')
+        result = spc.compute_spc(measurements.values, measurements.lsl, measurements.usl, window=5)
+        output = os.path.join(self.tmp_dir.name, 'spc', 'volt.html')
+        with patch.object(config, 'REPORT_TEMPLATE_PATH', TEMPLATE_PATH):
+            spc.generate_spc_report(measurements, result, output)
+
+        with open(output, encoding='utf-8') as f:
+            html = f.read()
+        self.assertIn('SPC Report - Volt', html)
+        self.assertIn('<polyline', html)
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,61 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from src.config import config
+from src.utils import template
+
+class TestTemplateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.template_dir = os.path.join(self.tmp_dir.name, 'report')
+        os.makedirs(self.template_dir)
+        self._write('hello.html', 'Hello {{ name }}')
+        self.patchers = [
+            patch.object(config, 'REPORT_TEMPLATE_PATH', self.template_dir),
+            patch.object(config, 'REPORT_TEMPLATE_COMPILED', os.path.join(self.tmp_dir.name, 'compiled.zip')),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        template._env = None
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.template_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_report_template_from_qt_resource(self):
+        first = template.get_template(os.path.basename(config.REPORT_FILE))
+        self.assertIs(template.get_template(os.path.basename(config.REPORT_FILE)), first)
+        self.assertTrue(first.filename.startswith(':'))
+
+    def test_compiled_once_and_reloaded_on_change(self):
+        first = template.get_template('hello.html')
+        self.assertIs(template.get_template('hello.html'), first)
+        self.assertEqual(first.render(name='A'), 'Hello A')
+
+        path = self._write('hello.html', 'Hi {{ name }}')
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+        self.assertEqual(template.get_template('hello.html').render(name='A'), 'Hi A')
+
+    def test_precompiled_templates_when_packaged(self):
+        template.compile_report_templates()
+        os.remove(os.path.join(self.template_dir, 'hello.html'))
+        with patch.object(template, '_PACKAGED', True):
+            self.assertEqual(template.get_template('hello.html').render(name='B'), 'Hello B')
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,131 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import time
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from src.config import config
+from src.utils import upload
+from src.utils.upload import UploadSpool
+
+class TestUploadSpool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.share = os.path.join(self.tmp_dir.name, 'share')
+        self.spool = UploadSpool(self.share, spool_dir=os.path.join(self.tmp_dir.name, 'spool'),
+                                 batch_size=2, interval_sec=0.05)
+
+    def tearDown(self):
+        self.spool.stop()
+        self.tmp_dir.cleanup()
+
+    def _report(self, name, content='<html></html>'):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_enqueue_survives_name_collision(self):
+        first = self.spool.enqueue(self._report('a.html', 'one'))
+        second = self.spool.enqueue(self._report('a.html', 'two'))
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.spool.backlog(), 2)
+
+    def test_upload_in_batches(self):
+        for i in range(3):
+            self.spool.enqueue(self._report(f'r{i}.html', f'report {i}'))
+
+        self.assertTrue(self.spool.upload_once())
+        self.assertEqual(self.spool.backlog(), 1)
+        self.assertTrue(self.spool.upload_once())
+        self.assertEqual(self.spool.backlog(), 0)
+        self.assertEqual(sorted(os.listdir(self.share)), ['r0.html', 'r1.html', 'r2.html'])
+        with open(os.path.join(self.share, 'r2.html'), encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'report 2')
+
+    def test_verification_failure_keeps_spool_file(self):
+        self.spool.enqueue(self._report('bad.html', 'content'))
+        with patch.object(upload, '_file_hash', return_value=(1, 'deadbeef')):
+            self.assertFalse(self.spool.upload_once())
+        self.assertEqual(self.spool.backlog(), 1)
+        self.assertEqual(os.listdir(self.share), [])
+
+    def test_failing_file_is_quarantined(self):
+        bad = self.spool.enqueue(self._report('bad.html', 'bad'))
+        time.sleep(0.01)
+        self.spool.enqueue(self._report('good.html', 'good'))
+        real_hash = upload._file_hash
+        def corrupt_bad(path):
+            return (0, 'deadbeef') if 'bad.html' in path else real_hash(path)
+        with patch.object(upload, '_file_hash', side_effect=corrupt_bad), \
+             patch.object(config, 'UPLOAD_MAX_ATTEMPTS', 3):
+            self.assertFalse(self.spool.upload_once())
+            self.assertEqual(os.listdir(self.share), ['good.html'])     # 不會阻擋後面的檔案
+            self.assertFalse(self.spool.upload_once())
+            self.assertFalse(self.spool.upload_once())
+        self.assertEqual(self.spool.backlog(), 0)
+        self.assertFalse(os.path.exists(bad))
+        self.assertTrue(os.path.exists(os.path.join(self.spool.quarantine_dir, 'bad.html')))
+        self.assertTrue(self.spool.upload_once())
+
+    def test_unc_destination_skips_remote_hardlink(self):
+        spool = UploadSpool(r'\\server\share\reports', spool_dir=os.path.join(self.tmp_dir.name, 'spool2'))
+        self.assertFalse(spool._remote_link_enabled)
+        self.assertTrue(self.spool._remote_link_enabled)
+
+    def test_worker_retries_until_share_is_back(self):
+        blocker = self.share        # 以同名檔案讓「網路路徑」暫時無法建立
+        with open(blocker, 'w') as f:
+            f.write('')
+        self.spool.enqueue(self._report('late.html'))
+        self.spool.start()
+        time.sleep(0.2)
+        self.assertEqual(self.spool.backlog(), 1)
+
+        os.remove(blocker)
+        deadline = time.time() + 5
+        while self.spool.backlog() and time.time() < deadline:
+            self.spool.notify()
+            time.sleep(0.05)
+        self.assertEqual(self.spool.backlog(), 0)
+        self.assertTrue(os.path.exists(os.path.join(self.share, 'late.html')))
+
+    def test_hardlinked_reports_upload_once(self):
+        first = self._report('pair_sn1.html', 'paired report')
+        second = os.path.join(self.tmp_dir.name, 'pair_sn2.html')
+        os.link(first, second)
+        self.spool.enqueue(first)
+        self.spool.enqueue(second)
+
+        with patch.object(upload, '_copy_with_hash', wraps=upload._copy_with_hash) as mock_copy:
+            self.assertTrue(self.spool.upload_once())
+        self.assertEqual(mock_copy.call_count, 1)
+        self.assertEqual(self.spool.backlog(), 0)
+        uploaded = [os.stat(os.path.join(self.share, n)) for n in ('pair_sn1.html', 'pair_sn2.html')]
+        self.assertEqual(uploaded[0].st_ino, uploaded[1].st_ino)
+
+class TestReportLinks(unittest.TestCase):
+
+    def test_paired_reports_share_one_file(self):
+        from src.config import config
+        from src.utils.record import ReportGenerator, REPORT_OBJECT_DIR
+        with tempfile.TemporaryDirectory() as tmp, patch.object(config, 'REPORT_FILE_PATH', tmp):
+            paths = [os.path.join(tmp, 'sn1.html'), os.path.join(tmp, 'sn2.html')]
+            with open(paths[1], 'w') as f:
+                f.write('stale')
+            generator = ReportGenerator.__new__(ReportGenerator)
+            self.assertEqual(generator._write_report_links('<html>pair</html>', paths), paths)
+
+            stats = [os.stat(p) for p in paths]
+            self.assertEqual(stats[0].st_ino, stats[1].st_ino)
+            with open(paths[1], encoding='utf-8') as f:
+                self.assertEqual(f.read(), '<html>pair</html>')
+            self.assertEqual(os.listdir(os.path.join(tmp, REPORT_OBJECT_DIR)), [])
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
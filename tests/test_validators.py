@@ -0,0 +1,76 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import yaml
+
+from src.utils.validators import DEFAULT_VALIDATORS, compile_barcodes, compile_spec, parametrized
+from src.utils.script import ScriptManager, ScriptValidationError
+
+SCRIPT = """
+Script:
+  Name: BarcodeScript
+  Version: "1.0"
+Product:
+  - Name: ProductTX
+    UseMac: 1
+    UseSn: 1
+    Barcodes: {MO: mo|pcb|testjig, SN: digits(12), mac: mac}
+  - Name: ProductRX
+    UseMac: 1
+    UseSn: 1
+Items: []
+"""
+
+class TestValidators(unittest.TestCase):
+
+    def test_default_specs(self):
+        self.assertTrue(DEFAULT_VALIDATORS['MO']("M1234567890"))
+        self.assertTrue(DEFAULT_VALIDATORS['MO']("M" + "A-" * 10 + "B"))
+        self.assertTrue(DEFAULT_VALIDATORS['MO']("TestJig01"))
+        self.assertFalse(DEFAULT_VALIDATORS['MO']("X1234567890"))
+        self.assertTrue(DEFAULT_VALIDATORS['SN']("12345678901"))
+        self.assertFalse(DEFAULT_VALIDATORS['SN']("1234567890"))
+        self.assertTrue(DEFAULT_VALIDATORS['MAC']("00:19:AB:CD:EF:01"))
+        self.assertTrue(DEFAULT_VALIDATORS['MAC']("0019ABCDEF01"))
+        self.assertFalse(DEFAULT_VALIDATORS['MAC']("0019ABCDEF0"))
+        self.assertFalse(DEFAULT_VALIDATORS['MAC'](None))
+
+    def test_alternation_is_full_match(self):
+        validator = compile_spec("mo|digits(3)")
+        self.assertTrue(validator("123"))
+        self.assertFalse(validator("M12345678901"))
+        self.assertFalse(validator("1234"))
+
+    def test_compiled_once(self):
+        self.assertIs(compile_spec("mac|mac_nosign"), DEFAULT_VALIDATORS['MAC'])
+        self.assertIs(parametrized('digits', 8), parametrized('digits', 8))
+
+    def test_invalid_specs(self):
+        for spec in ("", "unknown", "mac(12)", "digits(x)", "mo||"):
+            with self.assertRaises(ValueError, msg=spec):
+                compile_spec(spec)
+        with self.assertRaises(ValueError):
+            compile_barcodes(["mo"])
+
+    def test_compile_barcodes_merges_defaults(self):
+        validators = compile_barcodes({'sn': 'alnum(8)'})
+        self.assertEqual(validators['SN'].spec, 'alnum(8)')
+        self.assertIs(validators['MO'], DEFAULT_VALIDATORS['MO'])
+
+class TestScriptBarcodes(unittest.TestCase):
+
+    def test_product_barcodes_compiled_at_load(self):
+        products = ScriptManager()._parse_product(yaml.safe_load(SCRIPT)['Product'])
+        self.assertTrue(products[0].barcodes['SN']("123456789012"))
+        self.assertFalse(products[0].barcodes['MAC']("0019ABCDEF01"))
+        self.assertEqual(products[1].barcodes, DEFAULT_VALIDATORS)
+
+    def test_invalid_barcodes_raise_validation_error(self):
+        with self.assertRaises(ScriptValidationError):
+            ScriptManager()._parse_product([{'Name': 'Bad', 'Barcodes': {'SN': 'serial'}}])
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
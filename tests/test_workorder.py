@@ -0,0 +1,84 @@
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.append(project_root)
+
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from src.config import config
+from src.utils import workorder
+from src.utils.workorder import WorkOrderCache, WorkOrderProvider, WorkOrderRecord, CsvWorkOrderProvider
+from src.utils.barcode import build_scan_fields, fill_from_workorder
+from src.utils.script import Script, Product
+
+CSV = """mo,sn,mac1,mac2
+M1234567890,12345678901,00:19:AB:CD:EF:01,00:19:AB:CD:EF:02
+M1234567890,12345678902,0019ABCDEF03,
+M1234567899,12345678999,,
+"""
+
+class _Provider(WorkOrderProvider):
+    name = "mes"
+
+    def __init__(self, records):
+        self.records = records
+
+    def fetch(self):
+        return self.records
+
+class TestWorkOrderCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, 'workorder.csv')
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write(CSV)
+        self.cache_path = os.path.join(self.tmp_dir.name, 'workorder.db')
+        self.cache = WorkOrderCache(self.cache_path)
+        self.cache.refresh(CsvWorkOrderProvider(self.csv_path))
+
+    def tearDown(self):
+        self.cache.close()
+        WorkOrderCache._instance = None
+        self.tmp_dir.cleanup()
+
+    def test_lookup_by_sn_mac_and_unique_mo(self):
+        record = self.cache.lookup("12345678901")
+        self.assertEqual(record, WorkOrderRecord("M1234567890", "12345678901", ["00:19:AB:CD:EF:01", "00:19:AB:CD:EF:02"]))
+        self.assertEqual(self.cache.lookup("0019abcdef02").sn, "12345678901")
+        self.assertEqual(self.cache.lookup("00-19-AB-CD-EF-03").sn, "12345678902")
+        self.assertEqual(self.cache.lookup("M1234567899").sn, "12345678999")
+        self.assertIsNone(self.cache.lookup("M1234567890"))    # 同一 MO 有多台，無法判斷
+        self.assertIsNone(self.cache.lookup("99999999999"))
+
+    def test_refresh_replaces_only_same_source(self):
+        self.cache.refresh(_Provider([WorkOrderRecord("M0000000001", "55555555555", [])]))
+        self.assertEqual(self.cache.count(), 4)
+        self.cache.refresh(_Provider([]))
+        self.assertEqual(self.cache.count(), 3)
+        self.assertIsNone(self.cache.lookup("55555555555"))
+
+    def test_fill_from_workorder(self):
+        script = Script(pairing=1, product=[Product("TX", mac_count=2, sn_count=1), Product("RX", mac_count=2, sn_count=1)])
+        fields, _ = build_scan_fields(script)
+        with patch.object(config, 'WORKORDER_CACHE_PATH', self.cache_path), \
+             patch.object(WorkOrderCache, '_instance', self.cache):
+            filled = fill_from_workorder(fields, {'$sn1': "12345678901"}, '$sn1')
+            self.assertEqual(filled, {'$mo1': "M1234567890", '$mac11': "00:19:AB:CD:EF:01", '$mac12': "00:19:AB:CD:EF:02"})
+
+            # MAC2 沒有資料時仍需掃描；另一台設備的欄位不受影響
+            filled = fill_from_workorder(fields, {'$mac21': "0019ABCDEF03"}, '$mac21')
+            self.assertEqual(filled, {'$mo2': "M1234567890", '$sn2': "12345678902"})
+
+            self.assertEqual(fill_from_workorder(fields, {'$sn1': "99999999999"}, '$sn1'), {})
+
+    def test_lookup_disabled_without_cache(self):
+        with patch.object(config, 'WORKORDER_CACHE_PATH', os.path.join(self.tmp_dir.name, 'missing.db')):
+            self.assertIsNone(workorder.lookup("12345678901"))
+        with patch.object(config, 'WORKORDER_ENABLED', False):
+            self.assertIsNone(workorder.lookup("12345678901"))
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)